@@ -4,6 +4,13 @@ Captures node types, modified parameters, expressions, keyframes, spare
 parameter templates, connections, network boxes, and sticky notes.
 Supports recursive subnet traversal.
 
+Networks are written in schema v2: a stream of compact JSON records, one
+per line, that is written and read node by node so memory stays bounded
+for large networks. Spare parameter templates are interned (each distinct
+definition is written once and referenced by id) and keyframes are stored
+as columnar arrays. Files ending in ``.gz`` are gzip compressed. Schema v1
+files (one indented JSON document) are still loaded.
+
 Usage inside Houdini (Python Shell or Shelf Tool)::
 
     from houdiniLib.utility.node_serializer import serialize_network, deserialize_network
@@ -14,6 +21,9 @@ Usage inside Houdini (Python Shell or Shelf Tool)::
     # Serialize from current selection
     serialize_network("C:/tmp/selected.json")
 
+    # Gzip compressed output
+    serialize_network("C:/tmp/my_network.json.gz", node_path="/obj/geo1")
+
     # Recreate network from JSON
     nodes = deserialize_network("C:/tmp/my_network.json", "/obj/geo1_copy")
 
@@ -22,15 +32,31 @@ Compatibility:
 """
 
 import contextlib
+import gzip
+import hashlib
 import json
 import logging
+import os
+import time
 from pathlib import Path
 
 import hou
 
 logger = logging.getLogger(__name__)
 
-_SCHEMA_VERSION = 1
+_SCHEMA_VERSION = 2
+_LEGACY_SCHEMA_VERSION = 1
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_GZIP_LEVEL = 6
+
+_FLAG_GETTERS = (
+    ("display", "isDisplayFlagSet"),
+    ("render", "isRenderFlagSet"),
+    ("bypass", "isBypassFlagSet"),
+    ("template", "isTemplateFlagSet"),
+    ("lock", "isHardLocked"),
+)
 
 
 # ══════════════════════════════════════════════════════════════════
@@ -294,13 +320,7 @@ def _serialize_flags(node):
         Dict of flag names to boolean values.
     """
     flags = {}
-    for flag_name, getter in (
-        ("display", "isDisplayFlagSet"),
-        ("render", "isRenderFlagSet"),
-        ("bypass", "isBypassFlagSet"),
-        ("template", "isTemplateFlagSet"),
-        ("lock", "isHardLocked"),
-    ):
+    for flag_name, getter in _FLAG_GETTERS:
         try:
             flags[flag_name] = getattr(node, getter)()
         except AttributeError:
@@ -443,18 +463,15 @@ def _serialize_sticky_notes(parent):
 # ══════════════════════════════════════════════════════════════════
 
 
-def _serialize_node(node, include_keyframes=True):
-    """Serialize a single node to a dict.
-
-    If the node is a subnet (has children) and is not a locked HDA,
-    recursively serializes all children and their internal connections.
+def _serialize_node_data(node, include_keyframes=True):
+    """Serialize a single node to a dict, without its children.
 
     Args:
         node: The hou.Node to serialize.
         include_keyframes: Whether to include keyframe data.
 
     Returns:
-        Dict describing the node.
+        Dict describing the node itself.
     """
     pos = node.position()
     color = node.color()
@@ -477,6 +494,24 @@ def _serialize_node(node, include_keyframes=True):
     if user_data:
         data["user_data"] = user_data
 
+    return data
+
+
+def _serialize_node(node, include_keyframes=True):
+    """Serialize a single node to a schema v1 dict.
+
+    If the node is a subnet (has children) and is not a locked HDA,
+    recursively serializes all children and their internal connections.
+
+    Args:
+        node: The hou.Node to serialize.
+        include_keyframes: Whether to include keyframe data.
+
+    Returns:
+        Dict describing the node.
+    """
+    data = _serialize_node_data(node, include_keyframes)
+
     # Recursive children for subnets
     children = []
     child_connections = []
@@ -495,6 +530,422 @@ def _serialize_node(node, include_keyframes=True):
     return data
 
 
+# ══════════════════════════════════════════════════════════════════
+# Schema v2 — Records
+# ══════════════════════════════════════════════════════════════════
+#
+# A v2 file is a stream of JSON records, one per line:
+#
+#   header          version, houdini_version, source_path; delta files
+#                   also hold "base", the path of the snapshot they apply
+#                   to, relative to the delta file
+#   template        id + template dict, written before its first use
+#   node            one node without children; "parent" is the path of
+#                   its parent relative to the serialized network
+#                   ("" for top-level nodes), children follow their parent;
+#                   "hash" is the node's content hash
+#   connections     connections between the children of "parent",
+#                   written after those children
+#   network_boxes   top-level network boxes
+#   sticky_notes    top-level sticky notes
+#   removed         (delta files) relative paths of deleted nodes
+#   end             node and template counts; missing if truncated
+
+
+def _child_key(parent_key, name):
+    """Return the network-relative path of a child node.
+
+    Args:
+        parent_key: Relative path of the parent ("" for the network root).
+        name: Name of the child node.
+
+    Returns:
+        The relative path of the child.
+    """
+    return f"{parent_key}/{name}" if parent_key else name
+
+
+def _content_hash(data):
+    """Return a short, stable hash of JSON-serializable data.
+
+    Args:
+        data: Dict to hash; key order does not matter.
+
+    Returns:
+        16 character hex digest.
+    """
+    text = json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _node_hash(node_data):
+    """Return the content hash of a node dict in the v1 layout.
+
+    Evaluated values of animated or expression-driven parameters change
+    with the current frame but are never restored (the keyframes or the
+    expression win), so they are left out of the hash.
+
+    Args:
+        node_data: Node dict; children, 'kind', 'parent' and 'hash' keys
+            are ignored.
+
+    Returns:
+        16 character hex digest.
+    """
+    content = {
+        k: v
+        for k, v in node_data.items()
+        if k not in ("children", "connections", "kind", "parent", "hash")
+    }
+    content["parameters"] = {
+        name: (
+            {k: v for k, v in parm_data.items() if k != "value"}
+            if "keyframes" in parm_data or "expression" in parm_data
+            else parm_data
+        )
+        for name, parm_data in node_data.get("parameters", {}).items()
+    }
+    return _content_hash(content)
+
+
+def _record_id(record):
+    """Return the identity of a record when merging snapshots.
+
+    Args:
+        record: Record dict.
+
+    Returns:
+        Tuple identifying the node, the network of a connections record,
+        or the record kind.
+    """
+    kind = record.get("kind")
+    if kind == "node":
+        return kind, _child_key(record["parent"], record["name"])
+    if kind == "connections":
+        return kind, record["parent"]
+    return (kind,)
+
+
+def _keyframes_to_columns(keyframes_data):
+    """Convert per-key keyframe dicts to columnar arrays.
+
+    Every field becomes one list with an entry per key; keys that lack a
+    field (unset slopes, string keyframes) hold None.
+
+    Args:
+        keyframes_data: List of keyframe dicts from _serialize_keyframes.
+
+    Returns:
+        Dict mapping field names to lists of equal length.
+    """
+    columns = {}
+    count = len(keyframes_data)
+    for row, kf_data in enumerate(keyframes_data):
+        for field, value in kf_data.items():
+            columns.setdefault(field, [None] * count)[row] = value
+    return columns
+
+
+def _keyframes_from_columns(columns):
+    """Convert columnar keyframe arrays back to per-key dicts.
+
+    Args:
+        columns: Dict mapping field names to lists of equal length.
+
+    Returns:
+        List of keyframe dicts, omitting fields that are None.
+    """
+    count = len(columns.get("frame", ()))
+    return [
+        {field: values[row] for field, values in columns.items() if values[row] is not None}
+        for row in range(count)
+    ]
+
+
+def _encode_parm(parm_data):
+    """Encode a parameter dict for a v2 node record.
+
+    Parameters that only carry a value are stored as the bare value.
+
+    Args:
+        parm_data: Dict from _serialize_parm.
+
+    Returns:
+        The bare value, or the parameter dict with columnar keyframes.
+    """
+    if parm_data.keys() == {"value"}:
+        return parm_data["value"]
+    if "keyframes" in parm_data:
+        return {**parm_data, "keyframes": _keyframes_to_columns(parm_data["keyframes"])}
+    return parm_data
+
+
+def _decode_parm(encoded):
+    """Decode a parameter of a v2 node record to the v1 dict layout.
+
+    Args:
+        encoded: Bare value or parameter dict.
+
+    Returns:
+        Dict with 'value' and the optional v1 parameter fields.
+    """
+    if not isinstance(encoded, dict):
+        return {"value": encoded}
+    if isinstance(encoded.get("keyframes"), dict):
+        return {**encoded, "keyframes": _keyframes_from_columns(encoded["keyframes"])}
+    return encoded
+
+
+class _TemplateTable:
+    """Intern spare parameter templates so each definition is stored once."""
+
+    def __init__(self):
+        """Initialize an empty table."""
+        self._ids = {}
+
+    def __len__(self):
+        """Return the number of interned templates."""
+        return len(self._ids)
+
+    def intern(self, template):
+        """Return the id of a template, assigning a new one if unseen.
+
+        Args:
+            template: Serialized template dict.
+
+        Returns:
+            Tuple of (template_id, is_new).
+        """
+        key = json.dumps(template, sort_keys=True)
+        template_id = self._ids.get(key)
+        if template_id is not None:
+            return template_id, False
+        template_id = self._ids[key] = len(self._ids)
+        return template_id, True
+
+
+def _encode_node_record(node_data, parent_key, templates):
+    """Encode a v1 node dict (without children) as v2 records.
+
+    Args:
+        node_data: Dict from _serialize_node_data.
+        parent_key: Relative path of the parent node.
+        templates: _TemplateTable shared by the whole file.
+
+    Returns:
+        Tuple of (template_records, node_record); template_records holds
+        the templates this node uses for the first time.
+    """
+    template_records = []
+    spare_ids = []
+    for template in node_data.get("spare_parameters", ()):
+        template_id, is_new = templates.intern(template)
+        if is_new:
+            template_records.append({"kind": "template", "id": template_id, "template": template})
+        spare_ids.append(template_id)
+
+    record = {
+        "kind": "node",
+        "parent": parent_key,
+        "name": node_data["name"],
+        "type": node_data["type"],
+        "position": node_data.get("position", [0, 0]),
+        "color": node_data.get("color"),
+    }
+    if node_data.get("comment"):
+        record["comment"] = node_data["comment"]
+    # Only set flags are stored; the rest are False
+    flags = [name for name, value in node_data.get("flags", {}).items() if value]
+    if flags:
+        record["flags"] = flags
+    if node_data.get("parameters"):
+        record["parameters"] = {
+            name: _encode_parm(parm_data) for name, parm_data in node_data["parameters"].items()
+        }
+    if spare_ids:
+        record["spare_parameters"] = spare_ids
+    if node_data.get("user_data"):
+        record["user_data"] = node_data["user_data"]
+
+    return template_records, record
+
+
+def _decode_node_record(record, templates):
+    """Decode a v2 node record to the v1 node layout.
+
+    Args:
+        record: Node record read from a v2 file.
+        templates: Dict mapping template ids to template dicts.
+
+    Returns:
+        Node dict in the v1 layout (without children) plus the 'kind' and
+        'parent' keys of the record.
+
+    Raises:
+        ValueError: If the record references an unknown template id.
+    """
+    set_flags = set(record.get("flags", ()))
+    try:
+        spare_templates = [templates[tid] for tid in record.get("spare_parameters", ())]
+    except KeyError as e:
+        raise ValueError(f"Node {record['name']!r} references unknown template {e}") from e
+
+    node_data = {
+        "kind": "node",
+        "parent": record["parent"],
+        "name": record["name"],
+        "type": record["type"],
+        "position": record.get("position", [0, 0]),
+        "color": record.get("color"),
+        "comment": record.get("comment", ""),
+        "flags": {name: name in set_flags for name, _getter in _FLAG_GETTERS},
+        "parameters": {
+            name: _decode_parm(encoded) for name, encoded in record.get("parameters", {}).items()
+        },
+        "spare_parameters": spare_templates,
+    }
+    if record.get("user_data"):
+        node_data["user_data"] = record["user_data"]
+    if record.get("hash"):
+        node_data["hash"] = record["hash"]
+    return node_data
+
+
+def _write_node_tree(writer, node, parent_key, include_keyframes=True):
+    """Write a node and, depth first, its children to a stream writer.
+
+    Children are written right after their parent, followed by a
+    connections record for the subnet. Locked HDA contents are skipped.
+
+    Args:
+        writer: Open NetworkStreamWriter.
+        node: The hou.Node to serialize.
+        parent_key: Relative path of the node's parent.
+        include_keyframes: Whether to include keyframe data.
+    """
+    writer.write_node(_serialize_node_data(node, include_keyframes), parent_key)
+
+    node_key = _child_key(parent_key, node.name())
+    try:
+        if len(node.children()) > 0 and not node.isLockedHDA():
+            for child in node.children():
+                _write_node_tree(writer, child, node_key, include_keyframes)
+            writer.write(
+                {
+                    "kind": "connections",
+                    "parent": node_key,
+                    "connections": _serialize_connections(node),
+                }
+            )
+    except hou.PermissionError:
+        logger.warning("Cannot access children of locked HDA: %s", node.path())
+
+
+class NetworkStreamWriter:
+    """Write a schema v2 network file one record per line.
+
+    Records are encoded as they arrive, so a network never has to be held
+    in memory as a whole. The file is written next to its destination and
+    moved into place when the writer closes without error, so an
+    interrupted export never replaces a good file with a truncated one.
+
+    Attributes:
+        path: Destination file path.
+        compress: Whether the file is gzip compressed.
+        header: Header record written first.
+        node_count: Number of node records written.
+        template_count: Number of interned spare parameter templates.
+
+    Example:
+        >>> with NetworkStreamWriter("C:/tmp/net.json.gz", {"source_path": "/obj"}) as writer:
+        ...     writer.write_node(node_data, "")
+    """
+
+    def __init__(self, path, header=None, compress=None):
+        """Prepare the writer; the file is opened on enter.
+
+        Args:
+            path (str | Path): Output file path.
+            header (dict | None): Extra header fields (houdini_version,
+                source_path, ...).
+            compress (bool | None): Gzip the output. Defaults to True for
+                paths ending in '.gz'.
+        """
+        self.path = Path(path)
+        self.compress = self.path.suffix == ".gz" if compress is None else bool(compress)
+        self.header = {"kind": "header", "version": _SCHEMA_VERSION, **(header or {})}
+        self.node_count = 0
+        self._templates = _TemplateTable()
+        self._tmp_path = self.path.with_name(self.path.name + ".tmp")
+        self._file = None
+
+    @property
+    def template_count(self):
+        """Number of interned spare parameter templates."""
+        return len(self._templates)
+
+    def __enter__(self):
+        """Open the temporary file and write the header record."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.compress:
+            self._file = gzip.open(
+                self._tmp_path, "wt", encoding="utf-8", compresslevel=_GZIP_LEVEL
+            )
+        else:
+            self._file = open(self._tmp_path, "w", encoding="utf-8")
+        self.write(self.header)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Write the end record and move the file into place.
+
+        On error the temporary file is removed and the destination is left
+        untouched.
+        """
+        try:
+            if exc_type is None:
+                self.write(
+                    {
+                        "kind": "end",
+                        "node_count": self.node_count,
+                        "template_count": self.template_count,
+                    }
+                )
+        finally:
+            self._file.close()
+
+        if exc_type is None:
+            os.replace(self._tmp_path, self.path)
+        else:
+            with contextlib.suppress(OSError):
+                self._tmp_path.unlink()
+        return False
+
+    def write(self, record):
+        """Write one record as a compact JSON line.
+
+        Args:
+            record: JSON-serializable dict with a 'kind' key.
+        """
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        self._file.write("\n")
+
+    def write_node(self, node_data, parent_key="", node_hash=None):
+        """Write a node, preceded by the templates it uses for the first time.
+
+        Args:
+            node_data: Node dict in the v1 layout (children are ignored).
+            parent_key: Relative path of the node's parent.
+            node_hash: Precomputed content hash of the node, if known.
+        """
+        template_records, record = _encode_node_record(node_data, parent_key, self._templates)
+        record["hash"] = node_hash or _node_hash(node_data)
+        for template_record in template_records:
+            self.write(template_record)
+        self.write(record)
+        self.node_count += 1
+
+
 # ══════════════════════════════════════════════════════════════════
 # Serialization — Public API
 # ══════════════════════════════════════════════════════════════════
@@ -526,25 +977,45 @@ def _resolve_nodes(node_path=None):
     return parent, list(selected)
 
 
-def serialize_network(json_path, node_path=None, include_keyframes=True):
+def serialize_network(
+    json_path,
+    node_path=None,
+    include_keyframes=True,
+    schema_version=_SCHEMA_VERSION,
+    compress=None,
+):
     """Serialize a Houdini node network to a JSON file.
 
     Captures node types, modified parameters, expressions, keyframes, spare
     parameter templates, connections, network boxes, and sticky notes.
     Supports recursive subnet traversal.
 
+    Schema v2 (the default) streams one compact record per line while the
+    network is walked, so the serialized network is never held in memory.
+    Schema v1 builds one nested dict and writes it as indented JSON.
+
     Args:
         json_path (str | Path): Output JSON file path.
         node_path (str | None): Root node path (e.g. "/obj/geo1").
             If None, serializes the currently selected nodes.
         include_keyframes (bool): Include animation keyframes in output.
+        schema_version (int): 2 for the streamed format, 1 for the legacy
+            nested format.
+        compress (bool | None): Gzip the output (schema v2 only).
+            Defaults to True for paths ending in '.gz'.
 
     Returns:
-        Dict containing the serialized network data.
+        Dict containing the serialized network data for schema v1, or the
+        header of the written file with 'node_count' and 'template_count'
+        for schema v2.
 
     Raises:
-        ValueError: If no nodes are found to serialize.
+        ValueError: If no nodes are found to serialize or the schema
+            version is unsupported.
     """
+    if schema_version not in (_LEGACY_SCHEMA_VERSION, _SCHEMA_VERSION):
+        raise ValueError(f"Unsupported schema version {schema_version}")
+
     json_path = Path(json_path)
     parent, nodes = _resolve_nodes(node_path)
 
@@ -563,22 +1034,365 @@ def serialize_network(json_path, node_path=None, include_keyframes=True):
     else:
         connections = all_connections
 
-    network_data = {
-        "version": _SCHEMA_VERSION,
+    if schema_version == _LEGACY_SCHEMA_VERSION:
+        network_data = {
+            "version": _LEGACY_SCHEMA_VERSION,
+            "houdini_version": hou.applicationVersionString(),
+            "source_path": parent.path(),
+            "nodes": [_serialize_node(n, include_keyframes) for n in nodes],
+            "connections": connections,
+            "network_boxes": _serialize_network_boxes(parent),
+            "sticky_notes": _serialize_sticky_notes(parent),
+        }
+
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(network_data, f, indent=2, ensure_ascii=False)
+
+        logger.info("Serialized %d nodes to %s", len(nodes), json_path)
+        return network_data
+
+    header = {
         "houdini_version": hou.applicationVersionString(),
         "source_path": parent.path(),
-        "nodes": [_serialize_node(n, include_keyframes) for n in nodes],
-        "connections": connections,
-        "network_boxes": _serialize_network_boxes(parent),
-        "sticky_notes": _serialize_sticky_notes(parent),
     }
+    with NetworkStreamWriter(json_path, header, compress=compress) as writer:
+        for node in nodes:
+            _write_node_tree(writer, node, "", include_keyframes)
+        writer.write({"kind": "connections", "parent": "", "connections": connections})
+        writer.write({"kind": "network_boxes", "items": _serialize_network_boxes(parent)})
+        writer.write({"kind": "sticky_notes", "items": _serialize_sticky_notes(parent)})
+
+    logger.info(
+        "Serialized %d nodes (%d spare templates) to %s",
+        writer.node_count,
+        writer.template_count,
+        json_path,
+    )
+    summary = {k: v for k, v in writer.header.items() if k != "kind"}
+    summary["node_count"] = writer.node_count
+    summary["template_count"] = writer.template_count
+    return summary
+
+
+# ══════════════════════════════════════════════════════════════════
+# Serialization — Incremental Snapshots
+# ══════════════════════════════════════════════════════════════════
+
+# Node events that change what serialize_network captures for a node
+_DIRTY_EVENT_NAMES = (
+    "ParmTupleChanged",
+    "FlagChanged",
+    "AppearanceChanged",
+    "PositionChanged",
+    "NameChanged",
+    "SpareParmTemplatesChanged",
+    "CustomDataChanged",
+    "InputRewired",
+    "ChildCreated",
+)
+
+
+def _snapshot_hashes(base_path):
+    """Read the content hashes of every record of a snapshot.
+
+    Args:
+        base_path: Path of a full or delta snapshot.
+
+    Returns:
+        Dict mapping record ids (see _record_id) to content hashes.
+    """
+    hashes = {}
+    for record in iter_network_records(base_path):
+        kind = record.get("kind")
+        if kind in ("header", "end"):
+            continue
+        if kind == "node":
+            hashes[_record_id(record)] = record.get("hash") or _node_hash(record)
+        else:
+            hashes[_record_id(record)] = _content_hash(record)
+    return hashes
+
+
+def _write_changed_record(writer, record, previous, seen):
+    """Write a non-node record if it differs from the previous snapshot.
+
+    Args:
+        writer: Open NetworkStreamWriter.
+        record: Connections, network box or sticky note record.
+        previous: Record id to hash mapping of the previous snapshot.
+        seen: Set collecting the record ids of the current network.
+    """
+    record_id = _record_id(record)
+    seen.add(record_id)
+    if previous.get(record_id) != _content_hash(record):
+        writer.write(record)
+
+
+def _write_changed_tree(writer, node, parent_key, previous, seen, options):
+    """Write the nodes of a subtree that changed since the previous snapshot.
 
-    json_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(network_data, f, indent=2, ensure_ascii=False)
+    A node is serialized if it is new or, when dirty paths are tracked,
+    reported dirty; it is written only if its content hash changed. The
+    walk itself only lists children, so unchanged nodes cost no
+    parameter access.
 
-    logger.info("Serialized %d nodes to %s", len(nodes), json_path)
-    return network_data
+    Args:
+        writer: Open NetworkStreamWriter.
+        node: The hou.Node to compare.
+        parent_key: Relative path of the node's parent.
+        previous: Record id to hash mapping of the previous snapshot.
+        seen: Set collecting the record ids of the current network.
+        options: Tuple of (include_keyframes, dirty_paths).
+    """
+    include_keyframes, dirty_paths = options
+    node_key = _child_key(parent_key, node.name())
+    record_id = ("node", node_key)
+    seen.add(record_id)
+
+    old_hash = previous.get(record_id)
+    if old_hash is None or dirty_paths is None or node.path() in dirty_paths:
+        node_data = _serialize_node_data(node, include_keyframes)
+        node_hash = _node_hash(node_data)
+        if node_hash != old_hash:
+            writer.write_node(node_data, parent_key, node_hash)
+
+    try:
+        if len(node.children()) > 0 and not node.isLockedHDA():
+            for child in node.children():
+                _write_changed_tree(writer, child, node_key, previous, seen, options)
+            _write_changed_record(
+                writer,
+                {
+                    "kind": "connections",
+                    "parent": node_key,
+                    "connections": _serialize_connections(node),
+                },
+                previous,
+                seen,
+            )
+    except hou.PermissionError:
+        logger.warning("Cannot access children of locked HDA: %s", node.path())
+
+
+def _removed_keys(previous, seen):
+    """Return the top-most nodes of the previous snapshot that no longer exist.
+
+    Args:
+        previous: Record id to hash mapping of the previous snapshot.
+        seen: Record ids of the current network.
+
+    Returns:
+        Sorted list of relative node paths; descendants of a removed node
+        are implied and not listed.
+    """
+    missing = {record_id[1] for record_id in previous if record_id[0] == "node"}
+    missing -= {record_id[1] for record_id in seen if record_id[0] == "node"}
+    removed = []
+    for key in sorted(missing):
+        parts = key.split("/")
+        if not any("/".join(parts[:depth]) in missing for depth in range(1, len(parts))):
+            removed.append(key)
+    return removed
+
+
+def serialize_network_delta(
+    json_path,
+    base_path,
+    node_path=None,
+    include_keyframes=True,
+    compress=None,
+    dirty_paths=None,
+):
+    """Write only what changed in a network since a previous snapshot.
+
+    Compares the current network against the node content hashes stored in
+    the base snapshot and writes a schema v2 delta file holding the new and
+    changed nodes, the connection lists that changed, and the paths of
+    removed nodes. deserialize_network applies the delta on top of its base;
+    a delta can itself be the base of the next delta.
+
+    Without ``dirty_paths`` every node is serialized and hashed, so the
+    file stays small but the walk costs as much as a full snapshot. With
+    ``dirty_paths`` (see NetworkSnapshotTracker) only nodes that are new
+    or listed are serialized.
+
+    Args:
+        json_path (str | Path): Output delta file path.
+        base_path (str | Path): Previous snapshot (full or delta). Its
+            path is stored relative to the delta file.
+        node_path (str | None): Root node path. If None, compares the
+            currently selected nodes.
+        include_keyframes (bool): Include animation keyframes in output.
+        compress (bool | None): Gzip the output. Defaults to True for
+            paths ending in '.gz'.
+        dirty_paths (set[str] | None): Absolute paths of nodes edited
+            since the base snapshot, or None to check every node.
+
+    Returns:
+        The header of the written file with 'node_count' (changed nodes),
+        'removed_count' and 'template_count'.
+
+    Raises:
+        ValueError: If no nodes are found to serialize.
+        FileNotFoundError: If the base snapshot does not exist.
+    """
+    json_path = Path(json_path)
+    base_path = Path(base_path)
+    parent, nodes = _resolve_nodes(node_path)
+    previous = _snapshot_hashes(base_path)
+
+    node_names = {n.name() for n in nodes}
+    connections = _serialize_connections(parent)
+    if node_path is None:
+        connections = [
+            c
+            for c in connections
+            if (c.get("from_node") is None or c["from_node"] in node_names)
+            and c["to_node"] in node_names
+        ]
+
+    header = {
+        "houdini_version": hou.applicationVersionString(),
+        "source_path": parent.path(),
+        "base": Path(os.path.relpath(base_path, json_path.parent)).as_posix(),
+    }
+    seen = set()
+    options = (include_keyframes, dirty_paths)
+    with NetworkStreamWriter(json_path, header, compress=compress) as writer:
+        for node in nodes:
+            _write_changed_tree(writer, node, "", previous, seen, options)
+        for record in (
+            {"kind": "connections", "parent": "", "connections": connections},
+            {"kind": "network_boxes", "items": _serialize_network_boxes(parent)},
+            {"kind": "sticky_notes", "items": _serialize_sticky_notes(parent)},
+        ):
+            _write_changed_record(writer, record, previous, seen)
+
+        removed = _removed_keys(previous, seen)
+        if removed:
+            writer.write({"kind": "removed", "keys": removed})
+        # Subnets that lost all their children keep no stale connections
+        removed_prefixes = tuple(f"{key}/" for key in removed)
+        for record_id in previous:
+            if record_id[0] != "connections" or record_id in seen:
+                continue
+            key = record_id[1]
+            if key.startswith(removed_prefixes) or ("node", key) not in seen:
+                continue
+            writer.write({"kind": "connections", "parent": key, "connections": []})
+
+    logger.info(
+        "Wrote delta of %d changed and %d removed nodes to %s (base %s)",
+        writer.node_count,
+        len(removed),
+        json_path,
+        base_path,
+    )
+    summary = {k: v for k, v in writer.header.items() if k != "kind"}
+    summary["node_count"] = writer.node_count
+    summary["removed_count"] = len(removed)
+    summary["template_count"] = writer.template_count
+    return summary
+
+
+class NetworkSnapshotTracker:
+    """Take repeated snapshots of a network, writing deltas after the first.
+
+    Node event callbacks record which nodes are edited between snapshots,
+    so each delta only serializes the edited and new nodes instead of
+    walking every parameter of the network.
+
+    Attributes:
+        node_path: Root node path of the tracked network.
+        include_keyframes: Whether snapshots include keyframes.
+        last_snapshot: Path of the most recent snapshot, or None.
+
+    Example:
+        >>> tracker = NetworkSnapshotTracker("/obj/geo1")
+        >>> tracker.snapshot("C:/snapshots/geo1_000.json.gz")  # full snapshot
+        >>> tracker.snapshot("C:/snapshots/geo1_001.json.gz")  # delta
+        >>> tracker.stop()
+    """
+
+    def __init__(self, node_path, include_keyframes=True):
+        """Start tracking edits of a network.
+
+        Args:
+            node_path (str): Root node path (e.g. "/obj/geo1").
+            include_keyframes (bool): Include animation keyframes.
+
+        Raises:
+            ValueError: If the node does not exist.
+        """
+        root = hou.node(node_path)
+        if root is None:
+            raise ValueError(f"Node not found: {node_path!r}")
+
+        self.node_path = node_path
+        self.include_keyframes = include_keyframes
+        self.last_snapshot = None
+        self._event_types = tuple(
+            getattr(hou.nodeEventType, name)
+            for name in _DIRTY_EVENT_NAMES
+            if hasattr(hou.nodeEventType, name)
+        )
+        self._dirty_paths = set()
+        self._watched = []
+
+        self._watch(root)
+        for node in root.allSubChildren():
+            self._watch(node)
+
+    def _watch(self, node):
+        """Register the edit callback on a node."""
+        with contextlib.suppress(hou.ObjectWasDeleted, hou.OperationFailed):
+            node.addEventCallback(self._event_types, self._on_node_event)
+            self._watched.append(node)
+
+    def _on_node_event(self, event_type, **kwargs):
+        """Mark the node of an event dirty and watch newly created children."""
+        if event_type == getattr(hou.nodeEventType, "ChildCreated", None):
+            self._watch(kwargs["child_node"])
+        node = kwargs.get("node")
+        if node is not None:
+            with contextlib.suppress(hou.ObjectWasDeleted):
+                self._dirty_paths.add(node.path())
+
+    def snapshot(self, json_path, compress=None):
+        """Write a full snapshot the first time, then deltas.
+
+        Args:
+            json_path (str | Path): Output file path.
+            compress (bool | None): Gzip the output. Defaults to True for
+                paths ending in '.gz'.
+
+        Returns:
+            Summary dict from serialize_network or serialize_network_delta.
+        """
+        if self.last_snapshot is None:
+            summary = serialize_network(
+                json_path, self.node_path, self.include_keyframes, compress=compress
+            )
+        else:
+            summary = serialize_network_delta(
+                json_path,
+                self.last_snapshot,
+                self.node_path,
+                self.include_keyframes,
+                compress=compress,
+                dirty_paths=self._dirty_paths,
+            )
+        self._dirty_paths = set()
+        self.last_snapshot = Path(json_path)
+        return summary
+
+    def stop(self):
+        """Remove the edit callbacks from every tracked node."""
+        for node in self._watched:
+            with contextlib.suppress(hou.ObjectWasDeleted, hou.OperationFailed):
+                node.removeEventCallback(self._event_types, self._on_node_event)
+        self._watched = []
 
 
 # ══════════════════════════════════════════════════════════════════
@@ -697,74 +1511,138 @@ def _apply_expression(parm, parm_data):
         logger.warning("Failed to set expression on %s: %s", parm.path(), e)
 
 
+def _build_keyframe(kf_data):
+    """Build a hou.Keyframe or hou.StringKeyframe from a keyframe dict.
+
+    Args:
+        kf_data: Keyframe dict.
+
+    Returns:
+        The keyframe object.
+    """
+    if kf_data.get("string_keyframe"):
+        kf = hou.StringKeyframe()
+        kf.setFrame(kf_data["frame"])
+        expr = kf_data.get("expression", "")
+        if expr:
+            with contextlib.suppress(hou.OperationFailed):
+                kf.setExpression(expr, hou.exprLanguage.Hscript)
+        return kf
+
+    kf = hou.Keyframe()
+    kf.setFrame(kf_data["frame"])
+    kf.setValue(kf_data["value"])
+    for attr, setter in (
+        ("slope", "setSlope"),
+        ("in_slope", "setInSlope"),
+        ("accel", "setAccel"),
+        ("in_accel", "setInAccel"),
+    ):
+        if attr in kf_data:
+            getattr(kf, setter)(kf_data[attr])
+
+    expr = kf_data.get("expression")
+    if expr:
+        with contextlib.suppress(hou.OperationFailed):
+            kf.setExpression(expr, hou.exprLanguage.Hscript)
+    return kf
+
+
 def _apply_keyframes(parm, keyframes_data):
-    """Recreate keyframes on a parameter.
+    """Recreate keyframes on a parameter with one setKeyframes call.
 
     Args:
         parm: The hou.Parm to set keyframes on.
         keyframes_data: List of keyframe dicts.
     """
     parm.deleteAllKeyframes()
-    for kf_data in keyframes_data:
-        if kf_data.get("string_keyframe"):
-            kf = hou.StringKeyframe()
-            kf.setFrame(kf_data["frame"])
-            expr = kf_data.get("expression", "")
-            if expr:
-                with contextlib.suppress(hou.OperationFailed):
-                    kf.setExpression(expr, hou.exprLanguage.Hscript)
-        else:
-            kf = hou.Keyframe()
-            kf.setFrame(kf_data["frame"])
-            kf.setValue(kf_data["value"])
-            for attr, setter in (
-                ("slope", "setSlope"),
-                ("in_slope", "setInSlope"),
-                ("accel", "setAccel"),
-                ("in_accel", "setInAccel"),
-            ):
-                if attr in kf_data:
-                    getattr(kf, setter)(kf_data[attr])
+    keyframes = tuple(_build_keyframe(kf_data) for kf_data in keyframes_data)
+    try:
+        parm.setKeyframes(keyframes)
+    except AttributeError:
+        # Older builds without setKeyframes: one call per key
+        for kf in keyframes:
+            parm.setKeyframe(kf)
+
 
-            expr = kf_data.get("expression")
-            if expr:
-                with contextlib.suppress(hou.OperationFailed):
-                    kf.setExpression(expr, hou.exprLanguage.Hscript)
+def _set_parm_tuple(parm_tuple, components):
+    """Set the plain values of one parameter tuple.
+
+    A tuple whose every component has a value is set in one call; partial
+    tuples (and tuples the bulk call rejects) are set per component.
+
+    Args:
+        parm_tuple: The hou.ParmTuple.
+        components: Dict mapping component index to (hou.Parm, value).
+    """
+    if len(components) == len(parm_tuple):
+        try:
+            parm_tuple.set(tuple(components[index][1] for index in range(len(parm_tuple))))
+            return
+        except (TypeError, hou.OperationFailed, hou.PermissionError):
+            # Retry per component to report which value failed
+            pass
 
-        parm.setKeyframe(kf)
+    for parm, value in components.values():
+        try:
+            parm.set(value)
+        except (TypeError, hou.OperationFailed, hou.PermissionError) as e:
+            logger.warning("Failed to set %s = %r: %s", parm.path(), value, e)
 
 
-def _apply_parameters(node, params_data):
+def _apply_parameters(node, params_data, timer=None):
     """Apply serialized parameter values, expressions, and keyframes to a node.
 
+    Plain values are grouped by parameter tuple and set one tuple at a
+    time; keyframes are applied per parameter in bulk; locks are applied
+    last so locked parameters still receive their values.
+
     Args:
         node: The hou.Node to modify.
         params_data: Dict mapping parameter names to their data dicts.
+        timer: Optional _PhaseTimer; time is booked to 'params' and 'keys'.
     """
-    for parm_name, parm_data in params_data.items():
-        parm = node.parm(parm_name)
-        if parm is None:
-            logger.warning(
-                "Parameter %r not found on %s (type: %s)",
-                parm_name,
-                node.path(),
-                node.type().name(),
-            )
-            continue
+    timer = timer or _PhaseTimer()
+    keyed = []
+    locked = []
+
+    with timer.phase("params"):
+        tuple_values = {}
+        for parm_name, parm_data in params_data.items():
+            parm = node.parm(parm_name)
+            if parm is None:
+                logger.warning(
+                    "Parameter %r not found on %s (type: %s)",
+                    parm_name,
+                    node.path(),
+                    node.type().name(),
+                )
+                continue
 
-        # Keyframes take priority (they implicitly set values)
-        if "keyframes" in parm_data:
-            _apply_keyframes(parm, parm_data["keyframes"])
-        elif "expression" in parm_data:
-            _apply_expression(parm, parm_data)
-        else:
-            try:
-                parm.set(parm_data["value"])
-            except (TypeError, hou.OperationFailed, hou.PermissionError) as e:
-                logger.warning("Failed to set %s = %r: %s", parm.path(), parm_data["value"], e)
+            # Keyframes take priority (they implicitly set values)
+            if "keyframes" in parm_data:
+                keyed.append((parm, parm_data["keyframes"]))
+            elif "expression" in parm_data:
+                _apply_expression(parm, parm_data)
+            elif "_skipped" in parm_data:
+                logger.debug("Skipping %s parameter %s", parm_data["_skipped"], parm.path())
+            else:
+                parm_tuple = parm.tuple()
+                _, components = tuple_values.setdefault(parm_tuple.name(), (parm_tuple, {}))
+                components[parm.componentIndex()] = (parm, parm_data["value"])
+
+            if parm_data.get("locked", False):
+                locked.append(parm)
+
+        for parm_tuple, components in tuple_values.values():
+            _set_parm_tuple(parm_tuple, components)
 
-        # Lock state
-        if parm_data.get("locked", False):
+    with timer.phase("keys"):
+        for parm, keyframes_data in keyed:
+            _apply_keyframes(parm, keyframes_data)
+
+    with timer.phase("params"):
+        for parm in locked:
             parm.lock(True)
 
 
@@ -797,27 +1675,6 @@ def _apply_flags(node, flags_data):
             getattr(node, setter_name)(value)
 
 
-def _apply_flags_recursive(parent, nodes_data, name_remap):
-    """Recursively apply flags to all nodes including subnet children.
-
-    Args:
-        parent: The parent hou.Node.
-        nodes_data: List of node data dicts.
-        name_remap: Dict mapping original names to actual created names.
-    """
-    for node_data in nodes_data:
-        actual_name = name_remap.get(node_data["name"], node_data["name"])
-        node = parent.node(actual_name)
-        if node is None:
-            continue
-        _apply_flags(node, node_data.get("flags", {}))
-        # Recurse into children — skip locked HDAs
-        children_data = node_data.get("children", [])
-        if children_data and not node.isLockedHDA():
-            child_remap = {c.name(): c.name() for c in node.children()}
-            _apply_flags_recursive(node, children_data, child_remap)
-
-
 # ══════════════════════════════════════════════════════════════════
 # Deserialization — Connections
 # ══════════════════════════════════════════════════════════════════
@@ -1011,16 +1868,267 @@ def _recreate_sticky_notes(parent, notes_data):
 
 
 # ══════════════════════════════════════════════════════════════════
-# Deserialization — Node (recursive)
+# Schema v2 — Reading
 # ══════════════════════════════════════════════════════════════════
 
 
-def _deserialize_node(parent, node_data, name_remap):
-    """Create a single node from serialized data.
+def _open_network_file(path):
+    """Open a network file for text reading, detecting gzip compression.
+
+    Args:
+        path: Path of the file.
+
+    Returns:
+        A text file object.
+    """
+    with open(path, "rb") as f:
+        magic = f.read(len(_GZIP_MAGIC))
+    if magic == _GZIP_MAGIC:
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def _records_from_v1(data):
+    """Flatten a schema v1 document into v2-style records.
+
+    Args:
+        data: Parsed v1 JSON document.
+
+    Yields:
+        Header, node, connections, network box and sticky note records.
+    """
+    yield {
+        "kind": "header",
+        "version": data.get("version"),
+        "houdini_version": data.get("houdini_version"),
+        "source_path": data.get("source_path"),
+    }
+    yield from _flatten_v1_nodes(data.get("nodes", []), "")
+    yield {"kind": "connections", "parent": "", "connections": data.get("connections", [])}
+    yield {"kind": "network_boxes", "items": data.get("network_boxes", [])}
+    yield {"kind": "sticky_notes", "items": data.get("sticky_notes", [])}
+
+
+def _flatten_v1_nodes(nodes_data, parent_key):
+    """Yield node and subnet connection records from nested v1 node dicts.
+
+    Args:
+        nodes_data: List of v1 node dicts.
+        parent_key: Relative path of their parent.
+
+    Yields:
+        Node records followed, per subnet, by a connections record.
+    """
+    for node_data in nodes_data:
+        record = {k: v for k, v in node_data.items() if k not in ("children", "connections")}
+        yield {"kind": "node", "parent": parent_key, **record}
+
+        node_key = _child_key(parent_key, node_data["name"])
+        yield from _flatten_v1_nodes(node_data.get("children", []), node_key)
+        if node_data.get("connections"):
+            yield {
+                "kind": "connections",
+                "parent": node_key,
+                "connections": node_data["connections"],
+            }
 
-    Creates the node, sets its position, applies spare templates and
-    parameters, recurses into children for subnets, and records any
-    name remapping due to collisions.
+
+def _read_records(json_path):
+    """Yield the records stored in one network file.
+
+    Args:
+        json_path (Path): Path of the network file.
+
+    Yields:
+        Header first, then the decoded records of the file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the schema version is unsupported.
+    """
+    if not json_path.exists():
+        raise FileNotFoundError(f"JSON file not found: {json_path}")
+
+    with _open_network_file(json_path) as f:
+        try:
+            header = json.loads(f.readline())
+        except json.JSONDecodeError:
+            header = None
+
+        if not isinstance(header, dict) or header.get("kind") != "header":
+            # Schema v1: one (usually indented) JSON document
+            if header is None:
+                f.seek(0)
+                header = json.load(f)
+            version = header.get("version", 0)
+            if version != _LEGACY_SCHEMA_VERSION:
+                raise ValueError(
+                    f"Unsupported schema version {version} "
+                    f"(expected {_LEGACY_SCHEMA_VERSION} or {_SCHEMA_VERSION})"
+                )
+            yield from _records_from_v1(header)
+            return
+
+        version = header.get("version", 0)
+        if version != _SCHEMA_VERSION:
+            raise ValueError(f"Unsupported schema version {version} (expected {_SCHEMA_VERSION})")
+        yield header
+
+        templates = {}
+        ended = False
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            kind = record.get("kind")
+            if kind == "template":
+                templates[record["id"]] = record["template"]
+                continue
+            if kind == "node":
+                record = _decode_node_record(record, templates)
+            elif kind == "end":
+                ended = True
+            yield record
+
+    if not ended:
+        logger.warning("%s has no end record; the file may be truncated", json_path)
+
+
+def _merge_records(base_records, delta_records):
+    """Apply the records of a delta file on top of a base snapshot.
+
+    Changed nodes replace their base record in place, so parents still
+    come before their children; new nodes are appended in delta order.
+    Connections, network box and sticky note records move to the end so
+    they follow every node they reference. Removed nodes drop their
+    descendants and the connections between their children.
+
+    Args:
+        base_records: Records of the base snapshot.
+        delta_records: Records of the delta file, without its header.
+
+    Returns:
+        List of merged records, without header and end records.
+    """
+    merged = {}
+    for record in base_records:
+        if record.get("kind") not in ("header", "end"):
+            merged[_record_id(record)] = record
+
+    for record in delta_records:
+        kind = record.get("kind")
+        if kind == "end":
+            continue
+        if kind == "removed":
+            removed = set(record.get("keys", ()))
+            prefixes = tuple(f"{key}/" for key in removed)
+            for record_id in list(merged):
+                if record_id[0] not in ("node", "connections"):
+                    continue
+                key = record_id[1]
+                if key in removed or key.startswith(prefixes):
+                    del merged[record_id]
+            continue
+
+        record_id = _record_id(record)
+        if kind != "node":
+            merged.pop(record_id, None)
+        merged[record_id] = record
+
+    return list(merged.values())
+
+
+def iter_network_records(json_path):
+    """Yield the records of a serialized network one at a time.
+
+    Schema v2 files are read line by line, so only the current record and
+    the template table are held in memory. Node records are returned in
+    the v1 node layout (templates resolved, keyframes expanded to one dict
+    per key, all flags present) plus the 'kind' and 'parent' keys. Schema
+    v1 files are loaded whole and flattened into the same records. Gzip
+    compression is detected from the file contents.
+
+    Delta files written by serialize_network_delta are merged with their
+    base snapshot (following the chain of bases), which needs the records
+    of the merged network in memory.
+
+    Args:
+        json_path (str | Path): Path of the network file.
+
+    Yields:
+        Record dicts with a 'kind' key: 'header' first, then 'node',
+        'connections', 'network_boxes', 'sticky_notes' and, for v2 files,
+        'end'.
+
+    Raises:
+        FileNotFoundError: If the file or its base snapshot does not exist.
+        ValueError: If the schema version is unsupported.
+    """
+    json_path = Path(json_path)
+    records = _read_records(json_path)
+    header = next(records)
+
+    base = header.get("base")
+    if base is None:
+        yield header
+        yield from records
+        return
+
+    merged = _merge_records(iter_network_records(json_path.parent / base), records)
+    yield header
+    yield from merged
+
+
+# ══════════════════════════════════════════════════════════════════
+# Deserialization — Nodes
+# ══════════════════════════════════════════════════════════════════
+
+
+class _PhaseTimer:
+    """Accumulate wall-clock time per deserialization phase."""
+
+    PHASES = ("create", "params", "keys", "connections", "flags")
+
+    def __init__(self):
+        """Start every phase at zero seconds."""
+        self.seconds = dict.fromkeys(self.PHASES, 0.0)
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Book the time spent in the block to a phase.
+
+        Args:
+            name: Phase name.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] += time.perf_counter() - start
+
+
+@contextlib.contextmanager
+def _cooking_suspended():
+    """Switch Houdini to manual updates for the duration of the block.
+
+    Nodes created or edited inside the block do not trigger intermediate
+    cooks or viewport refreshes; the previous update mode is restored on
+    exit, which cooks the displayed network once.
+    """
+    previous = hou.updateModeSetting()
+    hou.setUpdateMode(hou.updateMode.Manual)
+    try:
+        yield
+    finally:
+        hou.setUpdateMode(previous)
+
+
+def _create_node(parent, node_data, name_remap):
+    """Create a single node, without its children, from serialized data.
+
+    Creates the node, sets its position, color, comment and user data,
+    applies spare templates, and records any name remapping due to
+    collisions. Parameters are applied separately by _apply_parameters.
 
     Args:
         parent: The parent hou.Node to create inside.
@@ -1074,35 +2182,103 @@ def _deserialize_node(parent, node_data, name_remap):
     # Spare templates (BEFORE parameters)
     _apply_spare_templates(node, node_data.get("spare_parameters", []))
 
-    # Parameters
-    _apply_parameters(node, node_data.get("parameters", {}))
-
-    # Recursive children — skip if the node is a locked HDA (it manages its own contents)
-    child_remap = {}
-    children_data = node_data.get("children", [])
-    if children_data and node.isLockedHDA():
-        logger.info(
-            "Skipping %d children of locked HDA %r (contents managed by asset definition)",
-            len(children_data),
-            node.path(),
-        )
-    else:
-        for child_data in children_data:
-            _deserialize_node(node, child_data, child_remap)
+    return node
 
-    # Internal connections (for subnet children)
-    # Split: same-level connections now, cross-level deferred
-    child_conns = node_data.get("connections", [])
-    if child_conns:
-        same_level = [c for c in child_conns if not c.get("cross_level")]
-        _recreate_connections(node, same_level, child_remap)
 
-        # Collect cross-level connections for deferred wiring
-        cross_level = [c for c in child_conns if c.get("cross_level")]
-        if cross_level:
-            node.setUserData("_deferred_cross_conns", json.dumps(cross_level))
+def _deserialize_records(parent, records, timer):
+    """Recreate a network from a stream of records.
 
-    return node
+    Node records arrive parent first, so every node is created inside an
+    already created parent. Subnet connections are wired as soon as their
+    connections record arrives; cross-level connections and flags are
+    applied once every node exists.
+
+    Args:
+        parent: The hou.Node to create the network inside.
+        records: Iterable of records from iter_network_records.
+        timer: _PhaseTimer collecting the time of each phase.
+
+    Returns:
+        List of top-level hou.Node objects created.
+    """
+    created_nodes = []
+    # Created nodes and their child name remaps, keyed by relative path
+    nodes_by_key = {"": parent}
+    remaps = {"": {}}
+    locked_keys = {}
+    pending_flags = []
+
+    for record in records:
+        kind = record.get("kind")
+
+        if kind == "node":
+            parent_key = record["parent"]
+            if parent_key in locked_keys:
+                locked_keys[parent_key] += 1
+                continue
+            container = nodes_by_key.get(parent_key)
+            if container is None:
+                # Parent failed to create or lives inside a skipped HDA
+                continue
+
+            with timer.phase("create"):
+                node = _create_node(container, record, remaps[parent_key])
+            if node is None:
+                continue
+            _apply_parameters(node, record.get("parameters", {}), timer)
+            node_key = _child_key(parent_key, record["name"])
+            nodes_by_key[node_key] = node
+            remaps[node_key] = {}
+            if node.isLockedHDA():
+                # Locked HDAs manage their own contents
+                locked_keys[node_key] = 0
+            pending_flags.append((node, record.get("flags", {})))
+            if not parent_key:
+                created_nodes.append(node)
+
+        elif kind == "connections":
+            parent_key = record["parent"]
+            container = nodes_by_key.get(parent_key)
+            if container is None:
+                continue
+            conns = record.get("connections", [])
+            with timer.phase("connections"):
+                if not parent_key:
+                    _recreate_connections(container, conns, remaps[parent_key])
+                    continue
+                # Subnet: same-level connections now, cross-level deferred
+                same_level = [c for c in conns if not c.get("cross_level")]
+                _recreate_connections(container, same_level, remaps[parent_key])
+                cross_level = [c for c in conns if c.get("cross_level")]
+                if cross_level:
+                    container.setUserData("_deferred_cross_conns", json.dumps(cross_level))
+
+        elif kind == "network_boxes":
+            with timer.phase("create"):
+                _recreate_network_boxes(parent, record.get("items", []), remaps[""])
+
+        elif kind == "sticky_notes":
+            with timer.phase("create"):
+                _recreate_sticky_notes(parent, record.get("items", []))
+
+    for node_key, skipped in locked_keys.items():
+        if skipped:
+            logger.info(
+                "Skipped %d children of locked HDA %r (contents managed by asset definition)",
+                skipped,
+                nodes_by_key[node_key].path(),
+            )
+
+    # Wire deferred cross-level connections (all nodes exist now)
+    with timer.phase("connections"):
+        _wire_deferred_cross_connections(parent)
+
+    # Apply flags last to avoid premature cooking
+    with timer.phase("flags"):
+        for node, flags in pending_flags:
+            _apply_flags(node, flags)
+
+    return created_nodes
 
 
 # ══════════════════════════════════════════════════════════════════
@@ -1110,18 +2286,29 @@ def _deserialize_node(parent, node_data, name_remap):
 # ══════════════════════════════════════════════════════════════════
 
 
-def deserialize_network(json_path, parent_path):
+def deserialize_network(json_path, parent_path, timings=None):
     """Recreate a Houdini node network from a JSON file.
 
     All operations are wrapped in a single undo group for atomic rollback.
     If the target parent already contains nodes with the same names,
     they are auto-renamed and an internal name remap dict ensures
-    connections are wired correctly.
+    connections are wired correctly. Schema v2 files are streamed record
+    by record; schema v1 files and gzip compressed files are also read,
+    and delta files from serialize_network_delta are applied on top of
+    their base snapshot.
+
+    Houdini is switched to manual updates while the network is built, so
+    nothing cooks until the end. Plain parameter values are set one
+    parameter tuple at a time and keyframes with one setKeyframes call per
+    parameter. The time spent per phase is logged.
 
     Args:
         json_path (str | Path): Path to the JSON file to read.
         parent_path (str): Parent node path where nodes will be created
             (e.g. "/obj/geo1").
+        timings (dict | None): If given, filled with the seconds spent in
+            each phase: 'create', 'params', 'keys', 'connections', 'flags'
+            and 'total'.
 
     Returns:
         List of top-level hou.Node objects created.
@@ -1131,6 +2318,7 @@ def deserialize_network(json_path, parent_path):
             is unsupported.
         FileNotFoundError: If the JSON file does not exist.
     """
+    start = time.perf_counter()
     json_path = Path(json_path)
     if not json_path.exists():
         raise FileNotFoundError(f"JSON file not found: {json_path}")
@@ -1139,35 +2327,23 @@ def deserialize_network(json_path, parent_path):
     if parent is None:
         raise ValueError(f"Parent node not found: {parent_path!r}")
 
-    with open(json_path, encoding="utf-8") as f:
-        data = json.load(f)
-
-    version = data.get("version", 0)
-    if version != _SCHEMA_VERSION:
-        raise ValueError(f"Unsupported schema version {version} (expected {_SCHEMA_VERSION})")
-
-    created_nodes = []
-    name_remap = {}
-
-    with hou.undos.group("Deserialize Network"):
-        # Phase 1: Create all nodes with parameters
-        for node_data in data.get("nodes", []):
-            node = _deserialize_node(parent, node_data, name_remap)
-            if node is not None:
-                created_nodes.append(node)
-
-        # Phase 2: Recreate top-level connections
-        _recreate_connections(parent, data.get("connections", []), name_remap)
-
-        # Phase 2b: Wire deferred cross-level connections (all nodes exist now)
-        _wire_deferred_cross_connections(parent)
-
-        # Phase 3: Network boxes and sticky notes
-        _recreate_network_boxes(parent, data.get("network_boxes", []), name_remap)
-        _recreate_sticky_notes(parent, data.get("sticky_notes", []))
-
-        # Phase 4: Apply flags recursively (last to avoid premature cooking)
-        _apply_flags_recursive(parent, data.get("nodes", []), name_remap)
-
-    logger.info("Deserialized %d nodes into %s", len(created_nodes), parent_path)
+    records = iter_network_records(json_path)
+    # Read the header first so version errors are raised before the undo group opens
+    next(records)
+
+    timer = _PhaseTimer()
+    with hou.undos.group("Deserialize Network"), _cooking_suspended():
+        created_nodes = _deserialize_records(parent, records, timer)
+
+    seconds = dict(timer.seconds, total=time.perf_counter() - start)
+    if timings is not None:
+        timings.update(seconds)
+
+    logger.info(
+        "Deserialized %d nodes into %s in %.3fs (%s)",
+        len(created_nodes),
+        parent_path,
+        seconds["total"],
+        ", ".join(f"{name} {seconds[name]:.3f}s" for name in _PhaseTimer.PHASES),
+    )
     return created_nodes
@@ -23,7 +23,7 @@ def __getattr__(name):
         AttributeError: If the attribute doesn't exist.
     """
     # List of available submodules
-    _available_submodules = ["bvh_importer"]
+    _available_submodules = ["bvh_batch", "bvh_importer", "bvh_parser"]
 
     if name in _available_submodules:
         # Check if already loaded
@@ -0,0 +1,412 @@
+"""Headless batch conversion of BVH takes into a compact cache.
+
+Parses many .bvh files in parallel worker processes with
+:mod:`bvh_parser` and stores each take as a compressed ``.npz`` file
+holding a JSON header (hierarchy, frame time, source info) and a float32
+motion array. Cache entries are keyed by the source file's size, mtime
+and SHA-1 hash, so re-runs only parse takes that changed.
+
+Nothing here needs Maya; run it from ``mayapy`` or any Python with NumPy:
+
+    mayapy -m mayaLib.animationLib.bvh_batch mocap/ --cache mocap/.bvh_cache
+
+Example:
+    >>> from mayaLib.animationLib import bvh_batch
+    >>> rows = bvh_batch.batch_convert_bvh(["mocap/"], "mocap/.bvh_cache")
+    >>> data = bvh_batch.load_bvh_cache(rows[0]["cache"])
+"""
+
+__all__ = [
+    "CACHE_FORMAT",
+    "CACHE_VERSION",
+    "batch_convert_bvh",
+    "cache_path_for",
+    "collect_bvh_files",
+    "convert_bvh_file",
+    "format_batch_report",
+    "load_bvh_cache",
+    "read_cache_header",
+    "save_bvh_cache",
+]
+
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from mayaLib.animationLib.bvh_parser import BVHData, BVHJoint, parse_bvh
+
+CACHE_FORMAT = "devpylib-bvh"
+CACHE_VERSION = 1
+
+
+def collect_bvh_files(paths):
+    """Expand files and directories into a sorted list of .bvh files.
+
+    Args:
+        paths: File or directory paths. Directories are searched recursively.
+
+    Returns:
+        list[str]: Absolute paths of every .bvh file found, without duplicates.
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+
+    found = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in files:
+                    if name.lower().endswith(".bvh"):
+                        found.add(os.path.abspath(os.path.join(root, name)))
+        elif os.path.isfile(path):
+            found.add(os.path.abspath(path))
+    return sorted(found)
+
+
+def cache_path_for(file_path, cache_dir):
+    """Return the cache file used for a BVH take.
+
+    The name keeps the take name readable and adds a hash of the absolute
+    source path so takes with the same name in different folders do not
+    collide.
+
+    Args:
+        file_path: Path of the .bvh file.
+        cache_dir: Directory holding the cache files.
+
+    Returns:
+        str: Path of the ``.npz`` cache file.
+    """
+    abs_path = os.path.abspath(file_path)
+    stem = os.path.splitext(os.path.basename(abs_path))[0]
+    digest = hashlib.sha1(abs_path.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(cache_dir, f"{stem}_{digest}.npz")
+
+
+def save_bvh_cache(cache_path, data, source=None):
+    """Write a parsed take to a cache file.
+
+    The file is written next to its final location and moved into place,
+    so an interrupted run never leaves a truncated cache entry behind.
+
+    Args:
+        cache_path: Destination ``.npz`` path.
+        data: Parsed BVHData.
+        source: Optional dict describing the source file (path, size,
+            mtime_ns, sha1) used for cache validation.
+    """
+    header = {
+        "format": CACHE_FORMAT,
+        "version": CACHE_VERSION,
+        "source": source or {},
+        "frameTime": data.frame_time,
+        "frames": data.num_frames,
+        "channels": data.num_channels,
+        "joints": [
+            {
+                "name": joint.name,
+                "parent": joint.parent,
+                "offset": list(joint.offset),
+                "channels": joint.channels,
+                "channelStart": joint.channel_start,
+                "endSite": list(joint.end_site) if joint.end_site is not None else None,
+            }
+            for joint in data.joints
+        ],
+    }
+    _write_cache(cache_path, header, data.motion.astype(np.float32))
+
+
+def _write_cache(cache_path, header, motion):
+    """Write a header and a float32 motion array to a cache file atomically.
+
+    Args:
+        cache_path: Destination ``.npz`` path.
+        header: JSON serializable header dict.
+        motion: Float32 motion array.
+    """
+    header_bytes = np.frombuffer(json.dumps(header).encode("utf-8"), dtype=np.uint8)
+
+    os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez_compressed(f, header=header_bytes, motion=motion)
+    os.replace(tmp_path, cache_path)
+
+
+def _update_cache_source(cache_path, header, source):
+    """Store new source info in a cache file, keeping its motion.
+
+    Used when a take was touched but its content hash still matches, so
+    the next run hits the cheap size and mtime check again.
+
+    Args:
+        cache_path: Path of the ``.npz`` cache file.
+        header: Header read from the file.
+        source: Source info replacing ``header["source"]``.
+    """
+    with np.load(cache_path) as archive:
+        motion = archive["motion"]
+    _write_cache(cache_path, {**header, "source": source}, motion)
+
+
+def read_cache_header(cache_path):
+    """Read only the JSON header of a cache file.
+
+    Args:
+        cache_path: Path of the ``.npz`` cache file.
+
+    Returns:
+        dict | None: The header, or None if the file is missing, corrupt or
+        is not a cache file of the current version.
+    """
+    try:
+        with np.load(cache_path) as archive:
+            header = json.loads(archive["header"].tobytes().decode("utf-8"))
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+
+    if header.get("format") != CACHE_FORMAT or header.get("version") != CACHE_VERSION:
+        return None
+    return header
+
+
+def load_bvh_cache(cache_path):
+    """Load a cached take.
+
+    Args:
+        cache_path: Path of the ``.npz`` cache file.
+
+    Returns:
+        BVHData: Hierarchy and float32 motion array.
+
+    Raises:
+        ValueError: If the file is not a BVH cache file.
+    """
+    with np.load(cache_path) as archive:
+        header = json.loads(archive["header"].tobytes().decode("utf-8"))
+        if header.get("format") != CACHE_FORMAT:
+            raise ValueError(f"Not a BVH cache file: {cache_path}")
+        motion = archive["motion"]
+
+    joints = [
+        BVHJoint(
+            name=joint["name"],
+            parent=joint["parent"],
+            offset=tuple(joint["offset"]),
+            channels=joint["channels"],
+            channel_start=joint["channelStart"],
+            end_site=tuple(joint["endSite"]) if joint["endSite"] is not None else None,
+        )
+        for joint in header["joints"]
+    ]
+    return BVHData(joints=joints, frame_time=header["frameTime"], motion=motion)
+
+
+def convert_bvh_file(file_path, cache_path, force=False):
+    """Parse one take into the cache unless its cache entry is current.
+
+    A cache entry is current when the source size and mtime match. If only
+    the mtime changed (e.g. the file was copied or touched) the content
+    hash decides, so unchanged takes are not parsed again; the new mtime is
+    then written to the cache header so later runs skip hashing too.
+    Unreadable cache files are treated as stale.
+
+    Runs in worker processes, so it never raises: failures are reported
+    in the returned row.
+
+    Args:
+        file_path: Path of the .bvh file.
+        cache_path: Path of its cache file.
+        force: Parse even if the cache entry is current. Defaults to False.
+
+    Returns:
+        dict: Report row with file, cache, status (``"parsed"``,
+        ``"cached"`` or ``"error"``), frames, channels, seconds and error.
+    """
+    row = _error_row(file_path, cache_path)
+    start = time.perf_counter()
+    try:
+        stat = os.stat(file_path)
+        header = None if force else read_cache_header(cache_path)
+        cached = header["source"] if header else {}
+
+        if (
+            header
+            and cached.get("size") == stat.st_size
+            and cached.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            status = "cached"
+        else:
+            with open(file_path, "rb") as f:
+                raw = f.read()
+            digest = hashlib.sha1(raw).hexdigest()
+            source = {
+                "path": file_path,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha1": digest,
+            }
+            if header and cached.get("sha1") == digest:
+                _update_cache_source(cache_path, header, source)
+                status = "cached"
+            else:
+                data = parse_bvh(io.StringIO(raw.decode("utf-8")))
+                save_bvh_cache(cache_path, data, source)
+                row["frames"] = data.num_frames
+                row["channels"] = data.num_channels
+                status = "parsed"
+
+        if status == "cached":
+            row["frames"] = header["frames"]
+            row["channels"] = header["channels"]
+        row["status"] = status
+    except Exception as exc:
+        row["error"] = f"{type(exc).__name__}: {exc}"
+
+    row["seconds"] = time.perf_counter() - start
+    return row
+
+
+def _error_row(file_path, cache_path, error=""):
+    """Return a report row for a take that failed to convert.
+
+    Args:
+        file_path: Path of the .bvh file.
+        cache_path: Path of its cache file.
+        error: Error message.
+
+    Returns:
+        dict: Row in the :func:`convert_bvh_file` layout.
+    """
+    return {
+        "file": file_path,
+        "cache": cache_path,
+        "status": "error",
+        "frames": 0,
+        "channels": 0,
+        "seconds": 0.0,
+        "error": error,
+    }
+
+
+def format_batch_report(rows, total_time, title="BVH batch"):
+    """Format the per-take summary printed after a batch run.
+
+    Args:
+        rows: Rows returned by :func:`convert_bvh_file`.
+        total_time: Wall clock time of the whole batch in seconds.
+        title: First word(s) of the report heading.
+
+    Returns:
+        str: Multi-line report listing every take and the totals.
+    """
+    counts = dict.fromkeys(("parsed", "cached", "error"), 0)
+    for row in rows:
+        counts[row["status"]] += 1
+
+    name_width = max([len("take")] + [len(os.path.basename(row["file"])) for row in rows])
+    lines = [
+        f"{title}: {len(rows)} takes in {total_time:.2f}s "
+        f"({counts['parsed']} parsed, {counts['cached']} cached, {counts['error']} failed)",
+        f"{'take':<{name_width}}  {'status':>6}  {'frames':>7}  {'chans':>5}  {'time':>8}",
+    ]
+    for row in rows:
+        line = (
+            f"{os.path.basename(row['file']):<{name_width}}  {row['status']:>6}  "
+            f"{row['frames']:>7}  {row['channels']:>5}  {row['seconds']:>7.3f}s"
+        )
+        if row["error"]:
+            line += f"  {row['error']}"
+        lines.append(line)
+    lines.append(
+        f"{'total':<{name_width}}  {'':>6}  {sum(row['frames'] for row in rows):>7}  "
+        f"{'':>5}  {sum(row['seconds'] for row in rows):>7.3f}s"
+    )
+    return "\n".join(lines)
+
+
+def batch_convert_bvh(
+    paths, cache_dir, max_workers=None, force=False, progress_callback=None, verbose=True
+):
+    """Convert a mocap library into the BVH cache using worker processes.
+
+    Args:
+        paths: .bvh files and/or directories to search recursively.
+        cache_dir: Directory receiving the cache files.
+        max_workers: Worker process count. Defaults to the CPU count.
+        force: Re-parse every take even if its cache is current.
+        progress_callback: Optional ``callback(percent, message)``.
+        verbose: Print the summary report. Defaults to True.
+
+    Returns:
+        list[dict]: One report row per take, sorted by file path.
+    """
+    files = collect_bvh_files(paths)
+    if not files:
+        return []
+
+    os.makedirs(cache_dir, exist_ok=True)
+    start = time.perf_counter()
+    rows = []
+    workers = min(max_workers or os.cpu_count() or 1, len(files))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for file_path in files:
+            cache_path = cache_path_for(file_path, cache_dir)
+            future = executor.submit(convert_bvh_file, file_path, cache_path, force)
+            futures[future] = (file_path, cache_path)
+
+        for done, future in enumerate(as_completed(futures), 1):
+            try:
+                row = future.result()
+            except Exception as exc:
+                # The worker itself died (e.g. a broken pool); keep the batch going
+                row = _error_row(*futures[future], f"{type(exc).__name__}: {exc}")
+            rows.append(row)
+            if progress_callback:
+                progress_callback(
+                    int(100 * done / len(files)),
+                    f"{row['status']}: {os.path.basename(row['file'])}",
+                )
+
+    rows.sort(key=lambda row: row["file"])
+    if verbose:
+        print(format_batch_report(rows, time.perf_counter() - start))
+    return rows
+
+
+def main(argv=None):
+    """Command line entry point.
+
+    Args:
+        argv: Argument list, defaults to ``sys.argv[1:]``.
+
+    Returns:
+        int: Exit code, 1 if any take failed to convert.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert BVH takes into a NumPy cache")
+    parser.add_argument("paths", nargs="+", help=".bvh files or directories")
+    parser.add_argument("--cache", required=True, help="Cache directory")
+    parser.add_argument("--workers", type=int, default=None, help="Worker process count")
+    parser.add_argument("--force", action="store_true", help="Ignore existing cache entries")
+
+    args = parser.parse_args(argv)
+    rows = batch_convert_bvh(args.paths, args.cache, max_workers=args.workers, force=args.force)
+    if not rows:
+        print("No .bvh files found")
+    return int(any(row["status"] == "error" for row in rows))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
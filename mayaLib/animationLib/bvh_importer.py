@@ -5,6 +5,9 @@ BVH is a common ASCII motion capture data format containing skeletal
 and motion data. Provides utilities for importing BVH motion capture
 data onto Maya skeletons with UI dialog and retargeting support.
 
+Parsing lives in the Maya independent :mod:`bvh_parser` module; this
+module builds the joints and writes all keys of a channel in one call.
+
 License:
     GNU General Public License v3.0 or later.
     Copyright (C) 2012 Jeroen Hoolmans.
@@ -23,8 +26,11 @@ __status__ = "Production"
 import os
 
 import maya.cmds as mc
+import numpy as np
 import pymel.core as pm
 
+from mayaLib.animationLib import bvh_parser
+
 # This maps the BVH naming convention to Maya
 TRANSLATION_DICT = {
     "Xposition": "translateX",
@@ -36,6 +42,72 @@ TRANSLATION_DICT = {
 }
 
 
+def key_channels(channels, values, start_frame=0):
+    """Key every frame of several channels with one API call per channel.
+
+    Each column of ``values`` is written to its plug with a single
+    ``MFnAnimCurve.addKeys`` call instead of one ``setKeyframe`` per frame.
+    Values are in UI units (degrees and scene linear units), as with
+    ``setKeyframe``.
+
+    Args:
+        channels: Plug names (``node.attribute``), one per column of ``values``.
+        values: Array of shape ``(frames, len(channels))``.
+        start_frame: Frame of the first row. Defaults to 0.
+
+    Returns:
+        list[str]: Names of the anim curves that received the keys.
+
+    Raises:
+        ValueError: If the column count does not match the channel count.
+    """
+    import maya.api.OpenMaya as om2  # noqa: N813 - Maya API alias
+    import maya.api.OpenMayaAnim as oma2  # noqa: N813 - Maya API alias
+
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim != 2 or values.shape[1] != len(channels):
+        raise ValueError(f"Expected {len(channels)} value columns, got shape {values.shape}")
+
+    time_unit = om2.MTime.uiUnit()
+    times = om2.MTimeArray([om2.MTime(start_frame + ii, time_unit) for ii in range(len(values))])
+    # API curves store radians and internal linear units
+    angle_scale = om2.MAngle.uiToInternal(1.0)
+    distance_scale = om2.MDistance.uiToInternal(1.0)
+
+    curve_names = []
+    for column, channel in enumerate(channels):
+        selection = om2.MSelectionList()
+        selection.add(channel)
+        plug = selection.getPlug(0)
+
+        curve_fn = oma2.MFnAnimCurve()
+        sources = plug.connectedTo(True, False)
+        if sources and sources[0].node().hasFn(om2.MFn.kAnimCurve):
+            curve_fn.setObject(sources[0].node())
+        else:
+            curve_fn.create(plug)
+            node_name, attr_name = channel.rsplit("|", 1)[-1].rsplit(".", 1)
+            om2.MFnDependencyNode(curve_fn.object()).setName(f"{node_name}_{attr_name}")
+
+        curve_type = curve_fn.animCurveType
+        if curve_type == oma2.MFnAnimCurve.kAnimCurveTA:
+            scale = angle_scale
+        elif curve_type == oma2.MFnAnimCurve.kAnimCurveTL:
+            scale = distance_scale
+        else:
+            scale = 1.0
+
+        curve_fn.addKeys(
+            times,
+            (values[:, column] * scale).tolist(),
+            oma2.MFnAnimCurve.kTangentGlobal,
+            oma2.MFnAnimCurve.kTangentGlobal,
+        )
+        curve_names.append(curve_fn.name())
+
+    return curve_names
+
+
 class TinyDAG:
     """Small helper class to keep track of parent hierarchy."""
 
@@ -186,132 +258,94 @@ class BVHImporterDialog:
         self._read_bvh()
 
     def _read_bvh(self, e=False):
-        # Safe close is needed for End Site part to keep from setting new parent.
-        safe_close = False
-        # Once motion is active, animate.
-        motion = False
-        # Clear channels before appending
-        self._channels = []
-
         # Scale the entire rig and animation
         rig_scale = mc.floatField(self._scale_field, q=True, value=True)
         frame = mc.intField(self._frame_field, q=True, value=True)
         rot_order = mc.optionMenu(self._rotation_order, q=True, select=True) - 1
 
-        with open(self._filename, encoding="utf-8") as f:
-            # Check to see if the file is valid (sort of)
-            if not next(f).startswith("HIERARCHY"):
-                mc.error("No valid .bvh file selected.")
-                return False
-
-            if self._root_node is None:
-                # Create a group for the rig, easier to scale.
-                # (Freeze transform when ungrouping please)
-                mocap_name = os.path.basename(self._filename)
-                grp = pm.group(em=True, name=f"_mocap_{mocap_name}_grp")
-                grp.scale.set(rig_scale, rig_scale, rig_scale)
-
-                # The group is now the 'root'
-                my_parent = TinyDAG(str(grp), None)
+        try:
+            data = bvh_parser.read_bvh(self._filename)
+        except (OSError, ValueError) as exc:
+            mc.error(f"No valid .bvh file selected: {exc}")
+            return False
+
+        if self._root_node is None:
+            # Create a group for the rig, easier to scale.
+            # (Freeze transform when ungrouping please)
+            mocap_name = os.path.basename(self._filename)
+            grp = pm.group(em=True, name=f"_mocap_{mocap_name}_grp")
+            grp.scale.set(rig_scale, rig_scale, rig_scale)
+            joint_paths = self._build_skeleton(data, TinyDAG(str(grp), None), rot_order)
+        else:
+            self._clear_animation()
+            joint_paths = self._build_skeleton(data, None, rot_order)
+
+        # Collect the channels that are animated, in motion column order
+        self._channels = [
+            f"{joint_paths[joint_index]}.{TRANSLATION_DICT[channel]}"
+            for _, joint_index, channel in data.iter_channels()
+        ]
+        if self._debug:
+            print(f"Frames: {data.num_frames}, channels: {len(self._channels)}")
+
+        key_channels(self._channels, data.motion, start_frame=frame)
+        return True
+
+    def _build_skeleton(self, data, group, rot_order):
+        """Create or update the joints described by a parsed BVH file.
+
+        Args:
+            data: Parsed BVHData.
+            group: TinyDAG of the mocap group the ROOT is parented to, or
+                None when targeting an existing skeleton.
+            rot_order: Rotate order index applied to every joint.
+
+        Returns:
+            list[str]: Full DAG path of every joint, in BVH joint order.
+        """
+        joint_dags = []
+        for index, bvh_joint in enumerate(data.joints):
+            if bvh_joint.parent >= 0:
+                parent = joint_dags[bvh_joint.parent]
+                dag = TinyDAG(bvh_joint.name, parent)
+            elif self._root_node is not None:
+                # Set the Hip joint as root
+                parent = None
+                dag = TinyDAG(str(self._root_node), None)
             else:
-                my_parent = TinyDAG(str(self._root_node), None)
-                self._clear_animation()
-
-            for line in f:
-                line = line.replace("	", " ")  # force spaces
-                if not motion:
-                    # root joint
-                    if line.startswith("ROOT"):
-                        # Set the Hip joint as root
-                        if self._root_node:
-                            my_parent = TinyDAG(str(self._root_node), None)
-                        else:
-                            my_parent = TinyDAG(line[5:].rstrip(), my_parent)
-
-                    if "JOINT" in line:
-                        jnt = line.split(" ")
-                        # Create the joint
-                        my_parent = TinyDAG(jnt[-1].rstrip(), my_parent)
-
-                    if "End Site" in line:
-                        # Finish up a hierarchy and ignore a closing bracket
-                        safe_close = True
-
-                    if "}" in line:
-                        # Ignore when safe_close is on
-                        if safe_close:
-                            safe_close = False
-                            continue
-
-                        # Go up one level
-                        if my_parent is not None:
-                            my_parent = my_parent.p_obj
-                            if my_parent is not None:
-                                mc.select(my_parent._full_path())
-
-                    if "CHANNELS" in line:
-                        chan = line.strip().split(" ")
-                        if self._debug:
-                            print(chan)
-
-                        # Append the channels that are animated
-                        if my_parent is not None:
-                            for i in range(int(chan[1])):
-                                parent_path = my_parent._full_path()
-                                attr = TRANSLATION_DICT[chan[2 + i]]
-                                channel = f"{parent_path}.{attr}"
-                                self._channels.append(channel)
-
-                    if "OFFSET" in line and my_parent is not None:
-                        offset = line.strip().split(" ")
-                        if self._debug:
-                            print(offset)
-                        jnt_name = str(my_parent)
-
-                        # When End Site is reached, name it "_tip"
-                        if safe_close:
-                            jnt_name += "_tip"
-
-                        # skip if exists
-                        if mc.objExists(my_parent._full_path()):
-                            jnt = pm.PyNode(my_parent._full_path())
-                            jnt.rotateOrder.set(rot_order)
-                            jnt.translate.set(
-                                [float(offset[1]), float(offset[2]), float(offset[3])]
-                            )
-                            continue
-
-                        # Build the joint and set its properties
-                        jnt = pm.joint(name=jnt_name, p=(0, 0, 0))
-                        jnt.translate.set([float(offset[1]), float(offset[2]), float(offset[3])])
-                        jnt.rotateOrder.set(rot_order)
-
-                    if "MOTION" in line:
-                        # Animate!
-                        motion = True
-
-                    if self._debug and my_parent is not None:
-                        print(f"parent: {my_parent._full_path()}")
-
-                else:
-                    # We don't really need to use Framecount and time
-                    # (since Python handles file reads nicely)
-                    if "Frame" not in line:
-                        data = line.split(" ")
-                        if len(data) > 0 and data[0] == "":
-                            data.pop(0)
-
-                        if self._debug:
-                            print("Animating..")
-                            print(f"Data size: {len(data)}")
-                            print(f"Channels size: {len(self._channels)}")
-                        # Set the values to channels
-                        for x in range(0, len(data) - 1):
-                            if self._debug:
-                                print(f"Set Attribute: {self._channels[x]} {float(data[x])}")
-                            mc.setKeyframe(self._channels[x], time=frame, value=float(data[x]))
-
-                        frame = frame + 1
+                parent = group
+                dag = TinyDAG(bvh_joint.name, group)
+            joint_dags.append(dag)
+
+            if self._debug:
+                print(f"joint {index}: {dag._full_path()} {bvh_joint.offset}")
+
+            jnt = self._ensure_joint(dag, parent, bvh_joint.name)
+            # Maya may rename new joints on clashes; children must follow
+            dag.obj = jnt.nodeName()
+            jnt.rotateOrder.set(rot_order)
+            jnt.translate.set(list(bvh_joint.offset))
+
+            if bvh_joint.end_site is not None:
+                # When End Site is reached, name it "_tip"
+                tip_dag = TinyDAG(f"{bvh_joint.name}_tip", dag)
+                tip = self._ensure_joint(tip_dag, dag, tip_dag.obj)
+                tip.rotateOrder.set(rot_order)
+                tip.translate.set(list(bvh_joint.end_site))
+
+        return [dag._full_path() for dag in joint_dags]
+
+    @staticmethod
+    def _ensure_joint(dag, parent, name):
+        """Return the joint at a DAG path, creating it under its parent if missing."""
+        if mc.objExists(dag._full_path()):
+            return pm.PyNode(dag._full_path())
+
+        if parent is not None:
+            mc.select(parent._full_path(), replace=True)
+        else:
+            mc.select(clear=True)
+        return pm.joint(name=name, p=(0, 0, 0))
 
     def _clear_animation(self):
         # select root joint
@@ -0,0 +1,275 @@
+"""Maya independent BVH (BioVision Hierarchy) parser.
+
+Reads the HIERARCHY section of a .bvh file line by line into a flat joint
+list and the MOTION section with a single vectorized conversion into a
+``(frames x channels)`` NumPy array. Nothing in this module touches Maya,
+so it can be used in batch tools and unit tests.
+
+Example:
+    >>> from mayaLib.animationLib import bvh_parser
+    >>> data = bvh_parser.read_bvh("walk.bvh")
+    >>> data.motion.shape
+    (120, 69)
+    >>> data.joint_path(3)
+    'Hips|Spine|Spine1|Neck'
+"""
+
+__all__ = [
+    "BVHJoint",
+    "BVHData",
+    "parse_bvh",
+    "read_bvh",
+]
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+VALID_CHANNELS = (
+    "Xposition",
+    "Yposition",
+    "Zposition",
+    "Xrotation",
+    "Yrotation",
+    "Zrotation",
+)
+
+
+@dataclass
+class BVHJoint:
+    """Single joint of a BVH hierarchy.
+
+    Attributes:
+        name: Joint name as written in the file.
+        parent: Index of the parent joint, -1 for ROOT joints.
+        offset: Rest offset from the parent joint.
+        channels: Animated channel names in file order (e.g. ``Xrotation``).
+        channel_start: Column of the first channel in the motion array.
+        end_site: Offset of the End Site block, None if the joint has none.
+    """
+
+    name: str
+    parent: int = -1
+    offset: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    channels: list[str] = field(default_factory=list)
+    channel_start: int = 0
+    end_site: tuple[float, float, float] | None = None
+
+
+@dataclass
+class BVHData:
+    """Parsed BVH file.
+
+    Attributes:
+        joints: Joints in file order; parents always precede their children.
+        frame_time: Seconds per frame from the ``Frame Time`` line.
+        motion: Channel values with shape ``(frames, channels)``.
+    """
+
+    joints: list[BVHJoint]
+    frame_time: float = 0.0
+    motion: np.ndarray = field(default_factory=lambda: np.zeros((0, 0)))
+
+    @property
+    def num_frames(self):
+        """Number of motion frames."""
+        return self.motion.shape[0]
+
+    @property
+    def num_channels(self):
+        """Total number of animated channels."""
+        return sum(len(joint.channels) for joint in self.joints)
+
+    def joint_path(self, index, separator="|"):
+        """Return the hierarchy path of a joint.
+
+        Args:
+            index: Joint index.
+            separator: Path separator. Defaults to the Maya DAG separator.
+
+        Returns:
+            str: Joint names from the root down to the joint.
+        """
+        names = []
+        while index >= 0:
+            joint = self.joints[index]
+            names.append(joint.name)
+            index = joint.parent
+        return separator.join(reversed(names))
+
+    def iter_channels(self):
+        """Iterate over every animated channel in motion column order.
+
+        Yields:
+            tuple: ``(column, joint_index, channel_name)``.
+        """
+        for joint_index, joint in enumerate(self.joints):
+            for ii, channel in enumerate(joint.channels):
+                yield joint.channel_start + ii, joint_index, channel
+
+
+def _parse_offset(tokens, line_number):
+    """Parse the three floats of an OFFSET line."""
+    if len(tokens) != 4:
+        raise ValueError(f"Line {line_number}: OFFSET needs three values")
+    return float(tokens[1]), float(tokens[2]), float(tokens[3])
+
+
+def _parse_hierarchy(stream):
+    """Read the HIERARCHY section up to and including the MOTION line.
+
+    Args:
+        stream: Text stream positioned at the start of the file.
+
+    Returns:
+        list[BVHJoint]: Joints in file order.
+
+    Raises:
+        ValueError: If the hierarchy is malformed.
+    """
+    first_line = stream.readline()
+    if not first_line.strip().startswith("HIERARCHY"):
+        raise ValueError("Not a BVH file: missing HIERARCHY header")
+
+    joints = []
+    stack = []
+    in_end_site = False
+    channel_count = 0
+    line_number = 1
+
+    while True:
+        line = stream.readline()
+        line_number += 1
+        if not line:
+            raise ValueError("Unexpected end of file: missing MOTION section")
+
+        tokens = line.split()
+        if not tokens:
+            continue
+        keyword = tokens[0]
+
+        if keyword in ("ROOT", "JOINT"):
+            if len(tokens) < 2:
+                raise ValueError(f"Line {line_number}: {keyword} without a name")
+            parent = stack[-1] if stack else -1
+            if keyword == "JOINT" and parent < 0:
+                raise ValueError(f"Line {line_number}: JOINT outside of a ROOT")
+            joints.append(BVHJoint(name=tokens[-1], parent=parent))
+            stack.append(len(joints) - 1)
+        elif keyword == "End":
+            if not stack:
+                raise ValueError(f"Line {line_number}: End Site outside of a joint")
+            in_end_site = True
+        elif keyword == "OFFSET":
+            offset = _parse_offset(tokens, line_number)
+            if in_end_site:
+                joints[stack[-1]].end_site = offset
+            elif stack:
+                joints[stack[-1]].offset = offset
+        elif keyword == "CHANNELS":
+            if not stack or in_end_site:
+                raise ValueError(f"Line {line_number}: CHANNELS outside of a joint")
+            if len(tokens) < 2:
+                raise ValueError(f"Line {line_number}: CHANNELS needs a count")
+            count = int(tokens[1])
+            channels = tokens[2:]
+            if len(channels) != count or not set(channels) <= set(VALID_CHANNELS):
+                raise ValueError(f"Line {line_number}: invalid CHANNELS {channels}")
+            joint = joints[stack[-1]]
+            joint.channels = channels
+            joint.channel_start = channel_count
+            channel_count += count
+        elif keyword == "}":
+            if in_end_site:
+                in_end_site = False
+            elif stack:
+                stack.pop()
+            else:
+                raise ValueError(f"Line {line_number}: unbalanced closing bracket")
+        elif keyword == "MOTION":
+            break
+
+    if stack:
+        raise ValueError("Unbalanced brackets in HIERARCHY section")
+    if not joints:
+        raise ValueError("BVH file contains no joints")
+    return joints
+
+
+def _parse_motion_header(stream):
+    """Read the ``Frames:`` and ``Frame Time:`` lines.
+
+    Args:
+        stream: Text stream positioned after the MOTION line.
+
+    Returns:
+        tuple: ``(frame_count, frame_time)``.
+
+    Raises:
+        ValueError: If either line is missing.
+    """
+    header = {}
+    while len(header) < 2:
+        line = stream.readline()
+        if not line:
+            raise ValueError("Unexpected end of file in MOTION header")
+        if not line.strip():
+            continue
+        key, _, value = line.partition(":")
+        key = key.strip().lower()
+        if key not in ("frames", "frame time"):
+            raise ValueError(f"Unexpected line in MOTION header: {line.strip()!r}")
+        header[key] = value.strip()
+    return int(header["frames"]), float(header["frame time"])
+
+
+def parse_bvh(stream):
+    """Parse a BVH file from a text stream.
+
+    The hierarchy is read line by line; the motion block is read in one go
+    and converted with a single NumPy call, which is what keeps large
+    captures fast.
+
+    Args:
+        stream: Readable text stream (open file or ``io.StringIO``).
+
+    Returns:
+        BVHData: Parsed hierarchy and motion.
+
+    Raises:
+        ValueError: If the file is malformed or the motion block is not a
+            whole number of frames.
+    """
+    joints = _parse_hierarchy(stream)
+    frame_count, frame_time = _parse_motion_header(stream)
+    channel_count = sum(len(joint.channels) for joint in joints)
+
+    values = np.array(stream.read().split(), dtype=np.float64)
+    if channel_count == 0:
+        motion = np.zeros((frame_count, 0))
+    elif values.size % channel_count:
+        raise ValueError(
+            f"Motion block has {values.size} values, not a multiple of {channel_count} channels"
+        )
+    else:
+        # Trust the data over the Frames line, which some exporters get wrong
+        motion = values.reshape(-1, channel_count)
+
+    return BVHData(joints=joints, frame_time=frame_time, motion=motion)
+
+
+def read_bvh(file_path):
+    """Parse a BVH file from disk.
+
+    Args:
+        file_path: Path to the .bvh file.
+
+    Returns:
+        BVHData: Parsed hierarchy and motion.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is malformed.
+    """
+    with open(file_path, encoding="utf-8") as f:
+        return parse_bvh(f)
@@ -180,12 +180,16 @@ def bf_add_input_port(bifrost_shape, node, port_name, port_type, port_children="
             "/" + node,
             input_port=True,
             output_port=False,
-            listPortChildren=port_children,
+            list_port_children=port_children,
         )
     else:
         cmds.vnnNode(bifrost_shape, node, createInputPort=(port_name, port_type))
         all_port_list = bf_list_all_port(
-            bifrost_shape, node, input_port=True, output_port=False, listPortChildren=port_children
+            bifrost_shape,
+            node,
+            input_port=True,
+            output_port=False,
+            list_port_children=port_children,
         )
 
     input_port_list = []
@@ -217,12 +221,16 @@ def bf_add_output_port(bifrost_shape, node, port_name, port_type, port_children=
             "/" + node,
             input_port=False,
             output_port=True,
-            listPortChildren=port_children,
+            list_port_children=port_children,
         )
     else:
         cmds.vnnNode(bifrost_shape, node, createOutputPort=(port_name, port_type))
         all_port_list = bf_list_all_port(
-            bifrost_shape, node, input_port=False, output_port=True, listPortChildren=port_children
+            bifrost_shape,
+            node,
+            input_port=False,
+            output_port=True,
+            list_port_children=port_children,
         )
 
     output_port_list = []
@@ -2,16 +2,26 @@
 
 Provides high-level composition of Bifrost graphs with Maya
 USD proxy stages.
+
+The builder keeps a :class:`BifrostGraphModel` of the prims it creates, so
+checking whether a prim exists or is already linked does not query the
+graph, and the transform connections of the Maya hierarchy are read in one
+pass before the prims are built.
 """
 
 import contextlib
 
+import maya.api.OpenMaya as om2  # noqa: N813 - Maya API alias
 import maya.cmds as cmds
 
 from mayaLib.bifrostLib import bifrost_api as bifrost
 from mayaLib.bifrostLib import bifrost_util_nodes
 from mayaLib.rigLib.utils.util import list_objects_under_group
 
+DEFINE_USD_MESH = "BifrostGraph,USD::Prim,define_usd_mesh"
+DEFINE_USD_PRIM = "BifrostGraph,USD::Prim,define_usd_prim"
+TRANSFORM_ATTRIBUTES = ("translate", "rotate", "scale")
+
 
 def get_all_deformed_and_constrained(group):
     """Get all mesh deformed and constrained under a group.
@@ -37,6 +47,275 @@ def get_all_deformed_and_constrained(group):
     return deformed_list, undeformed_list
 
 
+def get_parent_path(full_path):
+    """Get the full path of the parent of a DAG object.
+
+    Args:
+        full_path (str): Full path of the Maya object.
+
+    Returns:
+        str: Full path of the parent, empty for objects under the world.
+    """
+    if full_path.startswith("|"):
+        return full_path.rpartition("|")[0]
+
+    parent_list = cmds.listRelatives(full_path, p=True, fullPath=True)
+    return parent_list[-1] if parent_list else ""
+
+
+def get_ancestor_paths(full_path):
+    """Get the full path of an object and of all its ancestors.
+
+    Args:
+        full_path (str): Full path of the Maya object.
+
+    Returns:
+        list: Full paths, from the object up to the top of its hierarchy.
+    """
+    path_list = []
+    while full_path:
+        path_list.append(full_path)
+        full_path = get_parent_path(full_path)
+
+    return path_list
+
+
+def _has_incoming_connection(plug):
+    """Check if a plug or one of its children is a connection destination."""
+    if plug.isDestination:
+        return True
+
+    return any(plug.child(i).isDestination for i in range(plug.numChildren()))
+
+
+def get_transform_connection_flags(full_path_list):
+    """Find which transforms have incoming translate, rotate or scale connections.
+
+    Every object is looked up once through the API, replacing nine
+    ``connectionInfo`` queries per object.
+
+    Args:
+        full_path_list (list): Full paths of the Maya objects.
+
+    Returns:
+        dict: Full path -> True if one of its transform channels is driven.
+        Objects that do not exist are left out.
+    """
+    flag_dict = {}
+    for full_path in dict.fromkeys(full_path_list):
+        selection = om2.MSelectionList()
+        try:
+            selection.add(full_path)
+        except RuntimeError:
+            continue
+
+        fn_node = om2.MFnDependencyNode(selection.getDependNode(0))
+        flag_dict[full_path] = any(
+            _has_incoming_connection(fn_node.findPlug(attr, False)) for attr in TRANSFORM_ATTRIBUTES
+        )
+
+    return flag_dict
+
+
+def _port_node(port):
+    """Node part of a "node.port" string, without the leading slash."""
+    return port.lstrip("/").split(".", 1)[0]
+
+
+def _rename_port(port, old_name, new_name):
+    """Replace the node name of a port, or of a port inside a compound."""
+    stripped_port = port.lstrip("/")
+    if stripped_port == old_name:
+        return new_name
+
+    for separator in "./":
+        if stripped_port.startswith(old_name + separator):
+            return new_name + stripped_port[len(old_name) :]
+
+    return port
+
+
+class BifrostGraphModel:
+    """In-memory model of the nodes and connections of a Bifrost graph.
+
+    USDCharacterBuild records every prim it creates and links here, so the
+    existence and connection checks of the recursive build are dictionary
+    lookups instead of ``vnnCompound``/``vnnNode`` queries that get slower
+    as the graph grows. Connections made inside :meth:`batch` are queued
+    and sent to Maya together, in one undo chunk, when the batch ends.
+
+    Attributes:
+        bifrost_shape (str): Bifrost graph shape the edits are sent to.
+        node_dict (dict): Top level node name -> node type, None if unknown.
+        link_dict (dict): Node name -> set of the node names connected to it.
+    """
+
+    def __init__(self, bifrost_shape):
+        """Create the model and read the nodes already in the graph.
+
+        Args:
+            bifrost_shape (str): Bifrost graph shape.
+        """
+        self.bifrost_shape = bifrost_shape
+        self.node_dict = {}
+        self.link_dict = {}
+
+        self._pending_list = []
+        self._batch_depth = 0
+
+        for node in cmds.vnnCompound(bifrost_shape, "/", listNodes=True) or []:
+            self.node_dict[node] = None
+
+    def has_node(self, node):
+        """Check if a node exists in the graph.
+
+        Args:
+            node (str): Node name.
+
+        Returns:
+            bool: True if the node was found or created.
+        """
+        return node.lstrip("/") in self.node_dict
+
+    def get_node_type(self, node):
+        """Get the type of a node, querying Bifrost only the first time.
+
+        Args:
+            node (str): Node name.
+
+        Returns:
+            str: Node type, ex: "BifrostGraph,USD::Prim,define_usd_mesh".
+        """
+        node = node.lstrip("/")
+        if self.node_dict.get(node) is None:
+            self.node_dict[node] = bifrost.bf_get_node_type(self.bifrost_shape, node)
+
+        return self.node_dict[node]
+
+    def is_connected(self, node, other_node):
+        """Check if two nodes are connected, in any direction.
+
+        Args:
+            node (str): Node name.
+            other_node (str): Node name.
+
+        Returns:
+            bool: True if a connection between the nodes was made.
+        """
+        return other_node.lstrip("/") in self.link_dict.get(node.lstrip("/"), ())
+
+    def create_node(self, node_type, name=""):
+        """Create a top level node.
+
+        Args:
+            node_type (str): Node type, ex: "BifrostGraph,USD::Prim,define_usd_prim".
+            name (str): Optional name of the node.
+
+        Returns:
+            str: Node name.
+        """
+        node = bifrost.bf_create_node(self.bifrost_shape, node_type)
+        self.node_dict[node] = node_type
+        if name:
+            node = self.rename_node(node, name)
+
+        return node
+
+    def rename_node(self, node, name):
+        """Rename a node, updating its links and the queued connections.
+
+        Args:
+            node (str): Node name.
+            name (str): New name.
+
+        Returns:
+            str: New node name.
+        """
+        name = bifrost.bf_rename_node(self.bifrost_shape, node, name)
+
+        self.node_dict[name] = self.node_dict.pop(node, None)
+        link_set = self.link_dict.pop(node, set())
+        self.link_dict[name] = link_set
+        for other_node in link_set:
+            self.link_dict[other_node].discard(node)
+            self.link_dict[other_node].add(name)
+
+        self._pending_list = [
+            (
+                _rename_port(source_port, node, name),
+                _rename_port(destination, node, name),
+                child_port,
+            )
+            for source_port, destination, child_port in self._pending_list
+        ]
+
+        return name
+
+    def connect(self, source_port, destination_port):
+        """Connect two ports.
+
+        Args:
+            source_port (str): Source in the format "node.port".
+            destination_port (str): Destination in the format "node.port".
+        """
+        self._add_edit(source_port, destination_port, None)
+
+    def connect_child(self, source_port, node, port_name, port_children):
+        """Add an input port to a node and connect a source port to it.
+
+        Args:
+            source_port (str): Source in the format "node.port".
+            node (str): Node receiving the new input port.
+            port_name (str): Port name, ex: "children.prim_definition".
+            port_children (str): Parent port of the new port, ex: "children".
+        """
+        self._add_edit(source_port, node, (port_name, port_children))
+
+    def _add_edit(self, source_port, destination, child_port):
+        """Record a connection and send it now or queue it for the batch."""
+        source_node = _port_node(source_port)
+        destination_node = _port_node(destination)
+        self.link_dict.setdefault(source_node, set()).add(destination_node)
+        self.link_dict.setdefault(destination_node, set()).add(source_node)
+
+        self._pending_list.append((source_port, destination, child_port))
+        if not self._batch_depth:
+            self.flush()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Queue the connections made in the block and send them at the end.
+
+        Yields:
+            BifrostGraphModel: This model.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def flush(self):
+        """Send the queued port and connection edits to Bifrost."""
+        pending_list, self._pending_list = self._pending_list, []
+        if not pending_list:
+            return
+
+        cmds.undoInfo(openChunk=True)
+        try:
+            for source_port, destination, child_port in pending_list:
+                if child_port:
+                    port_name, port_children = child_port
+                    destination = bifrost.bf_add_input_port(
+                        self.bifrost_shape, destination, port_name, "auto", port_children
+                    )
+                bifrost.bf_connect(self.bifrost_shape, source_port, destination)
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+
 class USDCharacterBuild:
     """Build Bifrost nodes to manage usd."""
 
@@ -66,6 +345,8 @@ class USDCharacterBuild:
         self.single_usd = single_usd
         self.root_node = self.get_name_dict(cmds.ls(root_node, long=True)[-1])
         self.bifrost_shape, self.bifrost_transform = self.create_bifrost_graph(name)
+        self.graph = BifrostGraphModel(self.bifrost_shape)
+        self.transform_connection_dict = {}
 
         self.create_usd_stage_node = bifrost.bf_create_node(
             self.bifrost_shape, "BifrostGraph,USD::Stage,create_usd_stage"
@@ -144,6 +425,18 @@ class USDCharacterBuild:
 
         return name_dict
 
+    def cache_transform_connections(self, mesh_list):
+        """Read the transform connection flags of meshes and of their parents.
+
+        Args:
+            mesh_list (list): Full paths of the Maya meshes.
+        """
+        path_list = []
+        for mesh in mesh_list:
+            path_list.extend(get_ancestor_paths(mesh))
+
+        self.transform_connection_dict.update(get_transform_connection_flags(path_list))
+
     def create_bifrost_graph(self, name="usd"):
         """Create bifrost Graph.
 
@@ -324,7 +617,7 @@ class USDCharacterBuild:
 
         if self.single_usd:
             add_to_stage_compound = bifrost.bf_create_compound(
-                self.bifrost_shape, [self.add_to_stage_node]
+                self.bifrost_shape, [add_to_stage_node]
             )
             bifrost.bf_feedback_port(
                 self.bifrost_shape, add_to_stage_compound, "out_stage", "stage"
@@ -353,10 +646,12 @@ class USDCharacterBuild:
             node_list.extend([string_join_node, build_array_node, extension_value_node])
 
         # Create Prims
-        for geo in deformed_geo_list:
-            self.add_mesh(geo)
-        for geo in undeformed_geo_list:
-            self.add_undeformed_mesh(geo)
+        self.cache_transform_connections(deformed_geo_list + undeformed_geo_list)
+        with self.graph.batch():
+            for geo in deformed_geo_list:
+                self.add_mesh(geo, add_to_stage_node)
+            for geo in undeformed_geo_list:
+                self.add_undeformed_mesh(geo, add_to_stage_node)
 
         ###############
 
@@ -550,23 +845,13 @@ class USDCharacterBuild:
             (string): bifrost node name of the prim
 
         """
-        # List all Nodes in the Grpah
-        graph_node_list = cmds.vnnCompound(self.bifrost_shape, "/", listNodes=True)
-
         node_name = name_dict["long_name"] + "_define_usd_prim"
-        if node_name in graph_node_list:
+        if self.graph.has_node(node_name):
             node = node_name
         else:
-            new_node = bifrost.bf_create_node(
-                self.bifrost_shape, "BifrostGraph,USD::Prim,define_usd_prim"
-            )
+            self.graph.create_node(DEFINE_USD_PRIM, node_name)
             bifrost.bf_set_node_property(
-                self.bifrost_shape, new_node, "path", "/" + name_dict["short_name"]
-            )
-            new_node = bifrost.bf_rename_node(
-                self.bifrost_shape,
-                new_node,
-                name_dict["long_name"] + "_define_usd_prim",
+                self.bifrost_shape, node_name, "path", "/" + name_dict["short_name"]
             )
 
             bifrost.bf_set_node_property(self.bifrost_shape, node_name, "type", prim_type)
@@ -646,29 +931,25 @@ class USDCharacterBuild:
 
         return node_name
 
-    def add_undeformed_mesh(self, mesh_name):
+    def add_undeformed_mesh(self, mesh_name, add_to_stage_node):
         """Add Mesh shape to bifrost and relative mesh prim definition.
 
         Args:
             mesh_name (string): Maya mesh name.
+            add_to_stage_node (string): bifrost node name for adding to USD stage.
         """
         name_dict = self.get_name_dict(mesh_name)
 
         # Create nodes
-        define_mesh_node = bifrost.bf_create_node(
-            self.bifrost_shape, "BifrostGraph,USD::Prim,define_usd_mesh"
+        define_mesh_node = self.graph.create_node(
+            DEFINE_USD_MESH, name_dict["long_name"] + "_define_usd_mesh"
         )
-
         bifrost.bf_set_node_property(
             self.bifrost_shape, define_mesh_node, "path", "/" + name_dict["short_name"]
         )
-        define_mesh_node = bifrost.bf_rename_node(
-            self.bifrost_shape,
-            define_mesh_node,
-            name_dict["long_name"] + "_define_usd_mesh",
-        )
 
-        self.recursive_build_usd_graph(name_dict, define_mesh_node)
+        self.recursive_node_list = []
+        self.recursive_build_usd_graph(name_dict, define_mesh_node, add_to_stage_node)
 
     def add_xform(self, obj, obj_node=None):
         """Add xfrom attribute to a Mesh or Prim defintion.
@@ -680,8 +961,7 @@ class USDCharacterBuild:
         name_dict = self.get_name_dict(obj)
 
         node = name_dict["long_name"] + "_define_usd_attribute"
-        connected_node_list = cmds.vnnNode(self.bifrost_shape, "/" + obj_node, listConnectedNodes=1)
-        if connected_node_list is None or node not in connected_node_list:
+        if not self.graph.is_connected(obj_node, node):
             # Create input port
             bifrost.bf_add_output_port(
                 self.bifrost_shape,
@@ -709,40 +989,25 @@ class USDCharacterBuild:
             )
 
             # Connect
-            bifrost.bf_connect(
-                self.bifrost_shape,
-                self.time_node + ".frame",
-                define_attribute_node + ".frame",
-            )
-
-            bifrost.bf_connect(
-                self.bifrost_shape,
+            self.graph.connect(self.time_node + ".frame", define_attribute_node + ".frame")
+            self.graph.connect(
                 "input." + name_dict["short_name"] + "_translate",
                 define_attribute_node + ".translation",
             )
-            bifrost.bf_connect(
-                self.bifrost_shape,
+            self.graph.connect(
                 "input." + name_dict["short_name"] + "_rotate",
                 define_attribute_node + ".rotation",
             )
-            bifrost.bf_connect(
-                self.bifrost_shape,
+            self.graph.connect(
                 "input." + name_dict["short_name"] + "_scale",
                 define_attribute_node + ".scale",
             )
-
-            input_port = bifrost.bf_add_input_port(
-                self.bifrost_shape,
+            self.graph.connect_child(
+                define_attribute_node + ".attribute_definitions",
                 obj_node,
                 "attribute_definitions.attribute_definition",
-                "auto",
                 "attribute_definitions",
             )
-            bifrost.bf_connect(
-                self.bifrost_shape,
-                define_attribute_node + ".attribute_definitions",
-                input_port,
-            )
 
     def add_mesh(self, mesh_name, add_to_stage_node):
         """Add Mesh shape to bifrost and relative mesh prim definition.
@@ -760,27 +1025,20 @@ class USDCharacterBuild:
 
         # Creaci una classe
         input_mesh_node = bifrost.bf_add_mesh(self.bifrost_shape, mesh_name)
-        define_mesh_node = bifrost.bf_create_node(
-            self.bifrost_shape, "BifrostGraph,USD::Prim,define_usd_mesh"
+        define_mesh_node = self.graph.create_node(
+            DEFINE_USD_MESH, name_dict["long_name"] + "_define_usd_mesh"
         )
 
         mesh_out_port = bifrost.bf_list_all_port(
             self.bifrost_shape, input_mesh_node, input_port=False, output_port=True
         )[-1]
 
-        bifrost.bf_connect(self.bifrost_shape, mesh_out_port, define_mesh_node + ".mesh")
-        bifrost.bf_connect(
-            self.bifrost_shape, self.time_node + ".frame", define_mesh_node + ".frame"
-        )
+        self.graph.connect(mesh_out_port, define_mesh_node + ".mesh")
+        self.graph.connect(self.time_node + ".frame", define_mesh_node + ".frame")
 
         bifrost.bf_set_node_property(
             self.bifrost_shape, define_mesh_node, "path", "/" + name_dict["short_name"]
         )
-        define_mesh_node = bifrost.bf_rename_node(
-            self.bifrost_shape,
-            define_mesh_node,
-            name_dict["long_name"] + "_define_usd_mesh",
-        )
 
         self.recursive_node_list = []
         self.recursive_build_usd_graph(name_dict, define_mesh_node, add_to_stage_node)
@@ -794,6 +1052,9 @@ class USDCharacterBuild:
     def recursive_build_usd_graph(self, obj_data, node, add_to_stage_node):
         """Recursive build and connect Prims.
 
+        Existence and connection checks use the transform connection flags
+        and the graph model, so a level costs no scene or graph queries.
+
         Args:
             obj_data (dict): current Maya object, contains 'long_name' and 'short_name'
             node (string): current Bifrost prim node.
@@ -803,123 +1064,66 @@ class USDCharacterBuild:
             None
 
         """
-        # Check if maya object exists
-        if cmds.objExists(obj_data["full_path"]):
-            # get the object parent
-            parent = cmds.listRelatives(obj_data["full_path"], p=True, fullPath=True)[-1]
-            parent_obj = self.get_name_dict(parent)
-
-            # Check if there is a trnasform connection
-            connection_check = (
-                cmds.connectionInfo(obj_data["full_path"] + ".tx", isDestination=True)
-                or cmds.connectionInfo(obj_data["full_path"] + ".ty", isDestination=True)
-                or cmds.connectionInfo(obj_data["full_path"] + ".tz", isDestination=True)
-                or cmds.connectionInfo(obj_data["full_path"] + ".rx", isDestination=True)
-                or cmds.connectionInfo(obj_data["full_path"] + ".ry", isDestination=True)
-                or cmds.connectionInfo(obj_data["full_path"] + ".rz", isDestination=True)
-                or cmds.connectionInfo(obj_data["full_path"] + ".sx", isDestination=True)
-                or cmds.connectionInfo(obj_data["full_path"] + ".sy", isDestination=True)
-                or cmds.connectionInfo(obj_data["full_path"] + ".sz", isDestination=True)
-            )
+        full_path = obj_data["full_path"]
+        if full_path not in self.transform_connection_dict:
+            self.cache_transform_connections([full_path])
 
-            if connection_check:
-                self.add_xform(obj_data["full_path"], node)
-
-            # if the current node is the highest in hierarchy
-            if parent_obj["short_name"] == self.root_node["short_name"]:
-                new_node = self.create_prim(parent_obj)
-
-                # Check if there is a trnasform connection
-                connection_check = (
-                    cmds.connectionInfo(parent_obj["full_path"] + ".tx", isDestination=True)
-                    or cmds.connectionInfo(obj_data["full_path"] + ".ty", isDestination=True)
-                    or cmds.connectionInfo(obj_data["full_path"] + ".tz", isDestination=True)
-                    or cmds.connectionInfo(obj_data["full_path"] + ".rx", isDestination=True)
-                    or cmds.connectionInfo(obj_data["full_path"] + ".ry", isDestination=True)
-                    or cmds.connectionInfo(obj_data["full_path"] + ".rz", isDestination=True)
-                    or cmds.connectionInfo(obj_data["full_path"] + ".sx", isDestination=True)
-                    or cmds.connectionInfo(obj_data["full_path"] + ".sy", isDestination=True)
-                    or cmds.connectionInfo(obj_data["full_path"] + ".sz", isDestination=True)
+        # Check if maya object exists
+        if full_path not in self.transform_connection_dict:
+            return None
+
+        # get the object parent
+        parent_path = get_parent_path(full_path)
+        if not parent_path:
+            return None
+        parent_obj = self.get_name_dict(parent_path)
+
+        # Check if there is a transform connection
+        if self.transform_connection_dict[full_path]:
+            self.add_xform(full_path, node)
+
+        new_node = self.create_prim(parent_obj)
+
+        # if the current node is the highest in hierarchy
+        if parent_obj["short_name"] == self.root_node["short_name"]:
+            if self.transform_connection_dict.get(parent_path):
+                self.add_xform(parent_path, new_node)
+
+            # Check if the root is already created and connected to the create stage
+            if not self.graph.is_connected(new_node, node):
+                self.graph.connect_child(
+                    node + ".prim_definition", new_node, "children.prim_definition", "children"
                 )
 
-                if connection_check:
-                    self.add_xform(parent_obj["full_path"], new_node)
-
-                # Check if the root is already created and connected to the create stage
-                connected_node_list = cmds.vnnNode(
-                    self.bifrost_shape, "/" + new_node, listConnectedNodes=1
+            if not self.graph.is_connected(add_to_stage_node, new_node):
+                self.graph.connect_child(
+                    new_node + ".prim_definition",
+                    add_to_stage_node,
+                    "prim_definitions.prim_definition",
+                    "prim_definitions",
                 )
-                if connected_node_list is None or node not in connected_node_list:
-                    input_port = bifrost.bf_add_input_port(
-                        self.bifrost_shape,
-                        new_node,
-                        "children.prim_definition",
-                        "auto",
-                        "children",
-                    )
-                    bifrost.bf_connect(self.bifrost_shape, node + ".prim_definition", input_port)
 
-                connected_node_list = cmds.vnnNode(
-                    self.bifrost_shape, "/" + add_to_stage_node, listConnectedNodes=1
-                )
-                if self.root_node["long_name"] + "_define_usd_prim" not in connected_node_list:
-                    stage_input_port = bifrost.bf_add_input_port(
-                        self.bifrost_shape,
-                        add_to_stage_node,
-                        "prim_definitions.prim_definition",
-                        "auto",
-                        "prim_definitions",
-                    )
-                    bifrost.bf_connect(
-                        self.bifrost_shape,
-                        new_node + ".prim_definition",
-                        stage_input_port,
-                    )
+            self.recursive_node_list.append(new_node)
 
-                self.recursive_node_list.append(new_node)
+            return None
 
-                return None
+        # Check if the node is already connected
+        if self.graph.is_connected(new_node, node):
+            return None
 
-            else:
-                new_node = self.create_prim(parent_obj)
-                connected_node_list = cmds.vnnNode(
-                    self.bifrost_shape, "/" + new_node, listConnectedNodes=1
-                )
+        # Check the type of the prim (Transform or Mesh)
+        if self.graph.get_node_type(node) == DEFINE_USD_MESH:
+            definition = "mesh_definition"
+        else:
+            definition = "prim_definition"
+        self.graph.connect_child(
+            node + "." + definition, new_node, "children." + definition, "children"
+        )
+
+        self.recursive_build_usd_graph(parent_obj, new_node, add_to_stage_node)
+        self.recursive_node_list.append(new_node)
 
-                # Check if the node is already created
-                if connected_node_list is None or node not in connected_node_list:
-                    # Check the type of the prim (Transform or Mesh)
-                    if (
-                        bifrost.bf_get_node_type(self.bifrost_shape, node)
-                        == "BifrostGraph,USD::Prim,define_usd_mesh"
-                    ):
-                        input_port = bifrost.bf_add_input_port(
-                            self.bifrost_shape,
-                            new_node,
-                            "children.mesh_definition",
-                            "auto",
-                            "children",
-                        )
-                        bifrost.bf_connect(
-                            self.bifrost_shape, node + ".mesh_definition", input_port
-                        )
-                    else:
-                        input_port = bifrost.bf_add_input_port(
-                            self.bifrost_shape,
-                            new_node,
-                            "children.prim_definition",
-                            "auto",
-                            "children",
-                        )
-                        bifrost.bf_connect(
-                            self.bifrost_shape, node + ".prim_definition", input_port
-                        )
-
-                    self.recursive_build_usd_graph(parent_obj, new_node, add_to_stage_node)
-                    self.recursive_node_list.append(new_node)
-
-                else:
-                    return None
+        return None
 
     def add_block_attribute(self, attr_name, node_name="", prim_path="", parent=""):
         """Add Block attribute.
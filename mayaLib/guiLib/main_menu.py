@@ -28,8 +28,8 @@ except ImportError:
 
 import mayaLib
 from mayaLib.guiLib.base import base_ui as ui
+from mayaLib.pipelineLib.utility import catalog_search, lib_manager
 from mayaLib.pipelineLib.utility import docs as doc
-from mayaLib.pipelineLib.utility import lib_manager
 from mayaLib.pipelineLib.utility import list_function as lm
 
 
@@ -94,11 +94,62 @@ class SearchLineEdit(QtWidgets.QLineEdit):
         self.speak.emit(newtext)
 
 
+class CatalogListModel(QtCore.QAbstractListModel):
+    """List model of search results.
+
+    Rows are only dotted names; the view asks for the text of the rows it
+    shows, so no widget item is created per result.
+    """
+
+    def __init__(self, parent=None):
+        """Initialize an empty CatalogListModel.
+
+        Args:
+            parent (QObject, optional): Parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self._qualnames = []
+
+    def rowCount(self, parent=None):  # noqa: N802 - Qt override
+        """Return the number of results."""
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._qualnames)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """Return the tool name (display) or dotted path (tooltip) of a row."""
+        if not index.isValid():
+            return None
+        qualname = self._qualnames[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return qualname.rsplit(".", 1)[-1]
+        if role == QtCore.Qt.ToolTipRole:
+            return qualname
+        return None
+
+    def set_results(self, qualnames):
+        """Replace the results with a new list of dotted names.
+
+        Args:
+            qualnames (list[str]): Ranked dotted names.
+        """
+        self.beginResetModel()
+        self._qualnames = list(qualnames)
+        self.endResetModel()
+
+    def qualname(self, row):
+        """Return the dotted name shown in a row."""
+        return self._qualnames[row]
+
+
 class MenuLibWidget(QtWidgets.QWidget):
     """Widget that displays a searchable menu library."""
 
     update_widget = QtCore.Signal()
 
+    # Number of matches listed in the docs label
+    DOC_LABEL_ROWS = 10
+
     def __init__(self, lib_path, parent=None):
         """Initialize the MenuLibWidget.
 
@@ -119,6 +170,7 @@ class MenuLibWidget(QtWidgets.QWidget):
         # Defer StructureManager creation for lazy initialization
         self.lib_structure = None
         self.lib_dict = None
+        self.search_index = None
         self._structure_initialized = False
 
         # Setup layout
@@ -133,9 +185,11 @@ class MenuLibWidget(QtWidgets.QWidget):
         self.search_line_edit = SearchLineEdit(str(close_icon_path))
         self.layout.addWidget(self.search_line_edit)
 
-        # Widget List
-        self.button_item_list = []
-        self.button_list_widget = QtWidgets.QListWidget()
+        # Result List (the view only draws the visible rows of the model)
+        self.button_list_model = CatalogListModel(self)
+        self.button_list_widget = QtWidgets.QListView()
+        self.button_list_widget.setModel(self.button_list_model)
+        self.button_list_widget.setUniformItemSizes(True)
         self.button_list_widget.setStyleSheet("background: transparent;")
         self.button_list_widget.setFocusPolicy(QtCore.Qt.NoFocus)
         self.button_list_widget.adjustSize()
@@ -174,7 +228,7 @@ class MenuLibWidget(QtWidgets.QWidget):
         self.search_line_edit.speak.connect(
             lambda: self.build_button_list(self.search_line_edit.text())
         )
-        self.button_list_widget.itemClicked.connect(self.list_widget_button_click)
+        self.button_list_widget.clicked.connect(self.list_widget_button_click)
 
         self.show()
 
@@ -200,19 +254,26 @@ class MenuLibWidget(QtWidgets.QWidget):
         root_name = self.lib_structure.root_package.__name__
         self.lib_dict = full_dict.get(root_name, full_dict)
 
+        # Search index over names, module paths and first docstring lines
+        catalog = self.lib_structure.catalog
+        self.search_index = catalog_search.CatalogSearchIndex(
+            (catalog.get(libstr) if catalog is not None else None) or libstr
+            for libstr in self.lib_structure.final_class_list
+        )
+
         # Mark as initialized
         self._structure_initialized = True
 
         return True
 
-    def list_widget_button_click(self, item):
-        """Handle list widget item click to execute corresponding function.
+    def list_widget_button_click(self, index):
+        """Handle result list click to execute corresponding function.
 
         Args:
-            item (QListWidgetItem): The clicked item.
+            index (QModelIndex): The clicked row.
         """
         self._ensure_structure_initialized()
-        libstr = item.toolTip()
+        libstr = self.button_list_model.qualname(index.row())
         class_string = libstr.split(".")
         module = ".".join(class_string[:-1])
         key = class_string[-1]
@@ -222,35 +283,21 @@ class MenuLibWidget(QtWidgets.QWidget):
     def build_button_list(self, text):
         """Build the list of buttons based on the search text.
 
+        Words separated by spaces (or ``*``) must all match the tool name,
+        module path or first docstring line; results are ranked with name
+        matches first.
+
         Args:
             text (str): Search input text.
         """
         self._ensure_structure_initialized()
-        if self.button_list_widget.count() > 0 or text == "":
-            self.button_list_widget.clear()
-            del self.button_item_list[:]
-
-        doc_text = []
-        text_list = text.split("*")
-        for libstr in self.lib_structure.final_class_list:
-            str_match = [True for match in text_list if match in libstr]
-
-            if True in str_match:
-                doc_text.append(libstr)
-                tt = "\n".join(doc_text)
-                self.doc_label.setText(tt)
-                class_string = libstr.split(".")
-                key = class_string[-1]
-
-                button_q_list_widget_item = QtWidgets.QListWidgetItem(key)
-                button_q_list_widget_item.setToolTip(libstr)
-                self.button_item_list.append(button_q_list_widget_item)
-                self.button_list_widget.addItem(self.button_item_list[-1])
-
-        if text == "":
-            self.doc_label.setText("")
-            if self.button_list_widget.count() > 0:
-                self.button_list_widget.clear()
+        results = self.search_index.search(text)
+        self.button_list_model.set_results(results)
+
+        doc_text = results[: self.DOC_LABEL_ROWS]
+        if len(results) > self.DOC_LABEL_ROWS:
+            doc_text.append(f"... {len(results) - self.DOC_LABEL_ROWS} more")
+        self.doc_label.setText("\n".join(doc_text))
 
         self.button_list_widget.adjustSize()
 
@@ -339,14 +386,23 @@ class MenuLibWidget(QtWidgets.QWidget):
 
         Args:
             discipline (str): The discipline name.
-            function (function): The function associated with the action.
+            function (function | str): The function associated with the action,
+                or its dotted path. A dotted path is only imported when the
+                action is triggered.
 
         Returns:
             QAction: The created action.
         """
         extract_action = QAction(discipline, self)
-        extract_action.triggered.connect(lambda: self.button_clicked(function))
-        doc_text = doc.get_docs(function)
+        if isinstance(function, str):
+            lib_str = function
+            extract_action.triggered.connect(
+                lambda: self.button_clicked(self.lib_structure.load_callable(lib_str))
+            )
+            doc_text = self.lib_structure.get_doc(lib_str)
+        else:
+            extract_action.triggered.connect(lambda: self.button_clicked(function))
+            doc_text = doc.get_docs(function)
         extract_action.hovered.connect(lambda: self.button_hover(doc_text))
 
         return extract_action
@@ -378,10 +434,8 @@ class MenuLibWidget(QtWidgets.QWidget):
                 self.add_recursive_menu(sub_menu, value)
 
             else:
-                class_string = value.split(".")
-                module = ".".join(class_string[:-1])
-                func = self.lib_structure.import_and_exec(module, key)
-                up_menu.addAction(self.add_menu_action(key, func))
+                # The module is imported when the action is triggered
+                up_menu.addAction(self.add_menu_action(key, value))
 
     def add_multiple_menu_action(self, up_menu, discipline):
         """Add multiple actions to the menu based on the discipline.
@@ -2,15 +2,233 @@
 
 Provides functions for UV unwrapping, layout, and manipulation
 of UV coordinates.
+
+Shell and tile analysis reads the UVs and UV shell IDs of a mesh once into
+NumPy arrays (:class:`UVShellData`), so the boundary checks of a whole mesh
+cost a few API calls instead of several commands per shell and per tile.
 """
 
 import contextlib
 import math
 
 import maya.mel as mel
+import numpy as np
 import pymel.core as pm
 
 
+def component_ranges(geo, component, indices):
+    """Build compact component names from indices.
+
+    Args:
+        geo (str): Mesh name.
+        component (str): Component type, ex: "map" or "f".
+        indices: Component indices, in any order.
+
+    Returns:
+        list: Component names with consecutive indices merged,
+            ex: ["pCube1.map[0:3]", "pCube1.map[7]"].
+    """
+    indices = np.unique(np.asarray(indices, dtype=np.int64))
+    if not len(indices):
+        return []
+
+    breaks = np.flatnonzero(np.diff(indices) != 1) + 1
+    starts = indices[np.concatenate(([0], breaks))].tolist()
+    ends = indices[np.concatenate((breaks - 1, [len(indices) - 1]))].tolist()
+    return [
+        f"{geo}.{component}[{start}]" if start == end else f"{geo}.{component}[{start}:{end}]"
+        for start, end in zip(starts, ends, strict=True)
+    ]
+
+
+class UVShellData:
+    """UVs and UV shells of one mesh as NumPy arrays.
+
+    A UV is inside a tile when it lies strictly between the tile borders;
+    UVs sitting on a border belong to no tile, like in
+    :meth:`AutoUV.check_uv_in_boundaries`. Tiles are the floor of the
+    coordinates, so negative UVs fall in negative tiles.
+
+    Attributes:
+        geo (str): Mesh name used for component names.
+        u (np.ndarray): ``(uvs,)`` U coordinates.
+        v (np.ndarray): ``(uvs,)`` V coordinates.
+        shell_ids (np.ndarray): ``(uvs,)`` shell index of every UV.
+        shell_count (int): Number of UV shells.
+        face_shell_ids (np.ndarray): ``(faces,)`` shell index of every face,
+            -1 for faces without UVs.
+
+    Example:
+        >>> data = UVShellData.from_mesh('pCube1')
+        >>> bad_shells = np.flatnonzero(data.out_of_bounds_shells())
+    """
+
+    def __init__(self, u, v, shell_ids, shell_count=None, face_shell_ids=None, geo=""):
+        """Wrap UV arrays.
+
+        Args:
+            u: U coordinate of every UV.
+            v: V coordinate of every UV.
+            shell_ids: Shell index of every UV.
+            shell_count (int): Number of shells. Defaults to the highest shell index + 1.
+            face_shell_ids: Shell index of every face, -1 for faces without UVs.
+            geo (str): Mesh name used for component names.
+        """
+        self.geo = geo
+        self.u = np.asarray(u, dtype=np.float64)
+        self.v = np.asarray(v, dtype=np.float64)
+        self.shell_ids = np.asarray(shell_ids, dtype=np.int64)
+        if shell_count is None:
+            shell_count = int(self.shell_ids.max()) + 1 if len(self.shell_ids) else 0
+        self.shell_count = int(shell_count)
+        self.face_shell_ids = np.asarray(
+            face_shell_ids if face_shell_ids is not None else [], dtype=np.int64
+        )
+
+        self.tile_u = np.floor(self.u).astype(np.int64)
+        self.tile_v = np.floor(self.v).astype(np.int64)
+        self.inside_tile = (self.u > self.tile_u) & (self.v > self.tile_v)
+
+    @classmethod
+    def from_mesh(cls, geo):
+        """Read the UVs, UV shells and face UVs of a mesh in bulk.
+
+        Args:
+            geo (str): Mesh transform or shape.
+
+        Returns:
+            UVShellData: UV data of the current UV set.
+        """
+        import maya.api.OpenMaya as om2  # noqa: N813 - Maya API alias
+
+        selection = om2.MSelectionList()
+        selection.add(str(geo))
+        fn_mesh = om2.MFnMesh(selection.getDagPath(0).extendToShape())
+
+        u, v = fn_mesh.getUVs()
+        shell_count, shell_ids = fn_mesh.getUvShellsIds()
+        shell_ids = np.array(shell_ids, dtype=np.int64)
+
+        # Shell of every face: the shell of its first UV
+        uv_counts, uv_ids = (np.array(array, dtype=np.int64) for array in fn_mesh.getAssignedUVs())
+        face_shell_ids = np.full(len(uv_counts), -1, dtype=np.int64)
+        has_uvs = uv_counts > 0
+        first_uv = np.cumsum(uv_counts) - uv_counts
+        face_shell_ids[has_uvs] = shell_ids[uv_ids[first_uv[has_uvs]]]
+
+        return cls(u, v, shell_ids, shell_count, face_shell_ids, geo=str(geo))
+
+    def _shell_tile_keys(self):
+        """One int64 key per UV for its (shell, tile) pair, and a key decoder.
+
+        Sorting one key column is much faster than sorting (shell, u, v) rows.
+        """
+        if not len(self.shell_ids):
+            return np.empty(0, dtype=np.int64), lambda keys: np.empty((0, 3), dtype=np.int64)
+
+        u_min, v_min = self.tile_u.min(), self.tile_v.min()
+        u_span = int(self.tile_u.max() - u_min) + 1
+        v_span = int(self.tile_v.max() - v_min) + 1
+        keys = (self.shell_ids * u_span + (self.tile_u - u_min)) * v_span + (self.tile_v - v_min)
+
+        def decode(keys):
+            shell_tile_u, tile_v = np.divmod(keys, v_span)
+            shells, tile_u = np.divmod(shell_tile_u, u_span)
+            return np.stack((shells, tile_u + u_min, tile_v + v_min), axis=1)
+
+        return keys, decode
+
+    def _shell_tiles(self):
+        """Unique (shell, tile_u, tile_v) rows, sorted by shell."""
+        keys, decode = self._shell_tile_keys()
+        return decode(np.unique(keys))
+
+    def tile_counts(self):
+        """Count the tiles every shell touches.
+
+        Returns:
+            np.ndarray: ``(shells,)`` number of distinct tiles.
+        """
+        return np.bincount(self._shell_tiles()[:, 0], minlength=self.shell_count)
+
+    def out_of_bounds_shells(self):
+        """Flag the shells that do not fit inside a single tile.
+
+        Returns:
+            np.ndarray: ``(shells,)`` True for shells spanning several tiles
+            or with UVs on a tile border.
+        """
+        on_border = np.bincount(
+            self.shell_ids, weights=~self.inside_tile, minlength=self.shell_count
+        )
+        return (self.tile_counts() > 1) | (on_border > 0)
+
+    def shell_tile_ranges(self, shell):
+        """Tile boundaries of a shell, like :meth:`AutoUV.check_uv_boundaries`.
+
+        Args:
+            shell (int): Shell index.
+
+        Returns:
+            list: [u_min, u_max, v_min, v_max] of every tile the shell touches.
+        """
+        rows = self._shell_tiles()
+        return [
+            [tile_u, tile_u + 1, tile_v, tile_v + 1]
+            for _, tile_u, tile_v in rows[rows[:, 0] == shell].tolist()
+        ]
+
+    def tile_uv_groups(self, shell_mask=None):
+        """Group the UVs of shells by the tile they are inside.
+
+        Args:
+            shell_mask: Optional ``(shells,)`` boolean mask of the shells to
+                group. Defaults to all shells.
+
+        Returns:
+            list: (shell, (tile_u, tile_v), uv_indices) for every shell and
+            tile holding at least one UV strictly inside the tile.
+        """
+        keep = self.inside_tile.copy()
+        if shell_mask is not None:
+            keep &= np.asarray(shell_mask, dtype=bool)[self.shell_ids]
+
+        uv_indices = np.flatnonzero(keep)
+        if not len(uv_indices):
+            return []
+
+        keys, decode = self._shell_tile_keys()
+        keys = keys[uv_indices]
+        order = np.argsort(keys, kind="stable")
+        uv_indices = uv_indices[order]
+        keys = keys[order]
+
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        groups = np.split(uv_indices, starts[1:])
+        return [
+            (shell, (tile_u, tile_v), group)
+            for (shell, tile_u, tile_v), group in zip(
+                decode(keys[starts]).tolist(), groups, strict=True
+            )
+        ]
+
+    def shell_faces(self):
+        """Face components of every shell.
+
+        Returns:
+            list: One list of face component names per shell.
+        """
+        face_ids = np.flatnonzero(self.face_shell_ids >= 0)
+        face_ids = face_ids[np.argsort(self.face_shell_ids[face_ids], kind="stable")]
+        bounds = np.searchsorted(
+            self.face_shell_ids[face_ids], np.arange(self.shell_count + 1), side="left"
+        )
+        return [
+            component_ranges(self.geo, "f", face_ids[bounds[shell] : bounds[shell + 1]])
+            for shell in range(self.shell_count)
+        ]
+
+
 class AutoUV:
     """Automatic UV unwrapping and optimization tool.
 
@@ -23,6 +241,8 @@ class AutoUV:
         loops, providing 10x-80x speedup on meshes with 10,000+ UVs. This is
         achieved by replacing N individual pm.polyEditUV() calls with a single
         batch query, drastically reducing Python-to-C++ marshaling overhead.
+        Shell listing, boundary checks and tile cuts of a whole mesh run on
+        one :class:`UVShellData` read instead of per-shell commands.
 
     Attributes:
         None (operates on input geometry list)
@@ -243,16 +463,18 @@ class AutoUV:
         """Recursively cuts the UV shells of the given geometry at tile boundaries.
 
         Cuts the UV shells of the given geometry at the tile boundaries until all
-        UV shells are within the tile boundaries.
+        UV shells are within the tile boundaries. Shells and tiles come from one
+        :class:`UVShellData` read; UV cuts append new UVs, so the UV indices of
+        that read stay valid while cutting.
 
         Args:
             geo (str): The name of the geometry to cut the UV shells of.
         """
-        shell_list = self.get_uv_shell(geo)
-        for shell in shell_list:
-            if not self.check_uv_in_boundaries(shell):
-                self.cut_uv_tile(shell)
-                # self.recursive_cut_uv(geo)
+        uv_data = UVShellData.from_mesh(geo)
+        shell_mask = uv_data.out_of_bounds_shells()
+        for _shell, _tile, uv_indices in uv_data.tile_uv_groups(shell_mask):
+            pm.select(component_ranges(uv_data.geo, "map", uv_indices))
+            mel.eval("CreateUVShellAlongBorder;")
 
     def get_uv_shell(self, geo):
         """Get a list of UV shells for the given geometry. This function returns a list of strings, where each string is a list of faces that make up a UV shell.
@@ -263,15 +485,7 @@ class AutoUV:
         Returns:
             list: A list of strings, where each string is a list of faces that make up a UV shell.
         """
-        shell_number = pm.polyEvaluate(geo, uvShell=True)
-        shell_list = []
-        for i in range(shell_number):
-            shell_faces = pm.polyListComponentConversion(
-                pm.polyEvaluate(geo, uvsInShell=i), toFace=True
-            )
-            shell_list.append(shell_faces)
-
-        return shell_list
+        return UVShellData.from_mesh(geo).shell_faces()
 
     def set_texel_density(self, geo, texel_density=10.24, map_res=1024):
         """Set the texel density of the given geometry.
@@ -388,9 +602,10 @@ class AutoUV:
 
         bad_shell_list = []
         for geo in geo_list:
-            for shell in self.get_uv_shell(geo):
-                if not self.check_uv_in_boundaries(shell):
-                    bad_shell_list.append(shell)
+            uv_data = UVShellData.from_mesh(geo)
+            shell_list = uv_data.shell_faces()
+            for shell in np.flatnonzero(uv_data.out_of_bounds_shells()).tolist():
+                bad_shell_list.append(shell_list[shell])
         if len(bad_shell_list) > 0:
             print("Bad Shells")
             self.uv_layout_no_scale(bad_shell_list, 1, 1)
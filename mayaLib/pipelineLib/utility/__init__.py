@@ -5,8 +5,10 @@ workspace management, and function discovery.
 """
 
 __all__ = [
+    "catalog_search",
     "docs",
     "file_opener",
+    "function_catalog",
     "lib_manager",
     "list_function",
     "name_check",
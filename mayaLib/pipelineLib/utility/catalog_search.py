@@ -0,0 +1,213 @@
+"""Ranked search over the MayaLib tool catalog.
+
+A trigram index over each tool's name, module path and first docstring line
+answers substring queries without scanning the whole catalog; names also
+match fuzzily (query characters in order, e.g. ``svskw`` finds
+``save_skin_weights``), checked only on the names a character index says
+contain every query character. Results are ranked by where the match happened,
+and a query that extends the previous one only searches the previous
+results, so typing narrows the list incrementally.
+
+Example:
+    >>> index = CatalogSearchIndex(
+    ...     [{"qualname": "mayaLib.rigLib.utils.skin.save_skin_weights", "doc": "Save weights."}]
+    ... )
+    >>> index.search("skin weights")
+    ['mayaLib.rigLib.utils.skin.save_skin_weights']
+"""
+
+__all__ = [
+    "CatalogSearchIndex",
+    "split_query",
+]
+
+import re
+
+# Score of a term by the field it matched, best first
+SCORE_NAME_EXACT = 100
+SCORE_NAME_PREFIX = 80
+SCORE_NAME = 60
+SCORE_MODULE = 40
+SCORE_DOC = 20
+SCORE_FUZZY = 10
+
+_QUERY_SPLIT = re.compile(r"[\s*]+")
+
+
+def split_query(query):
+    """Split a search string into lowercase terms.
+
+    Spaces and ``*`` (the search field replaces spaces with ``*``) separate
+    terms; every term must match.
+
+    Args:
+        query (str): Raw search text.
+
+    Returns:
+        list[str]: Non-empty lowercase terms.
+    """
+    return [term for term in _QUERY_SPLIT.split(query.lower()) if term]
+
+
+def _trigrams(text):
+    """Return the set of three character substrings of a string."""
+    return {text[ii : ii + 3] for ii in range(len(text) - 2)}
+
+
+def _intersect_postings(index, keys):
+    """Return the ids listed under every key of an inverted index."""
+    postings = sorted((index.get(key, set()) for key in keys), key=len)
+    return set.intersection(*postings) if postings[0] else set()
+
+
+def _is_subsequence(term, text):
+    """Check whether the characters of ``term`` appear in order in ``text``."""
+    position = 0
+    for char in term:
+        position = text.find(char, position) + 1
+        if not position:
+            return False
+    return True
+
+
+class CatalogSearchIndex:
+    """Trigram index with ranked fuzzy matching over catalog entries.
+
+    Attributes:
+        qualnames: Dotted name of every indexed tool, in catalog order.
+        names: Lowercase tool names.
+        modules: Lowercase module paths.
+        docs: Lowercase first docstring lines.
+    """
+
+    def __init__(self, entries):
+        """Build the index.
+
+        Args:
+            entries: Iterable of dicts with a ``qualname`` and an optional
+                ``doc`` (catalog entries), or plain dotted name strings.
+        """
+        self.qualnames = []
+        self.names = []
+        self.modules = []
+        self.docs = []
+        self._trigram_index = {}
+        self._name_char_index = {}
+
+        for entry in entries:
+            if isinstance(entry, str):
+                entry = {"qualname": entry}
+            qualname = entry["qualname"]
+            module, _, name = qualname.rpartition(".")
+            doc = (entry.get("doc") or "").strip().split("\n", 1)[0]
+
+            self.qualnames.append(qualname)
+            self.names.append(name.lower())
+            self.modules.append(module.lower())
+            self.docs.append(doc.lower())
+            haystack = f"{module}.{name}\n{doc}".lower()
+
+            entry_id = len(self.qualnames) - 1
+            # Single characters let terms shorter than a trigram use the index
+            for gram in _trigrams(haystack) | set(haystack):
+                self._trigram_index.setdefault(gram, set()).add(entry_id)
+            for char in set(name.lower()):
+                self._name_char_index.setdefault(char, set()).add(entry_id)
+
+        self._last_terms = []
+        self._last_ids = None
+
+    def __len__(self):
+        """Return the number of indexed tools."""
+        return len(self.qualnames)
+
+    def _substring_candidates(self, term):
+        """Ids whose haystack may contain ``term``, from the trigram index.
+
+        Terms shorter than a trigram are looked up by their characters.
+
+        Returns:
+            set: Candidate ids.
+        """
+        return _intersect_postings(self._trigram_index, _trigrams(term) or set(term))
+
+    def _fuzzy_candidates(self, term):
+        """Ids whose name contains every character of ``term``.
+
+        Returns:
+            set: Ids that may match ``term`` as a subsequence of their name.
+        """
+        return _intersect_postings(self._name_char_index, set(term))
+
+    def _score_term(self, entry_id, term):
+        """Score how well one term matches one entry; 0 means no match."""
+        name = self.names[entry_id]
+        if name == term:
+            return SCORE_NAME_EXACT
+        if name.startswith(term):
+            return SCORE_NAME_PREFIX
+        if term in name:
+            return SCORE_NAME
+        if term in self.modules[entry_id]:
+            return SCORE_MODULE
+        if term in self.docs[entry_id]:
+            return SCORE_DOC
+        if _is_subsequence(term, name):
+            return SCORE_FUZZY
+        return 0
+
+    def _is_refinement(self, terms):
+        """Check whether ``terms`` only narrows the previous query."""
+        last = self._last_terms
+        if self._last_ids is None or not last or len(terms) < len(last):
+            return False
+        if terms[: len(last) - 1] != last[:-1]:
+            return False
+        return terms[len(last) - 1].startswith(last[-1])
+
+    def search(self, query, limit=None):
+        """Return the tools matching every term of a query, best first.
+
+        Args:
+            query (str): Search text; see :func:`split_query`.
+            limit (int, optional): Maximum number of results.
+
+        Returns:
+            list[str]: Dotted names ranked by score, then by name length.
+        """
+        terms = split_query(query)
+        if not terms:
+            self._last_terms, self._last_ids = [], None
+            return []
+
+        # None scores every tool; a refinement starts from the previous results
+        scores = dict.fromkeys(self._last_ids, 0) if self._is_refinement(terms) else None
+        for term in terms:
+            candidates = self._substring_candidates(term) | self._fuzzy_candidates(term)
+            if scores is not None:
+                if len(candidates) < len(scores):
+                    candidates = [entry_id for entry_id in candidates if entry_id in scores]
+                else:
+                    candidates = [entry_id for entry_id in scores if entry_id in candidates]
+
+            next_scores = {}
+            for entry_id in candidates:
+                score = self._score_term(entry_id, term)
+                if score:
+                    next_scores[entry_id] = score + (scores[entry_id] if scores else 0)
+            scores = next_scores
+
+        self._last_terms = terms
+        self._last_ids = list(scores)
+
+        ranked = sorted(
+            scores,
+            key=lambda entry_id: (
+                -scores[entry_id],
+                len(self.names[entry_id]),
+                self.qualnames[entry_id],
+            ),
+        )
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [self.qualnames[entry_id] for entry_id in ranked]
@@ -0,0 +1,418 @@
+"""Static catalog of the classes and functions of a package.
+
+Builds the tool list for the MayaLib menu by parsing source files with
+``ast`` instead of importing them, so opening the menu does not import
+every library (Ziva, Bifrost, Luna, ...). Modules are only imported when a
+tool is executed.
+
+The catalog is persisted as JSON; on refresh only files whose size/mtime
+changed are looked at again, and only files whose content hash changed
+are parsed again.
+
+Example:
+    >>> import mayaLib
+    >>> from mayaLib.pipelineLib.utility.function_catalog import FunctionCatalog
+    >>> catalog = FunctionCatalog.for_package(mayaLib)
+    >>> catalog.refresh()
+    >>> catalog.get("mayaLib.rigLib.utils.skin.save_skin_weights")["signature"]
+    "(geo_list, project_path=None, sw_ext='.swt', do_directory=True, binary=False)"
+"""
+
+__all__ = [
+    "CATALOG_VERSION",
+    "FunctionCatalog",
+    "default_cache_path",
+    "discover_modules",
+    "excluded_packages",
+    "parse_module_source",
+]
+
+import ast
+import hashlib
+import json
+import logging
+import os
+import warnings
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION = 1
+
+# Package path parts excluded from the catalog and the import-based scan
+# of list_function.StructureManager (substring match)
+EXCLUDED_PACKAGES = ("utility", "userSetup")
+# Modules that must not be listed (substring match)
+SKIP_MODULES = ("licenseRegister", "fix_loa_connection", "paintable_maps")
+
+
+def excluded_packages():
+    """Return the package name parts to exclude from the catalog.
+
+    ``lunaLib`` is added when ``DEVPYLIB_DISABLE_LUNA`` is ``"1"``.
+
+    Returns:
+        tuple: :data:`EXCLUDED_PACKAGES` plus the disabled libraries.
+    """
+    if os.environ.get("DEVPYLIB_DISABLE_LUNA", "0") == "1":
+        return (*EXCLUDED_PACKAGES, "lunaLib")
+    return EXCLUDED_PACKAGES
+
+
+def default_cache_path(package_name="mayaLib"):
+    """Return the catalog cache file for a package.
+
+    ``DEVPYLIB_CATALOG_CACHE`` overrides the location.
+
+    Args:
+        package_name (str): Root package name.
+
+    Returns:
+        str: Path of the JSON cache file.
+    """
+    override = os.environ.get("DEVPYLIB_CATALOG_CACHE")
+    if override:
+        return override
+    return os.path.join(os.path.expanduser("~"), ".devpylib", f"{package_name}_catalog.json")
+
+
+def _format_arguments(arguments, skip_first=False):
+    """Format an ``ast.arguments`` node like ``inspect.signature`` does.
+
+    Args:
+        arguments (ast.arguments): Function arguments.
+        skip_first (bool): Drop the first positional argument (``self``).
+
+    Returns:
+        str: Signature such as ``(a, b=1, *args, c=None, **kwargs)``.
+    """
+
+    def _arg(arg, default=None):
+        text = arg.arg
+        if arg.annotation is not None:
+            text += f": {ast.unparse(arg.annotation)}"
+        if default is not None:
+            text += f" = {ast.unparse(default)}" if arg.annotation else f"={ast.unparse(default)}"
+        return text
+
+    positional = arguments.posonlyargs + arguments.args
+    defaults = [None] * (len(positional) - len(arguments.defaults)) + list(arguments.defaults)
+    parts = [_arg(arg, default) for arg, default in zip(positional, defaults, strict=True)]
+    if arguments.posonlyargs:
+        parts.insert(len(arguments.posonlyargs), "/")
+    if skip_first and positional:
+        parts.pop(0)
+
+    if arguments.vararg is not None:
+        parts.append("*" + _arg(arguments.vararg))
+    elif arguments.kwonlyargs:
+        parts.append("*")
+    for arg, default in zip(arguments.kwonlyargs, arguments.kw_defaults, strict=True):
+        parts.append(_arg(arg, default))
+    if arguments.kwarg is not None:
+        parts.append("**" + _arg(arguments.kwarg))
+
+    return f"({', '.join(parts)})"
+
+
+def _class_signature(node):
+    """Return the constructor signature of a class definition."""
+    for item in node.body:
+        if isinstance(item, ast.FunctionDef | ast.AsyncFunctionDef) and item.name == "__init__":
+            return _format_arguments(item.args, skip_first=True)
+    return "()"
+
+
+def parse_module_source(source, module_name):
+    """Extract the public top-level classes and functions of a module.
+
+    Only definitions made in the module are listed; names imported from
+    other modules are not.
+
+    Args:
+        source (str): Python source code.
+        module_name (str): Dotted module name.
+
+    Returns:
+        list[dict]: One entry per definition with ``name``, ``qualname``,
+        ``module``, ``kind`` (``"class"`` or ``"function"``), ``signature``,
+        ``doc`` and ``lineno``.
+
+    Raises:
+        SyntaxError: If the source cannot be parsed.
+    """
+    tree = ast.parse(source)
+    entries = []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            kind = "class"
+            signature = _class_signature(node)
+        elif isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            kind = "function"
+            signature = _format_arguments(node.args)
+        else:
+            continue
+        if node.name.startswith("_"):
+            continue
+
+        entries.append(
+            {
+                "name": node.name,
+                "qualname": f"{module_name}.{node.name}",
+                "module": module_name,
+                "kind": kind,
+                "signature": signature,
+                "doc": ast.get_docstring(node) or "",
+                "lineno": node.lineno,
+            }
+        )
+    return entries
+
+
+def _is_excluded(module_name, excluded, skip_modules):
+    """Check a dotted module name against the exclusion lists."""
+    parts = module_name.split(".")[1:]
+    if any(ex in part for part in parts for ex in excluded):
+        return True
+    return any(skip in module_name for skip in skip_modules)
+
+
+def discover_modules(root_dir, package_name, excluded=None, skip=SKIP_MODULES):
+    """Find the modules that make up the menu, without importing anything.
+
+    Follows the package layout on disk: only directories with an
+    ``__init__.py`` are walked. Modules directly in the root package are
+    ignored, and a sub-package contributes its modules rather than its
+    ``__init__`` unless it has no modules at all.
+
+    Args:
+        root_dir (str): Directory of the root package.
+        package_name (str): Dotted name of the root package.
+        excluded (tuple, optional): Package name parts to exclude (substring
+            match). Defaults to :func:`excluded_packages`.
+        skip (tuple): Module names to skip (substring match).
+
+    Returns:
+        dict: ``{module_name: file_path}``.
+    """
+    if excluded is None:
+        excluded = excluded_packages()
+    modules = {}
+
+    def _walk(directory, dotted):
+        children = sorted(os.listdir(directory))
+        found_module = False
+        for child in children:
+            path = os.path.join(directory, child)
+            if os.path.isdir(path):
+                if os.path.isfile(os.path.join(path, "__init__.py")):
+                    found_module = True
+                    _walk(path, f"{dotted}.{child}")
+            elif child.endswith(".py") and child != "__init__.py":
+                found_module = True
+                name = f"{dotted}.{child[:-3]}"
+                if not _is_excluded(name, excluded, skip):
+                    modules[name] = path
+        if not found_module and not _is_excluded(dotted, excluded, skip):
+            modules[dotted] = os.path.join(directory, "__init__.py")
+
+    for child in sorted(os.listdir(root_dir)):
+        path = os.path.join(root_dir, child)
+        if os.path.isfile(os.path.join(path, "__init__.py")):
+            dotted = f"{package_name}.{child}"
+            if not _is_excluded(dotted, excluded, skip):
+                _walk(path, dotted)
+
+    return modules
+
+
+class FunctionCatalog:
+    """Incrementally refreshed catalog of the tools defined in a package.
+
+    Attributes:
+        root_dir: Directory of the root package.
+        package_name: Dotted name of the root package.
+        cache_path: JSON cache file, or None to keep the catalog in memory.
+        files: ``{module_name: record}`` with the file stats, hash and entries.
+        last_refresh: Counts of the last refresh (parsed, cached, removed, errors).
+    """
+
+    def __init__(
+        self,
+        root_dir,
+        package_name,
+        cache_path=None,
+        excluded=None,
+        skip=SKIP_MODULES,
+    ):
+        """Initialize the catalog and load its cache.
+
+        Args:
+            root_dir (str): Directory of the root package.
+            package_name (str): Dotted name of the root package.
+            cache_path (str, optional): JSON cache file. Defaults to None
+                (no persistence).
+            excluded (tuple, optional): Package name parts to exclude.
+                Defaults to :func:`excluded_packages`.
+            skip (tuple): Module names to skip.
+        """
+        self.root_dir = os.path.abspath(root_dir)
+        self.package_name = package_name
+        self.cache_path = cache_path
+        self.excluded = tuple(excluded_packages() if excluded is None else excluded)
+        self.skip = tuple(skip)
+        self.files = {}
+        self.last_refresh = {}
+        self._entries = None
+        self.load_cache()
+
+    @classmethod
+    def for_package(cls, package, cache_path=None, **kwargs):
+        """Create the catalog of an (already imported) root package.
+
+        Only the package's ``__path__`` and ``__name__`` are used; none of
+        its modules are imported.
+
+        Args:
+            package: Root package module, e.g. ``mayaLib``.
+            cache_path (str, optional): JSON cache file. Defaults to
+                :func:`default_cache_path`.
+            **kwargs: Forwarded to the constructor.
+
+        Returns:
+            FunctionCatalog: The catalog, not yet refreshed.
+        """
+        root_dir = list(package.__path__)[0]
+        return cls(
+            root_dir,
+            package.__name__,
+            cache_path=cache_path or default_cache_path(package.__name__),
+            **kwargs,
+        )
+
+    def load_cache(self):
+        """Load the cache file if it exists and matches this catalog."""
+        if not self.cache_path or not os.path.isfile(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == CATALOG_VERSION and data.get("root") == self.root_dir:
+            self.files = data.get("files", {})
+            self._entries = None
+
+    def save_cache(self):
+        """Write the catalog to its cache file."""
+        if not self.cache_path:
+            return
+        data = {"version": CATALOG_VERSION, "root": self.root_dir, "files": self.files}
+        os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+        tmp_path = f"{self.cache_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as exc:
+            warnings.warn(f"Could not write function catalog cache: {exc}", stacklevel=2)
+
+    def refresh(self):
+        """Bring the catalog up to date with the files on disk.
+
+        Returns:
+            dict: Counts of parsed, cached, removed and failed modules.
+        """
+        stats = {"parsed": 0, "cached": 0, "removed": 0, "errors": 0}
+        modules = discover_modules(self.root_dir, self.package_name, self.excluded, self.skip)
+
+        for module_name in set(self.files) - set(modules):
+            del self.files[module_name]
+            stats["removed"] += 1
+
+        for module_name, file_path in modules.items():
+            status = self._refresh_module(module_name, file_path)
+            stats[status] += 1
+
+        self._entries = None
+        self.last_refresh = stats
+        if stats["parsed"] or stats["removed"] or stats["errors"]:
+            self.save_cache()
+        return stats
+
+    def _refresh_module(self, module_name, file_path):
+        """Refresh the record of one module.
+
+        Returns:
+            str: ``"cached"``, ``"parsed"`` or ``"errors"``.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            self.files.pop(module_name, None)
+            return "errors"
+
+        record = self.files.get(module_name)
+        if (
+            record
+            and record["path"] == file_path
+            and record["size"] == stat.st_size
+            and record["mtime_ns"] == stat.st_mtime_ns
+        ):
+            return "cached"
+
+        try:
+            with open(file_path, "rb") as f:
+                raw = f.read()
+        except OSError:
+            self.files.pop(module_name, None)
+            return "errors"
+        digest = hashlib.sha1(raw).hexdigest()
+        if record and record["sha1"] == digest:
+            record.update(path=file_path, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+            return "cached"
+
+        record = {
+            "path": file_path,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha1": digest,
+            "entries": [],
+            "error": "",
+        }
+        self.files[module_name] = record
+        try:
+            record["entries"] = parse_module_source(raw.decode("utf-8"), module_name)
+        except (SyntaxError, UnicodeDecodeError, ValueError) as exc:
+            record["error"] = str(exc)
+            logger.warning("Could not parse %s: %s", module_name, exc)
+            return "errors"
+        return "parsed"
+
+    @property
+    def entries(self):
+        """All catalog entries keyed by qualified name, in module/line order."""
+        if self._entries is None:
+            self._entries = {}
+            for module_name in sorted(self.files):
+                for entry in self.files[module_name]["entries"]:
+                    self._entries[entry["qualname"]] = entry
+        return self._entries
+
+    def qualnames(self):
+        """Return the qualified name of every cataloged class and function.
+
+        Returns:
+            list[str]: Dotted names such as ``mayaLib.rigLib.utils.skin.save_skin_weights``.
+        """
+        return list(self.entries)
+
+    def get(self, qualname):
+        """Return the entry of a class or function.
+
+        Args:
+            qualname (str): Dotted name of the class or function.
+
+        Returns:
+            dict | None: The entry, or None if it is not cataloged.
+        """
+        return self.entries.get(qualname)
@@ -2,6 +2,10 @@
 
 Provides tools for discovering available functions and classes in modules
 for dynamic UI generation via the StructureManager class.
+
+By default the structure comes from a static :mod:`function_catalog` built
+by parsing the sources, so no library module is imported until one of its
+tools is executed. The import-based scan is kept behind ``use_catalog=False``.
 """
 
 __author__ = "Lorenzo Argentieri"
@@ -13,10 +17,10 @@ if pm.about(version=True) == "2022":
 else:
     import collections.abc as collection
 import inspect
-import os
 import pkgutil
 
 import mayaLib as mLib
+from mayaLib.pipelineLib.utility.function_catalog import FunctionCatalog, excluded_packages
 
 
 class StructureManager:
@@ -24,18 +28,25 @@ class StructureManager:
 
     # root_package = ''
 
-    def __init__(self, lib, lazy=False):
+    def __init__(self, lib, lazy=False, use_catalog=True, cache_path=None):
         """Initialize the class with the root package.
 
         Args:
             lib: The root package to scan for functions and classes.
             lazy (bool): If True, defer expensive scanning operations until first access.
                 Defaults to False for backwards compatibility.
+            use_catalog (bool): Build the structure from the static source
+                catalog instead of importing every module. Defaults to True.
+            cache_path (str, optional): Catalog cache file. Defaults to
+                ``function_catalog.default_cache_path()``.
         """
         self.root_package = lib
         self.struct_lib = {}
         self._lazy = lazy
         self._initialized = False
+        self._use_catalog = use_catalog
+        self._cache_path = cache_path
+        self.catalog = None
 
         self.final_class_list = []
         self.module_class_list = []
@@ -68,7 +79,9 @@ class StructureManager:
         immediately during __init__ when lazy=False (backwards compatibility).
 
         The method scans the root package to build a nested dictionary structure
-        mapping package/module paths to their classes and functions.
+        mapping package/module paths to their classes and functions. With
+        the catalog the sources are parsed (or read from the cache) instead of
+        imported.
         """
         # Skip if already initialized
         if self._initialized:
@@ -76,6 +89,26 @@ class StructureManager:
 
         self._initialized = True
 
+        if self._use_catalog:
+            self.catalog = FunctionCatalog.for_package(
+                self.root_package, cache_path=self._cache_path
+            )
+            self.catalog.refresh()
+            self.final_class_list = self.catalog.qualnames()
+        else:
+            self._scan_by_import()
+
+        # Build nested dictionary structure
+        for item in self.final_class_list:
+            split = item.split(".")
+            tmp_dict = {}
+            for key in reversed(split):
+                tmp_dict = {key: item} if key == split[-1] else self.incapsulate_dict(tmp_dict, key)
+
+            self.dict_merge(self.struct_lib, tmp_dict)
+
+    def _scan_by_import(self):
+        """Fill final_class_list by importing every module and inspecting it."""
         # Scan all packages
         self.package_list = self.list_all_package()
 
@@ -110,15 +143,6 @@ class StructureManager:
             for f in self.function_list:
                 self.final_class_list.append(item + "." + f[0])
 
-        # Build nested dictionary structure
-        for item in self.final_class_list:
-            split = item.split(".")
-            tmp_dict = {}
-            for key in reversed(split):
-                tmp_dict = {key: item} if key == split[-1] else self.incapsulate_dict(tmp_dict, key)
-
-            self.dict_merge(self.struct_lib, tmp_dict)
-
     def dict_merge(self, dct, merge_dct):
         """Recursively merges two dictionaries.
 
@@ -163,16 +187,40 @@ class StructureManager:
         func = getattr(module, function)
         return func
 
-    # Packages to always exclude from discovery
-    _EXCLUDED_PACKAGES = {"utility", "userSetup"}
+    def load_callable(self, lib_str):
+        """Import the module of a dotted tool name and return the tool.
+
+        Args:
+            lib_str (str): Dotted name, e.g. ``mayaLib.rigLib.utils.skin.save_skin_weights``.
+
+        Returns:
+            The class or function.
+        """
+        module_string, _, name = lib_str.rpartition(".")
+        return self.import_and_exec(module_string, name)
+
+    def get_doc(self, lib_str):
+        """Return the documentation of a tool without importing it when possible.
+
+        Args:
+            lib_str (str): Dotted name of the class or function.
+
+        Returns:
+            str: Signature and docstring from the catalog, or the docstring of
+            the imported object when no catalog is used.
+        """
+        self._ensure_initialized()
+        if self.catalog is not None:
+            entry = self.catalog.get(lib_str)
+            if entry is None:
+                return ""
+            return f"{entry['name']}{entry['signature']}\n\n{entry['doc']}".rstrip()
+        return inspect.getdoc(self.load_callable(lib_str)) or ""
 
     def list_all_package(self):
         """Return a list of all packages in the root package."""
-        excluded = set(self._EXCLUDED_PACKAGES)
-
-        # Exclude lunaLib when disabled via environment variable
-        if os.environ.get("DEVPYLIB_DISABLE_LUNA", "0") == "1":
-            excluded.add("lunaLib")
+        # Same exclusions as the catalog, lunaLib included when disabled
+        excluded = excluded_packages()
 
         package_list = []
         for p in pkgutil.walk_packages(self.root_package.__path__):
@@ -23,18 +23,25 @@ Attributes:
     bulgeshape (ramp): Falloff curve for bulge effect
     backface_culling (enum): Toggle backface collision detection
     sculpt_mode (enum): Lock deformation for sculpting
+    collisionStats (compound, output): Vertices ray-tested, bulge candidates
+        and total vertices of the last evaluation
+
+Only vertices inside the collider's world bounding box are ray-tested, and
+only vertices within the bulge range of that box are bulged; everything
+else is culled before any per-vertex API call.
 
 Author: Jan Lachauer (janlachauer@googlemail.com)
 Support: https://www.paypal.com/cgi-bin/webscr?cmd=_s-xclick&hosted_button_id=7KFXBVDNNMWHW
 """
 
 import contextlib
-import copy
+import ctypes
 import sys
 
 import maya.cmds as cmds
 import maya.OpenMaya as OpenMaya
 import maya.OpenMayaMPx as OpenMayaMPx
+import numpy as np
 from maya.mel import eval as meval
 
 K_PLUGIN_NODE_TYPE_NAME = "collisionDeformer"
@@ -51,12 +58,21 @@ if K_API_VERSION < 201600:
     K_OUTPUT_GEOM = OpenMayaMPx.cvar.MPxDeformerNode_outputGeom
     K_ENVELOPE = OpenMayaMPx.cvar.MPxDeformerNode_envelope
     K_GROUP_ID = OpenMayaMPx.cvar.MPxDeformerNode_groupId
+    K_WEIGHT_LIST = OpenMayaMPx.cvar.MPxDeformerNode_weightList
+    K_WEIGHTS = OpenMayaMPx.cvar.MPxDeformerNode_weights
 else:
     K_INPUT = OpenMayaMPx.cvar.MPxGeometryFilter_input
     K_INPUT_GEOM = OpenMayaMPx.cvar.MPxGeometryFilter_inputGeom
     K_OUTPUT_GEOM = OpenMayaMPx.cvar.MPxGeometryFilter_outputGeom
     K_ENVELOPE = OpenMayaMPx.cvar.MPxGeometryFilter_envelope
     K_GROUP_ID = OpenMayaMPx.cvar.MPxGeometryFilter_groupId
+    K_WEIGHT_LIST = OpenMayaMPx.cvar.MPxDeformerNode_weightList
+    K_WEIGHTS = OpenMayaMPx.cvar.MPxDeformerNode_weights
+
+# Slack added around the collider bounding box for the broad phase
+BROAD_PHASE_EPSILON = 1e-4
+# Number of bulge ramp samples in the falloff lookup table
+RAMP_LUT_SIZE = 256
 
 
 # Node definition
@@ -81,17 +97,123 @@ class CollisionDeformer(OpenMayaMPx.MPxDeformerNode):
         the Plug-in Manager or programmatically via pm.loadPlugin().
     """
 
-    # class variables
-    mm_accel_params = OpenMaya.MMeshIsectAccelParams()
-    intersector = OpenMaya.MMeshIntersector()
-    new_points = OpenMaya.MFloatPointArray()
-    max_dist = 0
-    base_collider_points = OpenMaya.MFloatPointArray()
-
     def __init__(self):
-        """Initialize CollisionDeformer deformer node."""
+        """Initialize CollisionDeformer deformer node and its per-node caches."""
         OpenMayaMPx.MPxDeformerNode.__init__(self)
 
+        self.mm_accel_params = OpenMaya.MMeshIsectAccelParams()
+        self.intersector = OpenMaya.MMeshIntersector()
+        # (N, 3) deformed points, kept between evaluations for sculpt mode
+        self.new_points = None
+        # Collider topology the acceleration grid was built for
+        self.collider_topology = None
+        # Painted weights per geometry index, dropped when the weight list is dirty
+        self.weight_cache = {}
+        # Broad phase statistics of the last evaluation
+        self.last_stats = (0, 0, 0)
+
+    def _get_weights(self, data_block, multi_index, count):
+        """Get the painted deformer weights of one geometry.
+
+        Weights are read once and cached until the data block reports the
+        weight list as dirty, so evaluations that only move the collider or
+        the mesh do not walk the weight list. The check runs here rather
+        than in ``setDependentsDirty``, which the Evaluation Manager does
+        not call during playback.
+
+        Args:
+            data_block: Maya data block containing node attributes
+            multi_index: Logical index of the deformed geometry
+            count: Number of vertices of the geometry
+
+        Returns:
+            np.ndarray: Weight per vertex; vertices without a stored weight get 1.0.
+        """
+        if not data_block.isClean(K_WEIGHT_LIST):
+            # Reading any geometry cleans the whole list, so drop them all
+            self.weight_cache.clear()
+
+        weights = self.weight_cache.get(multi_index)
+        if weights is not None and len(weights) == count:
+            return weights
+
+        weights = np.ones(count)
+        self.weight_cache[multi_index] = weights
+        weight_list = data_block.inputArrayValue(K_WEIGHT_LIST)
+        try:
+            weight_list.jumpToElement(multi_index)
+        except RuntimeError:
+            return weights
+
+        weights_handle = OpenMaya.MArrayDataHandle(weight_list.inputValue().child(K_WEIGHTS))
+        indices = []
+        values = []
+        for ii in range(weights_handle.elementCount()):
+            if ii:
+                weights_handle.next()
+            indices.append(weights_handle.elementIndex())
+            values.append(weights_handle.inputValue().asFloat())
+
+        indices = np.array(indices, dtype=np.int64)
+        in_range = indices < count
+        weights[indices[in_range]] = np.array(values)[in_range]
+        return weights
+
+    def _update_accel_params(self, collider_fn):
+        """Rebuild the collider's intersection grid only when its topology changes.
+
+        Args:
+            collider_fn: MFnMesh function set for collider mesh
+        """
+        topology = (
+            collider_fn.numVertices(),
+            collider_fn.numEdges(),
+            collider_fn.numPolygons(),
+            collider_fn.numFaceVertices(),
+        )
+        if topology != self.collider_topology:
+            self.mm_accel_params = collider_fn.autoUniformGridParams()
+            self.collider_topology = topology
+
+    def _is_stats_plug(self, plug):
+        """Check if a plug is collisionStats or one of its children.
+
+        Args:
+            plug (MPlug): Plug being computed.
+
+        Returns:
+            bool: True for the statistics plugs.
+        """
+        if plug == self.collisionStats:
+            return True
+        return plug.isChild() and plug.parent() == self.collisionStats
+
+    def _compute_stats(self, data_block):
+        """Evaluate the deformed geometry and write its broad phase statistics.
+
+        The statistics are a by-product of deforming, so every connected
+        output geometry is pulled first; that runs :meth:`compute` for the
+        dirty ones, which updates :attr:`last_stats`.
+
+        Args:
+            data_block: Maya data block containing node attributes
+        """
+        output_plug = OpenMaya.MPlug(self.thisMObject(), K_OUTPUT_GEOM)
+        indices = OpenMaya.MIntArray()
+        output_plug.getExistingArrayAttributeIndices(indices)
+        for i in range(indices.length()):
+            output_plug.elementByLogicalIndex(indices[i]).asMObject()
+
+        for attribute, value in zip(
+            (self.statCandidates, self.statBulgeCandidates, self.statVertices),
+            self.last_stats,
+            strict=True,
+        ):
+            handle = data_block.outputValue(attribute)
+            handle.setInt(int(value))
+            handle.setClean()
+        data_block.setClean(self.collisionStats)
+
     def _get_input_mesh_data(self, data_block, plug):
         """Retrieve input mesh geometry data.
 
@@ -100,10 +222,10 @@ class CollisionDeformer(OpenMayaMPx.MPxDeformerNode):
             plug: The plug being computed
 
         Returns:
-            tuple: (multi_index, in_mesh_fn, in_points, h_input_geom, sculpt_value)
+            tuple: (multi_index, in_mesh_fn, in_coords, h_input_geom, sculpt_value)
                 - multi_index: Logical index of the plug
                 - in_mesh_fn: MFnMesh function set for input mesh
-                - in_points: MFloatPointArray of input mesh points in world space
+                - in_coords: ``(N, 3)`` input mesh points in world space
                 - h_input_geom: Handle to input geometry
                 - sculpt_value: Sculpt mode attribute value
         """
@@ -127,12 +249,13 @@ class CollisionDeformer(OpenMayaMPx.MPxDeformerNode):
 
         in_points = OpenMaya.MFloatPointArray()
         in_mesh_fn.getPoints(in_points, OpenMaya.MSpace.kWorld)
+        in_coords = float_point_array_to_numpy(in_points)
 
-        # Copy points into array to set them later
-        if self.new_points.length() == 0 or sculpt_value == 0:
-            self.new_points = copy.copy(in_points)
+        # Copy points to deform them; sculpt mode keeps the previous result
+        if self.new_points is None or len(self.new_points) != len(in_coords) or sculpt_value == 0:
+            self.new_points = in_coords.copy()
 
-        return multi_index, in_mesh_fn, in_points, h_input_geom, sculpt_value
+        return multi_index, in_mesh_fn, in_coords, h_input_geom, sculpt_value
 
     def _get_collider_data(self, data_block):
         """Retrieve and process collider mesh data.
@@ -190,66 +313,62 @@ class CollisionDeformer(OpenMayaMPx.MPxDeformerNode):
         )
 
     def _apply_collider_offset(
-        self, collider_fn, collider_points, offset_value, pcounts, pconnect, polycount
+        self, collider_fn, collider_coords, offset_value, pcounts, pconnect, polycount
     ):
         """Apply offset to collider mesh by moving vertices along their normals.
 
         Args:
             collider_fn: MFnMesh function set for collider mesh
-            collider_points: Original collider mesh points
+            collider_coords: ``(N, 3)`` original collider mesh points
             offset_value: Distance to offset along normals
             pcounts: Polygon vertex counts array
             pconnect: Polygon vertex connection array
             polycount: Number of polygons in collider mesh
-
-        Returns:
-            MFloatPointArray: Base collider points before offset (for restoration)
         """
-        base_collider_points = copy.copy(collider_points)
-        new_collider_points = OpenMaya.MFloatPointArray()
-        collider_point_normal = OpenMaya.MVector()
-
-        for i in range(collider_points.length()):
-            collider_fn.getVertexNormal(i, collider_point_normal, OpenMaya.MSpace.kObject)
-            new_collider_point = OpenMaya.MFloatPoint(
-                collider_points[i].x + collider_point_normal.x * offset_value,
-                collider_points[i].y + collider_point_normal.y * offset_value,
-                collider_points[i].z + collider_point_normal.z * offset_value,
-            )
-            new_collider_points.append(new_collider_point)
+        collider_normals = OpenMaya.MFloatVectorArray()
+        collider_fn.getVertexNormals(False, collider_normals, OpenMaya.MSpace.kObject)
+        offset_coords = (
+            collider_coords + float_vector_array_to_numpy(collider_normals) * offset_value
+        )
 
         with contextlib.suppress(RuntimeError):
             collider_fn.createInPlace(
-                collider_points.length(), polycount, new_collider_points, pcounts, pconnect
+                len(offset_coords),
+                polycount,
+                numpy_to_float_point_array(offset_coords),
+                pcounts,
+                pconnect,
             )
 
-        return base_collider_points
-
     def _process_direct_collision(
         self,
-        in_mesh_fn,
         collider_fn,
         collider_object,
         collider_matrix_value,
         threshold_value,
         backface_value,
-        in_points,
-        data_block,
-        multi_index,
+        in_coords,
+        in_normals,
+        weights,
+        candidates,
         envelope_value,
     ):
         """Process direct collision detection and deformation.
 
+        Ray tests and closest point queries run per broad phase candidate;
+        the resulting offsets are applied to :attr:`new_points` in one
+        array operation.
+
         Args:
-            in_mesh_fn: MFnMesh function set for input mesh
             collider_fn: MFnMesh function set for collider mesh
             collider_object: Collider mesh object
             collider_matrix_value: Collider transform matrix
             threshold_value: Maximum distance threshold for collision detection
             backface_value: Backface culling setting (0=off, 1=on)
-            in_points: Original input mesh points
-            data_block: Maya data block for accessing weights
-            multi_index: Logical index of the deformer
+            in_coords: ``(N, 3)`` original input mesh points
+            in_normals: MFloatVectorArray of input mesh vertex normals in world space
+            weights: Deformer weight per vertex
+            candidates: Vertex indices that passed the broad phase
             envelope_value: Overall deformer envelope value
 
         Returns:
@@ -258,32 +377,21 @@ class CollisionDeformer(OpenMayaMPx.MPxDeformerNode):
                 - max_deformation: Maximum deformation distance
                 - deformed_points_indices: List of point indices that were deformed
         """
-        check_collision = 0
-        max_deformation = 0.0
         deformed_points_indices = []
+        target_points = []
 
-        point_normal = OpenMaya.MVector()
         point_info = OpenMaya.MPointOnMesh()
         empty_float_array = OpenMaya.MFloatArray()
 
-        # Create intersector
-        try:
-            self.intersector.create(collider_object, collider_matrix_value)
-            self.mm_accel_params = collider_fn.autoUniformGridParams()
-        except RuntimeError:
-            # Can't create intersector
-            return check_collision, max_deformation, deformed_points_indices
-
-        # Process each vertex for direct collision
-        for k in range(self.new_points.length()):
-            in_mesh_fn.getVertexNormal(k, point_normal, OpenMaya.MSpace.kWorld)
+        # Process each broad phase candidate for direct collision
+        for k in candidates:
+            k = int(k)
+            x, y, z = self.new_points[k].tolist()
 
             # Define intersection ray from the mesh vertex
-            ray_source = OpenMaya.MFloatPoint(
-                self.new_points[k].x, self.new_points[k].y, self.new_points[k].z
-            )
-            ray_direction = OpenMaya.MFloatVector(point_normal)
-            point = OpenMaya.MPoint(self.new_points[k])
+            ray_source = OpenMaya.MFloatPoint(x, y, z)
+            ray_direction = OpenMaya.MFloatVector(in_normals[k])
+            point = OpenMaya.MPoint(x, y, z)
 
             # MeshFn.allIntersections variables
             face_ids = None
@@ -348,7 +456,6 @@ class CollisionDeformer(OpenMayaMPx.MPxDeformerNode):
 
             # Process collision if detected
             if collision == 1:
-                check_collision += 1
                 deformed_points_indices.append(k)
 
                 # Get closest point on collider mesh
@@ -364,82 +471,78 @@ class CollisionDeformer(OpenMayaMPx.MPxDeformerNode):
                 else:
                     world_point = close_point
                     world_point = world_point * collider_matrix_value
+                target_points.append((world_point.x, world_point.y, world_point.z))
 
-                # Update maximum deformation distance
-                deformation_distance = point.distanceTo(world_point)
-                if max_deformation < deformation_distance:
-                    max_deformation = deformation_distance
+        if not deformed_points_indices:
+            return 0, 0.0, deformed_points_indices
 
-                # Apply deformation with weight
-                weight = self.weightValue(data_block, multi_index, k)
-                self.new_points[k].x += (world_point.x - in_points[k].x) * envelope_value * weight
-                self.new_points[k].y += (world_point.y - in_points[k].y) * envelope_value * weight
-                self.new_points[k].z += (world_point.z - in_points[k].z) * envelope_value * weight
+        # Move every colliding vertex towards its target at once
+        indices = np.array(deformed_points_indices, dtype=np.int64)
+        targets = np.array(target_points)
+        max_deformation = float(np.linalg.norm(targets - self.new_points[indices], axis=1).max())
+        scale = envelope_value * weights[indices]
+        self.new_points[indices] += (targets - in_coords[indices]) * scale[:, None]
 
-        return check_collision, max_deformation, deformed_points_indices
+        return len(indices), max_deformation, deformed_points_indices
 
     def _process_indirect_collision(
         self,
-        in_mesh_fn,
         collider_matrix_value,
         bulge_extend_value,
         bulge_value,
         max_deformation,
-        data_block,
-        multi_index,
+        normal_coords,
+        weights,
+        candidates,
         envelope_value,
-        this_node,
+        bulgeshape_handle,
     ):
         """Process indirect collision (bulge) deformation.
 
+        Closest points are queried per candidate; the falloff comes from a
+        lookup table of the bulge ramp and the offsets are applied in one
+        array operation.
+
         Args:
-            in_mesh_fn: MFnMesh function set for input mesh
             collider_matrix_value: Collider transform matrix
             bulge_extend_value: Maximum bulge range
             bulge_value: Bulge strength multiplier
             max_deformation: Maximum deformation distance from direct collision
-            data_block: Maya data block for accessing weights
-            multi_index: Logical index of the deformer
+            normal_coords: ``(N, 3)`` input mesh vertex normals in world space
+            weights: Deformer weight per vertex
+            candidates: Vertex indices within bulge range of the collider bounds
             envelope_value: Overall deformer envelope value
-            this_node: This node's MObject
+            bulgeshape_handle: MRampAttribute of the bulge falloff curve
         """
-        in_mesh_normal = OpenMaya.MVector()
-        indir_point_info = OpenMaya.MPointOnMesh()
-        bulgeshape_value_util = OpenMaya.MScriptUtil()
-        bulgeshape_value = bulgeshape_value_util.asFloatPtr()
-        bulgeshape_handle = OpenMaya.MRampAttribute(this_node, self.bulgeshape)
-
-        for i in range(self.new_points.length()):
-            in_mesh_fn.getVertexNormal(i, in_mesh_normal, OpenMaya.MSpace.kWorld)
-
-            indir_point = OpenMaya.MPoint(self.new_points[i])
-            self.intersector.getClosestPoint(indir_point, indir_point_info)
-            indir_close_point = OpenMaya.MPoint(indir_point_info.getPoint())
-
-            indir_world_point = indir_close_point * collider_matrix_value
-            bulge_pnts_dist = indir_point.distanceTo(indir_world_point)
-
-            weight = self.weightValue(data_block, multi_index, i)
-
-            # Calculate relative distance based on maximum bulge range
-            relative_distance = bulge_pnts_dist / (bulge_extend_value + 0.00001)
+        if not len(candidates):
+            return
 
-            # Get bulge curve value
-            bulgeshape_handle.getValueAtPosition(float(relative_distance), bulgeshape_value)
-            bulge_amount = OpenMaya.MScriptUtil().getFloat(bulgeshape_value)
+        indir_point_info = OpenMaya.MPointOnMesh()
+        close_points = np.empty((len(candidates), 3))
+        for row, (x, y, z) in enumerate(self.new_points[candidates].tolist()):
+            self.intersector.getClosestPoint(OpenMaya.MPoint(x, y, z), indir_point_info)
+            indir_world_point = OpenMaya.MPoint(indir_point_info.getPoint()) * collider_matrix_value
+            close_points[row] = (indir_world_point.x, indir_world_point.y, indir_world_point.z)
+
+        # Relative distance based on maximum bulge range, shaped by the ramp
+        bulge_pnts_dist = np.linalg.norm(close_points - self.new_points[candidates], axis=1)
+        relative_distance = bulge_pnts_dist / (bulge_extend_value + 0.00001)
+        bulge_amount = np.interp(
+            relative_distance,
+            np.linspace(0.0, 1.0, RAMP_LUT_SIZE),
+            ramp_lut(bulgeshape_handle, RAMP_LUT_SIZE),
+        )
 
-            # Apply bulge deformation
-            bulge_scale = (
-                bulge_extend_value
-                * (bulge_value / 5)
-                * envelope_value
-                * bulge_amount
-                * max_deformation
-                * weight
-            )
-            self.new_points[i].x += in_mesh_normal.x * bulge_scale
-            self.new_points[i].y += in_mesh_normal.y * bulge_scale
-            self.new_points[i].z += in_mesh_normal.z * bulge_scale
+        # Apply bulge deformation
+        bulge_scale = (
+            bulge_extend_value
+            * (bulge_value / 5)
+            * envelope_value
+            * bulge_amount
+            * max_deformation
+            * weights[candidates]
+        )
+        self.new_points[candidates] += normal_coords[candidates] * bulge_scale[:, None]
 
     def compute(self, plug, data_block):
         """Main compute method for collision deformer.
@@ -449,7 +552,14 @@ class CollisionDeformer(OpenMayaMPx.MPxDeformerNode):
         2. Processing direct collision (vertices inside collider)
         3. Processing indirect collision (bulge effect)
         4. Updating output mesh geometry
+
+        Requests for collisionStats evaluate the deformation and report the
+        broad phase statistics of its last run.
         """
+        if self._is_stats_plug(plug):
+            self._compute_stats(data_block)
+            return
+
         # Get this node reference
         this_node = self.thisMObject()
 
@@ -471,7 +581,7 @@ class CollisionDeformer(OpenMayaMPx.MPxDeformerNode):
         backface_value = backface_handle.asShort()
 
         # Get input mesh data
-        multi_index, in_mesh_fn, in_points, h_input_geom, sculpt_value = self._get_input_mesh_data(
+        multi_index, in_mesh_fn, in_coords, h_input_geom, sculpt_value = self._get_input_mesh_data(
             data_block, plug
         )
 
@@ -495,53 +605,92 @@ class CollisionDeformer(OpenMayaMPx.MPxDeformerNode):
         ) = collider_data
 
         # Early exit if no valid collider or envelope is zero
+        num_points = len(self.new_points)
         if collider_fn is None or envelope_value == 0:
+            self.last_stats = (0, 0, num_points)
             return
 
         # Apply offset to collider if needed
-        base_collider_points = None
+        collider_coords = float_point_array_to_numpy(collider_points)
         if offset_value != 0:
-            base_collider_points = self._apply_collider_offset(
-                collider_fn, collider_points, offset_value, pcounts, pconnect, polycount
+            self._apply_collider_offset(
+                collider_fn, collider_coords, offset_value, pcounts, pconnect, polycount
             )
 
+        # Create intersector; the acceleration grid follows collider topology
+        try:
+            self.intersector.create(collider_object, collider_matrix_value)
+            self._update_accel_params(collider_fn)
+            intersector_ready = True
+        except RuntimeError:
+            # Can't create intersector
+            intersector_ready = False
+
+        # Fetch normals and weights once for all vertices
+        in_normals = OpenMaya.MFloatVectorArray()
+        in_mesh_fn.getVertexNormals(False, in_normals, OpenMaya.MSpace.kWorld)
+        weights = self._get_weights(data_block, multi_index, num_points)
+
+        # Broad phase: only vertices inside the collider bounds can collide,
+        # only vertices within bulge range of them can bulge. Ray tests run
+        # on the collider points as stored while closest points go through
+        # the collider matrix, so the box encloses both.
+        padding = abs(offset_value) + BROAD_PHASE_EPSILON
+        raw_min, raw_max = world_bounding_box(collider_coords, OpenMaya.MMatrix(), padding)
+        box_min, box_max = world_bounding_box(collider_coords, collider_matrix_value, padding)
+        box_distance = distance_to_box(
+            self.new_points,
+            np.minimum(raw_min, box_min),
+            np.maximum(raw_max, box_max),
+        )
+        candidates = np.flatnonzero(box_distance <= 0.0) if intersector_ready else []
+
         # Process direct collision detection and deformation
         check_collision, max_deformation, deformed_points_indices = self._process_direct_collision(
-            in_mesh_fn,
             collider_fn,
             collider_object,
             collider_matrix_value,
             threshold_value,
             backface_value,
-            in_points,
-            data_block,
-            multi_index,
+            in_coords,
+            in_normals,
+            weights,
+            candidates,
             envelope_value,
         )
 
         # Process indirect collision (bulge) if any direct collision occurred
-        if check_collision != 0:
+        bulge_candidates = []
+        if check_collision != 0 and bulge_value * bulge_extend_value != 0:
+            bulgeshape_handle = OpenMaya.MRampAttribute(this_node, self.bulgeshape)
+            in_range = weights != 0
+            if ramp_value_at(bulgeshape_handle, 1.0) == 0:
+                # The curve ends at zero, so vertices beyond the range do not move
+                in_range &= box_distance <= bulge_extend_value
+            bulge_candidates = np.flatnonzero(in_range)
             self._process_indirect_collision(
-                in_mesh_fn,
                 collider_matrix_value,
                 bulge_extend_value,
                 bulge_value,
                 max_deformation,
-                data_block,
-                multi_index,
+                float_vector_array_to_numpy(in_normals),
+                weights,
+                bulge_candidates,
                 envelope_value,
-                this_node,
+                bulgeshape_handle,
             )
 
+        self.last_stats = (len(candidates), len(bulge_candidates), num_points)
+
         # Update output mesh with deformed points
-        out_mesh_fn.setPoints(self.new_points, OpenMaya.MSpace.kWorld)
+        out_mesh_fn.setPoints(numpy_to_float_point_array(self.new_points), OpenMaya.MSpace.kWorld)
         data_block.setClean(self.outputGeom)
 
         # Restore collider to original position if offset was applied
-        if offset_value != 0 and base_collider_points is not None:
+        if offset_value != 0:
             with contextlib.suppress(RuntimeError):
                 collider_fn.createInPlace(
-                    collider_points.length(), polycount, base_collider_points, pcounts, pconnect
+                    collider_points.length(), polycount, collider_points, pcounts, pconnect
                 )
 
     # accessoryNodeSetup used to initialize the ramp attributes
@@ -608,6 +757,165 @@ def float_m_matrix_to_m_matrix(fm):
     return mat
 
 
+def ramp_value_at(ramp_handle, position):
+    """Sample a curve ramp attribute at one position.
+
+    Args:
+        ramp_handle (MRampAttribute): Curve ramp to sample.
+        position (float): Position along the ramp.
+
+    Returns:
+        float: Ramp value at the position.
+    """
+    value_util = OpenMaya.MScriptUtil()
+    value_ptr = value_util.asFloatPtr()
+    ramp_handle.getValueAtPosition(float(position), value_ptr)
+    return OpenMaya.MScriptUtil().getFloat(value_ptr)
+
+
+def ramp_lut(ramp_handle, size=RAMP_LUT_SIZE):
+    """Sample a curve ramp attribute at evenly spaced positions.
+
+    Args:
+        ramp_handle (MRampAttribute): Curve ramp to sample.
+        size (int): Number of samples over ``[0, 1]``.
+
+    Returns:
+        np.ndarray: Ramp value per sample, for ``np.interp`` lookups.
+    """
+    return np.array([ramp_value_at(ramp_handle, position) for position in np.linspace(0, 1, size)])
+
+
+def _read_float_buffer(pointer, count, width):
+    """Copy a C float buffer into an ``(count, width)`` float64 array.
+
+    Args:
+        pointer: SWIG float pointer, e.g. from ``MScriptUtil.asFloat4Ptr``.
+        count (int): Number of rows.
+        width (int): Floats per row.
+
+    Returns:
+        np.ndarray: Copied values.
+    """
+    values = (ctypes.c_float * (count * width)).from_address(int(pointer))
+    return np.array(values, dtype=np.float64).reshape(count, width)
+
+
+def _float_buffer(count, width):
+    """Allocate a zeroed MScriptUtil float buffer.
+
+    Args:
+        count (int): Number of rows.
+        width (int): Floats per row, 3 or 4.
+
+    Returns:
+        tuple: ``(util, pointer)``; keep ``util`` alive while using ``pointer``.
+    """
+    util = OpenMaya.MScriptUtil()
+    util.createFromList([0.0] * (count * width), count * width)
+    pointer = util.asFloat4Ptr() if width == 4 else util.asFloat3Ptr()
+    return util, pointer
+
+
+def float_point_array_to_numpy(points):
+    """Convert an MFloatPointArray to an ``(N, 3)`` array with one bulk copy.
+
+    Args:
+        points (MFloatPointArray): Points to convert.
+
+    Returns:
+        np.ndarray: Point coordinates.
+    """
+    count = points.length()
+    if not count:
+        return np.zeros((0, 3))
+    util, pointer = _float_buffer(count, 4)
+    points.get(pointer)
+    return _read_float_buffer(pointer, count, 4)[:, :3]
+
+
+def float_vector_array_to_numpy(vectors):
+    """Convert an MFloatVectorArray to an ``(N, 3)`` array with one bulk copy.
+
+    Args:
+        vectors (MFloatVectorArray): Vectors to convert.
+
+    Returns:
+        np.ndarray: Vector coordinates.
+    """
+    count = vectors.length()
+    if not count:
+        return np.zeros((0, 3))
+    util, pointer = _float_buffer(count, 3)
+    vectors.get(pointer)
+    return _read_float_buffer(pointer, count, 3)
+
+
+def numpy_to_float_point_array(coords):
+    """Convert an ``(N, 3)`` array to an MFloatPointArray in one call.
+
+    Args:
+        coords (np.ndarray): Point coordinates.
+
+    Returns:
+        MFloatPointArray: Points with ``w = 1``.
+    """
+    count = len(coords)
+    values = np.ones((count, 4))
+    values[:, :3] = coords
+    util = OpenMaya.MScriptUtil()
+    util.createFromList(values.ravel().tolist(), count * 4)
+    return OpenMaya.MFloatPointArray(util.asFloat4Ptr(), count)
+
+
+def world_bounding_box(points, matrix, padding=0.0):
+    """Compute the world space bounding box of object space points.
+
+    The object space box is padded, then its eight corners are moved to
+    world space, so the result always encloses the transformed points.
+
+    Args:
+        points (np.ndarray): ``(N, 3)`` object space points.
+        matrix (MMatrix): Object to world transform.
+        padding (float): Object space distance added on every side.
+
+    Returns:
+        tuple: ``(box_min, box_max)`` world space corners.
+    """
+    if not len(points):
+        return np.zeros(3), np.full(3, -1.0)
+
+    box_min = points.min(axis=0) - padding
+    box_max = points.max(axis=0) + padding
+    corners = np.array(
+        [
+            [x, y, z, 1.0]
+            for x in (box_min[0], box_max[0])
+            for y in (box_min[1], box_max[1])
+            for z in (box_min[2], box_max[2])
+        ]
+    )
+    world_matrix = np.array([[matrix(row, column) for column in range(4)] for row in range(4)])
+    world = corners @ world_matrix
+    world = world[:, :3] / world[:, 3:]
+    return world.min(axis=0), world.max(axis=0)
+
+
+def distance_to_box(points, box_min, box_max):
+    """Distance of every point to an axis aligned box.
+
+    Args:
+        points (np.ndarray): ``(N, 3)`` points.
+        box_min (np.ndarray): Minimum box corner.
+        box_max (np.ndarray): Maximum box corner.
+
+    Returns:
+        np.ndarray: Distance per point, 0 for points inside the box.
+    """
+    outside = np.maximum(box_min - points, 0.0) + np.maximum(points - box_max, 0.0)
+    return np.linalg.norm(outside, axis=1)
+
+
 def node_creator():
     """Create and return a new CollisionDeformer node instance.
 
@@ -695,6 +1003,23 @@ def node_initializer():
     e_attr.setKeyable(True)
     e_attr.setStorable(True)
 
+    CollisionDeformer.statCandidates = n_attr.create(
+        "statCandidates", "stc", OpenMaya.MFnNumericData.kInt, 0
+    )
+    CollisionDeformer.statBulgeCandidates = n_attr.create(
+        "statBulgeCandidates", "stbc", OpenMaya.MFnNumericData.kInt, 0
+    )
+    CollisionDeformer.statVertices = n_attr.create(
+        "statVertices", "stv", OpenMaya.MFnNumericData.kInt, 0
+    )
+
+    CollisionDeformer.collisionStats = c_attr.create("collisionStats", "cst")
+    c_attr.addChild(CollisionDeformer.statCandidates)
+    c_attr.addChild(CollisionDeformer.statBulgeCandidates)
+    c_attr.addChild(CollisionDeformer.statVertices)
+    c_attr.setWritable(False)
+    c_attr.setStorable(False)
+
     # add attribute
     try:
         CollisionDeformer.addAttribute(CollisionDeformer.collider)
@@ -706,6 +1031,7 @@ def node_initializer():
         CollisionDeformer.addAttribute(CollisionDeformer.bulgeshape)
         CollisionDeformer.addAttribute(CollisionDeformer.offset)
         CollisionDeformer.addAttribute(CollisionDeformer.colliderBBoxSize)
+        CollisionDeformer.addAttribute(CollisionDeformer.collisionStats)
         output_geom = K_OUTPUT_GEOM
         CollisionDeformer.attributeAffects(CollisionDeformer.collider, output_geom)
         CollisionDeformer.attributeAffects(CollisionDeformer.offset, output_geom)
@@ -716,6 +1042,24 @@ def node_initializer():
         CollisionDeformer.attributeAffects(CollisionDeformer.backface, output_geom)
         CollisionDeformer.attributeAffects(CollisionDeformer.sculptmode, output_geom)
         CollisionDeformer.attributeAffects(CollisionDeformer.bulgeshape, output_geom)
+
+        # The statistics are a by-product of deforming, so they depend on
+        # everything the output geometry depends on
+        for attribute in (
+            K_INPUT,
+            K_ENVELOPE,
+            K_WEIGHT_LIST,
+            CollisionDeformer.collider,
+            CollisionDeformer.offset,
+            CollisionDeformer.colliderBBoxSize,
+            CollisionDeformer.bulge,
+            CollisionDeformer.bulgeextend,
+            CollisionDeformer.colliderMatrix,
+            CollisionDeformer.backface,
+            CollisionDeformer.sculptmode,
+            CollisionDeformer.bulgeshape,
+        ):
+            CollisionDeformer.attributeAffects(attribute, CollisionDeformer.collisionStats)
     except RuntimeError:
         sys.stderr.write(f"Failed to create attributes of {K_PLUGIN_NODE_TYPE_NAME} node\n")
 
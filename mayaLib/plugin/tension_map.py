@@ -15,10 +15,12 @@ Attributes:
     color (ramp): Color ramp for tension visualization (green=compression, red=stretch)
 """
 
+import hashlib
 import sys
 
 import maya.api.OpenMaya as OM2
 import maya.OpenMaya as OM
+import numpy as np
 
 K_PLUGIN_NODE_NAME = "tensionMap"
 ORIG_ATTR_NAME = "orig"
@@ -26,6 +28,11 @@ DEFORMED_ATTR_NAME = "deform"
 K_PLUGIN_NODE_CLASSIFY = "utility/general"
 K_PLUGIN_NODE_ID = OM2.MTypeId(0x86018)
 
+# Number of ramp samples in the color lookup table
+RAMP_LUT_SIZE = 256
+# Number of topologies kept in the adjacency cache (orig + deformed)
+TOPOLOGY_CACHE_SIZE = 2
+
 
 def maya_use_new_api():
     """Marker function to indicate Maya Python API 2.0 usage.
@@ -36,6 +43,115 @@ def maya_use_new_api():
     pass
 
 
+def topology_hash(counts, connects):
+    """Hash the connectivity of a polygon mesh.
+
+    Args:
+        counts (np.ndarray): Vertex count per polygon.
+        connects (np.ndarray): Polygon vertex ids, face after face.
+
+    Returns:
+        str: Digest that only changes when the mesh connectivity changes.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(counts, dtype=np.int32).tobytes())
+    digest.update(np.ascontiguousarray(connects, dtype=np.int32).tobytes())
+    return digest.hexdigest()
+
+
+def build_vertex_edge_adjacency(counts, connects, num_vertices):
+    """Build the unique edges of a polygon mesh and a vertex to edge CSR table.
+
+    Edges are derived from consecutive polygon vertices, so no edge
+    iterator is needed.
+
+    Args:
+        counts (np.ndarray): Vertex count per polygon.
+        connects (np.ndarray): Polygon vertex ids, face after face.
+        num_vertices (int): Number of mesh vertices.
+
+    Returns:
+        tuple: ``(edges, indptr, indices)`` where ``edges`` is an ``(E, 2)``
+        array of vertex ids and ``indices[indptr[v]:indptr[v + 1]]`` are the
+        edges connected to vertex ``v``.
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    connects = np.asarray(connects, dtype=np.int64)
+
+    # Next vertex of every face-vertex, wrapping around each polygon
+    face_start = np.repeat(np.cumsum(counts) - counts, counts)
+    local = np.arange(len(connects)) - face_start
+    wrap = (local + 1) % np.repeat(counts, counts)
+    pairs = np.stack([connects, connects[face_start + wrap]], axis=1)
+    edges = np.unique(np.sort(pairs, axis=1), axis=0)
+
+    vertex_ids = edges.T.ravel()
+    edge_ids = np.tile(np.arange(len(edges)), 2)
+    order = np.argsort(vertex_ids, kind="stable")
+    indptr = np.zeros(num_vertices + 1, dtype=np.int64)
+    np.cumsum(np.bincount(vertex_ids, minlength=num_vertices), out=indptr[1:])
+    return edges, indptr, edge_ids[order]
+
+
+def average_edge_lengths(points, edges, indptr, indices):
+    """Average length of the edges connected to each vertex.
+
+    Args:
+        points (np.ndarray): ``(N, 3)`` vertex positions.
+        edges (np.ndarray): ``(E, 2)`` edge vertex ids.
+        indptr (np.ndarray): CSR row pointers from build_vertex_edge_adjacency.
+        indices (np.ndarray): CSR edge ids from build_vertex_edge_adjacency.
+
+    Returns:
+        np.ndarray: Average edge length per vertex, 0 for isolated vertices.
+    """
+    lengths = np.linalg.norm(points[edges[:, 0]] - points[edges[:, 1]], axis=1)
+    degree = np.diff(indptr)
+    connected = degree > 0
+
+    averages = np.zeros(len(degree))
+    if len(indices):
+        sums = np.add.reduceat(lengths[indices], indptr[:-1][connected])
+        averages[connected] = sums / degree[connected]
+    return averages
+
+
+def tension_positions(orig_lengths, deformed_lengths):
+    """Map edge length changes to ramp positions.
+
+    Args:
+        orig_lengths (np.ndarray): Average rest edge length per vertex.
+        deformed_lengths (np.ndarray): Average deformed edge length per vertex.
+
+    Returns:
+        np.ndarray: Ramp position per vertex; 0.5 means unchanged, lower is
+        stretched and higher is compressed. Vertices without a rest length,
+        or meshes whose vertex counts differ, map to 0.5.
+    """
+    if len(orig_lengths) != len(deformed_lengths):
+        return np.full(len(deformed_lengths), 0.5)
+
+    positions = np.full(len(orig_lengths), 0.5)
+    valid = orig_lengths > 0.0
+    positions[valid] += (orig_lengths[valid] - deformed_lengths[valid]) / orig_lengths[valid]
+    return positions
+
+
+def sample_lut(lut, positions):
+    """Look up ramp colors for positions in [0, 1].
+
+    Args:
+        lut (np.ndarray): ``(S, 4)`` colors sampled uniformly along the ramp.
+        positions (np.ndarray): Ramp positions; values outside [0, 1] clamp.
+
+    Returns:
+        np.ndarray: ``(N, 4)`` colors.
+    """
+    last = len(lut) - 1
+    ids = np.rint(np.clip(positions, 0.0, 1.0) * last).astype(np.int64)
+    return lut[ids]
+
+
 class TensionMap(OM2.MPxNode):
     """Maya plugin node for visualizing mesh deformation tension via vertex colors.
 
@@ -59,18 +175,19 @@ class TensionMap(OM2.MPxNode):
     a_out_shape = OM2.MObject()
     a_color_ramp = OM2.MObject()
 
-    is_deformed_dirty = True
-    is_orig_dirty = True
-    orig_edge_len_array = []
-    deformed_edge_len_array = []
-
     def __init__(self):
         """Initialize TensionMap node.
 
-        Calls parent class constructor to set up MPxNode.
+        Calls parent class constructor to set up MPxNode and creates the
+        per-node caches.
         """
         OM2.MPxNode.__init__(self)
 
+        self.is_ramp_dirty = True
+        self.color_lut = None
+        # topology hash -> (edges, indptr, indices, vertex ids MIntArray)
+        self.topology_cache = {}
+
     def initialize_ramp(self, parent_node, ramp_obj, index, position, value, interpolation):
         """Initialize a color ramp attribute with a specific value and position.
 
@@ -113,21 +230,23 @@ class TensionMap(OM2.MPxNode):
         )
 
     def setDependentsDirty(self, dirty_plug, affected_plugs):  # noqa: N802
-        """Mark geometry plugs dirty when input meshes change.
+        """Flag the color lookup table as stale when the ramp changes.
+
+        Only the ramp is tracked here: the Evaluation Manager does not call
+        this method during playback, so the mesh inputs are read again on
+        every compute and only their topology is cached.
 
         Args:
             dirty_plug (MPlug): The plug that was dirtied.
             affected_plugs (MPlugArray): Array of plugs affected by the change.
         """
-        if dirty_plug.partialName() == DEFORMED_ATTR_NAME:
-            self.is_deformed_dirty = True
-        else:
-            self.is_deformed_dirty = False
+        root_plug = dirty_plug
+        while root_plug.isChild or root_plug.isElement:
+            root_plug = root_plug.parent() if root_plug.isChild else root_plug.array()
+        attribute = root_plug.attribute()
 
-        if dirty_plug.partialName() == ORIG_ATTR_NAME:
-            self.is_orig_dirty = True
-        else:
-            self.is_orig_dirty = False
+        if attribute == self.a_color_ramp:
+            self.is_ramp_dirty = True
 
     def compute(self, plug, data):
         """Main compute method for tension map visualization.
@@ -140,44 +259,65 @@ class TensionMap(OM2.MPxNode):
             data (MDataBlock): Data block containing input and output values.
         """
         if plug == self.a_out_shape:
-            this_obj = self.thisMObject()
             orig_handle = data.inputValue(self.a_orig_shape)
             deformed_handle = data.inputValue(self.a_deformed_shape)
             out_handle = data.outputValue(self.a_out_shape)
-            color_attribute = OM2.MRampAttribute(this_obj, self.a_color_ramp)
 
-            if self.is_orig_dirty:
-                self.orig_edge_len_array = self.get_edge_len(orig_handle)
-            if self.is_deformed_dirty:
-                self.deformed_edge_len_array = self.get_edge_len(deformed_handle)
+            if self.is_ramp_dirty or self.color_lut is None:
+                self.color_lut = self.sample_ramp()
+                self.is_ramp_dirty = False
+            orig_edge_len_array = self.get_edge_len(orig_handle)[0]
+            deformed_edge_len_array, vertex_ids = self.get_edge_len(deformed_handle)
 
             out_handle.copy(deformed_handle)
             out_handle.setMObject(deformed_handle.asMesh())
 
-            out_mesh = out_handle.asMesh()
-            mesh_fn = OM2.MFnMesh(out_mesh)
-            num_verts = mesh_fn.numVertices
-            vert_colors = OM2.MColorArray()
-            vert_ids = OM2.MIntArray()
-            vert_colors.setLength(num_verts)
-            vert_ids.setLength(num_verts)
-
-            for i in range(num_verts):
-                delta = 0
-                vert_color = OM2.MColor()
-                if len(self.orig_edge_len_array) == len(self.deformed_edge_len_array):
-                    delta = (
-                        (self.orig_edge_len_array[i] - self.deformed_edge_len_array[i])
-                        / self.orig_edge_len_array[i]
-                    ) + 0.5
-                else:
-                    delta = 0.5
-                vert_color = color_attribute.getValueAtPosition(delta)
-                vert_colors.__setitem__(i, vert_color)
-                vert_ids.__setitem__(i, i)
-            mesh_fn.setVertexColors(vert_colors, vert_ids)
+            mesh_fn = OM2.MFnMesh(out_handle.asMesh())
+            positions = tension_positions(orig_edge_len_array, deformed_edge_len_array)
+            colors = sample_lut(self.color_lut, positions)
+            mesh_fn.setVertexColors(OM2.MColorArray(colors.tolist()), vertex_ids)
         data.setClean(plug)
 
+    def sample_ramp(self):
+        """Sample the color ramp into a lookup table.
+
+        Returns:
+            np.ndarray: ``(RAMP_LUT_SIZE, 4)`` RGBA colors along the ramp.
+        """
+        color_attribute = OM2.MRampAttribute(self.thisMObject(), self.a_color_ramp)
+        lut = np.empty((RAMP_LUT_SIZE, 4))
+        for ii, position in enumerate(np.linspace(0.0, 1.0, RAMP_LUT_SIZE)):
+            color = color_attribute.getValueAtPosition(float(position))
+            lut[ii] = (color.r, color.g, color.b, color.a)
+        return lut
+
+    def get_topology(self, mesh_fn):
+        """Return the cached edge adjacency of a mesh.
+
+        The adjacency is rebuilt only when the topology hash of the mesh
+        is not in the cache, i.e. when its connectivity actually changed.
+
+        Args:
+            mesh_fn (MFnMesh): Function set attached to the mesh.
+
+        Returns:
+            tuple: ``(edges, indptr, indices, vertex_ids)``.
+        """
+        counts, connects = mesh_fn.getVertices()
+        counts = np.array(counts, dtype=np.int64)
+        connects = np.array(connects, dtype=np.int64)
+        key = topology_hash(counts, connects)
+
+        topology = self.topology_cache.get(key)
+        if topology is None:
+            num_verts = mesh_fn.numVertices
+            edges, indptr, indices = build_vertex_edge_adjacency(counts, connects, num_verts)
+            topology = (edges, indptr, indices, OM2.MIntArray(list(range(num_verts))))
+            if len(self.topology_cache) >= TOPOLOGY_CACHE_SIZE:
+                self.topology_cache.pop(next(iter(self.topology_cache)))
+            self.topology_cache[key] = topology
+        return topology
+
     def get_edge_len(self, mesh_handle):
         """Calculate average edge length for each vertex.
 
@@ -185,26 +325,13 @@ class TensionMap(OM2.MPxNode):
             mesh_handle (MDataHandle): Handle to mesh geometry.
 
         Returns:
-            list: Average edge length for each vertex in the mesh.
+            tuple: ``(lengths, vertex_ids)`` with the average edge length of
+            each vertex as an array and the matching vertex ids as MIntArray.
         """
-        edge_len_array = []
-
-        mesh_obj = mesh_handle.asMesh()
-        edge_iter = OM2.MItMeshEdge(mesh_obj)
-        vert_iter = OM2.MItMeshVertex(mesh_obj)
-        while not vert_iter.isDone():
-            length_sum = 0.0
-            connected_edges = OM2.MIntArray()
-            connected_edges = vert_iter.getConnectedEdges()
-            for i in range(connected_edges.__len__()):
-                edge_iter.setIndex(connected_edges[i])
-                length = edge_iter.length(OM2.MSpace.kWorld)
-                length_sum += length * 1.0
-
-            length_sum = length_sum / connected_edges.__len__()
-            edge_len_array.append(length_sum)
-            vert_iter.next()
-        return edge_len_array
+        mesh_fn = OM2.MFnMesh(mesh_handle.asMesh())
+        edges, indptr, indices, vertex_ids = self.get_topology(mesh_fn)
+        points = np.array(mesh_fn.getPoints(OM2.MSpace.kObject))[:, :3]
+        return average_edge_lengths(points, edges, indptr, indices), vertex_ids
 
 
 def node_creator():
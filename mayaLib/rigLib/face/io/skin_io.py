@@ -2,10 +2,16 @@
 
 This module provides functions for exporting and importing skin cluster
 weights using Maya's OpenMaya API for efficient data transfer. It supports
-both single-object and batch operations with pickle serialization.
+both single-object and batch operations.
 
-The module uses OpenMaya 1.0 API for skin cluster manipulation which
-provides significantly better performance than maya.cmds for large meshes.
+Skin files are written as compressed NumPy archives: a JSON header with the
+per-object metadata (influence names, skin cluster settings) plus the weights
+of each object as sparse CSR float32 arrays, so file size scales with the
+non-zero weights rather than the influence count. The weights move between
+``MFnSkinCluster`` and NumPy in bulk through the OpenMaya 2.0 API, so
+export/import cost no longer grows with interpreted per-element loops. Legacy
+pickle files are still readable and can still be written with
+``file_format="pickle"``.
 
 Example:
     Export skin weights::
@@ -22,6 +28,22 @@ import contextlib
 import json
 import logging
 import os
+import time
+import zipfile
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import numpy as np
+
+from mayaLib.rigLib.utils.skin_weights import (
+    SparseSkinWeights,
+    double_array_to_numpy,
+    get_skin_api_objects,
+    get_weight_matrix,
+    numpy_to_double_array,
+    prune_weights,
+    strip_influence_name,
+)
 
 __author__ = "Lorenzo Argentieri"
 
@@ -31,11 +53,23 @@ logger = logging.getLogger(__name__)
 # FILE_EXT = ".data"
 # PACK_EXT = ".list"
 
+SKIN_FILE_MAGIC = "devpylib-skin"
+"""Identifier stored in the header of NumPy skin files."""
+
+SKIN_FILE_VERSION = 2
+"""Current version of the NumPy skin file layout."""
+
+SKIN_FILE_FORMATS = ("npz", "pickle")
+"""Supported on-disk formats for :func:`export_skin`."""
+
+PACK_WORKERS = min(8, os.cpu_count() or 1)
+"""Default worker threads for skin pack serialization and file I/O."""
+
 # Python 2/3 compatibility for pickle
 try:
     import cPickle as pickle_module  # noqa: N813 - Python 2/3 compatibility
 except (ImportError, ModuleNotFoundError):
-    import _pickle as pickle_module  # noqa: N812 - Python 2/3 compatibility
+    import pickle as pickle_module
 
 # Try to import basestring for Python 2/3 compatibility
 with contextlib.suppress(NameError):
@@ -312,16 +346,298 @@ def apply_skin_data(skin_cls, list_dic):
         cmds.setAttr(f"{skin_cls}.{attr}", list_dic[attr])
 
 
-def export_skin(file_path=None, objs=None, *args):
+def remap_weight_columns(weights, file_influences, scene_influences):
+    """Reorder weight columns from file influence order to scene order.
+
+    Args:
+        weights: ``(points, len(file_influences))`` weight array.
+        file_influences: Influence names in the column order of ``weights``.
+        scene_influences: Influence names in skin cluster order.
+
+    Returns:
+        tuple: (remapped, unused) where remapped is a float64
+            ``(points, len(scene_influences))`` array (missing influences are
+            zero) and unused lists file influences absent from the scene.
+    """
+    scene_index = {name: ii for ii, name in enumerate(scene_influences)}
+    src_columns = []
+    dst_columns = []
+    unused = []
+    for ii, name in enumerate(file_influences):
+        jj = scene_index.get(name)
+        if jj is None:
+            unused.append(name)
+        else:
+            src_columns.append(ii)
+            dst_columns.append(jj)
+
+    weights = np.asarray(weights)
+    remapped = np.zeros((weights.shape[0], len(scene_influences)), dtype=np.float64)
+    remapped[:, dst_columns] = weights[:, src_columns]
+    return remapped, unused
+
+
+def set_weight_matrix(skin_cls, influences, weights, blend_weights=None, point_ids=None):
+    """Write a weight matrix to a skin cluster in one API call.
+
+    Columns are matched to the skin cluster influences by namespace-stripped
+    name, so the file influence order does not need to match the scene.
+
+    Args:
+        skin_cls: Skin cluster node (PyMEL node or name).
+        influences: Influence names for the columns of ``weights``.
+        weights: ``(points, influences)`` weight array.
+        blend_weights: Optional ``(points,)`` dual quaternion blend weights.
+        point_ids: Optional point indices of the rows of ``weights``. If
+            None, the rows cover every point of the shape.
+
+    Returns:
+        list: Influence names from the data that are not in the skin cluster.
+    """
+    import maya.api.OpenMaya as om2  # noqa: N813 - Maya API alias
+
+    fn_skin, dag_path, components = get_skin_api_objects(skin_cls, point_ids)
+
+    scene_influences = [
+        strip_influence_name(p.partialPathName()) for p in fn_skin.influenceObjects()
+    ]
+    remapped, unused = remap_weight_columns(weights, influences, scene_influences)
+    if unused:
+        logger.warning("Unused influences in import data: %s", unused)
+
+    influence_indices = om2.MIntArray(list(range(len(scene_influences))))
+    fn_skin.setWeights(
+        dag_path, components, influence_indices, numpy_to_double_array(remapped), False
+    )
+
+    if blend_weights is not None:
+        fn_skin.setBlendWeights(dag_path, components, numpy_to_double_array(blend_weights))
+
+    return unused
+
+
+def collect_skin_arrays(skin_cls, obj):
+    """Collect skin cluster data for an object as a NumPy-backed record.
+
+    Args:
+        skin_cls: PyMEL skin cluster node.
+        obj: PyMEL transform of the skinned object.
+
+    Returns:
+        dict: Record with ``objName``, ``nameSpace``, ``skinClsName``,
+            ``skinningMethod``, ``normalizeWeights``, ``influences``,
+            ``weights`` and ``blendWeights`` keys.
+    """
+    import maya.cmds as cmds
+
+    influences, weights, blend_weights = get_weight_matrix(skin_cls)
+    record = {
+        "objName": obj.name(),
+        "nameSpace": obj.namespace(),
+        "skinClsName": skin_cls.name(),
+        "influences": influences,
+        "weights": weights,
+        "blendWeights": blend_weights,
+    }
+    for attr in ["skinningMethod", "normalizeWeights"]:
+        record[attr] = cmds.getAttr(f"{skin_cls}.{attr}")
+    return record
+
+
+def apply_skin_arrays(skin_cls, record):
+    """Apply a NumPy-backed skin record to a skin cluster.
+
+    Args:
+        skin_cls: PyMEL skin cluster node.
+        record: Record as returned by :func:`collect_skin_arrays` or
+            :func:`read_skin_file`.
+    """
+    import maya.cmds as cmds
+
+    set_weight_matrix(skin_cls, record["influences"], record["weights"], record["blendWeights"])
+
+    for attr in ["skinningMethod", "normalizeWeights"]:
+        cmds.setAttr(f"{skin_cls}.{attr}", record[attr])
+
+
+def legacy_to_record(list_dic):
+    """Convert a legacy pickle object dictionary to a NumPy-backed record.
+
+    Args:
+        list_dic: Dictionary with ``weights`` stored as
+            ``{influence_name: [weight_values]}``.
+
+    Returns:
+        dict: Record in the :func:`collect_skin_arrays` layout.
+    """
+    influences = list(list_dic["weights"].keys())
+    if influences:
+        weights = np.array([list_dic["weights"][name] for name in influences], dtype=np.float64).T
+    else:
+        weights = np.zeros((len(list_dic["blendWeights"]), 0), dtype=np.float64)
+
+    record = dict(list_dic)
+    record["influences"] = influences
+    record["weights"] = np.ascontiguousarray(weights)
+    record["blendWeights"] = np.asarray(list_dic["blendWeights"], dtype=np.float64)
+    return record
+
+
+def record_to_legacy(record):
+    """Convert a NumPy-backed record to the legacy pickle dictionary layout.
+
+    Args:
+        record: Record in the :func:`collect_skin_arrays` layout.
+
+    Returns:
+        dict: Dictionary with per-influence weight lists.
+    """
+    weights = np.asarray(record["weights"], dtype=np.float64)
+    list_dic = {
+        key: value
+        for key, value in record.items()
+        if key not in ("influences", "weights", "blendWeights")
+    }
+    list_dic["weights"] = {
+        name: weights[:, ii].tolist() for ii, name in enumerate(record["influences"])
+    }
+    list_dic["blendWeights"] = np.asarray(record["blendWeights"], dtype=np.float64).tolist()
+    return list_dic
+
+
+def write_skin_file(file_path, records, file_format="npz", max_influences=None, threshold=0.0):
+    """Write skin records to disk.
+
+    The ``npz`` format stores a JSON header (influence names and settings)
+    and, per object, the weights as sparse CSR arrays (see
+    :class:`~mayaLib.rigLib.utils.skin_weights.SparseSkinWeights`) in a
+    compressed NumPy archive, so the file size scales with the number of
+    non-zero weights. The ``pickle`` format writes the legacy layout.
+
+    Args:
+        file_path: Output file path.
+        records: List of records as returned by :func:`collect_skin_arrays`.
+        file_format: One of :data:`SKIN_FILE_FORMATS`. Defaults to "npz".
+        max_influences: Maximum influences kept per point. None keeps all.
+        threshold: Weights less than or equal to this value are dropped.
+            Points are renormalized when pruning removes weights.
+
+    Raises:
+        ValueError: If ``file_format`` is not supported.
+    """
+    if file_format not in SKIN_FILE_FORMATS:
+        raise ValueError(f"Unsupported skin file format: {file_format}")
+
+    sparse_weights = []
+    for record in records:
+        sparse = SparseSkinWeights.from_dense(record["weights"], record["influences"])
+        sparse_weights.append(prune_weights(sparse, max_influences, threshold))
+
+    if file_format == "pickle":
+        legacy_records = [
+            dict(record, weights=sparse.to_dense())
+            for record, sparse in zip(records, sparse_weights, strict=True)
+        ]
+        pack_dic = {
+            "objs": [r["objName"] for r in records],
+            "objDDic": [record_to_legacy(r) for r in legacy_records],
+            "bypassObj": [],
+        }
+        with open(file_path, "wb") as fh:
+            pickle_module.dump(pack_dic, fh, pickle_module.HIGHEST_PROTOCOL)
+        return
+
+    header = {"format": SKIN_FILE_MAGIC, "version": SKIN_FILE_VERSION, "objects": []}
+    arrays = {}
+    for ii, (record, sparse) in enumerate(zip(records, sparse_weights, strict=True)):
+        meta = {
+            key: value for key, value in record.items() if key not in ("weights", "blendWeights")
+        }
+        meta["pointCount"] = sparse.num_points
+        header["objects"].append(meta)
+        arrays.update(sparse.to_arrays(prefix=f"obj{ii}_"))
+        arrays[f"obj{ii}_blendWeights"] = np.asarray(record["blendWeights"], dtype=np.float32)
+
+    arrays["header"] = np.frombuffer(json.dumps(header).encode("utf-8"), dtype=np.uint8)
+    with open(file_path, "wb") as fh:
+        np.savez_compressed(fh, **arrays)
+
+
+def read_skin_file(file_path):
+    """Read skin records from a NumPy or legacy pickle skin file.
+
+    The format is detected from the file content, so both formats can share
+    the same file extension. Version 1 NumPy files (dense weight matrices)
+    are still readable.
+
+    Args:
+        file_path: Path to the skin data file.
+
+    Returns:
+        list: Records in the :func:`collect_skin_arrays` layout.
+
+    Raises:
+        ValueError: If the file is a NumPy archive without a skin header, or
+            if it is truncated or corrupt.
+    """
+    try:
+        return _read_skin_records(file_path)
+    except (
+        pickle_module.UnpicklingError,
+        EOFError,
+        zipfile.BadZipFile,
+        zlib.error,
+        KeyError,
+    ) as exc:
+        raise ValueError(f"{file_path} is not a readable skin data file: {exc!r}") from exc
+
+
+def _read_skin_records(file_path):
+    """Decode a skin file; see :func:`read_skin_file`."""
+    if not zipfile.is_zipfile(file_path):
+        with open(file_path, "rb") as fh:
+            list_pack = pickle_module.load(fh)
+        return [legacy_to_record(obj_data) for obj_data in list_pack["objDDic"]]
+
+    with np.load(file_path, allow_pickle=False) as archive:
+        if "header" not in archive.files:
+            raise ValueError(f"{file_path} is not a skin data file")
+        header = json.loads(archive["header"].tobytes().decode("utf-8"))
+        if header.get("format") != SKIN_FILE_MAGIC:
+            raise ValueError(f"{file_path} is not a skin data file")
+
+        records = []
+        for ii, meta in enumerate(header["objects"]):
+            record = dict(meta)
+            if header["version"] == 1:
+                record["weights"] = archive[f"weights_{ii}"]
+                record["blendWeights"] = archive[f"blendWeights_{ii}"]
+            else:
+                sparse = SparseSkinWeights.from_arrays(
+                    meta["influences"], archive, prefix=f"obj{ii}_"
+                )
+                record["weights"] = sparse.to_dense()
+                record["blendWeights"] = archive[f"obj{ii}_blendWeights"]
+            records.append(record)
+
+    return records
+
+
+def export_skin(
+    file_path=None, objs=None, *args, file_format="npz", max_influences=None, threshold=0.0
+):
     """Export skin cluster weights for one or more objects.
 
     Serializes skin cluster data including influence weights,
-    blend weights, and cluster settings to a pickle file.
+    blend weights, and cluster settings with :func:`write_skin_file`.
 
     Args:
         file_path: Output file path. If None, opens a file dialog.
         objs: List of mesh objects to export. If None, uses selection.
         *args: Additional arguments (ignored, for Maya callback compatibility).
+        file_format: On-disk format, "npz" (default) or the legacy "pickle".
+        max_influences: Maximum influences kept per vertex. None keeps all.
+        threshold: Weights less than or equal to this value are dropped.
 
     Returns:
         bool: True if export was successful, False otherwise.
@@ -341,7 +657,7 @@ def export_skin(file_path=None, objs=None, *args):
             pm.displayWarning("Please Select One or more objects")
             return False
 
-    pack_dic = {"objs": [], "objDDic": [], "bypassObj": []}
+    records = []
 
     if not file_path:
         start_dir = pm.workspace(q=True, rootDirectory=True)
@@ -365,42 +681,104 @@ def export_skin(file_path=None, objs=None, *args):
         if not skin_cls:
             pm.displayWarning(f"{obj.name()}: Skipped because don't have Skin Cluster")
         else:
-            list_dic = {
-                "weights": {},
-                "blendWeights": [],
-                "skinClsName": "",
-                "objName": "",
-                "nameSpace": "",
-            }
-            list_dic["objName"] = obj.name()
-            list_dic["nameSpace"] = obj.namespace()
-            collect_skin_data(skin_cls, list_dic)
-            pack_dic["objs"].append(obj.name())
-            pack_dic["objDDic"].append(list_dic)
+            record = collect_skin_arrays(skin_cls, obj)
+            records.append(record)
             pm.displayInfo(
-                f"{skin_cls.name()} ({len(list_dic['weights'].keys())} influences, "
-                f"{len(list_dic['blendWeights'])} points) {obj.name()}"
+                f"{skin_cls.name()} ({len(record['influences'])} influences, "
+                f"{len(record['blendWeights'])} points) {obj.name()}"
             )
 
-    if pack_dic["objs"]:
-        with open(file_path, "wb") as fh:
-            pickle_module.dump(pack_dic, fh, pickle_module.HIGHEST_PROTOCOL)
+    if records:
+        write_skin_file(file_path, records, file_format, max_influences, threshold)
         logger.info("Skin data exported to: %s", file_path)
         return True
 
     return False
 
 
-def export_skin_pack(pack_path=None, objs=None, *args):
+def _timed_write_skin_file(file_path, record, file_format, max_influences, threshold):
+    """Write one record and measure it (runs on a pack worker thread).
+
+    Returns:
+        tuple: (seconds, file size in bytes).
+    """
+    start = time.perf_counter()
+    write_skin_file(file_path, [record], file_format, max_influences, threshold)
+    return time.perf_counter() - start, os.path.getsize(file_path)
+
+
+def _timed_read_skin_file(file_path):
+    """Read one skin file and measure it (runs on a pack worker thread).
+
+    Returns:
+        tuple: (records, seconds, file size in bytes).
+    """
+    start = time.perf_counter()
+    records = read_skin_file(file_path)
+    return records, time.perf_counter() - start, os.path.getsize(file_path)
+
+
+def format_pack_report(rows, main_label, io_label, total_time, title="Skin pack"):
+    """Format a per-object timing and size report for pack operations.
+
+    Args:
+        rows: List of dicts with ``name``, ``main`` (seconds spent on the
+            main thread), ``io`` (seconds spent on a worker) and ``size``
+            (bytes) keys.
+        main_label: Column label for the main-thread step.
+        io_label: Column label for the worker step.
+        total_time: Wall-clock seconds of the whole operation.
+        title: Report title.
+
+    Returns:
+        str: Multi-line report, slowest main-thread step first.
+    """
+    name_width = max([len(row["name"]) for row in rows] + [6])
+    lines = [
+        f"{title}: {len(rows)} objects in {total_time:.2f}s",
+        f"{'object':<{name_width}}  {main_label:>9}  {io_label:>9}  {'size KB':>10}",
+    ]
+    for row in sorted(rows, key=lambda r: r["main"], reverse=True):
+        lines.append(
+            f"{row['name']:<{name_width}}  {row['main']:>8.3f}s  {row['io']:>8.3f}s  "
+            f"{row['size'] / 1024.0:>10.1f}"
+        )
+    lines.append(
+        f"{'total':<{name_width}}  {sum(r['main'] for r in rows):>8.3f}s  "
+        f"{sum(r['io'] for r in rows):>8.3f}s  "
+        f"{sum(r['size'] for r in rows) / 1024.0:>10.1f}"
+    )
+    return "\n".join(lines)
+
+
+def export_skin_pack(
+    pack_path=None,
+    objs=None,
+    *args,
+    file_format="npz",
+    max_influences=None,
+    threshold=0.0,
+    max_workers=None,
+    progress_callback=None,
+):
     """Export skin weights for multiple objects as a batch pack.
 
     Creates a pack file (.list) containing references to individual
-    skin data files for each object.
+    skin data files for each object. Weights are gathered from Maya on the
+    main thread while a worker pool compresses and writes the previous
+    objects; a per-object timing/size report is printed at the end.
 
     Args:
         pack_path: Output pack file path. If None, opens a file dialog.
         objs: List of mesh objects to export. If None, uses selection.
         *args: Additional arguments (ignored, for Maya callback compatibility).
+        file_format: On-disk format, "npz" (default) or the legacy "pickle".
+        max_influences: Maximum influences kept per vertex. None keeps all.
+        threshold: Weights less than or equal to this value are dropped.
+        max_workers: Number of writer threads. Defaults to
+            :data:`PACK_WORKERS`.
+        progress_callback: Optional callable receiving
+            ``(percent: int, message: str)`` after each gathered object.
 
     Returns:
         bool: True if export was successful, False otherwise.
@@ -439,14 +817,61 @@ def export_skin_pack(pack_path=None, objs=None, *args):
     pack_dic["Path"], pack_name = os.path.split(pack_path)
     _ = pack_name  # Unused but needed from os.path.split
 
-    for obj in objs:
-        file_name = obj.stripNamespace() + file_ext
-        file_out_path = os.path.join(pack_dic["Path"], file_name)
-        if export_skin(file_out_path, [obj]):
+    report = []
+    pending = []
+    in_flight = set()
+    start_time = time.perf_counter()
+
+    workers = max_workers or PACK_WORKERS
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for ii, obj in enumerate(objs):
+            skin_cls = get_skin_cluster(obj)
+            if not skin_cls:
+                pm.displayWarning(f"{obj.name()}: Skipped because don't have Skin Cluster")
+                continue
+
+            # Keep the gathered-but-unwritten records bounded
+            while len(in_flight) >= 2 * workers:
+                _done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+
+            file_name = obj.stripNamespace() + file_ext
+            file_out_path = os.path.join(pack_dic["Path"], file_name)
+
+            gather_start = time.perf_counter()
+            record = collect_skin_arrays(skin_cls, obj)
+            gather_time = time.perf_counter() - gather_start
+
+            future = executor.submit(
+                _timed_write_skin_file,
+                file_out_path,
+                record,
+                file_format,
+                max_influences,
+                threshold,
+            )
+            in_flight.add(future)
+            pending.append((obj.name(), file_name, file_out_path, gather_time, future))
+
+            if progress_callback:
+                percent = int(((ii + 1) / len(objs)) * 100)
+                progress_callback(percent, f"Gathered {obj.name()}")
+
+        for obj_name, file_name, file_out_path, gather_time, future in pending:
+            try:
+                write_time, file_size = future.result()
+            except OSError as exc:
+                pm.displayWarning(f"{obj_name}: Skipped, cannot write {file_out_path}: {exc}")
+                continue
             pack_dic["objectsList"].append(file_name)
-            pm.displayInfo(file_out_path)
-        else:
-            pm.displayWarning(f"{obj.name()}: Skipped because don't have Skin Cluster")
+            report.append(
+                {"name": obj_name, "main": gather_time, "io": write_time, "size": file_size}
+            )
+
+    print(
+        format_pack_report(
+            report, "gather", "write", time.perf_counter() - start_time, "Skin pack export"
+        )
+    )
 
     if pack_dic["objectsList"]:
         data_string = json.dumps(pack_dic, indent=4, sort_keys=True)
@@ -461,42 +886,19 @@ def export_skin_pack(pack_path=None, objs=None, *args):
         return False
 
 
-def import_skin(file_path=None, *args):
-    """Import skin cluster weights from a data file.
+def apply_skin_records(records):
+    """Apply skin records to the matching objects in the scene.
 
-    Loads skin data and applies it to matching objects in the scene.
-    Creates skin clusters if they don't exist.
+    Creates skin clusters if they don't exist. Objects that cannot be found,
+    whose vertex count differs or whose joints are missing are skipped with
+    a warning.
 
     Args:
-        file_path: Path to the skin data file. If None, opens a file dialog.
-        *args: Additional arguments (ignored, for Maya callback compatibility).
-
-    Returns:
-        bool: True if import was successful, False otherwise.
+        records: Records as returned by :func:`read_skin_file`.
     """
     import pymel.all as pm
 
-    file_ext, _ = _get_constants()
-
-    if not file_path:
-        start_dir = pm.workspace(q=True, rootDirectory=True)
-        file_path = pm.fileDialog2(
-            dialogStyle=2,
-            fileMode=1,
-            startingDirectory=start_dir,
-            fileFilter=f"data data (*{file_ext})",
-        )
-
-    if not file_path:
-        return False
-
-    if not isinstance(file_path, basestring):
-        file_path = file_path[0]
-
-    with open(file_path, "rb") as fh:
-        list_pack = pickle_module.load(fh)
-
-    for obj_data in list_pack["objDDic"]:
+    for obj_data in records:
         obj_name = obj_data["objName"]
         try:
             skin_cluster = None
@@ -518,12 +920,12 @@ def import_skin(file_path=None, *args):
             skin_cluster = get_skin_cluster(obj_node)
             if not skin_cluster:
                 try:
-                    joints = list(obj_data["weights"].keys())
+                    joints = list(obj_data["influences"])
                     skin_cluster = pm.skinCluster(
                         joints, obj_node, tsb=True, nw=2, n=obj_data["skinClsName"]
                     )
                 except Exception:
-                    not_found = list(obj_data["weights"].keys())
+                    not_found = list(obj_data["influences"])
                     scene_joints = {pm.PyNode(x).name() for x in pm.ls(type="joint")}
                     for j in list(not_found):
                         if j in scene_joints:
@@ -535,24 +937,65 @@ def import_skin(file_path=None, *args):
                     continue
 
             if skin_cluster:
-                apply_skin_data(skin_cluster, obj_data)
+                apply_skin_arrays(skin_cluster, obj_data)
                 logger.info("%s skin data loaded.", obj_name)
                 print(f"{obj_name} skin data loaded.")
 
         except Exception:
             pm.displayWarning(f"Object: {obj_name} Skipped. Cannot be found in the scene")
 
+
+def import_skin(file_path=None, *args):
+    """Import skin cluster weights from a data file.
+
+    Loads skin data (NumPy or legacy pickle files) and applies it to
+    matching objects in the scene. Creates skin clusters if they don't exist.
+
+    Args:
+        file_path: Path to the skin data file. If None, opens a file dialog.
+        *args: Additional arguments (ignored, for Maya callback compatibility).
+
+    Returns:
+        bool: True if import was successful, False otherwise.
+    """
+    import pymel.all as pm
+
+    file_ext, _ = _get_constants()
+
+    if not file_path:
+        start_dir = pm.workspace(q=True, rootDirectory=True)
+        file_path = pm.fileDialog2(
+            dialogStyle=2,
+            fileMode=1,
+            startingDirectory=start_dir,
+            fileFilter=f"data data (*{file_ext})",
+        )
+
+    if not file_path:
+        return False
+
+    if not isinstance(file_path, basestring):
+        file_path = file_path[0]
+
+    apply_skin_records(read_skin_file(file_path))
     return True
 
 
-def import_skin_pack(file_path=None, *args):
+def import_skin_pack(file_path=None, *args, max_workers=None, progress_callback=None):
     """Import all skin weights from a batch pack file.
 
     Reads a pack file (.list) and imports each referenced skin data file.
+    Files are read and decompressed ahead by a worker pool while the main
+    thread applies the previous ones; a per-file timing/size report is
+    printed at the end.
 
     Args:
         file_path: Path to the pack file. If None, opens a file dialog.
         *args: Additional arguments (ignored, for Maya callback compatibility).
+        max_workers: Number of reader threads. Defaults to
+            :data:`PACK_WORKERS`.
+        progress_callback: Optional callable receiving
+            ``(percent: int, message: str)`` after each applied file.
 
     Returns:
         bool: True if import was successful, False otherwise.
@@ -580,9 +1023,49 @@ def import_skin_pack(file_path=None, *args):
         pack_dic = json.load(f)
 
     pack_dir = os.path.split(file_path)[0]
-    for p_file in pack_dic["objectsList"]:
-        data_file_path = os.path.join(pack_dir, p_file)
-        import_skin(data_file_path, True)
+    data_file_paths = [os.path.join(pack_dir, p_file) for p_file in pack_dic["objectsList"]]
+
+    report = []
+    start_time = time.perf_counter()
+
+    workers = max_workers or PACK_WORKERS
+    window = 2 * workers
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Read ahead a bounded number of files while the main thread applies
+        futures = [executor.submit(_timed_read_skin_file, p) for p in data_file_paths[:window]]
+
+        for ii, data_file_path in enumerate(data_file_paths):
+            if ii + window < len(data_file_paths):
+                futures.append(executor.submit(_timed_read_skin_file, data_file_paths[ii + window]))
+
+            try:
+                records, read_time, file_size = futures[ii].result()
+            except (OSError, ValueError) as exc:
+                logger.warning("Cannot read skin data %s: %s", data_file_path, exc)
+                continue
+            futures[ii] = None
+
+            apply_start = time.perf_counter()
+            apply_skin_records(records)
+            apply_time = time.perf_counter() - apply_start
+
+            report.append(
+                {
+                    "name": os.path.basename(data_file_path),
+                    "main": apply_time,
+                    "io": read_time,
+                    "size": file_size,
+                }
+            )
+            if progress_callback:
+                percent = int(((ii + 1) / len(data_file_paths)) * 100)
+                progress_callback(percent, f"Applied {os.path.basename(data_file_path)}")
+
+    print(
+        format_pack_report(
+            report, "apply", "read", time.perf_counter() - start_time, "Skin pack import"
+        )
+    )
 
     return True
 
@@ -631,6 +1114,21 @@ __all__ = [
     "set_influence_weights",
     "set_blend_weights",
     "apply_skin_data",
+    "strip_influence_name",
+    "get_skin_api_objects",
+    "double_array_to_numpy",
+    "numpy_to_double_array",
+    "get_weight_matrix",
+    "remap_weight_columns",
+    "set_weight_matrix",
+    "collect_skin_arrays",
+    "apply_skin_arrays",
+    "apply_skin_records",
+    "format_pack_report",
+    "legacy_to_record",
+    "record_to_legacy",
+    "write_skin_file",
+    "read_skin_file",
     "export_skin",
     "export_skin_pack",
     "import_skin",
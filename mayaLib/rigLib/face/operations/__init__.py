@@ -1,7 +1,7 @@
 """Facial rigging operation algorithms.
 
 Provides facial rig operation functions including edge detection,
-curve projection, and geometry selection handlers.
+curve projection, geometry selection handlers and bulk mesh data access.
 """
 
 from typing import Any
@@ -10,6 +10,7 @@ __all__ = [
     "curve_operations",
     "edge_detection",
     "geometry_selection",
+    "mesh_data",
 ]
 
 
@@ -12,6 +12,7 @@ The operations handle:
 - Reversing curve direction based on CV positions
 - Reconnecting curves to pointOnCurveInfo nodes
 - Setting curve display colors and visibility
+- Measuring and sampling curves by arc length from one bulk CV/knot read
 
 Example:
     Project a curve onto head geometry::
@@ -39,6 +40,8 @@ Example:
 import logging
 from enum import IntEnum
 
+from mayaLib.rigLib.math.curve_sampling import NurbsCurve
+
 __author__ = "Lorenzo Argentieri"
 
 logger = logging.getLogger(__name__)
@@ -107,7 +110,8 @@ def calculate_curve_parameter_distances(curve):
     """Calculate parameter distances along a curve for each CV.
 
     Creates a list of accumulated distances along the curve,
-    useful for setting pointOnCurveInfo parameters.
+    useful for setting pointOnCurveInfo parameters. The world space CVs
+    are read once and measured in NumPy, without temporary curves.
 
     Args:
         curve: Curve name or transform.
@@ -119,32 +123,25 @@ def calculate_curve_parameter_distances(curve):
         >>> distances = calculate_curve_parameter_distances("l_browsCurve")
         >>> print(f"Total length parameters: {distances[-1]}")
     """
-    import maya.cmds as cmds
-
-    cmds.select(f"{curve}.cv[*]", replace=True)
-    cv_list = cmds.ls(fl=True, sl=True)
-    cmds.select(clear=True)
+    return NurbsCurve.from_maya(curve).cv_distances().tolist()
 
-    if not cv_list:
-        return [0.0]
 
-    distances = [0.0]
+def get_curve_sample_parameters(curve, count, world_space=True):
+    """Get parameters spaced evenly by arc length along a curve.
 
-    for i in range(1, len(cv_list)):
-        prev_pos = get_curve_cv_position(curve, i - 1)
-        curr_pos = get_curve_cv_position(curve, i)
+    Args:
+        curve: Curve name or transform.
+        count: Number of parameters, both curve ends included.
+        world_space: Measure lengths in world instead of object space.
 
-        # Create temporary curve to measure distance
-        temp_curve = cmds.curve(
-            p=[prev_pos, curr_pos],
-            k=[0, 1],
-            d=1,
-        )
-        segment_length = cmds.arclen(temp_curve)
-        distances.append(distances[i - 1] + segment_length)
-        cmds.delete(temp_curve)
+    Returns:
+        list: Parameter values, e.g. for pointOnCurveInfo nodes.
 
-    return distances
+    Example:
+        >>> parameters = get_curve_sample_parameters("l_browsCurve", 200)
+        >>> print(f"Middle parameter: {parameters[100]}")
+    """
+    return NurbsCurve.from_maya(curve, world_space).uniform_parameters(count).tolist()
 
 
 def get_curve_length(curve):
@@ -6,6 +6,8 @@ lips, tongue, and other facial features.
 
 The algorithms analyze vertex positions to determine which edges belong
 to the upper or lower parts of a loop, useful for facial rig construction.
+Loops are ordered by walking the vertex pairs of the selected edges rather
+than by growing the Maya selection vertex by vertex.
 
 Example:
     Select upper eyelid edges::
@@ -27,6 +29,16 @@ Example:
 import logging
 from enum import IntEnum
 
+import numpy as np
+
+from mayaLib.rigLib.face.operations.mesh_data import (
+    get_component_positions,
+    get_edge_vertex_pairs,
+    get_extremity_indices,
+    get_mesh_data,
+)
+from mayaLib.rigLib.utils.mesh_topology import edge_loop_paths
+
 __author__ = "Lorenzo Argentieri"
 
 logger = logging.getLogger(__name__)
@@ -44,79 +56,37 @@ class Direction(IntEnum):
     DOWN = 1
 
 
-def _get_vertex_positions(vertices, axis="x"):
-    """Get positions of vertices along a specified axis.
-
-    Args:
-        vertices: List of vertex names.
-        axis: Axis to extract positions from ('x', 'y', or 'z').
-
-    Returns:
-        list: Position values along the specified axis.
-    """
-    import maya.cmds as cmds
-
-    axis_index = {"x": 0, "y": 1, "z": 2}.get(axis.lower(), 0)
-    positions = []
-
-    for vtx in vertices:
-        pos = cmds.xform(vtx, q=True, t=True)
-        positions.append(pos[axis_index])
-
-    return positions
-
-
-def _find_extremity_vertices(vertices, positions):
-    """Find the first and last vertices based on sorted positions.
+def _split_edge_loop(edges, direction, axis_index):
+    """Get the upper or lower half of an edge loop between its extremities.
 
     Args:
-        vertices: List of vertex names.
-        positions: List of position values corresponding to vertices.
+        edges: Edge names of one mesh forming a loop or an open path.
+        direction: Direction enum or int (0=UP, 1=DOWN).
+        axis_index: Axis of the extremities, 0 for X and 2 for Z.
 
     Returns:
-        tuple: (first_vertex, last_vertex) - the extremity vertices.
-    """
-    import maya.cmds as cmds
+        list: Ordered vertex names from the lowest to the highest vertex on
+        the axis, through the half whose second vertex is higher (UP) or
+        lower (DOWN) in object space Y.
 
-    sorted_positions = sorted(positions)
-    first_vertex = None
-    last_vertex = None
-
-    for i, vtx in enumerate(vertices):
-        if positions[i] == sorted_positions[0]:
-            cmds.select(vtx, replace=True)
-            first_vertex = cmds.ls(sl=True)[0]
-        if positions[i] == sorted_positions[-1]:
-            cmds.select(vtx, replace=True)
-            last_vertex = cmds.ls(sl=True)[0]
-
-    return first_vertex, last_vertex
-
-
-def _find_adjacent_vertices(first_vertex, vertices):
-    """Find vertices adjacent to the first vertex that are in the original list.
-
-    Args:
-        first_vertex: Starting vertex name.
-        vertices: Original vertex list to filter against.
-
-    Returns:
-        list: Adjacent vertices that exist in the original vertex list.
+    Raises:
+        RuntimeError: If no edges are given.
     """
-    import maya.cmds as cmds
-
-    cmds.select(first_vertex, replace=True)
-    cmds.GrowPolygonSelectionRegion()
-    grown_selection = cmds.ls(fl=True, sl=True)
-    cmds.select(clear=True)
+    pairs_dict = get_edge_vertex_pairs(edges)
+    if not pairs_dict:
+        raise RuntimeError("No edges to split")
 
-    # Filter to only vertices in the original list
-    adjacent = []
-    for sel_vtx in grown_selection:
-        if sel_vtx in vertices and sel_vtx != first_vertex:
-            adjacent.append(sel_vtx)
+    # Walk the selected edges themselves: mesh edges between two loop
+    # vertices can be chords of a triangulated cap rather than loop edges
+    node, pairs = next(iter(pairs_dict.items()))
+    indices = np.unique(pairs)
+    points = get_mesh_data(node).points(world_space=False)
 
-    return adjacent
+    first_row, end_row = get_extremity_indices(points[indices], axis_index)
+    path_list = edge_loop_paths(pairs, indices[first_row], indices[end_row])
+    second_y = [points[path[1], 1] if len(path) > 1 else points[path[0], 1] for path in path_list]
+    pick = np.argmin(second_y) if direction == Direction.DOWN else np.argmax(second_y)
+    return [f"{node}.vtx[{index}]" for index in path_list[pick].tolist()]
 
 
 def _select_vertex_by_direction(vertices, direction, axis="y"):
@@ -139,8 +109,7 @@ def _select_vertex_by_direction(vertices, direction, axis="y"):
         return vertices[0] if vertices else None
 
     axis_index = {"x": 0, "y": 1, "z": 2}.get(axis.lower(), 1)
-    pos1 = cmds.xform(vertices[0], q=True, t=True)
-    pos2 = cmds.xform(vertices[1], q=True, t=True)
+    pos1, pos2 = get_component_positions(vertices[:2], world_space=False)
 
     if direction == Direction.DOWN:
         # Select lower vertex
@@ -189,10 +158,10 @@ def find_edge_up_down(head_geo, direction, enable_loop_mode=True):
     direction. Used for eyelid and lip edge detection.
 
     The algorithm:
-    1. Converts edges to vertices
+    1. Reads the vertex pairs of the edges without changing the selection
     2. Finds extremity vertices (leftmost/rightmost on X axis)
-    3. Walks along the loop selecting vertices based on Y position
-    4. Returns ordered vertex list for the requested direction
+    3. Walks the selected edges and splits the loop at the extremities
+    4. Returns the half whose second vertex is higher (UP) or lower (DOWN)
 
     Args:
         head_geo: Name of the head geometry mesh.
@@ -219,71 +188,8 @@ def find_edge_up_down(head_geo, direction, enable_loop_mode=True):
     if not edge_sel:
         raise RuntimeError("No edges selected")
 
-    # Convert to vertices
-    cmds.ConvertSelectionToVertices()
-    vertex_list = cmds.ls(fl=True, sl=True)
-    if not vertex_list:
-        raise RuntimeError("Could not convert selection to vertices")
-
-    # Get X positions to find extremities
-    pos_x = _get_vertex_positions(vertex_list, axis="x")
-    first_vtx, end_vtx = _find_extremity_vertices(vertex_list, pos_x)
-
-    # Find adjacent vertices to first vertex
-    cmds.select(first_vtx, replace=True)
-    cmds.GrowPolygonSelectionRegion()
-    cmds.select(first_vtx, end_vtx, deselect=True)
-    grown_sel = cmds.ls(fl=True, sl=True)
-    cmds.select(clear=True)
-
-    # Filter grown selection to vertices in our loop
-    for vtx in vertex_list:
-        for sel_vtx in grown_sel:
-            if sel_vtx == vtx:
-                cmds.select(sel_vtx, toggle=True)
-
-    up_down_sel = cmds.ls(fl=True, sl=True)
-    if len(up_down_sel) >= 2:
-        _select_vertex_by_direction(up_down_sel, direction)
-
-    # Build vertex path from first to end
-    down_vertex = [first_vtx]
-    second = cmds.ls(fl=True, sl=True)
-    if second:
-        down_vertex.append(second[0])
-
-    # Walk along the edge loop
-    for k in range(2, len(vertex_list)):
-        cmds.GrowPolygonSelectionRegion()
-        # Deselect previous two vertices
-        if len(down_vertex) >= 2:
-            cmds.select(down_vertex[k - 2], down_vertex[k - 1], deselect=True)
-        new_sel = cmds.ls(fl=True, sl=True)
-        cmds.select(clear=True)
-
-        # Find next vertex in our loop
-        for vtx in vertex_list:
-            for sel_vtx in new_sel:
-                if sel_vtx == vtx:
-                    cmds.select(sel_vtx, add=True)
-
-        # Fix direction if multiple candidates
-        fix_edge_loop_direction(direction)
-        second = cmds.ls(fl=True, sl=True)
-
-        if second:
-            # Check if we reached the end
-            pos1 = cmds.xform(second[0], q=True, t=True)
-            pos2 = cmds.xform(end_vtx, q=True, t=True)
-            if pos1[0] == pos2[0] and pos1[1] == pos2[1]:
-                break
-            down_vertex.append(second[0])
-
-    down_vertex.append(end_vtx)
-
-    # Restore edge selection and enable loop mode
-    cmds.select(edge_sel, replace=True)
-    cmds.ConvertSelectionToContainedEdges()
+    # Split the loop at its X (side to side) extremities
+    down_vertex = _split_edge_loop(edge_sel, direction, axis_index=0)
 
     if enable_loop_mode:
         enable_edge_loop_mode()
@@ -326,68 +232,8 @@ def find_edge_up_down_tongue(direction, enable_loop_mode=True):
     if not edge_sel:
         raise RuntimeError("No edges selected")
 
-    # Convert to vertices
-    cmds.ConvertSelectionToVertices()
-    vertex_list = cmds.ls(fl=True, sl=True)
-    if not vertex_list:
-        raise RuntimeError("Could not convert selection to vertices")
-
-    # Get Z positions for tongue (front-back axis)
-    pos_z = _get_vertex_positions(vertex_list, axis="z")
-    first_vtx, end_vtx = _find_extremity_vertices(vertex_list, pos_z)
-
-    # Find adjacent vertices to first vertex
-    cmds.select(first_vtx, replace=True)
-    cmds.GrowPolygonSelectionRegion()
-    cmds.select(first_vtx, end_vtx, deselect=True)
-    grown_sel = cmds.ls(fl=True, sl=True)
-    cmds.select(clear=True)
-
-    # Filter grown selection to vertices in our loop
-    for vtx in vertex_list:
-        for sel_vtx in grown_sel:
-            if sel_vtx == vtx:
-                cmds.select(sel_vtx, toggle=True)
-
-    up_down_sel = cmds.ls(fl=True, sl=True)
-    if len(up_down_sel) >= 2:
-        _select_vertex_by_direction(up_down_sel, direction)
-
-    # Build vertex path from first to end
-    down_vertex = [first_vtx]
-    second = cmds.ls(fl=True, sl=True)
-    if second:
-        down_vertex.append(second[0])
-
-    # Walk along the edge loop
-    for k in range(2, len(vertex_list)):
-        cmds.GrowPolygonSelectionRegion()
-        # Deselect previous two vertices
-        if len(down_vertex) >= 2:
-            cmds.select(down_vertex[k - 2], down_vertex[k - 1], deselect=True)
-        new_sel = cmds.ls(fl=True, sl=True)
-
-        # Find next vertex in our loop
-        for vtx in vertex_list:
-            for sel_vtx in new_sel:
-                if sel_vtx == vtx:
-                    cmds.select(sel_vtx, replace=True)
-
-        second = cmds.ls(fl=True, sl=True)
-
-        if second:
-            # Check if we reached the end
-            pos1 = cmds.xform(second[0], q=True, t=True)
-            pos2 = cmds.xform(end_vtx, q=True, t=True)
-            if pos1[0] == pos2[0] and pos1[1] == pos2[1]:
-                break
-            down_vertex.append(second[0])
-
-    down_vertex.append(end_vtx)
-
-    # Restore edge selection and enable loop mode
-    cmds.select(edge_sel, replace=True)
-    cmds.ConvertSelectionToContainedEdges()
+    # Split the loop at its Z (front-back) extremities
+    down_vertex = _split_edge_loop(edge_sel, direction, axis_index=2)
 
     if enable_loop_mode:
         enable_edge_loop_mode()
@@ -31,6 +31,12 @@ Example:
 import logging
 from enum import IntEnum
 
+from mayaLib.rigLib.face.operations.mesh_data import (
+    get_component_positions,
+    get_components_bounding_box,
+    get_components_center,
+)
+
 __author__ = "Lorenzo Argentieri"
 
 logger = logging.getLogger(__name__)
@@ -424,32 +430,31 @@ def validate_vertex_selection(
 def get_vertex_positions(vertices: list, world_space: bool = True) -> list:
     """Get world or local positions for a list of vertices.
 
+    Points are read once per mesh and cached until the mesh changes.
+
     Args:
         vertices: List of vertex names.
         world_space: If True, return world space positions.
 
     Returns:
-        list: List of (x, y, z) tuples for each vertex.
+        list: List of (x, y, z) tuples for each vertex, grouped by mesh when
+        the vertices belong to several meshes.
 
     Example:
         >>> positions = get_vertex_positions(["pCube1.vtx[0]", "pCube1.vtx[1]"])
         >>> for pos in positions:
         ...     print(f"Position: {pos}")
     """
-    import maya.cmds as cmds
-
-    positions = []
-    for vtx in vertices:
-        pos = cmds.xform(vtx, q=True, ws=world_space, t=True)
-        if pos:
-            positions.append(tuple(pos))
-
-    return positions
+    positions = get_component_positions(vertices, world_space=world_space)
+    return [tuple(position) for position in positions.tolist()]
 
 
 def get_selection_center(selection: list | None = None) -> tuple:
     """Calculate the center point of a selection.
 
+    Components are converted to vertices without changing the Maya
+    selection, and every vertex counts once.
+
     Args:
         selection: List of components to find center of.
             If None, uses current selection.
@@ -469,24 +474,32 @@ def get_selection_center(selection: list | None = None) -> tuple:
     if not selection:
         return (0.0, 0.0, 0.0)
 
-    # Convert to vertices if not already
-    cmds.select(selection, replace=True)
-    cmds.ConvertSelectionToVertices()
-    vertices = cmds.ls(sl=True, fl=True)
+    return get_components_center(selection)
 
-    if not vertices:
-        return (0.0, 0.0, 0.0)
 
-    # Calculate average position
-    total_x, total_y, total_z = 0.0, 0.0, 0.0
-    for vtx in vertices:
-        pos = cmds.xform(vtx, q=True, ws=True, t=True)
-        total_x += pos[0]
-        total_y += pos[1]
-        total_z += pos[2]
+def get_selection_bounding_box(selection: list | None = None) -> tuple | None:
+    """Calculate the world space bounding box of a selection.
 
-    count = len(vertices)
-    return (total_x / count, total_y / count, total_z / count)
+    Args:
+        selection: List of components to measure.
+            If None, uses current selection.
+
+    Returns:
+        tuple: ((min_x, min_y, min_z), (max_x, max_y, max_z)), or None if the
+        selection has no vertices.
+
+    Example:
+        >>> bb_min, bb_max = get_selection_bounding_box(["head_geo.vtx[100:200]"])
+    """
+    import maya.cmds as cmds
+
+    if selection is None:
+        selection = cmds.ls(sl=True, fl=True)
+
+    if not selection:
+        return None
+
+    return get_components_bounding_box(selection)
 
 
 def store_edge_selection() -> list:
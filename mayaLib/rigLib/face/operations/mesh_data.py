@@ -0,0 +1,443 @@
+"""Bulk mesh point access for facial rigging operations.
+
+Face operations work on lists of component names (lip, eyelid and brow
+loops) and used to query them with one ``cmds.xform`` per vertex. This
+module reads every point of a mesh with a single ``MFnMesh.getPoints`` call
+into a NumPy array and keeps it until the mesh changes: a node dirty
+callback on the shape drops both spaces, a world matrix callback on its
+path drops the world space points. Component names are resolved to index
+arrays, so positions, centers and bounding boxes are array operations.
+
+Resolving components never changes the Maya selection; edges, faces and
+whole objects are converted to vertices with one
+``polyListComponentConversion`` call. Connectivity queries (neighbors,
+ordered edge loops, borders) go through a
+:class:`~mayaLib.rigLib.utils.mesh_topology.MeshTopology` built once per
+topology hash and shared by meshes with the same connectivity.
+
+Example:
+    Center and bounds of an eyelid loop::
+
+        from mayaLib.rigLib.face.operations import mesh_data
+
+        center = mesh_data.get_components_center(eyelid_vertices)
+        bb_min, bb_max = mesh_data.get_components_bounding_box(eyelid_vertices)
+"""
+
+import re
+
+import numpy as np
+
+from mayaLib.rigLib.utils.mesh_topology import MeshTopology, topology_hash
+
+__author__ = "Lorenzo Argentieri"
+
+_COMPONENT_PATTERN = re.compile(r"^(?P<node>[^.\[]+)\.(?P<kind>vtx|e|f)\[(?P<index>[^\]]+)\]$")
+
+# Full shape path -> MeshData
+_MESH_DATA_CACHE = {}
+
+# Topology hash -> MeshTopology, oldest entries dropped first
+_TOPOLOGY_CACHE = {}
+TOPOLOGY_CACHE_SIZE = 8
+
+
+def parse_components(components):
+    """Group component names by node and type and resolve their indices.
+
+    Args:
+        components: Component names such as ``"head_geo.vtx[12]"`` or
+            ``"head_geo.e[3:7]"``; ``[*]`` stands for every component.
+
+    Returns:
+        dict: ``{(node, kind): indices}`` in first-seen order, ``kind`` being
+        ``"vtx"``, ``"e"`` or ``"f"`` and ``indices`` an int64 array in
+        component order, or None for ``[*]``.
+
+    Raises:
+        ValueError: If a name is not a vertex, edge or face component.
+    """
+    groups = {}
+    for component in components:
+        match = _COMPONENT_PATTERN.match(component)
+        if match is None:
+            raise ValueError(f"Not a mesh component: {component}")
+
+        key = (match["node"], match["kind"])
+        if match["index"] == "*":
+            groups[key] = None
+            continue
+        index_list = groups.setdefault(key, [])
+        if index_list is None:
+            continue
+        start, _, stop = match["index"].partition(":")
+        index_list.extend(range(int(start), int(stop or start) + 1))
+
+    return {
+        key: None if index_list is None else np.array(index_list, dtype=np.int64)
+        for key, index_list in groups.items()
+    }
+
+
+def _shape_dag_path(mesh):
+    """Get the ``MDagPath`` of the visible mesh shape of a node.
+
+    Args:
+        mesh: Mesh transform or shape name.
+
+    Returns:
+        MDagPath: Path of the first non-intermediate mesh shape, or of the
+        node itself if it has none.
+    """
+    import maya.api.OpenMaya as om2  # noqa: N813 - Maya API alias
+
+    selection = om2.MSelectionList()
+    selection.add(mesh)
+    dag_path = selection.getDagPath(0)
+    if dag_path.hasFn(om2.MFn.kTransform):
+        for index in range(dag_path.numberOfShapesDirectlyBelow()):
+            shape_path = om2.MDagPath(dag_path).extendToShape(index)
+            if (
+                shape_path.hasFn(om2.MFn.kMesh)
+                and not om2.MFnDagNode(shape_path).isIntermediateObject
+            ):
+                return shape_path
+    return dag_path
+
+
+def _read_points(dag_path, world_space=True):
+    """Read every point of a mesh in bulk.
+
+    Args:
+        dag_path: ``MDagPath`` of the mesh shape.
+        world_space: Read world instead of object space positions.
+
+    Returns:
+        np.ndarray: ``(vertices, 3)`` float64 positions.
+    """
+    import maya.api.OpenMaya as om2  # noqa: N813 - Maya API alias
+
+    space = om2.MSpace.kWorld if world_space else om2.MSpace.kObject
+    return np.array(om2.MFnMesh(dag_path).getPoints(space), dtype=np.float64)[:, :3]
+
+
+def _read_topology(dag_path):
+    """Read the polygon connectivity of a mesh in bulk.
+
+    Args:
+        dag_path: ``MDagPath`` of the mesh shape.
+
+    Returns:
+        tuple: ``(counts, connects, num_vertices)`` with the int64 vertex
+        count per polygon and polygon vertex ids.
+    """
+    import maya.api.OpenMaya as om2  # noqa: N813 - Maya API alias
+
+    mesh_fn = om2.MFnMesh(dag_path)
+    counts, connects = mesh_fn.getVertices()
+    return (
+        np.array(counts, dtype=np.int64),
+        np.array(connects, dtype=np.int64),
+        mesh_fn.numVertices,
+    )
+
+
+def _read_edge_vertices(dag_path, edge_ids=None):
+    """Read the vertex pairs of some edges of a mesh.
+
+    Args:
+        dag_path: ``MDagPath`` of the mesh shape.
+        edge_ids: Maya edge ids, None for every edge.
+
+    Returns:
+        np.ndarray: ``(edges, 2)`` int64 vertex ids.
+    """
+    import maya.api.OpenMaya as om2  # noqa: N813 - Maya API alias
+
+    mesh_fn = om2.MFnMesh(dag_path)
+    if edge_ids is None:
+        edge_ids = range(mesh_fn.numEdges)
+    pairs = [mesh_fn.getEdgeVertices(int(edge_id)) for edge_id in edge_ids]
+    return np.array(pairs, dtype=np.int64).reshape(-1, 2)
+
+
+def _get_topology(counts, connects, num_vertices):
+    """Get the shared topology of some connectivity, building it if needed.
+
+    Args:
+        counts: Vertex count per polygon.
+        connects: Polygon vertex ids.
+        num_vertices: Number of vertices.
+
+    Returns:
+        MeshTopology: Topology cached by its hash.
+    """
+    key = (topology_hash(counts, connects), int(num_vertices))
+    topology = _TOPOLOGY_CACHE.get(key)
+    if topology is None:
+        topology = MeshTopology(counts, connects, num_vertices)
+        if len(_TOPOLOGY_CACHE) >= TOPOLOGY_CACHE_SIZE:
+            _TOPOLOGY_CACHE.pop(next(iter(_TOPOLOGY_CACHE)))
+        _TOPOLOGY_CACHE[key] = topology
+    return topology
+
+
+class MeshData:
+    """Point positions of one mesh, read in bulk and kept until it changes.
+
+    Attributes:
+        dag_path: ``MDagPath`` of the mesh shape.
+        name: Full path of the mesh shape.
+    """
+
+    def __init__(self, dag_path):
+        """Initialize the accessor; points are read on first use.
+
+        Args:
+            dag_path: ``MDagPath`` of the mesh shape.
+        """
+        self.dag_path = dag_path
+        self.name = dag_path.fullPathName()
+        self._points = {}
+        self._topology = None
+        self._callback_ids = []
+
+    def __repr__(self):
+        """Return a short description of the accessor."""
+        return f"{type(self).__name__}({self.name!r}, cached={sorted(self._points)})"
+
+    def points(self, world_space=True):
+        """Get every point of the mesh.
+
+        Args:
+            world_space: World instead of object space positions.
+
+        Returns:
+            np.ndarray: ``(vertices, 3)`` float64 positions; treat as read-only,
+            the array is shared by every caller until the mesh changes.
+        """
+        world_space = bool(world_space)
+        if world_space not in self._points:
+            self._points[world_space] = _read_points(self.dag_path, world_space)
+        return self._points[world_space]
+
+    def topology(self):
+        """Get the connectivity of the mesh.
+
+        Returns:
+            MeshTopology: Adjacency tables, shared with every mesh of the
+            same topology hash.
+        """
+        if self._topology is None:
+            self._topology = _get_topology(*_read_topology(self.dag_path))
+        return self._topology
+
+    @property
+    def num_vertices(self):
+        """int: Number of vertices of the mesh."""
+        return len(self.points(world_space=False))
+
+    def mark_dirty(self, *args):
+        """Drop the cached points of both spaces and the topology.
+
+        The topology is read again on next use but only rebuilt if its hash
+        changed.
+
+        Args:
+            *args: Callback arguments, ignored.
+        """
+        self._points.clear()
+        self._topology = None
+
+    def mark_world_dirty(self, *args):
+        """Drop the cached world space points.
+
+        Args:
+            *args: Callback arguments, ignored.
+        """
+        self._points.pop(True, None)
+
+    def add_callbacks(self):
+        """Track the shape and its path so edits invalidate the cache."""
+        import maya.api.OpenMaya as om2  # noqa: N813 - Maya API alias
+
+        self._callback_ids = [
+            om2.MNodeMessage.addNodeDirtyCallback(self.dag_path.node(), self.mark_dirty),
+            om2.MDagMessage.addWorldMatrixModifiedCallback(self.dag_path, self.mark_world_dirty),
+        ]
+
+    def remove_callbacks(self):
+        """Remove the callbacks added by :meth:`add_callbacks`."""
+        if not self._callback_ids:
+            return
+
+        import maya.api.OpenMaya as om2  # noqa: N813 - Maya API alias
+
+        om2.MMessage.removeCallbacks(self._callback_ids)
+        self._callback_ids = []
+
+
+def get_mesh_data(mesh):
+    """Get the cached point accessor of a mesh.
+
+    Args:
+        mesh: Mesh transform or shape name.
+
+    Returns:
+        MeshData: Accessor shared by every caller until the mesh is deleted
+        or :func:`clear_mesh_data_cache` is called.
+    """
+    dag_path = _shape_dag_path(mesh)
+    name = dag_path.fullPathName()
+    mesh_data = _MESH_DATA_CACHE.get(name)
+    if mesh_data is not None and mesh_data.dag_path.isValid():
+        return mesh_data
+
+    if mesh_data is not None:
+        mesh_data.remove_callbacks()
+    mesh_data = MeshData(dag_path)
+    mesh_data.add_callbacks()
+    _MESH_DATA_CACHE[name] = mesh_data
+    return mesh_data
+
+
+def clear_mesh_data_cache():
+    """Drop every cached mesh and topology and remove the mesh callbacks."""
+    for mesh_data in _MESH_DATA_CACHE.values():
+        mesh_data.remove_callbacks()
+    _MESH_DATA_CACHE.clear()
+    _TOPOLOGY_CACHE.clear()
+
+
+def get_mesh_topology(mesh):
+    """Get the cached connectivity of a mesh.
+
+    Args:
+        mesh: Mesh transform or shape name.
+
+    Returns:
+        MeshTopology: Adjacency tables of the mesh.
+    """
+    return get_mesh_data(mesh).topology()
+
+
+def get_vertex_indices(components):
+    """Resolve components to vertex indices per mesh.
+
+    Vertex names are resolved in place; edges, faces and whole objects
+    are converted with one ``polyListComponentConversion`` call and their
+    vertices appended after the vertex names of the same mesh.
+
+    Args:
+        components: Component or object names.
+
+    Returns:
+        dict: ``{node: indices}`` int64 vertex index arrays in first-seen
+        order of the nodes.
+    """
+    vertex_list = []
+    other_list = []
+    for component in components:
+        (vertex_list if ".vtx[" in component else other_list).append(component)
+
+    if other_list:
+        import maya.cmds as cmds
+
+        vertex_list.extend(cmds.polyListComponentConversion(other_list, toVertex=True) or [])
+
+    indices_dict = {}
+    for (node, _), indices in parse_components(vertex_list).items():
+        if indices is None:
+            indices = np.arange(get_mesh_data(node).num_vertices, dtype=np.int64)
+        if node in indices_dict:
+            indices = np.concatenate((indices_dict[node], indices))
+        indices_dict[node] = indices
+    return indices_dict
+
+
+def get_edge_vertex_pairs(components):
+    """Resolve edge components to their vertex pairs per mesh.
+
+    Args:
+        components: Edge names; other components are ignored.
+
+    Returns:
+        dict: ``{node: pairs}`` ``(edges, 2)`` int64 vertex ids in
+        first-seen order of the nodes.
+    """
+    pairs_dict = {}
+    for (node, kind), indices in parse_components(components).items():
+        if kind != "e":
+            continue
+        pairs_dict[node] = _read_edge_vertices(get_mesh_data(node).dag_path, indices)
+    return pairs_dict
+
+
+def get_component_positions(components, world_space=True, unique=False):
+    """Get the positions of the vertices of some components.
+
+    Args:
+        components: Component or object names.
+        world_space: World instead of object space positions.
+        unique: Count every vertex once, e.g. for centers.
+
+    Returns:
+        np.ndarray: ``(n, 3)`` positions, grouped by mesh and in component
+        order within a mesh.
+    """
+    position_list = []
+    for node, indices in get_vertex_indices(components).items():
+        if unique:
+            indices = np.unique(indices)
+        position_list.append(get_mesh_data(node).points(world_space)[indices])
+
+    if not position_list:
+        return np.zeros((0, 3))
+    return np.concatenate(position_list)
+
+
+def get_components_center(components, world_space=True):
+    """Get the average position of the vertices of some components.
+
+    Args:
+        components: Component or object names.
+        world_space: World instead of object space positions.
+
+    Returns:
+        tuple: ``(x, y, z)`` center, the origin for no vertices.
+    """
+    positions = get_component_positions(components, world_space, unique=True)
+    if not len(positions):
+        return (0.0, 0.0, 0.0)
+    return tuple(positions.mean(axis=0).tolist())
+
+
+def get_components_bounding_box(components, world_space=True):
+    """Get the axis aligned bounds of the vertices of some components.
+
+    Args:
+        components: Component or object names.
+        world_space: World instead of object space positions.
+
+    Returns:
+        tuple: ``(min, max)`` as ``(x, y, z)`` tuples, None for no vertices.
+    """
+    positions = get_component_positions(components, world_space)
+    if not len(positions):
+        return None
+    return tuple(positions.min(axis=0).tolist()), tuple(positions.max(axis=0).tolist())
+
+
+def get_extremity_indices(positions, axis=0):
+    """Find the rows with the lowest and highest value along an axis.
+
+    Args:
+        positions: ``(n, 3)`` positions.
+        axis: Axis index, 0 for X.
+
+    Returns:
+        tuple: ``(lowest, highest)`` row indices; the last row wins ties.
+    """
+    values = np.asarray(positions, dtype=np.float64)[::-1, axis]
+    last = len(values) - 1
+    return last - int(np.argmin(values)), last - int(np.argmax(values))
@@ -5,7 +5,10 @@ weights between meshes at runtime. It handles vertex-based weight copying,
 blendshape connections, and deformation transfer workflows.
 
 The functions support both component-based transfers (vertex-to-vertex) and
-full mesh transfers with influence matching.
+full mesh transfers with influence matching. Component transfers read all
+positions and weights in bulk, match vertices with a
+:class:`~mayaLib.rigLib.utils.point_grid.PointGrid` nearest neighbor query and
+write each destination skin cluster with a single ``setWeights`` call.
 
 Example:
     Copy skin weights from source to target::
@@ -23,6 +26,10 @@ Example:
 import contextlib
 import logging
 
+import numpy as np
+
+from mayaLib.rigLib.utils.point_grid import PointGrid
+
 __author__ = "Lorenzo Argentieri"
 
 logger = logging.getLogger(__name__)
@@ -219,7 +226,7 @@ def _source_destination_sel(sd_type):
         _source_vertex_list = list(selection_list)
 
 
-def copy_skin_global(progress_callback=None):
+def copy_skin_global(progress_callback=None, neighbors=1, power=2.0):
     """Copy skin weights from source to destination vertices.
 
     Uses the previously defined source and destination vertex lists
@@ -231,6 +238,9 @@ def copy_skin_global(progress_callback=None):
     Args:
         progress_callback: Optional callback function(value) for
             progress reporting (0-100 range).
+        neighbors: Source vertices blended per destination vertex.
+            Defaults to 1 (copy the closest vertex).
+        power: Inverse distance power used when blending neighbors.
 
     Returns:
         None
@@ -241,54 +251,178 @@ def copy_skin_global(progress_callback=None):
     global _destination_vertex_list
 
     base = cmds.ls(sl=1)
-    copy_skin_main(progress_callback)
+    copy_skin_main(progress_callback, neighbors=neighbors, power=power)
     _source_vertex_list = []
     _destination_vertex_list = []
     cmds.select(base)
 
 
-def copy_skin_main(progress_callback=None):
-    """Transfer skin weights vertex-by-vertex using closest distance.
+def blend_nearest_weights(distances, indices, source_weights, power=2.0):
+    """Blend source weight rows by inverse distance.
+
+    Args:
+        distances: ``(points, k)`` distances to the nearest source points.
+        indices: ``(points, k)`` indices of the nearest source points.
+        source_weights: ``(source_points, influences)`` weight matrix.
+        power: Inverse distance power. Higher values favor the closest
+            point more.
+
+    Returns:
+        np.ndarray: ``(points, influences)`` normalized weights. With a
+        single neighbor the closest source row is copied unchanged.
+    """
+    source_weights = np.asarray(source_weights, dtype=np.float64)
+    indices = np.asarray(indices).reshape(len(indices), -1)
+    if indices.shape[1] == 1:
+        return source_weights[indices[:, 0]]
+
+    distances = np.asarray(distances, dtype=np.float64).reshape(indices.shape)
+    # A coincident source point takes over the blend instead of dividing by zero
+    inverse = 1.0 / np.maximum(distances, 1e-12) ** power
+    inverse /= inverse.sum(axis=1, keepdims=True)
+
+    blended = np.zeros((len(indices), source_weights.shape[1]))
+    for column in range(indices.shape[1]):
+        blended += inverse[:, column, None] * source_weights[indices[:, column]]
+
+    totals = blended.sum(axis=1, keepdims=True)
+    np.divide(blended, totals, out=blended, where=totals > 0)
+    return blended
 
-    For each destination vertex, finds the closest source vertex and
-    copies its skin weights using Maya's artAttrSkinWeight tool.
+
+def transfer_weight_matrix(
+    source_points, source_weights, destination_points, neighbors=1, power=2.0
+):
+    """Transfer weights to new points by nearest source point.
+
+    Args:
+        source_points: ``(n, 3)`` source positions.
+        source_weights: ``(n, influences)`` source weights.
+        destination_points: ``(m, 3)`` destination positions.
+        neighbors: Source points blended per destination point.
+        power: Inverse distance power used when blending neighbors.
+
+    Returns:
+        tuple: (weights, distances) where weights is ``(m, influences)`` and
+        distances is ``(m,)``, the distance to the closest source point.
+    """
+    distances, indices = PointGrid(source_points).query(destination_points, k=neighbors)
+    weights = blend_nearest_weights(distances, indices, source_weights, power)
+    return weights, distances[:, 0]
+
+
+def _group_vertices(vertices):
+    """Group PyMEL vertex components by shape.
+
+    Returns:
+        dict: ``{shape_name: sorted unique vertex indices}`` in selection order
+        of the shapes.
+    """
+    groups = {}
+    for vertex in vertices:
+        groups.setdefault(vertex.node().name(), []).extend(vertex.indices())
+    return {shape: np.unique(ids) for shape, ids in groups.items()}
+
+
+def _world_points(shape, point_ids):
+    """Read the world space positions of some vertices of a mesh in bulk."""
+    import maya.api.OpenMaya as om2  # noqa: N813 - Maya API alias
+
+    selection = om2.MSelectionList()
+    selection.add(shape)
+    fn_mesh = om2.MFnMesh(selection.getDagPath(0))
+    points = np.array(fn_mesh.getPoints(om2.MSpace.kWorld))[:, :3]
+    return points[point_ids]
+
+
+def _shape_skin_cluster(shape):
+    """Return the skin cluster of a mesh shape, or None with a warning."""
+    import pymel.all as pm
+
+    skin_cls = get_skin_cluster(pm.PyNode(shape).getParent())
+    if skin_cls is None:
+        pm.displayWarning(f"{shape}: has no skinCluster, skipped")
+    return skin_cls
+
+
+def copy_skin_main(progress_callback=None, neighbors=1, power=2.0):
+    """Transfer skin weights to the destination vertices by closest distance.
+
+    Reads the positions and weights of all source vertices in bulk, finds
+    the closest source vertex of every destination vertex with a
+    :class:`PointGrid` query and writes each destination skin cluster with
+    one ``setWeights`` call. Influences are matched by name; weights of
+    source influences missing on a destination skin cluster are dropped and
+    the rows renormalized.
 
     Args:
         progress_callback: Optional callback function(value) for
             progress reporting (0-100 range).
+        neighbors: Source vertices blended per destination vertex.
+            Defaults to 1 (copy the closest vertex).
+        power: Inverse distance power used when blending neighbors.
 
     Note:
-        This is a brute-force O(n*m) algorithm. For large vertex counts,
-        consider using Maya's native copySkinWeights with surface association.
+        Positions are compared in world space, so source and destination
+        meshes do not need matching transforms.
     """
-    import maya.mel as mel
-    import pymel.all as pm
+    from mayaLib.rigLib.face.io.skin_io import remap_weight_columns, set_weight_matrix
+    from mayaLib.rigLib.utils.skin_weights import (
+        get_skin_api_objects,
+        get_weight_matrix,
+        strip_influence_name,
+    )
+
+    if not _source_vertex_list or not _destination_vertex_list:
+        return
+
+    # Source positions and weights, with the influences of every source mesh
+    source_points = []
+    source_blocks = []
+    influences = []
+    for shape, point_ids in _group_vertices(_source_vertex_list).items():
+        skin_cls = _shape_skin_cluster(shape)
+        if skin_cls is None:
+            continue
+        shape_influences, weights, _blend_weights = get_weight_matrix(skin_cls, point_ids)
+        influences.extend(name for name in shape_influences if name not in influences)
+        source_points.append(_world_points(shape, point_ids))
+        source_blocks.append((shape_influences, weights))
+
+    if not source_points:
+        return
+    source_points = np.concatenate(source_points)
+    source_weights = np.concatenate(
+        [remap_weight_columns(weights, names, influences)[0] for names, weights in source_blocks]
+    )
+    if progress_callback:
+        progress_callback(10)
 
-    source_ver = _source_vertex_list
-    destination_ver = _destination_vertex_list
-    progress_value = 0.0
+    destinations = _group_vertices(_destination_vertex_list)
+    grid = PointGrid(source_points)
+    for done, (shape, point_ids) in enumerate(destinations.items(), 1):
+        skin_cls = _shape_skin_cluster(shape)
+        if skin_cls is None:
+            continue
 
-    if len(destination_ver) > 0:
-        for x_dis in destination_ver:
-            x_dis_pos = x_dis.getPosition()
-            min_length = 20000
-            closest_src = None
+        distances, indices = grid.query(_world_points(shape, point_ids), k=neighbors)
+        weights = blend_nearest_weights(distances, indices, source_weights, power)
 
-            for x_src in source_ver:
-                new_length = (x_dis_pos - x_src.getPosition()).length()
-                if new_length < min_length:
-                    min_length = new_length
-                    closest_src = x_src
+        fn_skin = get_skin_api_objects(skin_cls)[0]
+        scene_influences = [
+            strip_influence_name(path.partialPathName()) for path in fn_skin.influenceObjects()
+        ]
+        weights, unused = remap_weight_columns(weights, influences, scene_influences)
+        if unused:
+            logger.warning("%s: influences missing from skinCluster: %s", shape, unused)
+            totals = weights.sum(axis=1, keepdims=True)
+            np.divide(weights, totals, out=weights, where=totals > 0)
 
-            if closest_src:
-                pm.select(closest_src)
-                mel.eval("artAttrSkinWeightCopy")
-                pm.select(x_dis)
-                mel.eval("artAttrSkinWeightPaste")
+        set_weight_matrix(skin_cls, scene_influences, weights, point_ids=point_ids)
+        logger.info("Copied skin weights to %d vertices of %s", len(point_ids), shape)
 
-                progress_value += 10.0 / len(destination_ver)
-                if progress_callback:
-                    progress_callback(progress_value * 10)
+        if progress_callback:
+            progress_callback(10 + 90 * done / len(destinations))
 
 
 def hammer_skin_weights():
@@ -625,6 +759,8 @@ __all__ = [
     "destination_define",
     "copy_skin_global",
     "copy_skin_main",
+    "blend_nearest_weights",
+    "transfer_weight_matrix",
     "hammer_skin_weights",
     "copy_pivot",
     "connect_blendshape",
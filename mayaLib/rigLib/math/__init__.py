@@ -6,7 +6,7 @@ for efficient rigging workflows.
 
 from typing import Any
 
-__all__ = ["collision", "vector", "matrix", "rbf"]
+__all__ = ["collision", "vector", "matrix", "rbf", "curve_sampling"]
 
 
 def __getattr__(name: str) -> Any:
@@ -1 +1,475 @@
-"""Matrix math utilities for Maya rigging."""
+"""Matrix math utilities for Maya rigging.
+
+Batched transform math on ``(N, 4, 4)`` float64 NumPy stacks, following
+Maya's conventions: matrices act on row vectors, the translation is stored
+in the last row, and a transform is composed as
+``scale * shear * rotate * translate``, so a child's world matrix is
+``local * parent_world``. Quaternions use the ``(x, y, z, w)`` order of
+``MQuaternion``.
+
+Every function handles a whole stack with NumPy array operations instead of
+one ``pm.dt.Matrix``/``MMatrix`` product at a time; only
+:func:`from_mmatrix` and :func:`to_mmatrix` touch OpenMaya, so the rest of the
+module works outside Maya.
+
+Example:
+    Rebuild world matrices of a joint chain after editing local rotations::
+
+        from mayaLib.rigLib.math import matrix
+
+        local = matrix.world_to_local(world, parents)
+        local = matrix.compose(translate, rotate=quaternions, scale=scale)
+        world = matrix.local_to_world(local, parents)
+"""
+
+__author__ = "Lorenzo Argentieri"
+
+from itertools import chain
+
+import numpy as np
+
+__all__ = [
+    "as_matrix_stack",
+    "identity",
+    "normalize_quaternions",
+    "quaternion_multiply",
+    "quaternion_to_rotation",
+    "rotation_to_quaternion",
+    "compose",
+    "decompose",
+    "inverse",
+    "inverse_rigid",
+    "slerp",
+    "lerp",
+    "blend",
+    "hierarchy_depths",
+    "local_to_world",
+    "world_to_local",
+    "from_mmatrix",
+    "to_mmatrix",
+]
+
+
+def as_matrix_stack(matrices):
+    """Convert matrices to a contiguous ``(N, 4, 4)`` float64 stack.
+
+    Args:
+        matrices: One ``(4, 4)`` matrix, a stack of them, or 16 values per
+            matrix in row-major order.
+
+    Returns:
+        np.ndarray: ``(N, 4, 4)`` float64 array.
+    """
+    return np.ascontiguousarray(matrices, dtype=np.float64).reshape(-1, 4, 4)
+
+
+def identity(count=1):
+    """Build a stack of identity matrices.
+
+    Args:
+        count: Number of matrices.
+
+    Returns:
+        np.ndarray: ``(count, 4, 4)`` float64 array.
+    """
+    return np.tile(np.eye(4), (count, 1, 1))
+
+
+def normalize_quaternions(quaternions):
+    """Normalize quaternions along the last axis.
+
+    Zero-length quaternions become the identity rotation.
+
+    Args:
+        quaternions: ``(..., 4)`` array of ``(x, y, z, w)`` values.
+
+    Returns:
+        np.ndarray: Unit quaternions with the same shape.
+    """
+    quaternions = np.array(quaternions, dtype=np.float64)
+    length = np.linalg.norm(quaternions, axis=-1, keepdims=True)
+    degenerate = length[..., 0] < 1e-12
+    quaternions[degenerate] = (0.0, 0.0, 0.0, 1.0)
+    length[degenerate] = 1.0
+    return quaternions / length
+
+
+def quaternion_multiply(q1, q2):
+    """Multiply ``(x, y, z, w)`` quaternion arrays element-wise.
+
+    Args:
+        q1: ``(..., 4)`` left quaternions.
+        q2: ``(..., 4)`` right quaternions.
+
+    Returns:
+        np.ndarray: ``(..., 4)`` products ``q1 * q2``.
+    """
+    q1 = np.asarray(q1, dtype=np.float64)
+    q2 = np.asarray(q2, dtype=np.float64)
+    vector1, w1 = q1[..., :3], q1[..., 3:]
+    vector2, w2 = q2[..., :3], q2[..., 3:]
+    vector = w1 * vector2 + w2 * vector1 + np.cross(vector1, vector2)
+    w = w1 * w2 - np.sum(vector1 * vector2, axis=-1, keepdims=True)
+    return np.concatenate((vector, w), axis=-1)
+
+
+def quaternion_to_rotation(quaternions):
+    """Convert quaternions to row-vector rotation matrices.
+
+    Args:
+        quaternions: ``(N, 4)`` or ``(4,)`` array of ``(x, y, z, w)`` values.
+
+    Returns:
+        np.ndarray: ``(N, 3, 3)`` rotation matrices, rows being the rotated
+        X, Y and Z axes like ``MQuaternion.asMatrix``.
+    """
+    x, y, z, w = np.moveaxis(normalize_quaternions(np.atleast_2d(quaternions)), -1, 0)
+    rotation = np.empty((len(x), 3, 3))
+    rotation[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    rotation[:, 0, 1] = 2.0 * (x * y + z * w)
+    rotation[:, 0, 2] = 2.0 * (x * z - y * w)
+    rotation[:, 1, 0] = 2.0 * (x * y - z * w)
+    rotation[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    rotation[:, 1, 2] = 2.0 * (y * z + x * w)
+    rotation[:, 2, 0] = 2.0 * (x * z + y * w)
+    rotation[:, 2, 1] = 2.0 * (y * z - x * w)
+    rotation[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return rotation
+
+
+def rotation_to_quaternion(rotations):
+    """Convert row-vector rotation matrices to quaternions.
+
+    Uses Shepperd's method, picking per matrix the largest of the four
+    quaternion components as the pivot so the result stays accurate near
+    180 degree rotations.
+
+    Args:
+        rotations: ``(N, 3, 3)`` or ``(N, 4, 4)`` orthonormal matrices.
+
+    Returns:
+        np.ndarray: ``(N, 4)`` unit ``(x, y, z, w)`` quaternions with ``w >= 0``.
+    """
+    rotations = np.asarray(rotations, dtype=np.float64)
+    # Work on the column-vector form
+    column = np.swapaxes(rotations.reshape((-1,) + rotations.shape[-2:])[:, :3, :3], 1, 2)
+    count = len(column)
+    diagonal = np.diagonal(column, axis1=1, axis2=2)
+    trace = diagonal.sum(axis=1)
+    pivot = np.argmax(np.column_stack((diagonal, trace)), axis=1)
+
+    quaternions = np.empty((count, 4))
+    rows = np.flatnonzero(pivot != 3)
+    i = pivot[rows]
+    j = (i + 1) % 3
+    k = (j + 1) % 3
+    quaternions[rows, i] = 1.0 - trace[rows] + 2.0 * column[rows, i, i]
+    quaternions[rows, j] = column[rows, j, i] + column[rows, i, j]
+    quaternions[rows, k] = column[rows, k, i] + column[rows, i, k]
+    quaternions[rows, 3] = column[rows, k, j] - column[rows, j, k]
+
+    rows = np.flatnonzero(pivot == 3)
+    quaternions[rows, 0] = column[rows, 2, 1] - column[rows, 1, 2]
+    quaternions[rows, 1] = column[rows, 0, 2] - column[rows, 2, 0]
+    quaternions[rows, 2] = column[rows, 1, 0] - column[rows, 0, 1]
+    quaternions[rows, 3] = 1.0 + trace[rows]
+
+    quaternions[quaternions[:, 3] < 0.0] *= -1.0
+    return normalize_quaternions(quaternions)
+
+
+def compose(translate=None, rotate=None, scale=None, shear=None):
+    """Compose transform matrices from their components.
+
+    Components broadcast against each other, so e.g. one scale can be
+    shared by a stack of rotations. Omitted components are neutral.
+
+    Args:
+        translate: ``(N, 3)`` translations.
+        rotate: ``(N, 4)`` ``(x, y, z, w)`` quaternions.
+        scale: ``(N, 3)`` scales.
+        shear: ``(N, 3)`` ``(xy, xz, yz)`` shears, as in ``MTransformationMatrix``.
+
+    Returns:
+        np.ndarray: ``(N, 4, 4)`` matrices ``scale * shear * rotate * translate``.
+    """
+    components = [
+        np.atleast_2d(np.asarray(value, dtype=np.float64))
+        for value in (translate, rotate, scale, shear)
+        if value is not None
+    ]
+    count = max((len(value) for value in components), default=1)
+
+    upper = np.tile(np.eye(3), (count, 1, 1))
+    if shear is not None:
+        xy, xz, yz = np.moveaxis(np.broadcast_to(np.atleast_2d(shear), (count, 3)), -1, 0)
+        upper[:, 1, 0] = xy
+        upper[:, 2, 0] = xz
+        upper[:, 2, 1] = yz
+    if scale is not None:
+        upper *= np.broadcast_to(np.atleast_2d(scale), (count, 3))[:, :, None]
+    if rotate is not None:
+        upper = upper @ np.broadcast_to(quaternion_to_rotation(rotate), (count, 3, 3))
+
+    matrices = identity(count)
+    matrices[:, :3, :3] = upper
+    if translate is not None:
+        matrices[:, 3, :3] = np.broadcast_to(np.atleast_2d(translate), (count, 3))
+    return matrices
+
+
+def decompose(matrices):
+    """Decompose transform matrices into their components.
+
+    Inverse of :func:`compose`: rows of the upper 3x3 are orthogonalized
+    in X, Y, Z order to separate scale and shear from the rotation. A
+    negative determinant is assigned to the Z scale.
+
+    Args:
+        matrices: ``(N, 4, 4)`` transform matrices.
+
+    Returns:
+        tuple: ``(translate, rotate, scale, shear)`` arrays of shape
+        ``(N, 3)``, ``(N, 4)``, ``(N, 3)`` and ``(N, 3)``.
+    """
+    matrices = as_matrix_stack(matrices)
+    row_x, row_y, row_z = np.moveaxis(matrices[:, :3, :3], 1, 0)
+
+    scale_x = np.linalg.norm(row_x, axis=1)
+    axis_x = row_x / scale_x[:, None]
+
+    shear_xy = np.einsum("ij,ij->i", row_y, axis_x)
+    row_y = row_y - shear_xy[:, None] * axis_x
+    scale_y = np.linalg.norm(row_y, axis=1)
+    axis_y = row_y / scale_y[:, None]
+
+    shear_xz = np.einsum("ij,ij->i", row_z, axis_x)
+    shear_yz = np.einsum("ij,ij->i", row_z, axis_y)
+    row_z = row_z - shear_xz[:, None] * axis_x - shear_yz[:, None] * axis_y
+    scale_z = np.linalg.norm(row_z, axis=1)
+    axis_z = row_z / scale_z[:, None]
+
+    flip = np.einsum("ij,ij->i", np.cross(axis_x, axis_y), axis_z) < 0.0
+    scale_z[flip] *= -1.0
+    axis_z[flip] *= -1.0
+
+    rotation = np.stack((axis_x, axis_y, axis_z), axis=1)
+    scale = np.column_stack((scale_x, scale_y, scale_z))
+    shear = np.column_stack((shear_xy / scale_y, shear_xz / scale_z, shear_yz / scale_z))
+    return matrices[:, 3, :3].copy(), rotation_to_quaternion(rotation), scale, shear
+
+
+def inverse(matrices):
+    """Invert general transform matrices.
+
+    Args:
+        matrices: ``(N, 4, 4)`` invertible matrices.
+
+    Returns:
+        np.ndarray: ``(N, 4, 4)`` inverses.
+    """
+    return np.linalg.inv(as_matrix_stack(matrices))
+
+
+def inverse_rigid(matrices):
+    """Invert rotation plus translation matrices without a general inverse.
+
+    Only valid for matrices without scale or shear: the rotation is
+    transposed and the translation rotated back.
+
+    Args:
+        matrices: ``(N, 4, 4)`` rigid transform matrices.
+
+    Returns:
+        np.ndarray: ``(N, 4, 4)`` inverses.
+    """
+    matrices = as_matrix_stack(matrices)
+    rotation_t = np.swapaxes(matrices[:, :3, :3], 1, 2)
+    inverted = identity(len(matrices))
+    inverted[:, :3, :3] = rotation_t
+    inverted[:, 3, :3] = -np.einsum("ni,nij->nj", matrices[:, 3, :3], rotation_t)
+    return inverted
+
+
+def slerp(quaternions_a, quaternions_b, weight):
+    """Spherically interpolate quaternions along the shortest arc.
+
+    Nearly identical rotations are linearly interpolated and normalized.
+
+    Args:
+        quaternions_a: ``(N, 4)`` start quaternions.
+        quaternions_b: ``(N, 4)`` end quaternions.
+        weight: Blend weight, a scalar or one per quaternion; 0 gives the start.
+
+    Returns:
+        np.ndarray: ``(N, 4)`` unit quaternions.
+    """
+    quaternions_a = normalize_quaternions(np.atleast_2d(quaternions_a))
+    quaternions_b = normalize_quaternions(np.atleast_2d(quaternions_b))
+    weight = np.asarray(weight, dtype=np.float64).reshape(-1, 1)
+
+    dots = np.sum(quaternions_a * quaternions_b, axis=-1, keepdims=True)
+    quaternions_b = np.where(dots < 0.0, -quaternions_b, quaternions_b)
+    dots = np.minimum(np.abs(dots), 1.0)
+
+    angle = np.arccos(dots)
+    sin_angle = np.sin(angle)
+    linear = sin_angle < 1e-6
+    safe_sin = np.where(linear, 1.0, sin_angle)
+    start = np.where(linear, 1.0 - weight, np.sin((1.0 - weight) * angle) / safe_sin)
+    end = np.where(linear, weight, np.sin(weight * angle) / safe_sin)
+    return normalize_quaternions(start * quaternions_a + end * quaternions_b)
+
+
+def lerp(matrices_a, matrices_b, weight):
+    """Linearly interpolate matrix values.
+
+    Cheap, but rotations shrink in between; use :func:`blend` to keep
+    rigid rotations.
+
+    Args:
+        matrices_a: ``(N, 4, 4)`` start matrices.
+        matrices_b: ``(N, 4, 4)`` end matrices.
+        weight: Blend weight, a scalar or one per matrix; 0 gives the start.
+
+    Returns:
+        np.ndarray: ``(N, 4, 4)`` matrices.
+    """
+    matrices_a = as_matrix_stack(matrices_a)
+    matrices_b = as_matrix_stack(matrices_b)
+    weight = np.asarray(weight, dtype=np.float64).reshape(-1, 1, 1)
+    return matrices_a + (matrices_b - matrices_a) * weight
+
+
+def blend(matrices_a, matrices_b, weight):
+    """Blend transform matrices component by component.
+
+    Translation, scale and shear are interpolated linearly and rotation
+    with :func:`slerp`, like a ``blendMatrix`` node.
+
+    Args:
+        matrices_a: ``(N, 4, 4)`` start matrices.
+        matrices_b: ``(N, 4, 4)`` end matrices.
+        weight: Blend weight, a scalar or one per matrix; 0 gives the start.
+
+    Returns:
+        np.ndarray: ``(N, 4, 4)`` matrices.
+    """
+    translate_a, rotate_a, scale_a, shear_a = decompose(matrices_a)
+    translate_b, rotate_b, scale_b, shear_b = decompose(matrices_b)
+    column_weight = np.asarray(weight, dtype=np.float64).reshape(-1, 1)
+    return compose(
+        translate_a + (translate_b - translate_a) * column_weight,
+        slerp(rotate_a, rotate_b, weight),
+        scale_a + (scale_b - scale_a) * column_weight,
+        shear_a + (shear_b - shear_a) * column_weight,
+    )
+
+
+def hierarchy_depths(parents):
+    """Compute the depth of every joint in a hierarchy.
+
+    Args:
+        parents: Parent index of every joint, -1 for roots.
+
+    Returns:
+        np.ndarray: int array, 0 for roots.
+
+    Raises:
+        ValueError: If the hierarchy has a cycle.
+    """
+    parents = np.asarray(parents, dtype=np.int64)
+    depths = np.zeros(len(parents), dtype=np.int64)
+    ancestors = parents.copy()
+    for _ in range(len(parents)):
+        has_ancestor = ancestors >= 0
+        if not has_ancestor.any():
+            return depths
+        depths += has_ancestor
+        ancestors[has_ancestor] = parents[ancestors[has_ancestor]]
+    raise ValueError("Joint hierarchy has a cycle")
+
+
+def local_to_world(local_matrices, parents, root_matrix=None):
+    """Convert local matrices to world matrices along a joint hierarchy.
+
+    Joints are processed one hierarchy level at a time, so the cost is one
+    batched product per level rather than one product per joint; joints
+    may be listed in any order.
+
+    Args:
+        local_matrices: ``(N, 4, 4)`` matrices relative to the parents.
+        parents: Parent index of every joint, -1 for roots.
+        root_matrix: ``(4, 4)`` world matrix the roots are relative to.
+
+    Returns:
+        np.ndarray: ``(N, 4, 4)`` world matrices.
+    """
+    local_matrices = as_matrix_stack(local_matrices)
+    parents = np.asarray(parents, dtype=np.int64)
+    depths = hierarchy_depths(parents)
+
+    world_matrices = np.empty_like(local_matrices)
+    roots = np.flatnonzero(depths == 0)
+    world_matrices[roots] = local_matrices[roots]
+    if root_matrix is not None:
+        world_matrices[roots] = world_matrices[roots] @ np.asarray(root_matrix, dtype=np.float64)
+
+    for depth in range(1, depths.max(initial=0) + 1):
+        level = np.flatnonzero(depths == depth)
+        world_matrices[level] = local_matrices[level] @ world_matrices[parents[level]]
+    return world_matrices
+
+
+def world_to_local(world_matrices, parents, root_matrix=None):
+    """Convert world matrices to local matrices along a joint hierarchy.
+
+    Args:
+        world_matrices: ``(N, 4, 4)`` world matrices.
+        parents: Parent index of every joint, -1 for roots.
+        root_matrix: ``(4, 4)`` world matrix the roots are relative to.
+
+    Returns:
+        np.ndarray: ``(N, 4, 4)`` matrices relative to the parents.
+    """
+    world_matrices = as_matrix_stack(world_matrices)
+    parents = np.asarray(parents, dtype=np.int64)
+
+    parent_inverses = np.empty_like(world_matrices)
+    children = parents >= 0
+    parent_inverses[children] = inverse(world_matrices[parents[children]])
+    if root_matrix is None:
+        parent_inverses[~children] = np.eye(4)
+    else:
+        parent_inverses[~children] = inverse(root_matrix)
+    return world_matrices @ parent_inverses
+
+
+def from_mmatrix(matrices):
+    """Convert OpenMaya matrices to a NumPy stack.
+
+    Args:
+        matrices: One ``MMatrix`` or a sequence of them (e.g. an
+            ``MMatrixArray``); any sequence of 16 row-major values works.
+
+    Returns:
+        np.ndarray: ``(N, 4, 4)`` float64 array.
+    """
+    if len(matrices) == 16 and not hasattr(matrices[0], "__len__"):
+        matrices = [matrices]
+    values = np.fromiter(chain.from_iterable(matrices), dtype=np.float64, count=16 * len(matrices))
+    return values.reshape(-1, 4, 4)
+
+
+def to_mmatrix(matrices):
+    """Convert a NumPy stack to OpenMaya 2.0 matrices.
+
+    Args:
+        matrices: ``(N, 4, 4)`` matrices.
+
+    Returns:
+        list: ``MMatrix`` objects, one per matrix.
+    """
+    import maya.api.OpenMaya as om2  # noqa: N813 - Maya API alias
+
+    return [om2.MMatrix(values) for values in as_matrix_stack(matrices).reshape(-1, 16).tolist()]
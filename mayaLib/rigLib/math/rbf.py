@@ -1 +1,410 @@
-"""Radial Basis Function utilities for Maya rigging."""
+"""Radial Basis Function utilities for Maya rigging.
+
+Pose-space interpolation for corrective shapes and pose-space deformation:
+:class:`RBFSolver` is fitted once on the driver poses and their output
+values, solving the (optionally regularized) kernel system for a weight
+matrix. Evaluating a pose is then one distance row, one kernel evaluation
+and one matrix-vector product; :meth:`RBFSolver.evaluate_batch` evaluates
+many poses with a single matrix product.
+
+Driver poses are rows of floats. Rotational drivers can be compared with
+the ``"quaternion"`` metric (angle between rotations, ``q`` and ``-q`` are the
+same rotation) or the ``"swing_twist"`` metric (separately weighted swing and
+twist angles around a twist axis). Quaternions use the ``(x, y, z, w)``
+order of ``MQuaternion``; a pose row may hold several quaternions, one per
+driver joint.
+
+The module only depends on NumPy, so solvers can be fitted and evaluated
+outside Maya.
+
+Example:
+    Drive three corrective shape weights from an elbow rotation::
+
+        from mayaLib.rigLib.math import rbf
+
+        solver = rbf.RBFSolver(
+            driver_quaternions,  # (poses, 4)
+            shape_weights,  # (poses, 3)
+            kernel="gaussian",
+            metric="swing_twist",
+        )
+        weights = solver.evaluate(current_quaternion)
+"""
+
+__author__ = "Lorenzo Argentieri"
+
+import numpy as np
+
+from mayaLib.rigLib.math.matrix import normalize_quaternions, quaternion_multiply
+
+__all__ = [
+    "KERNELS",
+    "METRICS",
+    "gaussian",
+    "thin_plate",
+    "multiquadric",
+    "inverse_multiquadric",
+    "swing_twist_decompose",
+    "euclidean_distance",
+    "quaternion_distance",
+    "swing_twist_distance",
+    "pairwise_distance",
+    "RBFSolver",
+]
+
+
+def gaussian(distance, epsilon):
+    """Gaussian kernel ``exp(-(epsilon * r)^2)``.
+
+    Args:
+        distance: Array of distances.
+        epsilon: Shape parameter, the inverse of the kernel radius.
+
+    Returns:
+        np.ndarray: Kernel values.
+    """
+    return np.exp(-np.square(epsilon * distance))
+
+
+def thin_plate(distance, epsilon):
+    """Thin-plate spline kernel ``r^2 log(r)``, 0 at ``r = 0``.
+
+    Args:
+        distance: Array of distances.
+        epsilon: Shape parameter; distances are scaled by it.
+
+    Returns:
+        np.ndarray: Kernel values.
+    """
+    scaled = np.asarray(epsilon * distance, dtype=np.float64)
+    safe = np.where(scaled > 0.0, scaled, 1.0)
+    return np.square(scaled) * np.log(safe)
+
+
+def multiquadric(distance, epsilon):
+    """Multiquadric kernel ``sqrt(1 + (epsilon * r)^2)``.
+
+    Args:
+        distance: Array of distances.
+        epsilon: Shape parameter.
+
+    Returns:
+        np.ndarray: Kernel values.
+    """
+    return np.sqrt(1.0 + np.square(epsilon * distance))
+
+
+def inverse_multiquadric(distance, epsilon):
+    """Inverse multiquadric kernel ``1 / sqrt(1 + (epsilon * r)^2)``.
+
+    Args:
+        distance: Array of distances.
+        epsilon: Shape parameter.
+
+    Returns:
+        np.ndarray: Kernel values.
+    """
+    return 1.0 / np.sqrt(1.0 + np.square(epsilon * distance))
+
+
+KERNELS = {
+    "gaussian": gaussian,
+    "thin_plate": thin_plate,
+    "multiquadric": multiquadric,
+    "inverse_multiquadric": inverse_multiquadric,
+}
+
+
+def _as_quaternions(poses):
+    """Reshape pose rows into unit quaternions.
+
+    Args:
+        poses: ``(n, 4 * k)`` or ``(4 * k,)`` array of ``(x, y, z, w)`` values.
+
+    Returns:
+        np.ndarray: ``(n, k, 4)`` array of normalized quaternions.
+
+    Raises:
+        ValueError: If the row size is not a multiple of 4.
+    """
+    poses = np.atleast_2d(np.asarray(poses, dtype=np.float64))
+    if poses.shape[1] % 4:
+        raise ValueError(f"quaternion poses need 4 values per driver, got {poses.shape[1]}")
+    return normalize_quaternions(poses.reshape(len(poses), -1, 4))
+
+
+def swing_twist_decompose(quaternions, twist_axis=(1.0, 0.0, 0.0)):
+    """Split rotations into swing and twist, ``q = swing * twist``.
+
+    The twist is the rotation around ``twist_axis``; the swing moves the
+    twist axis. Rotations that swing the axis by exactly 180 degrees have no
+    defined twist and get the identity twist.
+
+    Args:
+        quaternions: ``(..., 4)`` array of ``(x, y, z, w)`` values.
+        twist_axis: Twist axis in the local space of the rotation.
+
+    Returns:
+        tuple: ``(swing, twist)`` unit quaternion arrays of the input shape.
+    """
+    quaternions = normalize_quaternions(quaternions)
+    axis = np.asarray(twist_axis, dtype=np.float64)
+    axis = axis / np.linalg.norm(axis)
+
+    projection = quaternions[..., :3] @ axis
+    twist = np.concatenate(
+        (projection[..., None] * axis, quaternions[..., 3:]),
+        axis=-1,
+    )
+    twist = normalize_quaternions(twist)
+
+    # swing = q * conjugate(twist)
+    conjugate = twist * (-1.0, -1.0, -1.0, 1.0)
+    swing = quaternion_multiply(quaternions, conjugate)
+    return swing, twist
+
+
+def _rotation_angles(quaternions_a, quaternions_b):
+    """Compute the pairwise rotation angles between quaternion sets.
+
+    Args:
+        quaternions_a: ``(n, k, 4)`` unit quaternions.
+        quaternions_b: ``(m, k, 4)`` unit quaternions.
+
+    Returns:
+        np.ndarray: ``(k, n, m)`` angles in radians, in ``[0, pi]``.
+    """
+    dots = np.abs(np.einsum("nki,mki->knm", quaternions_a, quaternions_b))
+    return 2.0 * np.arccos(np.clip(dots, 0.0, 1.0))
+
+
+def euclidean_distance(poses_a, poses_b):
+    """Compute pairwise Euclidean distances between pose rows.
+
+    Args:
+        poses_a: ``(n, d)`` poses.
+        poses_b: ``(m, d)`` poses.
+
+    Returns:
+        np.ndarray: ``(n, m)`` distances.
+    """
+    poses_a = np.atleast_2d(np.asarray(poses_a, dtype=np.float64))
+    poses_b = np.atleast_2d(np.asarray(poses_b, dtype=np.float64))
+    squared = (
+        np.einsum("ij,ij->i", poses_a, poses_a)[:, None]
+        + np.einsum("ij,ij->i", poses_b, poses_b)[None, :]
+        - 2.0 * (poses_a @ poses_b.T)
+    )
+    return np.sqrt(np.maximum(squared, 0.0))
+
+
+def quaternion_distance(poses_a, poses_b):
+    """Compute pairwise rotation distances between quaternion poses.
+
+    Each driver contributes the angle between its rotations; angles of
+    several drivers are combined like the components of a Euclidean
+    distance.
+
+    Args:
+        poses_a: ``(n, 4 * k)`` quaternion poses.
+        poses_b: ``(m, 4 * k)`` quaternion poses.
+
+    Returns:
+        np.ndarray: ``(n, m)`` distances in radians.
+    """
+    angles = _rotation_angles(_as_quaternions(poses_a), _as_quaternions(poses_b))
+    return np.sqrt(np.sum(np.square(angles), axis=0))
+
+
+def swing_twist_distance(
+    poses_a, poses_b, twist_axis=(1.0, 0.0, 0.0), swing_weight=1.0, twist_weight=1.0
+):
+    """Compute pairwise swing-twist distances between quaternion poses.
+
+    The swing and twist angles of each driver are weighted separately, so
+    e.g. forearm twist can count less than elbow bend.
+
+    Args:
+        poses_a: ``(n, 4 * k)`` quaternion poses.
+        poses_b: ``(m, 4 * k)`` quaternion poses.
+        twist_axis: Twist axis in the local space of the drivers.
+        swing_weight: Weight of the swing angle.
+        twist_weight: Weight of the twist angle.
+
+    Returns:
+        np.ndarray: ``(n, m)`` distances in radians.
+    """
+    swing_a, twist_a = swing_twist_decompose(_as_quaternions(poses_a), twist_axis)
+    swing_b, twist_b = swing_twist_decompose(_as_quaternions(poses_b), twist_axis)
+    angles = swing_weight * _rotation_angles(swing_a, swing_b) + twist_weight * _rotation_angles(
+        twist_a, twist_b
+    )
+    return np.sqrt(np.sum(np.square(angles), axis=0))
+
+
+METRICS = {
+    "euclidean": euclidean_distance,
+    "quaternion": quaternion_distance,
+    "swing_twist": swing_twist_distance,
+}
+
+
+def pairwise_distance(poses_a, poses_b, metric="euclidean", **metric_options):
+    """Compute pairwise distances between pose rows with a named metric.
+
+    Args:
+        poses_a: ``(n, d)`` poses.
+        poses_b: ``(m, d)`` poses.
+        metric: Name in :data:`METRICS`.
+        **metric_options: Extra arguments of the metric, e.g. ``twist_axis``.
+
+    Returns:
+        np.ndarray: ``(n, m)`` distances.
+
+    Raises:
+        ValueError: If the metric is unknown.
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric '{metric}', expected one of {sorted(METRICS)}")
+    return METRICS[metric](poses_a, poses_b, **metric_options)
+
+
+class RBFSolver:
+    """Radial basis function interpolator with a precomputed weight matrix.
+
+    Fitting solves ``(Phi + regularization * I) W = values``, ``Phi`` being
+    the kernel of the pairwise distances between the driver poses. The
+    system is solved with ``numpy.linalg.solve`` and falls back to a least
+    squares solution when it is singular (duplicated poses, thin-plate
+    kernels without regularization).
+
+    Attributes:
+        poses: ``(poses, d)`` float64 driver poses.
+        values: ``(poses, outputs)`` float64 output values.
+        kernel: Kernel name.
+        metric: Distance metric name.
+        epsilon: Kernel shape parameter.
+        regularization: Value added to the kernel matrix diagonal.
+        weights: ``(poses, outputs)`` solved weight matrix.
+    """
+
+    def __init__(
+        self,
+        poses,
+        values,
+        kernel="gaussian",
+        epsilon=None,
+        metric="euclidean",
+        regularization=0.0,
+        **metric_options,
+    ):
+        """Initialize and fit the solver.
+
+        Args:
+            poses: ``(poses, d)`` driver poses, one row per pose.
+            values: ``(poses, outputs)`` output values, or one value per pose.
+            kernel: Name in :data:`KERNELS`.
+            epsilon: Kernel shape parameter. Defaults to the inverse of the
+                mean distance between the driver poses.
+            metric: Name in :data:`METRICS`.
+            regularization: Value added to the kernel matrix diagonal; higher
+                values smooth the interpolation instead of hitting every pose.
+            **metric_options: Extra arguments of the metric, e.g.
+                ``twist_axis`` or ``twist_weight`` for ``"swing_twist"``.
+
+        Raises:
+            ValueError: If the kernel or metric is unknown or the poses and
+                values do not match.
+        """
+        if kernel not in KERNELS:
+            raise ValueError(f"Unknown kernel '{kernel}', expected one of {sorted(KERNELS)}")
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric '{metric}', expected one of {sorted(METRICS)}")
+
+        self.poses = np.atleast_2d(np.asarray(poses, dtype=np.float64))
+        values = np.asarray(values, dtype=np.float64)
+        self.values = values.reshape(len(values), -1)
+        if len(self.poses) != len(self.values):
+            raise ValueError(f"Got {len(self.poses)} poses but {len(self.values)} rows of values")
+
+        self.kernel = kernel
+        self.metric = metric
+        self.metric_options = metric_options
+        self.regularization = float(regularization)
+        self.epsilon = epsilon
+        self.weights = None
+        self.fit()
+
+    def __repr__(self):
+        """Return a short description of the solver."""
+        return (
+            f"{type(self).__name__}(poses={self.num_poses}, outputs={self.num_outputs}, "
+            f"kernel='{self.kernel}', metric='{self.metric}')"
+        )
+
+    @property
+    def num_poses(self):
+        """int: Number of driver poses."""
+        return len(self.poses)
+
+    @property
+    def num_outputs(self):
+        """int: Number of output values per pose."""
+        return self.values.shape[1]
+
+    def distances(self, poses):
+        """Compute the distances from poses to the driver poses.
+
+        Args:
+            poses: ``(n, d)`` poses, or one ``(d,)`` pose.
+
+        Returns:
+            np.ndarray: ``(n, poses)`` distances.
+        """
+        return METRICS[self.metric](poses, self.poses, **self.metric_options)
+
+    def fit(self):
+        """Solve the weight matrix from the driver poses and values.
+
+        Called on initialization; call it again after editing ``values``,
+        ``epsilon`` or ``regularization``.
+
+        Returns:
+            np.ndarray: ``(poses, outputs)`` weight matrix.
+        """
+        distance_matrix = self.distances(self.poses)
+        if self.epsilon is None:
+            off_diagonal = distance_matrix[~np.eye(self.num_poses, dtype=bool)]
+            mean_distance = off_diagonal.mean() if off_diagonal.size else 0.0
+            self.epsilon = 1.0 / mean_distance if mean_distance > 0.0 else 1.0
+
+        kernel_matrix = KERNELS[self.kernel](distance_matrix, self.epsilon)
+        kernel_matrix[np.diag_indices_from(kernel_matrix)] += self.regularization
+
+        try:
+            self.weights = np.linalg.solve(kernel_matrix, self.values)
+        except np.linalg.LinAlgError:
+            self.weights = np.linalg.lstsq(kernel_matrix, self.values, rcond=None)[0]
+        return self.weights
+
+    def evaluate(self, pose):
+        """Interpolate the output values of one pose.
+
+        Args:
+            pose: ``(d,)`` pose.
+
+        Returns:
+            np.ndarray: ``(outputs,)`` values.
+        """
+        return self.evaluate_batch(pose)[0]
+
+    def evaluate_batch(self, poses):
+        """Interpolate the output values of many poses at once.
+
+        Args:
+            poses: ``(n, d)`` poses, e.g. one per frame.
+
+        Returns:
+            np.ndarray: ``(n, outputs)`` values.
+        """
+        return KERNELS[self.kernel](self.distances(poses), self.epsilon) @ self.weights
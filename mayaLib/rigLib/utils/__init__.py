@@ -25,14 +25,17 @@ __all__ = [
     "joint",
     "line_of_action",
     "matrix_utils",
+    "mesh_topology",
     "meta_human",
     "name",
     "parameter_resolution",
+    "point_grid",
     "pole_vector",
     "proxy_geo",
     "pxr_control",
     "scapula",
     "skin",
+    "skin_weights",
     "smart_foot_roll",
     "spaces",
     "stretchy_ik_chain",
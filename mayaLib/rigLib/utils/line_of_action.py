@@ -1,7 +1,16 @@
-"""Utilities to analyze meshes and generate line-of-action curves in Maya."""
+"""Utilities to analyze meshes and generate line-of-action curves in Maya.
+
+The geometry analysis (centroid, PCA main axis and extremal vertices) has a
+pure Python reference implementation and a NumPy one. The NumPy path
+(:func:`compute_lines_of_action`) analyzes many point sets at once: the
+points of all muscles are concatenated, per-muscle sums are taken with
+``reduceat`` and all 3x3 covariance matrices go through a single
+``numpy.linalg.eigh`` call.
+"""
 
 import math
 
+import numpy as np
 import pymel.core as pm
 from maya import OpenMaya, cmds
 
@@ -170,6 +179,23 @@ def compute_main_axis(points):
     return centroid, main_axis
 
 
+def get_points_array(geo_name):
+    """Get the vertices of a mesh as a NumPy array in one API call.
+
+    Args:
+        geo_name (str): The name of the mesh.
+
+    Returns:
+        np.ndarray: ``(vertices, 3)`` float64 object space positions.
+    """
+    import maya.api.OpenMaya as om2  # noqa: N813 - Maya API alias
+
+    selection = om2.MSelectionList()
+    selection.add(str(geo_name))
+    geo_fn = om2.MFnMesh(selection.getDagPath(0))
+    return np.array(geo_fn.getPoints(), dtype=np.float64).reshape(-1, 4)[:, :3]
+
+
 def get_points_py_list(geo_name):
     """Get the vertices of a mesh using maya.OpenMaya API.
 
@@ -179,30 +205,7 @@ def get_points_py_list(geo_name):
     Returns:
         list: A list of vertices, where each vertex is a list of coordinates.
     """
-    vertices = []
-
-    maya_sel = OpenMaya.MSelectionList()
-    maya_sel.add(geo_name)
-    geo_dag = OpenMaya.MDagPath()
-    maya_sel.getDagPath(0, geo_dag)
-    geo_fn = OpenMaya.MFnMesh(geo_dag)
-    geo_points = OpenMaya.MPointArray()
-    geo_fn.getPoints(geo_points)
-    geo_triangles_count = OpenMaya.MIntArray()
-    geo_triangles_vertices = OpenMaya.MIntArray()
-    geo_fn.getTriangles(geo_triangles_count, geo_triangles_vertices)
-
-    points_count = geo_points.length()
-    for point_index in range(points_count):
-        vertices.append(
-            [
-                geo_points[point_index].x,
-                geo_points[point_index].y,
-                geo_points[point_index].z,
-            ]
-        )
-
-    return vertices
+    return get_points_array(geo_name).tolist()
 
 
 def get_closest_point_and_uv(
@@ -484,6 +487,136 @@ def find_extremal_vertices(
     return extremal_vertices_data
 
 
+def _squared_distances(points, targets):
+    """Row-wise squared distances between two ``(n, 3)`` arrays."""
+    delta = points - targets
+    return np.einsum("ij,ij->i", delta, delta)
+
+
+def _segment_argmin(values, offsets, segment):
+    """Index of the first minimum of every segment of a flat array.
+
+    Args:
+        values: Flat values of all segments.
+        offsets: Start of each (non-empty) segment.
+        segment: Segment id of every value.
+
+    Returns:
+        np.ndarray: Index into ``values`` of the first minimum of each segment,
+        matching the first-wins tie breaking of a Python loop.
+    """
+    minima = np.minimum.reduceat(values, offsets)
+    candidates = np.flatnonzero(values == minima[segment])
+    return candidates[np.searchsorted(candidates, offsets)]
+
+
+def compute_lines_of_action(point_sets, eps=1e-8):
+    """Compute centroid, main axis and extremal vertices of many point sets.
+
+    Vectorized equivalent of :func:`compute_main_axis` followed by
+    :func:`find_extremal_vertices`, run on all point sets at once. The main
+    axis is the eigenvector of the largest eigenvalue of the sample
+    covariance matrix, oriented like the power iteration result (positive
+    component sum).
+
+    Args:
+        point_sets (list): ``(n, 3)`` point arrays (or lists), one per mesh.
+        eps (float, optional): Tolerance of the bounding box intersection
+            tests. Defaults to 1e-8.
+
+    Returns:
+        list: One dict per point set with ``centroid``, ``main_axis``,
+        ``start_point``, ``end_point``, ``start_index`` and ``end_index``, or
+        None for sets with fewer than two points or without two bounding box
+        intersections. Points are lists of floats.
+    """
+    results = [None] * len(point_sets)
+    arrays = [np.asarray(points, dtype=np.float64).reshape(-1, 3) for points in point_sets]
+    valid = [ii for ii, points in enumerate(arrays) if len(points) >= 2]
+    if not valid:
+        return results
+
+    sizes = np.array([len(arrays[ii]) for ii in valid])
+    offsets = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    points = np.concatenate([arrays[ii] for ii in valid])
+    segment = np.repeat(np.arange(len(valid)), sizes)
+
+    # Centroids and sample covariance matrices of every set
+    centroids = np.add.reduceat(points, offsets) / sizes[:, None]
+    centered = points - centroids[segment]
+    covariances = np.add.reduceat(centered[:, :, None] * centered[:, None, :], offsets)
+    covariances /= (sizes - 1)[:, None, None]
+
+    # Main axes, oriented like a power iteration started from (1, 1, 1)
+    axes = np.linalg.eigh(covariances)[1][:, :, -1]
+    axes[axes.sum(axis=1) < 0] *= -1.0
+
+    # Line/bounding box intersections: t of the 2 boundaries of the 3 axes
+    box_min = np.minimum.reduceat(points, offsets)
+    box_max = np.maximum.reduceat(points, offsets)
+    bounds = np.stack([box_min, box_max], axis=1)
+    usable = np.abs(axes) >= eps
+    safe_axes = np.where(usable, axes, 1.0)
+    t = (bounds - centroids[:, None, :]) / safe_axes[:, None, :]
+    hits = centroids[:, None, None, :] + t[..., None] * axes[:, None, None, :]
+    inside = (hits >= box_min[:, None, None, :] - eps) & (hits <= box_max[:, None, None, :] + eps)
+    # Only the two other axes of each boundary are tested, as in the reference
+    inside |= np.eye(3, dtype=bool)[None, None, :, :]
+    hit = usable[:, None, :] & inside.all(axis=3)
+
+    found = hit.reshape(len(valid), -1).sum(axis=1) >= 2
+    t_start = np.where(hit, t, np.inf).reshape(len(valid), -1).min(axis=1)
+    t_end = np.where(hit, t, -np.inf).reshape(len(valid), -1).max(axis=1)
+    t_start = np.where(found, t_start, 0.0)
+    t_end = np.where(found, t_end, 0.0)
+    starts = centroids + t_start[:, None] * axes
+    ends = centroids + t_end[:, None] * axes
+
+    # Closest vertex of each set to its end points
+    start_ids = _segment_argmin(_squared_distances(points, starts[segment]), offsets, segment)
+    end_ids = _segment_argmin(_squared_distances(points, ends[segment]), offsets, segment)
+
+    for row, ii in enumerate(valid):
+        if not found[row]:
+            continue
+        results[ii] = {
+            "centroid": centroids[row].tolist(),
+            "main_axis": axes[row].tolist(),
+            "start_point": points[start_ids[row]].tolist(),
+            "end_point": points[end_ids[row]].tolist(),
+            "start_index": int(start_ids[row] - offsets[row]),
+            "end_index": int(end_ids[row] - offsets[row]),
+        }
+    return results
+
+
+def compute_line_of_action(points):
+    """Compute centroid, main axis and extremal vertices of one point set.
+
+    Args:
+        points: ``(n, 3)`` point array or list of points.
+
+    Returns:
+        dict | None: See :func:`compute_lines_of_action`.
+    """
+    return compute_lines_of_action([points])[0]
+
+
+def analyze_lines_of_action(geos):
+    """Analyze the line of action of many meshes in one batch.
+
+    Args:
+        geos (list): Mesh names or nodes.
+
+    Returns:
+        dict: ``{geo_name: analysis}`` with the dicts returned by
+        :func:`compute_lines_of_action` (None if a mesh cannot be analyzed).
+    """
+    names = [str(geo) for geo in geos]
+    analyses = compute_lines_of_action([get_points_array(geo_name) for geo_name in names])
+    return dict(zip(names, analyses, strict=True))
+
+
 def get_name_from_geo(geo_name, object_name):
     """Generate a name for the object based on geometry name and object type.
 
@@ -565,6 +698,7 @@ def create_line_of_action(
     skeleton_geo,
     name_suffix="_loa_crv",
     space_scale=1.0,
+    analysis=None,
 ):  # pylint: disable=too-many-locals
     """Create a line of action curve between extremal points on geometry.
 
@@ -579,24 +713,23 @@ def create_line_of_action(
             will be attached.
         name_suffix (str, optional): Suffix to append to the curve name. Defaults to "_loa_crv".
         space_scale (float, optional): Scale factor for the space. Defaults to 1.0.
+        analysis (dict, optional): Precomputed result of
+            :func:`compute_lines_of_action` for ``geo``. Computed if None.
 
     Returns:
-        str: The name of the created curve.
+        str: The name of the created curve, or None if the geometry cannot
+            be analyzed.
     """
-    # Retrieve vertices positions from the geometry.
-    vertices = get_points_py_list(geo)
-
-    # Compute the main axis of the geometry.
-    main_axis_info = compute_main_axis(vertices)
-    fibers_centroid = main_axis_info[0]
-    fibers_dir = main_axis_info[1]
-
-    # Find the extremal vertices along the main axis.
-    extremal_vertices_data = find_extremal_vertices(vertices, fibers_centroid, fibers_dir)
+    if analysis is None:
+        # Compute the main axis and the extremal vertices of the geometry.
+        analysis = compute_line_of_action(get_points_array(geo))
+    if analysis is None:
+        pm.warning(f"{geo}: cannot compute a line of action.")
+        return None
 
     # Extract start and end points.
-    start_point = extremal_vertices_data["start_point"]
-    end_point = extremal_vertices_data["end_point"]
+    start_point = analysis["start_point"]
+    end_point = analysis["end_point"]
 
     # Generate names for rivets based on the geometry's short name.
     geo_short_name = str(geo).rsplit("|", maxsplit=1)[-1]
@@ -665,12 +798,16 @@ def create_all_lines_of_action(
     else:
         skeleton_proxy = skeleton_proxy or ""
 
+    # Analyze every muscle in one batch before building anything
+    analyses = analyze_lines_of_action(geos)
+
     cv_list = []
     for geo in geos:
-        geo_name = str(geo)
-        cv_name = f"{geo_name.replace('_geo', '')}{name_suffix}"
-        create_line_of_action(geo, skeleton_proxy, name_suffix=name_suffix)
-        cv_list.append(cv_name)
+        curve = create_line_of_action(
+            geo, skeleton_proxy, name_suffix=name_suffix, analysis=analyses[str(geo)]
+        )
+        if curve:
+            cv_list.append(curve)
 
     if not pm.objExists(loa_grp):
         pm.group(n=loa_grp, em=True, p="guide")
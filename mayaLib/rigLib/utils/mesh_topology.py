@@ -0,0 +1,411 @@
+"""Mesh connectivity tables and traversal queries in plain NumPy.
+
+:class:`MeshTopology` builds the vertex to vertex, vertex to face and edge
+to face adjacency of a polygon mesh as CSR arrays (``indptr``/``indices``)
+from the polygon counts and vertex ids returned by ``MFnMesh.getVertices``,
+plus the list of boundary edges. Neighborhood queries are ragged gathers
+over these arrays, so k-rings and breadth-first distances never touch the
+Maya selection and can run in batch.
+
+Edges are numbered by this module (unique sorted vertex pairs), not with
+Maya's edge ids; queries take and return vertex ids.
+
+Example:
+    Order the vertices of a selected eyelid loop and split it at its
+    corners::
+
+        from mayaLib.rigLib.utils.mesh_topology import MeshTopology
+
+        topology = MeshTopology.from_mesh_fn(mesh_fn)
+        upper, lower = topology.loop_paths(loop_vertices, inner_corner, outer_corner)
+"""
+
+__author__ = "Lorenzo Argentieri"
+
+import hashlib
+
+import numpy as np
+
+__all__ = [
+    "MeshTopology",
+    "edge_loop_paths",
+    "topology_hash",
+    "csr_from_pairs",
+    "gather_rows",
+]
+
+
+def topology_hash(counts, connects):
+    """Hash the connectivity of a polygon mesh.
+
+    Args:
+        counts: Vertex count per polygon.
+        connects: Polygon vertex ids, face after face.
+
+    Returns:
+        str: Digest that only changes when the mesh connectivity changes.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(counts, dtype=np.int32).tobytes())
+    digest.update(np.ascontiguousarray(connects, dtype=np.int32).tobytes())
+    return digest.hexdigest()
+
+
+def csr_from_pairs(rows, columns, num_rows):
+    """Build a CSR table from (row, column) pairs.
+
+    Args:
+        rows: Row id of every pair.
+        columns: Column id of every pair.
+        num_rows: Number of rows.
+
+    Returns:
+        tuple: ``(indptr, indices)`` with the columns of row ``r`` in
+        ``indices[indptr[r]:indptr[r + 1]]``, sorted within each row.
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    columns = np.asarray(columns, dtype=np.int64)
+    order = np.lexsort((columns, rows))
+    indptr = np.zeros(num_rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=num_rows), out=indptr[1:])
+    return indptr, columns[order]
+
+
+def gather_rows(indptr, indices, rows):
+    """Concatenate the entries of some CSR rows in one gather.
+
+    Args:
+        indptr: CSR row offsets.
+        indices: CSR entries.
+        rows: Row ids to gather.
+
+    Returns:
+        np.ndarray: Entries of every row, row after row.
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    starts = indptr[rows]
+    counts = indptr[rows + 1] - starts
+    offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return indices[offsets + np.arange(len(offsets))]
+
+
+def _walk_paths(pairs):
+    """Split a graph whose vertices have at most two neighbors into paths.
+
+    Open paths are walked from their ends first, so the vertices left over
+    afterwards all lie on closed loops.
+
+    Args:
+        pairs: ``(E, 2)`` vertex pairs.
+
+    Returns:
+        list: ``(vertices, closed)`` tuples, open paths starting at their
+        lowest end and loops at their lowest vertex.
+    """
+    neighbor_dict = {}
+    for vertex_a, vertex_b in np.asarray(pairs, dtype=np.int64).reshape(-1, 2).tolist():
+        neighbor_dict.setdefault(vertex_a, []).append(vertex_b)
+        neighbor_dict.setdefault(vertex_b, []).append(vertex_a)
+
+    ends = sorted(vertex for vertex, neighbors in neighbor_dict.items() if len(neighbors) == 1)
+    visited = set()
+    path_list = []
+    for start in ends + sorted(neighbor_dict):
+        if start in visited:
+            continue
+        path = [start]
+        visited.add(start)
+        current = start
+        while current is not None:
+            current = next((n for n in neighbor_dict[current] if n not in visited), None)
+            if current is not None:
+                path.append(current)
+                visited.add(current)
+        closed = len(path) > 2 and start in neighbor_dict[path[-1]]
+        path_list.append((np.array(path, dtype=np.int64), closed))
+    return path_list
+
+
+def _paths_between(path_list, start, end):
+    """Get the paths between two vertices from walked paths and loops.
+
+    Args:
+        path_list: ``(vertices, closed)`` tuples from :func:`_walk_paths`.
+        start: First vertex of the paths.
+        end: Last vertex of the paths.
+
+    Returns:
+        list: Ordered vertex arrays from ``start`` to ``end``.
+
+    Raises:
+        ValueError: If ``start`` and ``end`` are not on one path.
+    """
+    for path, closed in path_list:
+        start_positions = np.flatnonzero(path == start)
+        end_positions = np.flatnonzero(path == end)
+        if not len(start_positions) or not len(end_positions):
+            continue
+
+        if closed:
+            path = np.roll(path, -start_positions[0])
+            end_index = int(np.flatnonzero(path == end)[0])
+            return [path[: end_index + 1], np.append(path[:1], path[end_index:][::-1])]
+
+        start_index, end_index = start_positions[0], end_positions[0]
+        if start_index <= end_index:
+            return [path[start_index : end_index + 1]]
+        return [path[end_index : start_index + 1][::-1]]
+
+    raise ValueError(f"Vertices {start} and {end} are not on one path of the loop")
+
+
+def edge_loop_paths(pairs, start, end):
+    """Get the paths between two vertices of a loop given by its edges.
+
+    Unlike :meth:`MeshTopology.loop_paths` only the given edges are
+    followed, so chords between loop vertices (e.g. in a triangulated cap)
+    are ignored.
+
+    Args:
+        pairs: ``(E, 2)`` vertex pairs of the loop or path edges.
+        start: First vertex of the paths.
+        end: Last vertex of the paths.
+
+    Returns:
+        list: Ordered vertex arrays from ``start`` to ``end``: the two
+        sides of a closed loop, or the one path of an open path.
+
+    Raises:
+        ValueError: If ``start`` and ``end`` are not connected through
+            the edges.
+    """
+    return _paths_between(_walk_paths(pairs), start, end)
+
+
+class MeshTopology:
+    """Adjacency tables of a polygon mesh.
+
+    Attributes:
+        num_vertices: Number of vertices.
+        face_indptr: ``num_faces + 1`` offsets into ``face_vertices``.
+        face_vertices: Polygon vertex ids, face after face.
+        edges: ``(E, 2)`` unique edges, vertex ids sorted within and across rows.
+        face_edges: Edge id of every face-vertex, from it to the next vertex.
+        vertex_indptr, vertex_neighbors: Vertex to vertex CSR table.
+        vertex_face_indptr, vertex_faces: Vertex to face CSR table.
+        edge_face_indptr, edge_faces: Edge to face CSR table.
+        boundary_edges: Ids of the edges used by a single face.
+        key: Topology hash of the mesh.
+    """
+
+    def __init__(self, counts, connects, num_vertices=None):
+        """Build the adjacency tables.
+
+        Args:
+            counts: Vertex count per polygon.
+            connects: Polygon vertex ids, face after face.
+            num_vertices: Number of vertices, including unused ones.
+                Defaults to the highest vertex id plus one.
+        """
+        counts = np.asarray(counts, dtype=np.int64)
+        connects = np.asarray(connects, dtype=np.int64)
+        if num_vertices is None:
+            num_vertices = int(connects.max()) + 1 if len(connects) else 0
+
+        self.key = topology_hash(counts, connects)
+        self.num_vertices = int(num_vertices)
+        self.face_indptr = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.face_indptr[1:])
+        self.face_vertices = connects
+
+        # Next vertex of every face-vertex, wrapping around each polygon
+        face_ids = np.repeat(np.arange(len(counts)), counts)
+        face_start = self.face_indptr[face_ids]
+        wrap = (np.arange(len(connects)) - face_start + 1) % counts[face_ids]
+        pairs = np.sort(np.stack((connects, connects[face_start + wrap]), axis=1), axis=1)
+        self.edges, self.face_edges = np.unique(pairs, axis=0, return_inverse=True)
+        self.face_edges = self.face_edges.reshape(-1)
+
+        self.vertex_indptr, self.vertex_neighbors = csr_from_pairs(
+            self.edges.T.ravel(), self.edges[:, ::-1].T.ravel(), self.num_vertices
+        )
+        self.vertex_face_indptr, self.vertex_faces = csr_from_pairs(
+            connects, face_ids, self.num_vertices
+        )
+        self.edge_face_indptr, self.edge_faces = csr_from_pairs(
+            self.face_edges, face_ids, len(self.edges)
+        )
+        self.boundary_edges = np.flatnonzero(np.diff(self.edge_face_indptr) == 1)
+
+    @classmethod
+    def from_mesh_fn(cls, mesh_fn):
+        """Build the tables of a mesh from one ``getVertices`` call.
+
+        Args:
+            mesh_fn: ``MFnMesh`` attached to the mesh.
+
+        Returns:
+            MeshTopology: Adjacency tables of the mesh.
+        """
+        counts, connects = mesh_fn.getVertices()
+        return cls(
+            np.array(counts, dtype=np.int64),
+            np.array(connects, dtype=np.int64),
+            mesh_fn.numVertices,
+        )
+
+    def __repr__(self):
+        """Return a short description of the topology."""
+        return (
+            f"{type(self).__name__}(vertices={self.num_vertices}, faces={self.num_faces}, "
+            f"edges={self.num_edges}, boundary_edges={len(self.boundary_edges)})"
+        )
+
+    @property
+    def num_faces(self):
+        """int: Number of faces."""
+        return len(self.face_indptr) - 1
+
+    @property
+    def num_edges(self):
+        """int: Number of edges."""
+        return len(self.edges)
+
+    def neighbors(self, vertex):
+        """Get the vertices sharing an edge with a vertex.
+
+        Args:
+            vertex: Vertex id.
+
+        Returns:
+            np.ndarray: Sorted neighbor vertex ids.
+        """
+        return self.vertex_neighbors[self.vertex_indptr[vertex] : self.vertex_indptr[vertex + 1]]
+
+    def faces_of_vertex(self, vertex):
+        """Get the faces using a vertex.
+
+        Args:
+            vertex: Vertex id.
+
+        Returns:
+            np.ndarray: Sorted face ids.
+        """
+        return self.vertex_faces[
+            self.vertex_face_indptr[vertex] : self.vertex_face_indptr[vertex + 1]
+        ]
+
+    def edge_ids(self, vertices_a, vertices_b):
+        """Find the edges between vertex pairs.
+
+        Args:
+            vertices_a: First vertex of every pair.
+            vertices_b: Second vertex of every pair.
+
+        Returns:
+            np.ndarray: Edge id of every pair, -1 where the vertices share no edge.
+        """
+        pairs = np.sort(
+            np.stack((np.atleast_1d(vertices_a), np.atleast_1d(vertices_b)), axis=1), axis=1
+        )
+        edge_keys = self.edges[:, 0] * self.num_vertices + self.edges[:, 1]
+        keys = pairs[:, 0] * self.num_vertices + pairs[:, 1]
+        positions = np.minimum(np.searchsorted(edge_keys, keys), max(len(edge_keys) - 1, 0))
+        found = len(edge_keys) > 0 and edge_keys[positions] == keys
+        return np.where(found, positions, -1)
+
+    def faces_of_edge(self, edge):
+        """Get the faces using an edge.
+
+        Args:
+            edge: Edge id.
+
+        Returns:
+            np.ndarray: Sorted face ids; one face for boundary edges.
+        """
+        return self.edge_faces[self.edge_face_indptr[edge] : self.edge_face_indptr[edge + 1]]
+
+    def geodesic_distances(self, sources, max_steps=None):
+        """Count the edges on the shortest path from sources to every vertex.
+
+        Breadth-first search, one CSR gather per ring.
+
+        Args:
+            sources: Source vertex ids.
+            max_steps: Stop after this many rings.
+
+        Returns:
+            np.ndarray: int64 edge count per vertex, -1 where not reached.
+        """
+        distances = np.full(self.num_vertices, -1, dtype=np.int64)
+        frontier = np.unique(np.asarray(sources, dtype=np.int64))
+        distances[frontier] = 0
+
+        step = 0
+        while len(frontier) and (max_steps is None or step < max_steps):
+            step += 1
+            ring = np.unique(gather_rows(self.vertex_indptr, self.vertex_neighbors, frontier))
+            frontier = ring[distances[ring] < 0]
+            distances[frontier] = step
+        return distances
+
+    def k_ring(self, vertices, k=1, include_sources=True):
+        """Get the vertices within ``k`` edges of some vertices.
+
+        Args:
+            vertices: Source vertex ids.
+            k: Number of rings.
+            include_sources: Include the source vertices themselves.
+
+        Returns:
+            np.ndarray: Sorted vertex ids.
+        """
+        distances = self.geodesic_distances(vertices, max_steps=k)
+        lowest = 0 if include_sources else 1
+        return np.flatnonzero(distances >= lowest)
+
+    def order_vertices(self, vertices):
+        """Order vertices connected by edges into paths and loops.
+
+        Only the edges between two of the vertices are followed, so the
+        vertices should form simple edge loops or open edge paths; mesh
+        edges between loop vertices that are not on the loop (chords) are
+        followed too. Use :func:`edge_loop_paths` when the loop edges are
+        known.
+
+        Args:
+            vertices: Vertex ids, e.g. the vertices of a selected edge loop.
+
+        Returns:
+            list: ``(ordered_vertices, closed)`` tuples, one per connected
+            path; open paths start at one of their ends.
+        """
+        members = np.zeros(self.num_vertices, dtype=bool)
+        members[np.asarray(vertices, dtype=np.int64)] = True
+        return _walk_paths(self.edges[members[self.edges].all(axis=1)])
+
+    def boundary_loops(self):
+        """Get the ordered vertices of every border of the mesh.
+
+        Returns:
+            list: int64 vertex arrays, one per border.
+        """
+        return [path for path, _ in _walk_paths(self.edges[self.boundary_edges])]
+
+    def loop_paths(self, vertices, start, end):
+        """Get the paths between two vertices of an edge loop.
+
+        Args:
+            vertices: Vertex ids of the loop or path.
+            start: First vertex of the paths.
+            end: Last vertex of the paths.
+
+        Returns:
+            list: Ordered vertex arrays from ``start`` to ``end``: the two
+            sides of a closed loop, or the one path of an open path.
+
+        Raises:
+            ValueError: If ``start`` and ``end`` are not connected through
+                the vertices.
+        """
+        return _paths_between(self.order_vertices(vertices), start, end)
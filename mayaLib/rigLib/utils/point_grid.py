@@ -0,0 +1,208 @@
+"""Uniform grid for vectorized nearest point queries.
+
+Maya ships without SciPy, so :class:`PointGrid` provides the k-nearest
+neighbor query needed by the skin transfer tools in plain NumPy. Source
+points are bucketed into cubic cells sorted by cell key; a query gathers the
+points of the 27 cells around each query point in one ragged gather and
+ranks them with a single ``lexsort``. A query whose k-th candidate could be
+beaten by a point outside the searched cells (points far from the source,
+sparse regions) is answered by a brute force pass, so results are exact.
+
+Example:
+    >>> import numpy as np
+    >>> from mayaLib.rigLib.utils.point_grid import PointGrid
+    >>> grid = PointGrid(np.random.rand(20000, 3))
+    >>> distances, indices = grid.query(np.random.rand(20000, 3), k=4)
+"""
+
+__author__ = "Lorenzo Argentieri"
+
+import numpy as np
+
+__all__ = [
+    "PointGrid",
+    "brute_force_query",
+]
+
+# Average number of source points per occupied cell
+POINTS_PER_CELL = 8
+# Query points processed at once; bounds the size of the candidate arrays
+QUERY_CHUNK_SIZE = 4096
+
+_NEIGHBOR_OFFSETS = np.array(
+    [(x, y, z) for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1)], dtype=np.int64
+)
+
+
+def brute_force_query(source, points, k=1, chunk_size=512):
+    """Exact k-nearest neighbors by comparing against every source point.
+
+    Args:
+        source: ``(n, 3)`` source points.
+        points: ``(m, 3)`` query points.
+        k: Number of neighbors per query point.
+        chunk_size: Query points compared at once.
+
+    Returns:
+        tuple: (distances, indices), both ``(m, k)`` and sorted by distance.
+    """
+    source = np.asarray(source, dtype=np.float64)
+    points = np.asarray(points, dtype=np.float64)
+    k = min(k, len(source))
+    distances = np.empty((len(points), k))
+    indices = np.empty((len(points), k), dtype=np.int64)
+
+    source_sq = np.einsum("ij,ij->i", source, source)
+    for start in range(0, len(points), chunk_size):
+        chunk = points[start : start + chunk_size]
+        dist_sq = np.einsum("ij,ij->i", chunk, chunk)[:, None] - 2.0 * chunk @ source.T + source_sq
+        np.maximum(dist_sq, 0.0, out=dist_sq)
+        if k < len(source):
+            nearest = np.argpartition(dist_sq, k - 1, axis=1)[:, :k]
+        else:
+            nearest = np.broadcast_to(np.arange(k), (len(chunk), k))
+        nearest_sq = np.take_along_axis(dist_sq, nearest, axis=1)
+        order = np.argsort(nearest_sq, axis=1)
+        indices[start : start + len(chunk)] = np.take_along_axis(nearest, order, axis=1)
+        distances[start : start + len(chunk)] = np.sqrt(
+            np.take_along_axis(nearest_sq, order, axis=1)
+        )
+    return distances, indices
+
+
+class PointGrid:
+    """Uniform cell grid over a fixed set of source points.
+
+    Attributes:
+        points: ``(n, 3)`` float64 source points.
+        cell_size: Edge length of the cubic cells.
+        origin: Minimum corner of the grid.
+        dims: Cell count along each axis.
+    """
+
+    def __init__(self, points, cell_size=None):
+        """Bucket the source points.
+
+        Args:
+            points: ``(n, 3)`` source points.
+            cell_size: Cell edge length. Defaults to a size that puts about
+                :data:`POINTS_PER_CELL` points in each occupied cell.
+
+        Raises:
+            ValueError: If there are no source points.
+        """
+        self.points = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 3)
+        if not len(self.points):
+            raise ValueError("PointGrid needs at least one source point")
+
+        self.origin = self.points.min(axis=0)
+        extent = self.points.max(axis=0) - self.origin
+        self.cell_size = float(cell_size or self._default_cell_size(extent))
+        self.dims = np.floor(extent / self.cell_size).astype(np.int64) + 1
+
+        keys = self._cell_keys(self._cells(self.points))
+        self._order = np.argsort(keys, kind="stable")
+        self._sorted_keys = keys[self._order]
+
+    def __len__(self):
+        """Return the number of source points."""
+        return len(self.points)
+
+    def _default_cell_size(self, extent):
+        """Pick a cell size from the extent and point count.
+
+        Face regions are surfaces, so points are spread over the area of
+        the bounding box rather than its volume; sizing the cells from the
+        two largest extents keeps cells from going empty on thin shells.
+        """
+        largest = np.sort(extent)[1:]
+        area = largest[0] * largest[1]
+        if area > 0:
+            size = np.sqrt(area * POINTS_PER_CELL / len(self.points))
+        else:
+            size = largest[1] * POINTS_PER_CELL / len(self.points)
+        return size if size > 0 else 1.0
+
+    def _cells(self, points):
+        """Integer cell coordinates of points, clipped to the grid."""
+        cells = np.floor((points - self.origin) / self.cell_size).astype(np.int64)
+        return np.clip(cells, 0, self.dims - 1)
+
+    def _cell_keys(self, cells):
+        """Linear keys of cell coordinates; -1 for cells outside the grid."""
+        keys = (cells[:, 0] * self.dims[1] + cells[:, 1]) * self.dims[2] + cells[:, 2]
+        outside = np.any((cells < 0) | (cells >= self.dims), axis=1)
+        keys[outside] = -1
+        return keys
+
+    def query(self, points, k=1):
+        """Find the k nearest source points of every query point.
+
+        Args:
+            points: ``(m, 3)`` query points.
+            k: Number of neighbors per query point; capped at the number of
+                source points.
+
+        Returns:
+            tuple: (distances, indices), both ``(m, k)`` and sorted by
+            distance. Indices refer to the source points.
+        """
+        points = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 3)
+        k = min(int(k), len(self.points))
+        distances = np.empty((len(points), k))
+        indices = np.empty((len(points), k), dtype=np.int64)
+
+        for start in range(0, len(points), QUERY_CHUNK_SIZE):
+            chunk = points[start : start + QUERY_CHUNK_SIZE]
+            distances[start : start + len(chunk)], indices[start : start + len(chunk)] = (
+                self._query_chunk(chunk, k)
+            )
+        return distances, indices
+
+    def _query_chunk(self, points, k):
+        """Query a chunk of points against the 27 cells around each point."""
+        num_points = len(points)
+        cells = self._cells(points)
+
+        # Candidate ranges of the 27 neighboring cells, query major
+        neighbor_keys = self._cell_keys(
+            (cells[:, None, :] + _NEIGHBOR_OFFSETS[None, :, :]).reshape(-1, 3)
+        )
+        starts = np.searchsorted(self._sorted_keys, neighbor_keys, side="left")
+        ends = np.searchsorted(self._sorted_keys, neighbor_keys, side="right")
+        counts = np.where(neighbor_keys >= 0, ends - starts, 0)
+
+        # Ragged gather of every candidate
+        total = int(counts.sum())
+        run_starts = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        candidates = self._order[np.arange(total) + run_starts]
+        query_ids = np.repeat(np.arange(num_points).repeat(len(_NEIGHBOR_OFFSETS)), counts)
+
+        delta = self.points[candidates] - points[query_ids]
+        dist_sq = np.einsum("ij,ij->i", delta, delta)
+
+        # Rank candidates per query and keep the first k
+        order = np.lexsort((dist_sq, query_ids))
+        ranked_queries = query_ids[order]
+        rank = np.arange(total) - np.searchsorted(ranked_queries, ranked_queries)
+        kept = rank < k
+        kept_queries = ranked_queries[kept]
+        kept_rank = rank[kept]
+
+        distances = np.full((num_points, k), np.inf)
+        indices = np.full((num_points, k), -1, dtype=np.int64)
+        distances[kept_queries, kept_rank] = np.sqrt(dist_sq[order[kept]])
+        indices[kept_queries, kept_rank] = candidates[order[kept]]
+
+        # A source point outside the searched cells is at least this far
+        # away; there are no source points beyond the border cells
+        local = (points - self.origin) / self.cell_size - (cells - 1)
+        low = np.where(cells == 0, np.inf, local)
+        high = np.where(cells == self.dims - 1, np.inf, 3.0 - local)
+        margin = np.minimum(low, high).min(axis=1) * self.cell_size
+        exact = distances[:, -1] <= margin
+
+        if not exact.all():
+            missed = np.flatnonzero(~exact)
+            distances[missed], indices[missed] = brute_force_query(self.points, points[missed], k)
+        return distances, indices
@@ -1,43 +1,118 @@
 """Proxy geometry generation from skinned meshes for fast viewport display.
 
 Provides the ProxyGeo class which creates per-joint proxy geometry from
-a skinned mesh by duplicating and removing faces based on skin weights,
-useful for creating fast/medium/slow display hierarchy levels.
+a skinned mesh, useful for creating fast/medium/slow display hierarchy levels.
+
+The skin weights, points, face topology and UVs of the source mesh are read
+once; faces are assigned to influences with NumPy and every proxy mesh is
+built directly from its face subset with ``MFnMesh.create``, so the cost no
+longer grows with one duplicate, rebind and per-vertex weight query per joint.
 """
 
 __author__ = "Lorenzo Argentieri"
 
+import numpy as np
 import pymel.core as pm
 
-from mayaLib.rigLib.utils import common, name, skin
+from mayaLib.rigLib.utils import name, skin
+
+
+def face_offsets(counts):
+    """Start of each face in the flat face-vertex list.
+
+    Args:
+        counts: Vertex count of every face.
+
+    Returns:
+        np.ndarray: ``(faces,)`` int64 offsets into the face-vertex list.
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    return np.concatenate(([0], np.cumsum(counts)[:-1]))
+
 
+def face_influence_mask(counts, connects, weights, threshold=0.45):
+    """Assign faces to every influence weighted above a threshold.
 
-def invert_selection(shape, faces):
-    """Invert face selection on a mesh shape.
+    A face belongs to an influence if any of its vertices has a weight
+    greater than ``threshold`` for it, like converting the weighted
+    vertices of a joint to faces.
+
+    Args:
+        counts: Vertex count of every face.
+        connects: Flat face-vertex indices.
+        weights: ``(vertices, influences)`` skin weights.
+        threshold: Minimum weight (exclusive) of a vertex.
+
+    Returns:
+        np.ndarray: ``(faces, influences)`` boolean mask.
+    """
+    face_vertex_weights = np.asarray(weights)[np.asarray(connects)]
+    return np.maximum.reduceat(face_vertex_weights, face_offsets(counts), axis=0) > threshold
 
-    Selects all faces on the shape except those specified, useful for
-    deleting faces outside a region of influence.
+
+def face_dominant_influence(counts, connects, weights):
+    """Assign every face to the influence with the highest average weight.
 
     Args:
-        shape: Mesh shape node to operate on
-        faces: Face component list to exclude from selection
+        counts: Vertex count of every face.
+        connects: Flat face-vertex indices.
+        weights: ``(vertices, influences)`` skin weights.
 
     Returns:
-        list: Selected face components (inverse of input faces)
+        np.ndarray: ``(faces, influences)`` boolean mask with exactly one
+        influence per face.
     """
-    pm.select(shape + ".f[*]")
-    pm.select(faces, deselect=True)
-    # mel.eval('InvertSelection;')
-    return pm.ls(sl=True)
+    face_vertex_weights = np.asarray(weights)[np.asarray(connects)]
+    totals = np.add.reduceat(face_vertex_weights, face_offsets(counts), axis=0)
+    mask = np.zeros(totals.shape, dtype=bool)
+    mask[np.arange(len(totals)), totals.argmax(axis=1)] = True
+    return mask
+
+
+def extract_face_subset(points, counts, connects, face_mask, uv_ids=None):
+    """Build the points and topology of a mesh made of some faces.
+
+    Vertices not used by the kept faces are dropped and the remaining ones
+    renumbered in their original order.
+
+    Args:
+        points: ``(vertices, 3)`` vertex positions.
+        counts: Vertex count of every face.
+        connects: Flat face-vertex indices.
+        face_mask: ``(faces,)`` boolean mask of the faces to keep.
+        uv_ids: Optional flat face-vertex UV indices.
+
+    Returns:
+        tuple: (points, counts, connects, uv_map, uv_ids) of the new mesh.
+        uv_map holds the original index of every kept UV and is None, like
+        uv_ids, when no UV indices were given.
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    face_vertex_mask = np.repeat(np.asarray(face_mask, dtype=bool), counts)
+
+    vertex_map, sub_connects = np.unique(
+        np.asarray(connects)[face_vertex_mask], return_inverse=True
+    )
+    uv_map = sub_uv_ids = None
+    if uv_ids is not None:
+        uv_map, sub_uv_ids = np.unique(np.asarray(uv_ids)[face_vertex_mask], return_inverse=True)
+
+    return (
+        np.asarray(points)[vertex_map],
+        counts[face_mask],
+        sub_connects.reshape(-1),
+        uv_map,
+        None if sub_uv_ids is None else sub_uv_ids.reshape(-1),
+    )
 
 
 class ProxyGeo:
     """Per-joint proxy geometry generator for fast viewport display.
 
-    Automatically creates optimized proxy geometry from a skinned mesh by duplicating
-    and removing faces based on skin weight influence. Useful for creating fast/medium/
-    slow display hierarchy levels that maintain proper deformation while reducing
-    viewport geometry for performance.
+    Automatically creates optimized proxy geometry from a skinned mesh, one mesh
+    per joint made of the faces that joint influences. Useful for creating
+    fast/medium/slow display hierarchy levels that maintain proper deformation
+    while reducing viewport geometry for performance.
 
     Attributes:
         proxyGeoList: List of created proxy geometry transform nodes
@@ -49,17 +124,19 @@ class ProxyGeo:
         >>> fast_group = proxy.get_fast_geo_group()
     """
 
-    def __init__(self, geo, do_parent_cnst=True, threshold=0.45):
+    def __init__(self, geo, do_parent_cnst=True, threshold=0.45, dominant=False):
         """Create per-joint proxy geometry from a skinned mesh.
 
-        Duplicates the source mesh for each joint influence, removes faces with
-        low skin weights, and creates a fast-display geometry hierarchy useful
-        for viewport performance optimization.
+        Reads the skin weights once, assigns the faces of the source mesh to
+        the joints and builds one mesh per joint from its faces. Joints that
+        get no faces get no proxy.
 
         Args:
             geo: Source skinned mesh to generate proxy geometry from
             do_parent_cnst: Parent constrain proxy geo to joints. Defaults to True.
             threshold: Skin weight threshold (0-1) for face inclusion. Defaults to 0.45.
+            dominant: Give every face to its highest weighted joint only,
+                instead of to every joint above the threshold. Defaults to False.
 
         Attributes:
             proxyGeoList: List of created proxy geometry transform nodes
@@ -70,7 +147,6 @@ class ProxyGeo:
             >>> proxy_meshes = proxy.get_proxy_geo_list()
         """
         self.proxy_geo_list = []
-        pivot_locator = pm.spaceLocator(n="pivotGeo_LOC")
         # Create proxy geo Group
         self.shape_grp = pm.group(n="fastGeo_GRP", em=True)
 
@@ -78,74 +154,104 @@ class ProxyGeo:
         skin_cluster = skin.find_related_skin_cluster(geo)
         if not skin_cluster:
             print("Missing SkinCluster")
-        else:
-            self.skin = skin_cluster
-
-            # Get joint influence of the skin
-            influnces = self.skin.getInfluence(q=True)  # influences is joint
-            for joint in influnces:
-                # duplicate mesh for a control
-                transform, dupli_shape = self.duplicate_source_mesh(obj=geo, joint=joint)
-                common.center_pivot(transform, pivot_locator)
+            return
 
-                # copy skinCluster
-                skin.copy_bind(pm.ls(geo)[0], transform)
+        self.skin = skin_cluster
+        influences, weights, mesh_data = self.read_skinned_mesh(skin_cluster)
+        points, counts, connects, uvs, uv_ids = mesh_data
 
-                # delete faces in the new shape based on selected joint
-                self.delete_vertex(joint=joint, new_shape=dupli_shape, threshold=threshold)
+        # Faces of every joint, computed for all joints at once
+        if dominant:
+            face_mask = face_dominant_influence(counts, connects, weights)
+        else:
+            face_mask = face_influence_mask(counts, connects, weights, threshold)
 
-                # delete non deformer history
-                common.delete_history(dupli_shape)
+        for column, joint in enumerate(influences):
+            if not face_mask[:, column].any():
+                continue
 
-                # parent under proxy group
-                pm.parent(transform, self.shape_grp)
-                self.proxy_geo_list.append(transform)
+            transform = self.create_proxy_mesh(
+                name.remove_suffix(joint) + "_PRX",
+                extract_face_subset(points, counts, connects, face_mask[:, column], uv_ids),
+                uvs,
+            )
 
-                # parentConstraint with joint
-                if do_parent_cnst:
-                    pm.parentConstraint(joint, transform, mo=True)
+            # parent under proxy group
+            pm.parent(transform, self.shape_grp)
+            self.proxy_geo_list.append(transform)
 
-            # delete pivot locator
-            pm.delete(pivot_locator)
+            # parentConstraint with joint
+            if do_parent_cnst:
+                pm.parentConstraint(joint, transform, mo=True)
 
-    def duplicate_source_mesh(self, obj, joint):
-        """Duplicate source mesh for per-joint proxy geometry.
+    def read_skinned_mesh(self, skin_cluster):
+        """Read the weights and geometry of a skinned mesh in bulk.
 
         Args:
-            obj: Source mesh to duplicate
-            joint: Joint for naming the duplicated mesh
+            skin_cluster: Skin cluster of the source mesh.
 
         Returns:
-            tuple: (Duplicated transform node, Shape node)
+            tuple: (influences, weights, mesh_data) where influences are the
+            joint PyNodes in weight column order, weights a
+            ``(vertices, influences)`` array and mesh_data a tuple of world
+            space points, face counts, face-vertex indices, ``(u, v)`` arrays
+            and face-vertex UV indices. The UV entries are None if some faces
+            have no UVs.
         """
-        dupli_obj = pm.duplicate(obj)
-        pm.rename(dupli_obj, name.remove_suffix(joint) + "_PRX")
+        import maya.api.OpenMaya as om2  # noqa: N813 - Maya API alias
+
+        from mayaLib.rigLib.utils.skin_weights import double_array_to_numpy, get_skin_api_objects
+
+        fn_skin, dag_path, components = get_skin_api_objects(skin_cluster)
+        influences = [pm.PyNode(path.fullPathName()) for path in fn_skin.influenceObjects()]
+        m_weights, num_influences = fn_skin.getWeights(dag_path, components)
+        weights = double_array_to_numpy(m_weights, num_influences)
+
+        fn_mesh = om2.MFnMesh(dag_path)
+        points = np.array(fn_mesh.getPoints(om2.MSpace.kWorld))[:, :3]
+        counts, connects = (np.array(array, dtype=np.int64) for array in fn_mesh.getVertices())
 
-        return dupli_obj[0], dupli_obj[0].getShape()
+        uvs = uv_ids = None
+        uv_counts, assigned_ids = fn_mesh.getAssignedUVs()
+        if fn_mesh.numUVs() and np.array_equal(np.array(uv_counts), counts):
+            u_values, v_values = fn_mesh.getUVs()
+            uvs = (np.array(u_values), np.array(v_values))
+            uv_ids = np.array(assigned_ids, dtype=np.int64)
 
-    def delete_vertex(self, joint, new_shape, threshold=0.45):
-        """Remove vertices with low skin weight influence from proxy mesh.
+        return influences, weights, (points, counts, connects, uvs, uv_ids)
 
-        Evaluates skin weights for each vertex and removes faces where the
-        specified joint's influence is below the threshold.
+    def create_proxy_mesh(self, mesh_name, subset, uvs=None):
+        """Create a mesh from the output of :func:`extract_face_subset`.
 
         Args:
-            joint: Joint to evaluate skin weights for
-            new_shape: Proxy mesh shape to remove vertices from
-            threshold: Minimum skin weight (0-1) to keep vertices. Defaults to 0.45.
+            mesh_name: Name of the new transform.
+            subset: (points, counts, connects, uv_map, uv_ids) of the mesh.
+            uvs: ``(u, v)`` arrays of the source mesh, or None.
+
+        Returns:
+            PyNode: Transform of the new mesh, with the default shader.
         """
-        verts = []
-        skincluster = skin.find_related_skin_cluster(new_shape)
-        for x in range(pm.polyEvaluate(new_shape, v=1)):
-            v = pm.skinPercent(skincluster, f"{new_shape}.vtx[{x}]", transform=joint, q=1)
-            if v > threshold:
-                verts.append(f"{new_shape}.vtx[{x}]")
-        pm.select(verts)
-
-        faces = pm.polyListComponentConversion(verts, fromVertex=True, toFace=True)
-        # pm.select(faces)
-        to_delete = invert_selection(new_shape, faces)
-        pm.polyDelFacet(to_delete, ch=False)
+        import maya.api.OpenMaya as om2  # noqa: N813 - Maya API alias
+
+        points, counts, connects, uv_map, uv_ids = subset
+        m_points = om2.MPointArray([om2.MPoint(*point) for point in points.tolist()])
+        fn_mesh = om2.MFnMesh()
+        if uvs is not None and uv_map is not None:
+            transform_obj = fn_mesh.create(
+                m_points,
+                counts.tolist(),
+                connects.tolist(),
+                uvs[0][uv_map].tolist(),
+                uvs[1][uv_map].tolist(),
+            )
+            fn_mesh.assignUVs(counts.tolist(), uv_ids.tolist())
+        else:
+            transform_obj = fn_mesh.create(m_points, counts.tolist(), connects.tolist())
+
+        transform = pm.PyNode(om2.MFnDagNode(transform_obj).fullPathName())
+        transform = pm.rename(transform, mesh_name)
+        pm.sets("initialShadingGroup", edit=True, forceElement=transform)
+        return transform
 
     def get_proxy_geo_list(self):
         """Get list of created proxy geometry transforms.
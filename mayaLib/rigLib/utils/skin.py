@@ -204,6 +204,7 @@ def save_skin_weights(
     project_path=None,
     sw_ext=".swt",
     do_directory=True,
+    binary=False,
 ):
     """Save weights for character geometry objects.
 
@@ -212,6 +213,7 @@ def save_skin_weights(
         project_path (string | None): file path
         sw_ext (string): file extension
         do_directory (bool): create directory.
+        binary (bool): write the binary bSkinSaver layout instead of text.
     """
     if project_path is None:
         project_path = Path(cmds.file(q=True, sn=True)).parent.as_posix()
@@ -236,7 +238,7 @@ def save_skin_weights(
 
         # save skin weight file
         pm.select(obj)
-        b_skin_saver.b_save_skin_values(wt_file)
+        b_skin_saver.b_save_skin_values(wt_file, binary=binary)
 
 
 def load_skin_weights(
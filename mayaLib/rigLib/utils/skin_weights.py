@@ -0,0 +1,442 @@
+"""Sparse skin weight container and bulk skin cluster weight access.
+
+Skinned meshes usually carry 4-8 non-zero influences per vertex, while Maya
+hands out (and the legacy file formats store) a dense
+``(vertices, influences)`` matrix. :class:`SparseSkinWeights` stores the same
+data in CSR form (``indptr``/``indices``/``values``) so serialization cost and
+file size scale with the number of non-zero weights. Pruning by threshold or
+by maximum influence count and renormalization are done with vectorized
+NumPy operations.
+
+The module also hosts the OpenMaya 2.0 helpers that move a whole weight
+matrix between ``MFnSkinCluster`` and NumPy in one call. They are shared by
+``mayaLib.rigLib.face.io.skin_io`` and ``mayaLib.utility.b_skin_saver``.
+
+Example:
+    Prune a skin cluster to four influences per vertex::
+
+        from mayaLib.rigLib.utils import skin_weights
+
+        influences, dense, _ = skin_weights.get_weight_matrix("skinCluster1")
+        sparse = skin_weights.SparseSkinWeights.from_dense(dense, influences)
+        sparse = sparse.prune_max_influences(4).normalize()
+"""
+
+__author__ = "Lorenzo Argentieri"
+
+import numpy as np
+
+__all__ = [
+    "SparseSkinWeights",
+    "prune_weights",
+    "strip_influence_name",
+    "get_skin_api_objects",
+    "double_array_to_numpy",
+    "numpy_to_double_array",
+    "get_weight_matrix",
+    "read_sparse_weights",
+]
+
+
+class SparseSkinWeights:
+    """Skin weights stored as a CSR matrix of ``(points, influences)``.
+
+    Row ``i`` holds the weights of point ``i``: its influence columns are
+    ``indices[indptr[i]:indptr[i + 1]]`` and the matching weights are
+    ``values[indptr[i]:indptr[i + 1]]``. Columns are sorted within each row.
+
+    Instances are treated as immutable; every pruning or normalization
+    method returns a new container.
+
+    Attributes:
+        influences: Influence names, one per column.
+        indptr: int64 array of ``num_points + 1`` row offsets.
+        indices: int32 array of influence columns for each stored weight.
+        values: float32 array of stored weights.
+    """
+
+    def __init__(self, influences, indptr, indices, values):
+        """Initialize the container from CSR arrays.
+
+        Args:
+            influences: Influence names, one per column.
+            indptr: Row offsets, ``num_points + 1`` entries.
+            indices: Influence column of every stored weight.
+            values: Stored weights.
+
+        Raises:
+            ValueError: If the arrays are inconsistent.
+        """
+        self.influences = list(influences)
+        self.indptr = np.ascontiguousarray(indptr, dtype=np.int64)
+        self.indices = np.ascontiguousarray(indices, dtype=np.int32)
+        self.values = np.ascontiguousarray(values, dtype=np.float32)
+
+        if self.indptr.ndim != 1 or len(self.indptr) == 0 or self.indptr[0] != 0:
+            raise ValueError("indptr must be a 1D array starting at 0")
+        if len(self.indices) != len(self.values) or self.indptr[-1] != len(self.values):
+            raise ValueError("indices and values must match indptr[-1] in length")
+        if len(self.indices) and (
+            self.indices.min() < 0 or self.indices.max() >= len(self.influences)
+        ):
+            raise ValueError("influence index out of range")
+
+    def __repr__(self):
+        """Return a short description of the container."""
+        return (
+            f"{type(self).__name__}(points={self.num_points}, "
+            f"influences={self.num_influences}, nnz={self.nnz})"
+        )
+
+    @property
+    def num_points(self):
+        """int: Number of points (rows)."""
+        return len(self.indptr) - 1
+
+    @property
+    def num_influences(self):
+        """int: Number of influences (columns)."""
+        return len(self.influences)
+
+    @property
+    def nnz(self):
+        """int: Number of stored weights."""
+        return len(self.values)
+
+    @property
+    def shape(self):
+        """tuple: Dense shape ``(num_points, num_influences)``."""
+        return (self.num_points, self.num_influences)
+
+    def row_ids(self):
+        """Get the row (point) index of every stored weight.
+
+        Returns:
+            numpy.ndarray: int64 array aligned with ``indices``/``values``.
+        """
+        return np.repeat(np.arange(self.num_points, dtype=np.int64), np.diff(self.indptr))
+
+    @classmethod
+    def from_coo(cls, influences, num_points, rows, columns, values):
+        """Build a container from coordinate (row, column, value) triplets.
+
+        Entries are sorted by row then column; duplicates are not merged.
+
+        Args:
+            influences: Influence names, one per column.
+            num_points: Number of rows.
+            rows: Row index of every entry.
+            columns: Influence column of every entry.
+            values: Weight of every entry.
+
+        Returns:
+            SparseSkinWeights: The new container.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = np.asarray(columns, dtype=np.int32)
+        values = np.asarray(values, dtype=np.float32)
+
+        order = np.lexsort((columns, rows))
+        counts = np.bincount(rows, minlength=num_points)
+        indptr = np.zeros(num_points + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return cls(influences, indptr, columns[order], values[order])
+
+    @classmethod
+    def from_dense(cls, weights, influences, threshold=0.0):
+        """Build a container from a dense weight matrix.
+
+        Args:
+            weights: ``(points, influences)`` weight array.
+            influences: Influence names, one per column.
+            threshold: Weights less than or equal to this value are dropped.
+
+        Returns:
+            SparseSkinWeights: The new container.
+
+        Raises:
+            ValueError: If the column count does not match ``influences``.
+        """
+        weights = np.asarray(weights)
+        if weights.ndim != 2 or weights.shape[1] != len(influences):
+            raise ValueError(
+                f"Expected a (points, {len(influences)}) weight matrix, got {weights.shape}"
+            )
+
+        mask = weights > threshold
+        indptr = np.zeros(weights.shape[0] + 1, dtype=np.int64)
+        np.cumsum(mask.sum(axis=1), out=indptr[1:])
+        # Row-major nonzero keeps rows ordered and columns sorted within a row
+        _rows, columns = np.nonzero(mask)
+        return cls(influences, indptr, columns, weights[mask])
+
+    def to_dense(self, dtype=np.float64):
+        """Expand the container to a dense weight matrix.
+
+        Args:
+            dtype: Output dtype. Defaults to float64 (the Maya API type).
+
+        Returns:
+            numpy.ndarray: ``(points, influences)`` array.
+        """
+        dense = np.zeros(self.shape, dtype=dtype)
+        dense[self.row_ids(), self.indices] = self.values
+        return dense
+
+    def _masked(self, mask):
+        """Return a container keeping only the entries selected by ``mask``."""
+        counts = np.bincount(self.row_ids()[mask], minlength=self.num_points)
+        indptr = np.zeros(self.num_points + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return type(self)(self.influences, indptr, self.indices[mask], self.values[mask])
+
+    def prune_threshold(self, threshold):
+        """Drop weights less than or equal to ``threshold``.
+
+        Args:
+            threshold: Minimum weight to keep (exclusive).
+
+        Returns:
+            SparseSkinWeights: The pruned container (not renormalized).
+        """
+        return self._masked(self.values > threshold)
+
+    def prune_max_influences(self, max_influences):
+        """Keep only the ``max_influences`` largest weights of every point.
+
+        Ties are broken by keeping the lower influence column.
+
+        Args:
+            max_influences: Maximum number of influences per point.
+
+        Returns:
+            SparseSkinWeights: The pruned container (not renormalized).
+
+        Raises:
+            ValueError: If ``max_influences`` is smaller than 1.
+        """
+        if max_influences < 1:
+            raise ValueError("max_influences must be at least 1")
+
+        rows = self.row_ids()
+        # Sort by row, then by descending weight; rank is the offset inside the row
+        order = np.lexsort((self.indices, -self.values, rows))
+        rank = np.empty(self.nnz, dtype=np.int64)
+        rank[order] = np.arange(self.nnz, dtype=np.int64) - self.indptr[rows[order]]
+        return self._masked(rank < max_influences)
+
+    def normalize(self):
+        """Rescale the weights of every point to sum to 1.
+
+        Points whose weights sum to zero are left untouched.
+
+        Returns:
+            SparseSkinWeights: The normalized container.
+        """
+        rows = self.row_ids()
+        sums = np.bincount(rows, weights=self.values, minlength=self.num_points)
+        scale = np.ones_like(sums)
+        np.divide(1.0, sums, out=scale, where=sums > 0)
+        values = self.values * scale[rows]
+        return type(self)(self.influences, self.indptr, self.indices, values)
+
+    def used_influences(self):
+        """Get the columns that carry at least one stored weight.
+
+        Returns:
+            numpy.ndarray: Sorted int32 array of influence columns.
+        """
+        return np.unique(self.indices).astype(np.int32)
+
+    def compact(self):
+        """Drop influences that carry no weight on any point.
+
+        Returns:
+            SparseSkinWeights: Container whose influence list only holds the
+                used influences, in their original order.
+        """
+        used = self.used_influences()
+        remap = np.full(self.num_influences, -1, dtype=np.int32)
+        remap[used] = np.arange(len(used), dtype=np.int32)
+        influences = [self.influences[ii] for ii in used]
+        return type(self)(influences, self.indptr, remap[self.indices], self.values)
+
+    def to_arrays(self, prefix=""):
+        """Export the CSR arrays for ``numpy.savez``.
+
+        Args:
+            prefix: Optional key prefix, used to store several objects in
+                one archive.
+
+        Returns:
+            dict: ``{prefix + "indptr"/"indices"/"values": array}``.
+        """
+        return {
+            f"{prefix}indptr": self.indptr,
+            f"{prefix}indices": self.indices,
+            f"{prefix}values": self.values,
+        }
+
+    @classmethod
+    def from_arrays(cls, influences, arrays, prefix=""):
+        """Rebuild a container from arrays written by :meth:`to_arrays`.
+
+        Args:
+            influences: Influence names, one per column.
+            arrays: Mapping holding the CSR arrays (e.g. an ``NpzFile``).
+            prefix: Key prefix used when the arrays were written.
+
+        Returns:
+            SparseSkinWeights: The rebuilt container.
+        """
+        return cls(
+            influences,
+            arrays[f"{prefix}indptr"],
+            arrays[f"{prefix}indices"],
+            arrays[f"{prefix}values"],
+        )
+
+
+def prune_weights(weights, max_influences=None, threshold=0.0, normalize=True):
+    """Apply threshold and max-influence pruning to a container.
+
+    Args:
+        weights: Source :class:`SparseSkinWeights`.
+        max_influences: Maximum influences per point. None keeps all.
+        threshold: Weights less than or equal to this value are dropped.
+        normalize: Renormalize points after pruning. Only applied when some
+            weights were actually removed.
+
+    Returns:
+        SparseSkinWeights: The pruned container.
+    """
+    pruned = weights.prune_threshold(threshold) if threshold > 0 else weights
+    if max_influences:
+        pruned = pruned.prune_max_influences(max_influences)
+    if normalize and pruned.nnz != weights.nnz:
+        pruned = pruned.normalize()
+    return pruned
+
+
+def strip_influence_name(path_name):
+    """Strip DAG path and namespace from an influence name.
+
+    Args:
+        path_name: Influence name as returned by ``partialPathName()`` or
+            ``fullPathName()``.
+
+    Returns:
+        str: Short influence name without DAG path or namespace.
+    """
+    return path_name.split("|")[-1].split(":")[-1]
+
+
+def get_skin_api_objects(skin_cls, point_ids=None):
+    """Get the OpenMaya 2.0 objects needed for bulk weight access.
+
+    Args:
+        skin_cls: Skin cluster node (PyMEL node or name).
+        point_ids: Optional vertex (or curve CV) indices. If None, the
+            components cover every point of the shape.
+
+    Returns:
+        tuple: (fn_skin, dag_path, components) where fn_skin is an
+            ``MFnSkinCluster``, dag_path the skinned shape ``MDagPath`` and
+            components an ``MObject`` with the requested points.
+    """
+    import maya.api.OpenMaya as om2  # noqa: N813 - Maya API alias
+    import maya.api.OpenMayaAnim as oma2  # noqa: N813 - Maya API alias
+
+    selection = om2.MSelectionList()
+    selection.add(str(skin_cls))
+    fn_skin = oma2.MFnSkinCluster(selection.getDependNode(0))
+    dag_path = fn_skin.getPathAtIndex(0)
+
+    if dag_path.hasFn(om2.MFn.kNurbsSurface) and point_ids is None:
+        fn_surface = om2.MFnNurbsSurface(dag_path)
+        fn_comp = om2.MFnDoubleIndexedComponent()
+        components = fn_comp.create(om2.MFn.kSurfaceCVComponent)
+        fn_comp.setCompleteData(fn_surface.numCVsInU, fn_surface.numCVsInV)
+    else:
+        if dag_path.hasFn(om2.MFn.kNurbsCurve):
+            component_type = om2.MFn.kCurveCVComponent
+        else:
+            component_type = om2.MFn.kMeshVertComponent
+        fn_comp = om2.MFnSingleIndexedComponent()
+        components = fn_comp.create(component_type)
+        if point_ids is None:
+            fn_comp.setCompleteData(om2.MItGeometry(dag_path).count())
+        else:
+            fn_comp.addElements([int(ii) for ii in point_ids])
+
+    return fn_skin, dag_path, components
+
+
+def double_array_to_numpy(m_array, num_columns=None):
+    """Convert an OpenMaya 2.0 ``MDoubleArray`` to a NumPy array in bulk.
+
+    Args:
+        m_array: Source ``MDoubleArray`` (or any float sequence).
+        num_columns: If given, reshape the result to ``(-1, num_columns)``.
+
+    Returns:
+        numpy.ndarray: float64 array holding a copy of the values.
+    """
+    array = np.fromiter(m_array, dtype=np.float64, count=len(m_array))
+    if num_columns:
+        array = array.reshape(-1, num_columns)
+    return array
+
+
+def numpy_to_double_array(array):
+    """Convert a NumPy array to an OpenMaya 2.0 ``MDoubleArray`` in bulk.
+
+    Args:
+        array: Array of any shape; it is flattened in C order.
+
+    Returns:
+        MDoubleArray: Array holding a copy of the values.
+    """
+    import maya.api.OpenMaya as om2  # noqa: N813 - Maya API alias
+
+    return om2.MDoubleArray(np.ascontiguousarray(array, dtype=np.float64).ravel().tolist())
+
+
+def get_weight_matrix(skin_cls, point_ids=None):
+    """Read the weight matrix of a skin cluster in one API call.
+
+    Args:
+        skin_cls: Skin cluster node (PyMEL node or name).
+        point_ids: Optional point indices; rows follow this order. If None,
+            every point of the shape is read.
+
+    Returns:
+        tuple: (influences, weights, blend_weights) where influences is a
+            list of namespace-stripped influence names, weights a float64
+            ``(points, influences)`` array and blend_weights a float64
+            ``(points,)`` array of dual quaternion blend weights.
+    """
+    fn_skin, dag_path, components = get_skin_api_objects(skin_cls, point_ids)
+
+    influences = [strip_influence_name(p.partialPathName()) for p in fn_skin.influenceObjects()]
+    m_weights, num_influences = fn_skin.getWeights(dag_path, components)
+    weights = double_array_to_numpy(m_weights, num_influences)
+    blend_weights = double_array_to_numpy(fn_skin.getBlendWeights(dag_path, components))
+
+    return influences, weights, blend_weights
+
+
+def read_sparse_weights(skin_cls, max_influences=None, threshold=0.0):
+    """Read a skin cluster straight into a pruned sparse container.
+
+    Args:
+        skin_cls: Skin cluster node (PyMEL node or name).
+        max_influences: Maximum influences per point. None keeps all.
+        threshold: Weights less than or equal to this value are dropped.
+
+    Returns:
+        SparseSkinWeights: The skin cluster weights.
+    """
+    influences, weights, _blend_weights = get_weight_matrix(skin_cls)
+    sparse = SparseSkinWeights.from_dense(weights, influences)
+    return prune_weights(sparse, max_influences, threshold)
@@ -0,0 +1,182 @@
+"""Performance benchmark for the vectorized line-of-action analysis.
+
+This script compares the two geometry analysis paths of
+``mayaLib.rigLib.utils.line_of_action`` on synthetic muscle point clouds:
+1. Old approach: pure Python lists, nested-loop covariance, power iteration
+   and a per-vertex extremal search, run once per muscle
+2. New approach: ``compute_lines_of_action`` analyzing every muscle in one
+   batch with NumPy (``reduceat`` sums, one stacked ``eigh`` call)
+
+Both paths must pick the same extremal vertices. The benchmark verifies that
+the batch path is at least 5x faster for a 100+ muscle rig.
+"""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+
+# Add parent directories to path for imports
+_test_dir = Path(__file__).parent.resolve()
+_mayalib_dir = _test_dir.parent
+_root_dir = _mayalib_dir.parent
+
+if str(_root_dir) not in sys.path:
+    sys.path.insert(0, str(_root_dir))
+
+# Mock Maya modules before importing mayaLib
+for _module in ("maya", "maya.cmds", "maya.OpenMaya", "pymel", "pymel.core"):
+    sys.modules.setdefault(_module, MagicMock())
+
+from mayaLib.rigLib.utils import line_of_action  # noqa: E402 - Maya mocks must exist first
+
+
+# ANSI color codes for output
+class Colors:
+    """ANSI color codes for terminal output."""
+
+    HEADER = "\033[95m"
+    OKGREEN = "\033[92m"
+    WARNING = "\033[93m"
+    FAIL = "\033[91m"
+    ENDC = "\033[0m"
+    BOLD = "\033[1m"
+
+
+def make_muscle_clouds(num_muscles, min_points=200, max_points=3000, seed=0):
+    """Generate elongated, randomly oriented point clouds shaped like muscles.
+
+    Args:
+        num_muscles: Number of point clouds.
+        min_points: Minimum points per cloud.
+        max_points: Maximum points per cloud.
+        seed: Random seed.
+
+    Returns:
+        list[np.ndarray]: ``(n, 3)`` point arrays.
+    """
+    rng = np.random.default_rng(seed)
+    clouds = []
+    for _ in range(num_muscles):
+        num_points = int(rng.integers(min_points, max_points))
+        direction = rng.normal(size=3)
+        direction /= np.linalg.norm(direction)
+        along = rng.uniform(-1.0, 1.0, (num_points, 1)) * rng.uniform(5.0, 20.0)
+        spread = rng.normal(size=(num_points, 3)) * rng.uniform(0.5, 2.0)
+        clouds.append(along * direction + spread + rng.normal(size=3) * 50.0)
+    return clouds
+
+
+def benchmark_old_python_approach(clouds):
+    """Analyze every cloud with the pure Python reference functions.
+
+    Args:
+        clouds: Point arrays; converted to lists as ``get_points_py_list`` did.
+
+    Returns:
+        tuple: (seconds, list of (start_index, end_index)).
+    """
+    start_time = time.perf_counter()
+    indices = []
+    for cloud in clouds:
+        vertices = cloud.tolist()
+        centroid, main_axis = line_of_action.compute_main_axis(vertices)
+        extremal = line_of_action.find_extremal_vertices(vertices, centroid, main_axis)
+        indices.append((extremal["start_index"], extremal["end_index"]))
+    return time.perf_counter() - start_time, indices
+
+
+def benchmark_new_batch_approach(clouds):
+    """Analyze all clouds in one ``compute_lines_of_action`` call.
+
+    Args:
+        clouds: Point arrays.
+
+    Returns:
+        tuple: (seconds, list of (start_index, end_index)).
+    """
+    start_time = time.perf_counter()
+    results = line_of_action.compute_lines_of_action(clouds)
+    elapsed = time.perf_counter() - start_time
+    return elapsed, [(result["start_index"], result["end_index"]) for result in results]
+
+
+def format_time(seconds: float) -> str:
+    """Format time in seconds to human-readable string.
+
+    Args:
+        seconds: Time in seconds.
+
+    Returns:
+        str: Formatted time string.
+    """
+    if seconds < 1.0:
+        return f"{seconds * 1000:.1f} ms"
+    return f"{seconds:.3f} s"
+
+
+def run_benchmark() -> bool:
+    """Run the complete line-of-action benchmark.
+
+    Returns:
+        bool: True if both paths agree everywhere and the batch path is at
+            least 5x faster for 100+ muscles.
+    """
+    print(f"\n{Colors.BOLD}{Colors.HEADER}{'Line of Action Analysis Benchmark':^70}{Colors.ENDC}\n")
+    print("Old approach: Python lists, nested-loop covariance, power iteration (per muscle)")
+    print("New approach: NumPy batch PCA and extremal search (all muscles at once)\n")
+
+    test_configs = [
+        (10, "10 muscles"),
+        (50, "50 muscles"),
+        (200, "200 muscles (full body)"),
+    ]
+
+    print(
+        f"{Colors.BOLD}{'Test Case':<30} {'Old Time':<12} {'New Time':<12} {'Speedup':<10}{Colors.ENDC}"
+    )
+    print("-" * 70)
+
+    success = True
+    for num_muscles, description in test_configs:
+        clouds = make_muscle_clouds(num_muscles, seed=num_muscles)
+        # Warm-up run
+        benchmark_new_batch_approach(clouds)
+
+        old_time, old_indices = benchmark_old_python_approach(clouds)
+        new_time, new_indices = benchmark_new_batch_approach(clouds)
+        speedup = old_time / new_time if new_time > 0 else float("inf")
+
+        color = Colors.OKGREEN if speedup >= 5.0 else Colors.WARNING
+        print(
+            f"{description:<30} {format_time(old_time):<12} {format_time(new_time):<12} "
+            f"{color}{speedup:.1f}x{Colors.ENDC}"
+        )
+
+        if old_indices != new_indices:
+            print(f"  {Colors.FAIL}✗ extremal vertices differ between paths{Colors.ENDC}")
+            success = False
+        if num_muscles >= 100 and speedup < 5.0:
+            success = False
+
+    status = f"{Colors.OKGREEN}✓ SUCCESS" if success else f"{Colors.FAIL}✗ FAILED"
+    print(f"\n{status}{Colors.ENDC}: identical results, 5x+ speedup for 100+ muscles\n")
+    return success
+
+
+def test_line_of_action_performance_benchmark():
+    """Pytest test function for the line-of-action benchmark.
+
+    Verifies the batch NumPy path matches the Python reference and is
+    significantly faster on a full-body muscle count.
+    """
+    success = run_benchmark()
+    assert success, "Batch analysis should match the reference and be 5x+ faster"
+
+
+if __name__ == "__main__":
+    # Run standalone benchmark
+    success = run_benchmark()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,214 @@
+"""Performance benchmark for the NumPy RBF pose-space solver.
+
+This script compares three ways of evaluating a fitted
+``mayaLib.rigLib.math.rbf.RBFSolver`` over an animation of input poses:
+1. Python reference: per frame, a Python loop over the driver poses
+   computing each distance and kernel value and accumulating every output
+2. Per-frame NumPy: ``RBFSolver.evaluate`` once per frame (one distance
+   row and one matrix-vector product)
+3. Batch NumPy: ``RBFSolver.evaluate_batch`` on all frames at once (one
+   matrix product)
+
+All paths must give the same values. The benchmark verifies that the batch
+path is at least 10x faster than the Python reference for 100 poses x 50
+outputs.
+"""
+
+import math
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+
+# Add parent directories to path for imports
+_test_dir = Path(__file__).parent.resolve()
+_mayalib_dir = _test_dir.parent
+_root_dir = _mayalib_dir.parent
+
+if str(_root_dir) not in sys.path:
+    sys.path.insert(0, str(_root_dir))
+
+# Mock Maya modules before importing mayaLib
+for _module in ("maya", "maya.cmds", "maya.OpenMaya", "pymel", "pymel.core"):
+    sys.modules.setdefault(_module, MagicMock())
+
+from mayaLib.rigLib.math import rbf  # noqa: E402 - Maya mocks must exist first
+
+
+# ANSI color codes for output
+class Colors:
+    """ANSI color codes for terminal output."""
+
+    HEADER = "\033[95m"
+    OKGREEN = "\033[92m"
+    WARNING = "\033[93m"
+    FAIL = "\033[91m"
+    ENDC = "\033[0m"
+    BOLD = "\033[1m"
+
+
+def make_pose_problem(num_poses, num_outputs, num_frames, num_inputs=6, seed=0):
+    """Generate driver poses, output values and an animation of input poses.
+
+    Args:
+        num_poses: Number of driver poses.
+        num_outputs: Number of outputs per pose (e.g. corrective shapes).
+        num_frames: Number of input poses to evaluate.
+        num_inputs: Number of driver values per pose.
+        seed: Random seed.
+
+    Returns:
+        tuple: (poses, values, frames) arrays.
+    """
+    rng = np.random.default_rng(seed)
+    poses = rng.uniform(-1.0, 1.0, (num_poses, num_inputs))
+    values = rng.uniform(0.0, 1.0, (num_poses, num_outputs))
+    frames = rng.uniform(-1.0, 1.0, (num_frames, num_inputs))
+    return poses, values, frames
+
+
+def benchmark_python_reference(solver, frames):
+    """Evaluate every frame with Python loops over poses and outputs.
+
+    Args:
+        solver: Fitted Gaussian ``RBFSolver``.
+        frames: Input poses.
+
+    Returns:
+        tuple: (seconds, list of output lists).
+    """
+    poses = solver.poses.tolist()
+    weights = solver.weights.tolist()
+    epsilon = solver.epsilon
+    start_time = time.perf_counter()
+    results = []
+    for frame in frames.tolist():
+        outputs = [0.0] * solver.num_outputs
+        for pose, pose_weights in zip(poses, weights, strict=True):
+            distance = math.sqrt(sum((a - b) ** 2 for a, b in zip(frame, pose, strict=True)))
+            kernel = math.exp(-((epsilon * distance) ** 2))
+            for index, weight in enumerate(pose_weights):
+                outputs[index] += kernel * weight
+        results.append(outputs)
+    return time.perf_counter() - start_time, results
+
+
+def benchmark_per_frame(solver, frames):
+    """Evaluate every frame with ``RBFSolver.evaluate``.
+
+    Args:
+        solver: Fitted ``RBFSolver``.
+        frames: Input poses.
+
+    Returns:
+        tuple: (seconds, ``(frames, outputs)`` array).
+    """
+    start_time = time.perf_counter()
+    results = np.array([solver.evaluate(frame) for frame in frames])
+    return time.perf_counter() - start_time, results
+
+
+def benchmark_batch(solver, frames):
+    """Evaluate all frames with one ``RBFSolver.evaluate_batch`` call.
+
+    Args:
+        solver: Fitted ``RBFSolver``.
+        frames: Input poses.
+
+    Returns:
+        tuple: (seconds, ``(frames, outputs)`` array).
+    """
+    start_time = time.perf_counter()
+    results = solver.evaluate_batch(frames)
+    return time.perf_counter() - start_time, results
+
+
+def format_time(seconds: float) -> str:
+    """Format time in seconds to human-readable string.
+
+    Args:
+        seconds: Time in seconds.
+
+    Returns:
+        str: Formatted time string.
+    """
+    if seconds < 1.0:
+        return f"{seconds * 1000:.1f} ms"
+    return f"{seconds:.3f} s"
+
+
+def run_benchmark() -> bool:
+    """Run the complete RBF evaluation benchmark.
+
+    Returns:
+        bool: True if all paths agree and the batch path is at least 10x
+            faster than the Python reference for 100 poses x 50 outputs.
+    """
+    print(f"\n{Colors.BOLD}{Colors.HEADER}{'RBF Pose Interpolation Benchmark':^78}{Colors.ENDC}\n")
+    print("Python:    per-frame loops over poses and outputs")
+    print("Per frame: RBFSolver.evaluate, one matrix-vector product per frame")
+    print("Batch:     RBFSolver.evaluate_batch, one matrix product for all frames\n")
+
+    test_configs = [
+        (20, 10, 200, "20 poses x 10 outputs"),
+        (100, 50, 200, "100 poses x 50 outputs"),
+        (100, 50, 1000, "100 poses x 50 outputs, 1000 fr"),
+    ]
+
+    print(
+        f"{Colors.BOLD}{'Test Case':<34} {'Python':<11} {'Per frame':<11} {'Batch':<11} "
+        f"{'Speedup':<8}{Colors.ENDC}"
+    )
+    print("-" * 78)
+
+    success = True
+    for num_poses, num_outputs, num_frames, description in test_configs:
+        poses, values, frames = make_pose_problem(num_poses, num_outputs, num_frames)
+
+        fit_start = time.perf_counter()
+        solver = rbf.RBFSolver(poses, values, kernel="gaussian")
+        fit_time = time.perf_counter() - fit_start
+        # Warm-up run
+        benchmark_batch(solver, frames)
+
+        python_time, python_results = benchmark_python_reference(solver, frames)
+        frame_time, frame_results = benchmark_per_frame(solver, frames)
+        batch_time, batch_results = benchmark_batch(solver, frames)
+        speedup = python_time / batch_time if batch_time > 0 else float("inf")
+
+        color = Colors.OKGREEN if speedup >= 10.0 else Colors.WARNING
+        print(
+            f"{description:<34} {format_time(python_time):<11} {format_time(frame_time):<11} "
+            f"{format_time(batch_time):<11} {color}{speedup:.1f}x{Colors.ENDC}"
+        )
+        print(f"  fit: {format_time(fit_time)}")
+
+        if not (
+            np.allclose(python_results, batch_results) and np.allclose(frame_results, batch_results)
+        ):
+            print(f"  {Colors.FAIL}✗ values differ between paths{Colors.ENDC}")
+            success = False
+        if num_poses >= 100 and speedup < 10.0:
+            success = False
+
+    status = f"{Colors.OKGREEN}✓ SUCCESS" if success else f"{Colors.FAIL}✗ FAILED"
+    print(f"\n{status}{Colors.ENDC}: identical values, 10x+ batch speedup for 100 poses\n")
+    return success
+
+
+def test_rbf_performance_benchmark():
+    """Pytest test function for the RBF evaluation benchmark.
+
+    Verifies the precomputed weight matrix paths match a Python reference
+    and that batch evaluation is significantly faster.
+    """
+    success = run_benchmark()
+    assert success, "Batch RBF evaluation should match the reference and be 10x+ faster"
+
+
+if __name__ == "__main__":
+    # Run standalone benchmark
+    success = run_benchmark()
+    sys.exit(0 if success else 1)
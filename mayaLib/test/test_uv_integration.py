@@ -160,6 +160,24 @@ class MockPyMelIntegration:
             return len(self.shells) * 0.5
         return 0
 
+    def uv_shell_data(self, geo):
+        """Mock UVShellData.from_mesh() - one bulk read of every shell."""
+        from mayaLib.modelLib.base.uv import UVShellData
+
+        self.api_call_count += 1
+        self.api_call_log.append(("uvShellData", geo, {}))
+
+        coords = [uv for shell in self.shells for uv in shell.uv_coords]
+        shell_ids = [shell.shell_id for shell in self.shells for _ in shell.uv_coords]
+        return UVShellData(
+            [u for u, _ in coords],
+            [v for _, v in coords],
+            shell_ids,
+            shell_count=len(self.shells),
+            face_shell_ids=[shell.shell_id for shell in self.shells],
+            geo=self.mesh.name(),
+        )
+
     def select(self, *args, **kwargs):
         """Mock pm.select()."""
         self.api_call_count += 1
@@ -270,6 +288,7 @@ def test_autouv_workflow_integration():
     with (
         patch("mayaLib.modelLib.base.uv.pm", mock_pm),
         patch("mayaLib.modelLib.base.uv.mel.eval", mock_mel_eval),
+        patch("mayaLib.modelLib.base.uv.UVShellData.from_mesh", mock_pm.uv_shell_data),
     ):
         from mayaLib.modelLib.base.uv import AutoUV
 
@@ -7,6 +7,16 @@ retrieval instead of per-vertex API calls. It compares:
 
 The benchmark verifies that batch operations achieve at least 10x speedup
 for meshes with 10,000+ UVs.
+
+A second benchmark covers the shell analysis of ``recursive_cut_uv`` and
+``final_layout_uv``:
+1. Old approach: per-shell commands (shell listing, boundary check, tile
+   ranges and per-tile UV filtering) with Python loops over the coordinates
+2. New approach: one ``UVShellData`` read of UVs and shell IDs per mesh and
+   vectorized tile membership and out-of-bounds flags
+
+Both must flag the same shells and cut the same UVs, with at least 10x
+speedup for meshes with 500+ shells.
 """
 
 import sys
@@ -14,6 +24,8 @@ import time
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import numpy as np
+
 # Add parent directories to path for imports
 _test_dir = Path(__file__).parent.resolve()
 _mayalib_dir = _test_dir.parent
@@ -45,6 +57,8 @@ sys.modules["maya.mel"] = MagicMock()
 sys.modules["pymel"] = MagicMock()
 sys.modules["pymel.core"] = MagicMock()
 
+from mayaLib.modelLib.base.uv import UVShellData  # noqa: E402 - Maya mocks must exist first
+
 
 class MockUVData:
     """Mock UV data generator for performance testing."""
@@ -456,6 +470,183 @@ def run_benchmark() -> bool:
     return target_achieved
 
 
+def make_uv_shells(num_shells, uvs_per_shell=60, seed=0):
+    """Generate UV shells, about a third of them crossing tile borders.
+
+    Args:
+        num_shells: Number of shells.
+        uvs_per_shell: UVs in every shell.
+        seed: Random seed.
+
+    Returns:
+        list[list[tuple[float, float]]]: (u, v) coordinates of every shell.
+    """
+    rng = np.random.default_rng(seed)
+    shells = []
+    for _ in range(num_shells):
+        origin = rng.integers(0, 4, size=2) + rng.uniform(0.05, 0.6, size=2)
+        size = rng.uniform(0.1, 0.3) if rng.random() < 0.66 else rng.uniform(0.5, 1.5)
+        coords = origin + rng.uniform(0.0, size, size=(uvs_per_shell, 2))
+        shells.append([tuple(uv) for uv in coords.tolist()])
+    return shells
+
+
+def benchmark_old_per_shell_analysis(mock_pm: MockPyMel, shells: list) -> tuple:
+    """Benchmark the old per-shell command approach.
+
+    Replays the command pattern of ``get_uv_shell``, ``check_uv_in_boundaries``,
+    ``check_uv_boundaries`` and ``cut_uv_tile`` for every shell.
+
+    Args:
+        mock_pm: Mock PyMEL interface, used for the simulated command overhead.
+        shells: (u, v) coordinates of every shell.
+
+    Returns:
+        tuple: (seconds, out-of-bounds shells, sorted (shell, tile, uv indices) groups).
+    """
+    mock_pm.reset_overhead()
+    start_time = time.perf_counter()
+
+    mock_pm._record_api_overhead()  # polyEvaluate(uvShell=True)
+    bad_shells = []
+    groups = []
+    offset = 0
+    for shell_id, coords in enumerate(shells):
+        # polyEvaluate(uvsInShell) + polyListComponentConversion(toFace)
+        mock_pm._record_api_overhead()
+        mock_pm._record_api_overhead()
+
+        # check_uv_in_boundaries: conversion, ls, polyEditUV
+        for _ in range(3):
+            mock_pm._record_api_overhead()
+        inside = True
+        u_min, u_max, v_min, v_max = 0, 1, 0, 1
+        for i, (u, v) in enumerate(coords):
+            if i > 0 and not (u_min < u < u_max and v_min < v < v_max):
+                inside = False
+                break
+            u_min, u_max, v_min, v_max = int(u), int(u) + 1, int(v), int(v) + 1
+
+        if not inside:
+            bad_shells.append(shell_id)
+
+            # check_uv_boundaries: conversion, ls, polyEditUV
+            for _ in range(3):
+                mock_pm._record_api_overhead()
+            tile_range = []
+            for u, v in coords:
+                tile = [int(u), int(u) + 1, int(v), int(v) + 1]
+                if tile not in tile_range:
+                    tile_range.append(tile)
+
+            # cut_uv_tile: conversion, ls, polyEditUV per tile
+            for tile in tile_range:
+                for _ in range(3):
+                    mock_pm._record_api_overhead()
+                indices = [
+                    offset + i
+                    for i, (u, v) in enumerate(coords)
+                    if tile[0] < u < tile[1] and tile[2] < v < tile[3]
+                ]
+                if indices:
+                    groups.append((shell_id, (tile[0], tile[2]), indices))
+
+        offset += len(coords)
+
+    elapsed = time.perf_counter() - start_time + mock_pm.get_total_overhead_seconds()
+    return elapsed, bad_shells, sorted(groups)
+
+
+def benchmark_new_array_analysis(mock_pm: MockPyMel, shells: list) -> tuple:
+    """Benchmark the UVShellData approach.
+
+    The UV arrays are built outside the timed section; the three bulk reads
+    of ``UVShellData.from_mesh`` are counted as simulated command overhead.
+
+    Args:
+        mock_pm: Mock PyMEL interface, used for the simulated command overhead.
+        shells: (u, v) coordinates of every shell.
+
+    Returns:
+        tuple: (seconds, out-of-bounds shells, sorted (shell, tile, uv indices) groups).
+    """
+    coords = np.array([uv for shell in shells for uv in shell])
+    shell_ids = np.repeat(np.arange(len(shells)), [len(shell) for shell in shells])
+
+    mock_pm.reset_overhead()
+    start_time = time.perf_counter()
+
+    # getUVs, getUvShellsIds, getAssignedUVs
+    for _ in range(3):
+        mock_pm._record_api_overhead()
+    uv_data = UVShellData(coords[:, 0], coords[:, 1], shell_ids, len(shells))
+    shell_mask = uv_data.out_of_bounds_shells()
+    groups = uv_data.tile_uv_groups(shell_mask)
+
+    elapsed = time.perf_counter() - start_time + mock_pm.get_total_overhead_seconds()
+    bad_shells = np.flatnonzero(shell_mask).tolist()
+    return (
+        elapsed,
+        bad_shells,
+        sorted((shell, tile, indices.tolist()) for shell, tile, indices in groups),
+    )
+
+
+def run_shell_analysis_benchmark() -> bool:
+    """Run the per-shell vs. array shell analysis benchmark.
+
+    Returns:
+        bool: True if both paths agree everywhere and the array path is at
+            least 10x faster for 500+ shells.
+    """
+    print_section_header("UV Shell Analysis Benchmark")
+    print("Old approach: per-shell commands and Python coordinate loops")
+    print("New approach: one UVShellData read, vectorized tile analysis\n")
+
+    test_configs = [
+        (50, "50 shells"),
+        (500, "500 shells (prop)"),
+        (2000, "2K shells (character)"),
+    ]
+
+    print(
+        f"{Colors.BOLD}{'Test Case':<30} {'Old Time':<15} {'New Time':<15} "
+        f"{'Speedup':<15}{Colors.ENDC}"
+    )
+    print("-" * 75)
+
+    success = True
+    for num_shells, description in test_configs:
+        shells = make_uv_shells(num_shells, seed=num_shells)
+        mock_pm = MockPyMel(MockUVData(0))
+        # Warm-up run
+        benchmark_new_array_analysis(mock_pm, shells)
+
+        old_time, old_bad, old_groups = benchmark_old_per_shell_analysis(mock_pm, shells)
+        new_time, new_bad, new_groups = benchmark_new_array_analysis(mock_pm, shells)
+        speedup = old_time / new_time if new_time > 0 else float("inf")
+
+        print(
+            f"{description:<30} {format_time(old_time):<15} {format_time(new_time):<15} "
+            f"{format_speedup(speedup):<25}"
+        )
+
+        if old_bad != new_bad or old_groups != new_groups:
+            print(f"  {Colors.FAIL}✗ shell analysis differs between paths{Colors.ENDC}")
+            success = False
+        if num_shells >= 500 and speedup < 10.0:
+            success = False
+
+    print(f"\n{Colors.BOLD}Methods Optimized:{Colors.ENDC}")
+    print("  • get_uv_shell()")
+    print("  • recursive_cut_uv()")
+    print("  • final_layout_uv()")
+
+    status = f"{Colors.OKGREEN}✓ SUCCESS" if success else f"{Colors.FAIL}✗ FAILED"
+    print(f"\n{status}{Colors.ENDC}: identical results, 10x+ speedup for 500+ shells\n")
+    return success
+
+
 def test_uv_performance_benchmark():
     """Pytest test function for UV performance benchmark.
 
@@ -466,9 +657,20 @@ def test_uv_performance_benchmark():
     assert success, "Batch operations should achieve 10x+ speedup for 10K+ UV meshes"
 
 
+def test_uv_shell_analysis_benchmark():
+    """Pytest test function for the UV shell analysis benchmark.
+
+    Verifies the UVShellData path flags the same shells and cuts the same
+    UVs as the per-shell commands, and is significantly faster.
+    """
+    success = run_shell_analysis_benchmark()
+    assert success, "Shell analysis should match the per-shell path and be 10x+ faster"
+
+
 if __name__ == "__main__":
     # Run standalone benchmark
     import sys
 
     success = run_benchmark()
+    success = run_shell_analysis_benchmark() and success
     sys.exit(0 if success else 1)
@@ -7,10 +7,14 @@ Author: Thomas Bittner (thomasbittner@hotmail.de)
 Copyright: 2013-2016
 """
 
+import struct
 import time
 
+import numpy as np
 from maya import OpenMaya, OpenMayaAnim, cmds, mel
 
+from mayaLib.rigLib.utils import skin_weights
+
 # pylint: disable=too-many-lines,too-many-locals,too-many-branches
 # pylint: disable=too-many-statements,too-many-nested-blocks
 # pylint: disable=missing-function-docstring,invalid-name,line-too-long
@@ -127,6 +131,282 @@ from maya import OpenMaya, OpenMayaAnim, cmds, mel
 #         b_save_vertex_skin_values(str(self.vertices_file_line.text()), self.ignore_soft_selection_when_saving.isChecked())
 
 
+BINARY_MAGIC = b"BSKW"
+"""Magic bytes at the start of binary bSkinSaver files."""
+
+BINARY_VERSION = 2
+"""Current version of the binary bSkinSaver layout (2 added sparse blocks)."""
+
+KIND_OBJECTS = 0
+"""Binary file kind holding whole-object weights."""
+
+KIND_VERTICES = 1
+"""Binary file kind holding weights of selected vertices."""
+
+FLAG_SOFT_SELECTION = 1
+"""Header flag set when the vertex blocks carry soft selection weights."""
+
+FLAG_SPARSE = 2
+"""Header flag set when the weight blocks are stored as CSR arrays."""
+
+_FILE_HEADER = struct.Struct("<4sHHII")  # magic, version, kind, flags, object count
+_OBJECT_HEADER = struct.Struct("<IIII")  # name length, vertex count, rows, influences
+_NAME_LENGTH = struct.Struct("<H")
+
+
+def is_binary_weights_file(input_file):
+    """Check whether a file uses the binary bSkinSaver layout.
+
+    Args:
+        input_file (str): Path to the weight file.
+
+    Returns:
+        bool: True if the file starts with :data:`BINARY_MAGIC`.
+    """
+    with open(input_file, "rb") as input_stream:
+        return input_stream.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+
+def write_binary_weights(output_file, entries, kind=KIND_OBJECTS, sparse=False):
+    """Write weight blocks in the binary bSkinSaver layout.
+
+    The file has a fixed header followed by one block per object: a block
+    header, the object name, the influence table, then (4-byte aligned) the
+    vertex ids (vertex files only), the soft selection weights (if any) and
+    the weights. Dense files store a row-major float32 ``(rows, influences)``
+    block; sparse files store CSR arrays instead: int32 row offsets
+    (``rows + 1``), then int32 influence columns and float32 weights of the
+    stored entries, so a mesh costs about ``max influences`` weights per
+    vertex instead of one per influence.
+
+    Args:
+        output_file (str): Path to write.
+        entries (list): Dicts with ``name``, ``vertex_count``, ``influences``
+            and either ``weights`` (``(rows, influences)`` array) or
+            ``sparse`` (:class:`~mayaLib.rigLib.utils.skin_weights.SparseSkinWeights`)
+            keys, plus ``vertex_ids`` for vertex files and optional
+            ``soft_weights``.
+        kind (int): :data:`KIND_OBJECTS` or :data:`KIND_VERTICES`.
+        sparse (bool): Store CSR blocks instead of dense weight blocks.
+    """
+    flags = FLAG_SPARSE if sparse else 0
+    if any(entry.get("soft_weights") is not None for entry in entries):
+        flags |= FLAG_SOFT_SELECTION
+
+    with open(output_file, "wb") as output:
+        output.write(_FILE_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, kind, flags, len(entries)))
+        for entry in entries:
+            name = entry["name"].encode("utf-8")
+            sparse_weights = entry.get("sparse")
+            if sparse_weights is None:
+                weights = np.ascontiguousarray(entry["weights"], dtype="<f4")
+                weights = weights.reshape(len(weights), len(entry["influences"]))
+                if sparse:
+                    sparse_weights = skin_weights.SparseSkinWeights.from_dense(
+                        weights, entry["influences"]
+                    )
+                row_count = len(weights)
+            else:
+                row_count = sparse_weights.num_points
+                if not sparse:
+                    weights = sparse_weights.to_dense(np.dtype("<f4"))
+            output.write(
+                _OBJECT_HEADER.pack(
+                    len(name), entry["vertex_count"], row_count, len(entry["influences"])
+                )
+            )
+            output.write(name)
+            for influence in entry["influences"]:
+                influence = influence.encode("utf-8")
+                output.write(_NAME_LENGTH.pack(len(influence)))
+                output.write(influence)
+            output.write(b"\0" * (-output.tell() % 4))
+
+            if kind == KIND_VERTICES:
+                output.write(np.asarray(entry["vertex_ids"], dtype="<i4").tobytes())
+            if flags & FLAG_SOFT_SELECTION:
+                soft_weights = entry.get("soft_weights")
+                if soft_weights is None:
+                    soft_weights = np.ones(row_count)
+                output.write(np.asarray(soft_weights, dtype="<f4").tobytes())
+            if sparse:
+                output.write(sparse_weights.indptr.astype("<i4").tobytes())
+                output.write(sparse_weights.indices.astype("<i4").tobytes())
+                output.write(sparse_weights.values.astype("<f4").tobytes())
+            else:
+                output.write(weights.tobytes())
+
+
+def read_binary_weights(input_file):
+    """Read a binary bSkinSaver file through a memory map.
+
+    The weight, vertex id and soft selection arrays are read-only views on
+    the mapped file, so only the pages that are actually used get loaded.
+    Sparse blocks are returned as a ``sparse`` container and expanded to a
+    dense ``weights`` array, which is what the loaders apply.
+
+    Args:
+        input_file (str): Path to the weight file.
+
+    Returns:
+        tuple: (kind, entries) with entries in the
+            :func:`write_binary_weights` layout; ``vertex_ids`` and
+            ``soft_weights`` are None when absent, ``sparse`` is None for
+            dense files.
+
+    Raises:
+        ValueError: If the file is not a supported binary bSkinSaver file.
+    """
+    data = np.memmap(input_file, dtype=np.uint8, mode="r")
+    magic, version, kind, flags, object_count = _FILE_HEADER.unpack_from(data, 0)
+    if magic != BINARY_MAGIC or version > BINARY_VERSION:
+        raise ValueError(f"{input_file} is not a supported binary weights file")
+
+    offset = _FILE_HEADER.size
+    entries = []
+    for _ in range(object_count):
+        name_length, vertex_count, row_count, inf_count = _OBJECT_HEADER.unpack_from(data, offset)
+        offset += _OBJECT_HEADER.size
+        name = bytes(data[offset : offset + name_length]).decode("utf-8")
+        offset += name_length
+
+        influences = []
+        for _ in range(inf_count):
+            (length,) = _NAME_LENGTH.unpack_from(data, offset)
+            offset += _NAME_LENGTH.size
+            influences.append(bytes(data[offset : offset + length]).decode("utf-8"))
+            offset += length
+        offset += -offset % 4
+
+        entry = {
+            "name": name,
+            "vertex_count": vertex_count,
+            "influences": influences,
+            "vertex_ids": None,
+            "soft_weights": None,
+            "sparse": None,
+        }
+        if kind == KIND_VERTICES:
+            entry["vertex_ids"] = np.frombuffer(data, dtype="<i4", count=row_count, offset=offset)
+            offset += 4 * row_count
+        if flags & FLAG_SOFT_SELECTION:
+            entry["soft_weights"] = np.frombuffer(data, dtype="<f4", count=row_count, offset=offset)
+            offset += 4 * row_count
+        if flags & FLAG_SPARSE:
+            indptr = np.frombuffer(data, dtype="<i4", count=row_count + 1, offset=offset)
+            offset += 4 * (row_count + 1)
+            nnz = int(indptr[-1])
+            indices = np.frombuffer(data, dtype="<i4", count=nnz, offset=offset)
+            offset += 4 * nnz
+            values = np.frombuffer(data, dtype="<f4", count=nnz, offset=offset)
+            offset += 4 * nnz
+            entry["sparse"] = skin_weights.SparseSkinWeights(influences, indptr, indices, values)
+            entry["weights"] = entry["sparse"].to_dense(np.float32)
+        else:
+            entry["weights"] = np.frombuffer(
+                data, dtype="<f4", count=row_count * inf_count, offset=offset
+            ).reshape(row_count, inf_count)
+            offset += 4 * row_count * inf_count
+        entries.append(entry)
+
+    return kind, entries
+
+
+def format_weight_line(weights):
+    """Format one row of weights for the text bSkinSaver layout.
+
+    Args:
+        weights (list): Weight values of one vertex.
+
+    Returns:
+        str: Space-separated weights, with zeros written as "0".
+    """
+    return " ".join(["0" if x == 0 else str(x) for x in weights])
+
+
+def read_text_object_weights(input_file):
+    """Read a text bSkinSaver object file one object at a time.
+
+    Args:
+        input_file (str): Path to the weight file.
+
+    Yields:
+        dict: Entry in the :func:`write_binary_weights` layout for every
+            object in the file.
+    """
+    with open(input_file, encoding="utf-8") as input_stream:
+        while True:
+            object_name = input_stream.readline()
+            if not object_name:
+                return
+            if not object_name.strip():
+                continue
+
+            joints = []
+            for raw_line in input_stream:
+                line = raw_line.strip()
+                if line.startswith("============"):
+                    break
+                joints.append(line)
+
+            weight_lines = []
+            for raw_line in input_stream:
+                line = raw_line.strip()
+                if not line:
+                    break
+                weight_lines.append(line)
+
+            weights = parse_weight_lines(weight_lines, len(joints))
+            yield {
+                "name": object_name.strip(),
+                "vertex_count": len(weights),
+                "influences": joints,
+                "weights": weights,
+            }
+
+
+def read_text_vertex_weights(input_file):
+    """Read a text bSkinSaver vertex file.
+
+    Args:
+        input_file (str): Path to the weight file.
+
+    Returns:
+        dict: Entry in the :func:`write_binary_weights` layout (without a
+            ``name``).
+    """
+    file_joints = []
+    vert_ids = []
+    soft_weights = []
+    weight_lines = []
+
+    with open(input_file, encoding="utf-8") as input_stream:
+        vertex_count = int(input_stream.readline().strip())
+        for raw_line in input_stream:
+            line = raw_line.strip()
+            if line.startswith("========"):
+                break
+            file_joints.append(line)
+
+        for raw_line in input_stream:
+            line = raw_line.strip()
+            if not line:
+                break
+            splitted_strings = line.split(":")
+            vert_ids.append(splitted_strings[0])
+            if len(splitted_strings) == 3:
+                soft_weights.append(splitted_strings[1])
+            weight_lines.append(splitted_strings[-1])
+
+    return {
+        "vertex_count": vertex_count,
+        "influences": file_joints,
+        "vertex_ids": np.array(vert_ids, dtype=np.int32),
+        "soft_weights": np.array(soft_weights, dtype=np.float64) if soft_weights else None,
+        "weights": parse_weight_lines(weight_lines, len(file_joints)),
+    }
+
+
 def b_find_skin_cluster(object_name, b_skin_path=None):
     """Find skin cluster connected to a deformed object.
 
@@ -159,8 +439,9 @@ def b_find_skin_cluster(object_name, b_skin_path=None):
 def b_load_vertex_skin_values(input_file, ignore_joint_locks):
     """Load vertex-level skin weights from a file to selected object.
 
-    Reads skin weight data from a formatted file and applies it to vertices
-    of the selected mesh, handling joint locks and soft selection.
+    Reads skin weight data from a text or binary weight file and applies it
+    to vertices of the selected mesh, handling joint locks and soft
+    selection.
 
     Args:
         input_file (str): Path to the weight file.
@@ -168,12 +449,7 @@ def b_load_vertex_skin_values(input_file, ignore_joint_locks):
     """
     time_before = time.time()
 
-    line = ""
-    file_joints = []
-    splitted_strings = []
-    splitted_weights = []
     selection_list = OpenMaya.MSelectionList()
-    vertex_count = 0
 
     OpenMaya.MGlobal.getActiveSelectionList(selection_list)
     node = OpenMaya.MDagPath()
@@ -195,77 +471,32 @@ def b_load_vertex_skin_values(input_file, ignore_joint_locks):
 
     fn_skin_cluster = OpenMayaAnim.MFnSkinCluster(skin_cluster)
 
-    file_position = 0
-
-    # getting the weightLines
+    # reading the file
     #
-    file_weight_floats = []
-    fn_vtx_comp = OpenMaya.MFnSingleIndexedComponent()
-    vtx_components = OpenMaya.MObject()
-    vtx_components = fn_vtx_comp.create(OpenMaya.MFn.kMeshVertComponent)
+    if is_binary_weights_file(input_file):
+        entry = read_binary_weights(input_file)[1][0]
+    else:
+        entry = read_text_vertex_weights(input_file)
 
-    bind_vert_count = 0
-    did_check_soft_selection = False
-    do_soft_selection = False
-    soft_weights = []
-    weights_index = 1
+    if OpenMaya.MItGeometry(node).count() != entry["vertex_count"]:
+        print("vertex counts don't match!")
+        return
 
-    with open(input_file, encoding="utf-8") as input_stream:
-        while True:
-            raw_line = input_stream.readline()
-            if not raw_line:
-                break
-            line = raw_line.strip()
-            if not line:
-                break
+    file_joints = entry["influences"]
+    vert_ids = entry["vertex_ids"]
+    soft_weights = entry["soft_weights"]
+    file_weights = np.asarray(entry["weights"], dtype=np.float64)
+    bind_vert_count = len(vert_ids)
 
-            if file_position == 0:
-                vertex_count = int(line)
-                if OpenMaya.MItGeometry(node).count() != vertex_count:
-                    print("vertex counts don't match!")
-                    return
-                file_position = 1
-
-            elif file_position == 1:
-                if not line.startswith("========"):
-                    file_joints.append(line)
-                else:
-                    file_position = 2
-
-            elif file_position == 2:
-                splitted_strings = line.split(":")
-
-                # do we have softselection?
-                if not did_check_soft_selection:
-                    if len(splitted_strings) == 3:
-                        weights_index = 2
-                        do_soft_selection = True
-                        soft_weights = [1.0] * bind_vert_count
-                    else:
-                        weights_index = 1
-                        do_soft_selection = False
-                    did_check_soft_selection = True
-
-                # vertId
-                vert_id = int(splitted_strings[0])
-                fn_vtx_comp.addElement(vert_id)
-
-                # softselection
-                if do_soft_selection:
-                    soft_weights.append(float(splitted_strings[1]))
-
-                # weights
-                splitted_weights = splitted_strings[weights_index].split(" ")
-                file_weight_floats.append(list(map(float, splitted_weights)))
-
-                bind_vert_count += 1
+    fn_vtx_comp = OpenMaya.MFnSingleIndexedComponent()
+    vtx_components = fn_vtx_comp.create(OpenMaya.MFn.kMeshVertComponent)
+    for vert_id in vert_ids.tolist():
+        fn_vtx_comp.addElement(vert_id)
 
     b_skin_path = OpenMaya.MDagPath()
     fn_skin_cluster.getPathAtIndex(0, b_skin_path)
 
-    # print('file_weight_floats: ', file_weight_floats)
-
-    # getting mayaJoints
+    # getting mayaJoints and old weights
     #
     influence_array = OpenMaya.MDagPathArray()
     maya_joints = []
@@ -274,12 +505,7 @@ def b_load_vertex_skin_values(input_file, ignore_joint_locks):
     for i in range(inf_count):
         maya_joints.append(OpenMaya.MFnDagNode(influence_array[i]).name().split("|")[-1])
 
-        # getting old weights
-    #
-    old_weight_doubles = OpenMaya.MDoubleArray()
-    script_util = OpenMaya.MScriptUtil()
-    inf_count_ptr = script_util.asUintPtr()
-    fn_skin_cluster.getWeights(b_skin_path, vtx_components, old_weight_doubles, inf_count_ptr)
+    old_weights = skin_weights.get_weight_matrix(fn_skin_cluster.name(), vert_ids)[1]
 
     # making allJoints
     #
@@ -290,103 +516,43 @@ def b_load_vertex_skin_values(input_file, ignore_joint_locks):
 
     # mapping joints and making sure we have all joints in the skinCluster
     #
-    all_influences_in_scene = True
-    missing_influences_list = []
-    for i in range(len(file_joints)):
-        influence_in_scene = False
-        for k in range(len(maya_joints)):
-            if maya_joints[k] == file_joints[i]:
-                influence_in_scene = True
-
-        if not influence_in_scene:
-            all_influences_in_scene = False
-            missing_influences_list.append(file_joints[i])
-
-    if not all_influences_in_scene:
+    maya_joint_index = {joint: k for k, joint in enumerate(maya_joints)}
+    missing_influences_list = [joint for joint in file_joints if joint not in maya_joint_index]
+
+    if missing_influences_list:
         print(("There are influences missing:", missing_influences_list))
         return
 
-    # getting allExistInMaya
-    #
-    all_exist_in_maya = [-1] * len(all_joints)
-    for i in range(len(all_joints)):
-        for k in range(len(maya_joints)):
-            if all_joints[i] == maya_joints[k]:
-                all_exist_in_maya[i] = k
-                break
-
-    # print('all_exist_in_maya: ', all_exist_in_maya)
+    all_exist_in_maya = [maya_joint_index[joint] for joint in all_joints]
 
     # getting joint locks
     #
-    all_locks = [False] * len(all_joints)
+    all_locks = np.zeros(len(all_joints), dtype=bool)
     if not ignore_joint_locks:
         for i in range(len(all_joints)):
             all_locks[i] = cmds.getAttr(f"{all_joints[i]}.liw")
 
-    weight_doubles = OpenMaya.MDoubleArray(0)
-
-    # copy weights from file_weight_floats and old_weight_doubles into weight_doubles (include joint locks) and soft_weights lists
+    # file weights for unlocked joints, old weights for locked ones
     #
     print(("bind_vert_count: ", bind_vert_count))
-    for i in range(bind_vert_count):
-        for k in range(len(all_joints)):
-            # file_joints:
-            #
-            if k < len(file_joints):
-                if not all_locks[k]:
-                    weight_doubles.append(
-                        file_weight_floats[i][k]
-                    )  # weight_doubles[k + len(all_joints) * i] = file_weight_floats[i][k]
-                else:
-                    if all_exist_in_maya[k]:
-                        weight_doubles.append(
-                            old_weight_doubles[all_exist_in_maya[k] + len(maya_joints) * i]
-                        )
-                    else:
-                        weight_doubles.append(0)
-
-            # maya_joints
-            #
-            else:
-                if not all_locks[k]:
-                    weight_doubles.append(0)
-                else:
-                    if all_exist_in_maya[k]:
-                        weight_doubles.append(
-                            old_weight_doubles[all_exist_in_maya[k] + len(maya_joints) * i]
-                        )
-                    else:
-                        weight_doubles.append(0)
+    old_all_joints = old_weights[:, all_exist_in_maya]
+    new_weights = np.zeros((bind_vert_count, len(all_joints)))
+    new_weights[:, : len(file_joints)] = file_weights
+    new_weights[:, all_locks] = old_all_joints[:, all_locks]
 
     # normalize
     #
-    for i in range(bind_vert_count):
-        sum_a = 0
-        sum_b = 0
-        for inf in range(len(all_joints)):
-            if not all_locks[inf]:
-                sum_a += weight_doubles[inf + i * len(all_joints)]
-            else:
-                sum_b += weight_doubles[inf + i * len(all_joints)]
-
-        if sum_a > 0.0001:
-            sum_a_denom = 1 / sum_a
-            for inf in range(len(all_joints)):
-                if not all_locks[inf]:
-                    weight_doubles[inf + i * len(all_joints)] *= sum_a_denom * (1 - sum_b)
+    sum_a = new_weights[:, ~all_locks].sum(axis=1)
+    sum_b = new_weights[:, all_locks].sum(axis=1)
+    scale = np.ones(bind_vert_count)
+    np.divide(1.0 - sum_b, sum_a, out=scale, where=sum_a > 0.0001)
+    new_weights[:, ~all_locks] *= scale[:, np.newaxis]
 
     # soft selection
     #
-    if do_soft_selection:
-        for i in range(bind_vert_count):
-            for inf in range(len(all_exist_in_maya)):
-                index = inf + i * len(all_exist_in_maya)
-                old_weights = old_weight_doubles[all_exist_in_maya[inf] + len(maya_joints) * i]
-
-                weight_doubles[index] = weight_doubles[index] * soft_weights[i] + old_weights * (
-                    1.0 - soft_weights[i]
-                )
+    if soft_weights is not None:
+        soft = np.asarray(soft_weights, dtype=np.float64)[:, np.newaxis]
+        new_weights = new_weights * soft + old_all_joints * (1.0 - soft)
 
     # SET WEIGHTS
     #
@@ -394,12 +560,8 @@ def b_load_vertex_skin_values(input_file, ignore_joint_locks):
     for i in range(len(all_exist_in_maya)):
         all_joints_indices[i] = all_exist_in_maya[i]
 
-    # print 'maya_joints: ', maya_joints
-    # print 'all_joints_indices: ', all_joints_indices
-    # print 'all_joints: ', all_joints
-    # print 'weight_doubles before: ', weight_doubles
-
     print("setting weights...")
+    weight_doubles = to_m_double_array(new_weights)
     fn_skin_cluster.setWeights(b_skin_path, vtx_components, all_joints_indices, weight_doubles, 0)
 
     # select the vertices
@@ -438,20 +600,24 @@ def vertex_to_id_list(verts):
     return vert_ids
 
 
-def b_save_vertex_skin_values(input_file, ignore_soft_selection):
+def b_save_vertex_skin_values(input_file, ignore_soft_selection, binary=False):
     """Save vertex-level skin weights from selected vertices to file.
 
-    Exports skin weight data for selected vertices to a formatted text file,
-    optionally including soft selection weights.
+    Exports skin weight data for selected vertices, optionally including
+    soft selection weights. Only influences that carry weight on the
+    selection are written.
 
     Args:
         input_file (str): Path to save weight file to.
         ignore_soft_selection (bool): If False, save soft selection weights.
+        binary (bool): Write the binary layout instead of the text layout
+            (which stays available for diffing).
     """
     time_before = time.time()
 
     print("saving Vertex skinWeights.. ")
 
+    soft_weights = None
     if not ignore_soft_selection:
         verts, soft_weights = get_soft_selection()
     else:
@@ -473,196 +639,208 @@ def b_save_vertex_skin_values(input_file, ignore_soft_selection):
         print("no skinCluster found on selected vertices")
         return
 
-    with open(input_file, "w", encoding="utf-8") as output:
-        output.write(str(OpenMaya.MItGeometry(dag_path).count()) + "\n")
+    _influences, weights, _blend_weights = skin_weights.get_weight_matrix(
+        fn_skin_cluster.name(), vert_ids
+    )
+    used_influences = np.flatnonzero(weights.any(axis=0))
 
-        fn_vtx_comp = OpenMaya.MFnSingleIndexedComponent()
-        vtx_components = OpenMaya.MObject()
-        vtx_components = fn_vtx_comp.create(OpenMaya.MFn.kMeshVertComponent)
+    # joints.. (full DAG node names, as the loader matches them against the skinCluster)
+    influents_array = OpenMaya.MDagPathArray()
+    fn_skin_cluster.influenceObjects(influents_array)
+    entry = {
+        "name": OpenMaya.MFnDagNode(dag_path).name(),
+        "vertex_count": OpenMaya.MItGeometry(dag_path).count(),
+        "influences": [OpenMaya.MFnDagNode(influents_array[i]).name() for i in used_influences],
+        "vertex_ids": vert_ids,
+        "soft_weights": soft_weights,
+        "weights": weights[:, used_influences],
+    }
+
+    if binary:
+        write_binary_weights(input_file, [entry], KIND_VERTICES)
+    else:
+        with open(input_file, "w", encoding="utf-8") as output:
+            output.write(str(entry["vertex_count"]) + "\n")
+            for influence in entry["influences"]:
+                output.write(influence + "\n")
 
-        weight_array = OpenMaya.MFloatArray()
-        mesh_iter = OpenMaya.MItMeshVertex(dag_path, component)
-        # while not mesh_iter.isDone():
-        for vert_id in vert_ids:
-            fn_vtx_comp.addElement(vert_id)
-            # mesh_iter.next()
-
-        vertex_count = mesh_iter.count()
-        script_util = OpenMaya.MScriptUtil()
-        inf_count_ptr = script_util.asUintPtr()
-        fn_skin_cluster.getWeights(dag_path, vtx_components, weight_array, inf_count_ptr)
-        inf_count = OpenMaya.MScriptUtil.getUint(inf_count_ptr)
-
-        weight_check_array = []
-        for _i in range(inf_count):
-            weight_check_array.append(False)
-
-        for i in range(vertex_count):
-            for k in range(inf_count):
-                if not weight_check_array[k] and weight_array[((i * inf_count) + k)]:
-                    weight_check_array[k] = True
-
-        # joints..
-        influents_array = OpenMaya.MDagPathArray()
-        fn_skin_cluster.influenceObjects(influents_array)
-        for i in range(inf_count):
-            if weight_check_array[i]:
-                output.write(OpenMaya.MFnDagNode(influents_array[i]).name() + "\n")
-
-        output.write("============\n")
-
-        weight_array_string = []
-        for i in range(len(vert_ids)):
-            vert_id = vert_ids[i]
-            soft_weight = ""
-            if not ignore_soft_selection:
-                soft_weight = f"{soft_weights[i]:f}:"
-
-            weights_string = " ".join(
-                [
-                    "0" if x == 0 else str(x)
-                    for n, x in enumerate(weight_array[i * inf_count : (i + 1) * inf_count])
-                    if weight_check_array[n]
-                ]
-            )
-            weight_array_string = f"{vert_id}:{soft_weight}{weights_string}"
+            output.write("============\n")
 
-            output.write(weight_array_string + "\n")
-            next(mesh_iter)
+            for i, row in enumerate(entry["weights"].tolist()):
+                soft_weight = ""
+                if soft_weights is not None:
+                    soft_weight = f"{soft_weights[i]:f}:"
+                output.write(f"{vert_ids[i]}:{soft_weight}{format_weight_line(row)}\n")
 
     print(("done, it took", (time.time() - time_before), " seconds"))
 
 
-def b_save_skin_values(input_file):
+def b_save_skin_values(input_file, max_influences=None, threshold=0.0, binary=False):
     """Save all skin weights from selected objects to file.
 
-    Exports skin weight data for all vertices of selected mesh objects
-    to a formatted text file.
+    Exports skin weight data for all vertices of selected mesh objects.
+    Weights are read in bulk into a sparse container, optionally pruned,
+    and influences that carry no weight are left out of the file.
+
+    The binary layout stores the sparse container as CSR blocks. The text
+    layout stays dense, one weight per influence on every line, because it
+    is the original bSkinSaver format that other bSkinSaver versions and
+    diff tools read; the dense rows are only built for it.
 
     Args:
         input_file (str): Path to save weight file to.
+        max_influences (int | None): Maximum influences kept per vertex.
+            None keeps all of them.
+        threshold (float): Weights less than or equal to this value are
+            dropped. Vertices are renormalized when pruning removes weights.
+        binary (bool): Write the binary layout instead of the text layout
+            (which stays available for diffing).
     """
     time_before = time.time()
 
-    with open(input_file, "w", encoding="utf-8") as output:
-        selection = OpenMaya.MSelectionList()
-        OpenMaya.MGlobal.getActiveSelectionList(selection)
+    entries = []
+    selection = OpenMaya.MSelectionList()
+    OpenMaya.MGlobal.getActiveSelectionList(selection)
 
-        iterate = OpenMaya.MItSelectionList(selection)
+    iterate = OpenMaya.MItSelectionList(selection)
 
-        while not iterate.isDone():
-            node = OpenMaya.MDagPath()
-            component = OpenMaya.MObject()
-            iterate.getDagPath(node, component)
-            if not node.hasFn(OpenMaya.MFn.kTransform):
-                print(
-                    OpenMaya.MFnDagNode(node).name()
-                    + " is not a Transform node (need to select transform node of polyMesh)"
-                )
-            else:
-                object_name = OpenMaya.MFnDagNode(node).name()
-                new_transform = OpenMaya.MFnTransform(node)
-                for child_index in range(new_transform.childCount()):
-                    child_object = new_transform.child(child_index)
-                    if (
-                        child_object.hasFn(OpenMaya.MFn.kMesh)
-                        or child_object.hasFn(OpenMaya.MFn.kNurbsSurface)
-                        or child_object.hasFn(OpenMaya.MFn.kCurve)
-                    ):
-                        skin_cluster = b_find_skin_cluster(
-                            OpenMaya.MFnDagNode(child_object).partialPathName()
+    while not iterate.isDone():
+        node = OpenMaya.MDagPath()
+        component = OpenMaya.MObject()
+        iterate.getDagPath(node, component)
+        if not node.hasFn(OpenMaya.MFn.kTransform):
+            print(
+                OpenMaya.MFnDagNode(node).name()
+                + " is not a Transform node (need to select transform node of polyMesh)"
+            )
+        else:
+            object_name = OpenMaya.MFnDagNode(node).name()
+            new_transform = OpenMaya.MFnTransform(node)
+            for child_index in range(new_transform.childCount()):
+                child_object = new_transform.child(child_index)
+                if (
+                    child_object.hasFn(OpenMaya.MFn.kMesh)
+                    or child_object.hasFn(OpenMaya.MFn.kNurbsSurface)
+                    or child_object.hasFn(OpenMaya.MFn.kCurve)
+                ):
+                    skin_cluster = b_find_skin_cluster(
+                        OpenMaya.MFnDagNode(child_object).partialPathName()
+                    )
+                    if skin_cluster is not False:
+                        fn_skin_cluster = OpenMayaAnim.MFnSkinCluster(skin_cluster)
+                        sparse = skin_weights.read_sparse_weights(
+                            fn_skin_cluster.name(), max_influences, threshold
+                        ).compact()
+                        entries.append(
+                            {
+                                "name": object_name,
+                                "vertex_count": sparse.num_points,
+                                "influences": sparse.influences,
+                                "sparse": sparse,
+                            }
                         )
-                        if skin_cluster is not False:
-                            b_skin_path = OpenMaya.MDagPath()
-                            fn_skin_cluster = OpenMayaAnim.MFnSkinCluster(skin_cluster)
-                            fn_skin_cluster.getPathAtIndex(0, b_skin_path)
-                            influence_array = OpenMaya.MDagPathArray()
-                            fn_skin_cluster.influenceObjects(influence_array)
-                            influents_count = influence_array.length()
-                            output.write(object_name + "\n")
-
-                            for k in range(influents_count):
-                                joint_tokens = str(influence_array[k].fullPathName()).split("|")
-                                joint_tokens = joint_tokens[len(joint_tokens) - 1].split(":")
-                                output.write(joint_tokens[len(joint_tokens) - 1] + "\n")
-
-                            output.write("============\n")
-
-                            fn_vtx_comp = OpenMaya.MFnSingleIndexedComponent()
-                            vtx_components = OpenMaya.MObject()
-                            vtx_components = fn_vtx_comp.create(OpenMaya.MFn.kMeshVertComponent)
-
-                            vertex_count = OpenMaya.MFnMesh(b_skin_path).numVertices()
-                            for i in range(vertex_count):
-                                fn_vtx_comp.addElement(i)
-
-                            weight_array = OpenMaya.MFloatArray()
-                            script_util = OpenMaya.MScriptUtil()
-                            inf_count_ptr = script_util.asUintPtr()
-                            fn_skin_cluster.getWeights(
-                                b_skin_path, vtx_components, weight_array, inf_count_ptr
-                            )
-                            inf_count = OpenMaya.MScriptUtil.getUint(inf_count_ptr)
-
-                            for i in range(vertex_count):
-                                # save_string = ' '.join(map(str,weight_array[i*inf_count : (i+1)*inf_count]))
-                                save_string = " ".join(
-                                    [
-                                        "0" if x == 0 else str(x)
-                                        for n, x in enumerate(
-                                            weight_array[i * inf_count : (i + 1) * inf_count]
-                                        )
-                                    ]
-                                )
-
-                                output.write(save_string + "\n")
-
-                            output.write("\n")
-
-            next(iterate)
+
+        next(iterate)
+
+    if binary:
+        write_binary_weights(input_file, entries, KIND_OBJECTS, sparse=True)
+    else:
+        with open(input_file, "w", encoding="utf-8") as output:
+            for entry in entries:
+                output.write(entry["name"] + "\n")
+
+                for influence in entry["influences"]:
+                    output.write(influence + "\n")
+
+                output.write("============\n")
+
+                for row in entry["sparse"].to_dense().tolist():
+                    output.write(format_weight_line(row) + "\n")
+
+                output.write("\n")
 
     print(("done saving weights, it took ", (time.time() - time_before), " seconds."))
 
 
-def b_skin_object(object_name, file_joints, weights):
+def parse_weight_lines(weight_lines, joint_count):
+    """Parse bSkinSaver weight lines into a weight matrix in one pass.
+
+    Args:
+        weight_lines (list): One space-separated weight string per vertex.
+        joint_count (int): Number of joints (columns) per line.
+
+    Returns:
+        numpy.ndarray: float64 ``(vertices, joint_count)`` array.
+    """
+    if not joint_count:
+        return np.zeros((len(weight_lines), 0))
+    return np.array(" ".join(weight_lines).split(), dtype=np.float64).reshape(-1, joint_count)
+
+
+def to_m_double_array(array):
+    """Convert a NumPy array to an OpenMaya 1.0 ``MDoubleArray`` in bulk.
+
+    Args:
+        array (numpy.ndarray): Array of any shape; flattened in C order.
+
+    Returns:
+        MDoubleArray: Array holding a copy of the values.
+    """
+    values = np.ascontiguousarray(array, dtype=np.float64).ravel().tolist()
+    script_util = OpenMaya.MScriptUtil()
+    script_util.createFromList(values, len(values))
+    return OpenMaya.MDoubleArray(script_util.asDoublePtr(), len(values))
+
+
+def build_scene_joint_index():
+    """Index every joint in the scene by its short, namespace-stripped name.
+
+    Built once per load and shared by all objects of a batch, so joint
+    lookups are dictionary hits instead of scene scans. When several joints
+    share a short name, the first one found wins.
+
+    Returns:
+        dict: ``{short_name: MDagPath}``.
+    """
+    joint_index = {}
+    it = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kJoint)
+    while not it.isDone():
+        dag_path = OpenMaya.MDagPath()
+        OpenMaya.MDagPath.getAPathTo(it.item(), dag_path)
+        joint_index.setdefault(skin_weights.strip_influence_name(dag_path.fullPathName()), dag_path)
+        next(it)
+    return joint_index
+
+
+def b_skin_object(object_name, file_joints, weights, joint_index=None):
     """Apply skin weights to object from file data.
 
     Creates or updates a skin cluster on the specified object and applies
-    weight data from a saved file.
+    weight data from a saved file. File joints are matched to scene joints
+    and skinCluster influences by namespace-stripped short name.
 
     Args:
         object_name (str): Name of the mesh object to apply weights to.
         file_joints (list): List of joint names from the weight file.
-        weights (list): List of weight strings for each vertex.
+        weights (list | numpy.ndarray): List of weight strings for each
+            vertex, or an already parsed ``(vertices, joints)`` array.
+        joint_index (dict | None): Scene joint index from
+            :func:`build_scene_joint_index`. Built on the fly if None.
     """
     if not cmds.objExists(object_name):
         print((object_name, " doesn't exist - skipping. "))
         return
 
-    it = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kJoint)
+    if joint_index is None:
+        joint_index = build_scene_joint_index()
 
     # quick check if all the joints are in scene
     #
-    all_influences_in_scene = True
-    scene_joint_tokens = []
-
-    for joint_index in range(len(file_joints)):
-        joint_here = False
-        it = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kJoint)
-        while not it.isDone():
-            scene_joint_tokens = str(OpenMaya.MFnDagNode(it.item()).fullPathName()).split("|")
-            if str(file_joints[joint_index]) == str(
-                scene_joint_tokens[len(scene_joint_tokens) - 1]
-            ):
-                joint_here = True
-
-            next(it)
-
-        if not joint_here:
-            all_influences_in_scene = False
-            print(("missing influence: ", file_joints[joint_index]))
-
-    if not all_influences_in_scene:
+    missing_influences = [joint for joint in file_joints if joint not in joint_index]
+    for joint in missing_influences:
+        print(("missing influence: ", joint))
+
+    if missing_influences:
         print((object_name, " can't be skinned because of missing influences."))
         return
 
@@ -680,38 +858,26 @@ def b_skin_object(object_name, file_joints, weights):
         influents_array = OpenMaya.MDagPathArray()
         inf_count = fn_skin_cluster.influenceObjects(influents_array)
 
-        influence_string_array = []
+        influence_index = {}
         for i in range(inf_count):
-            influence_string_array.append(OpenMaya.MFnDagNode(influents_array[i]).name())
+            influence_name = skin_weights.strip_influence_name(influents_array[i].fullPathName())
+            influence_index.setdefault(influence_name, i)
 
-        all_joints_here = True
-        for joint in file_joints:
-            if joint not in influence_string_array:
-                print(("missing a joint (", joint, ", ..)"))
-                all_joints_here = False
-                break
+        missing_joints = [joint for joint in file_joints if joint not in influence_index]
+        all_joints_here = not missing_joints
 
         if not all_joints_here:
+            print(("missing a joint (", missing_joints[0], ", ..)"))
             mel.eval("DetachSkin " + object_name)
         else:
-            object_found_joints_in_file = [False] * len(influence_string_array)
-
-            for i in range(len(file_joints)):
-                for k in range(len(influence_string_array)):
-                    if file_joints[i] == influence_string_array[k]:
-                        file_joints_map_array[i] = k
-                        object_found_joints_in_file[k] = True
-
-            for i in range(len(influence_string_array)):
-                if not object_found_joints_in_file[i]:
-                    object_empty_joints.append(i)
-
-            # print 'joint_map_array: ', file_joints_map_array
+            file_joints_map_array = [influence_index[joint] for joint in file_joints]
+            mapped_joints = set(file_joints_map_array)
+            object_empty_joints = [i for i in range(inf_count) if i not in mapped_joints]
 
     if not all_joints_here:
         cmd = "select "
-        for i in range(len(file_joints)):
-            cmd += " " + file_joints[i]
+        for joint in file_joints:
+            cmd += " " + joint_index[joint].fullPathName()
 
         cmd += " " + object_name
         mel.eval(cmd)
@@ -730,11 +896,6 @@ def b_skin_object(object_name, file_joints, weights):
     b_skin_path = OpenMaya.MDagPath()
     fn_skin_cluster.getPathAtIndex(fn_skin_cluster.indexForOutputConnection(0), b_skin_path)
 
-    weight_strings = []
-    vertex_iter = OpenMaya.MItGeometry(b_skin_path)
-
-    weight_doubles = OpenMaya.MDoubleArray()
-
     single_indexed = True
     vtx_components = OpenMaya.MObject()
     fn_vtx_comp = OpenMaya.MFnSingleIndexedComponent()
@@ -748,12 +909,12 @@ def b_skin_object(object_name, file_joints, weights):
     elif b_skin_path.node().apiType() == OpenMaya.MFn.kNurbsCurve:
         vtx_components = fn_vtx_comp.create(OpenMaya.MFn.kCurveCVComponent)
 
-    # nurbs curves..
+    # all points, in the same order the weights were saved
     #
-    counter_value = 0
-    current_u = 0
-    current_v = 0
-    if not single_indexed:
+    vertex_count = OpenMaya.MItGeometry(b_skin_path).count()
+    if single_indexed:
+        fn_vtx_comp.setCompleteData(vertex_count)
+    else:
         cvs_u = OpenMaya.MFnNurbsSurface(b_skin_path.node()).numCVsInU()
         cvs_v = OpenMaya.MFnNurbsSurface(b_skin_path.node()).numCVsInV()
         form_u = OpenMaya.MFnNurbsSurface(b_skin_path.node()).formInU()
@@ -764,28 +925,21 @@ def b_skin_object(object_name, file_joints, weights):
         if form_v == 3:
             cvs_v -= 3
 
-    # go through all vertices and append to the weight_doubles array
-    #
-    vertex_iter = OpenMaya.MItGeometry(b_skin_path)
-    while not vertex_iter.isDone():
-        weight_strings = []
-        if single_indexed:
-            fn_vtx_comp.addElement(counter_value)
-        else:
-            fn_vtx_comp_double.addElement(current_u, current_v)
-            current_v += 1
-            if current_v >= cvs_v:
-                current_v = 0
-                current_u += 1
-
-        weight_strings = weights[counter_value].split(" ")
-        for i in range(len(weight_strings)):
-            weight_doubles.append(float(weight_strings[i]))
-        for _i in range(len(object_empty_joints)):
-            weight_doubles.append(0)
+        for current_u in range(cvs_u):
+            for current_v in range(cvs_v):
+                fn_vtx_comp_double.addElement(current_u, current_v)
 
-        counter_value += 1
-        next(vertex_iter)
+    # parse all weight lines at once and pad the joints missing from the file
+    #
+    if isinstance(weights, np.ndarray):
+        file_weights = np.asarray(weights, dtype=np.float64)[:vertex_count]
+    else:
+        file_weights = parse_weight_lines(weights, len(file_joints))[:vertex_count]
+    if object_empty_joints:
+        file_weights = np.hstack(
+            [file_weights, np.zeros((len(file_weights), len(object_empty_joints)))]
+        )
+    weight_doubles = to_m_double_array(file_weights)
 
     # createing the influence Array
     #
@@ -806,8 +960,8 @@ def b_skin_object(object_name, file_joints, weights):
 def b_load_skin_values(load_on_selection, input_file):
     """Load skin weights from file and apply to objects.
 
-    Reads a skin weight file and applies weights to mesh objects.
-    Can load to selected object or all objects in the file.
+    Reads a text or binary skin weight file and applies weights to mesh
+    objects. Can load to selected object or all objects in the file.
 
     Args:
         load_on_selection (bool): If True, apply weights only to selected object.
@@ -815,8 +969,6 @@ def b_load_skin_values(load_on_selection, input_file):
     """
     time_before = time.time()
 
-    joints = []
-    weights = []
     polygon_object = ""
 
     if load_on_selection:
@@ -837,42 +989,22 @@ def b_load_skin_values(load_on_selection, input_file):
         print("You need to select a polygon object")
         return
 
-    with open(input_file, encoding="utf-8") as input_stream:
-        file_position = 0
-        while True:
-            line = input_stream.readline()
-            if not line:
-                break
+    if is_binary_weights_file(input_file):
+        entries = read_binary_weights(input_file)[1]
+    else:
+        entries = read_text_object_weights(input_file)
+
+    joint_index = build_scene_joint_index()
+    for entry in entries:
+        object_name = polygon_object if load_on_selection else entry["name"]
+        b_skin_object(object_name, entry["influences"], entry["weights"], joint_index)
+
+        if cmds.objExists(object_name):
+            mel.eval("select " + object_name)
+            mel.eval("refresh")
 
-            line = line.strip()
-
-            if file_position != 0:
-                if not line.startswith("============"):
-                    if file_position == 1:
-                        joints.append(line)
-                    elif file_position == 2:
-                        if len(line) > 0:
-                            weights.append(line)
-                        else:
-                            b_skin_object(polygon_object, joints, weights)
-                            polygon_object = ""
-                            joints = []
-                            weights = []
-                            file_position = 0
-                            if load_on_selection:
-                                break
-
-                else:  # it's ========
-                    file_position = 2
-
-            else:  # file_position == 0
-                if not load_on_selection:
-                    polygon_object = line
-                file_position = 1
-
-            if cmds.objExists(polygon_object):
-                mel.eval("select " + polygon_object)
-                mel.eval("refresh")
+        if load_on_selection:
+            break
 
     print(("done loading weights, it took ", (time.time() - time_before), " seconds."))
 
@@ -35,6 +35,8 @@ def pytest_configure(config):
         "maya.internal.nodes",
         "maya.internal.nodes.proximitywrap",
         "maya.internal.nodes.proximitywrap.node_interface",
+        "maya.OpenMaya",
+        "maya.OpenMayaMPx",
         "maya.OpenMayaUI",
         "pymel",
         "pymel.core",
@@ -49,6 +51,8 @@ def pytest_configure(config):
         "zBuilder.bundle.utils",
         "zBuilder.bundle.utils.vfxUtils",
         "vnnCompiler",
+        # Houdini
+        "hou",
     ]
 
     for module in maya_modules:
@@ -0,0 +1,156 @@
+"""Unit tests for the bSkinSaver text and binary weight file layouts.
+
+Covers the binary writer/memory-mapped reader and the text readers, which
+do not need a Maya session.
+"""
+
+import numpy as np
+import pytest
+
+from mayaLib.rigLib.utils.skin_weights import SparseSkinWeights
+from mayaLib.utility import b_skin_saver
+
+
+def _object_entry(name="body_geo", vertex_count=6, influences=("root", "spine")):
+    """Build an object weight entry."""
+    rng = np.random.default_rng(2)
+    weights = rng.random((vertex_count, len(influences)))
+    return {
+        "name": name,
+        "vertex_count": vertex_count,
+        "influences": list(influences),
+        "weights": weights / weights.sum(axis=1, keepdims=True),
+    }
+
+
+@pytest.mark.unit
+class TestBinaryWeights:
+    """Test suite for write_binary_weights / read_binary_weights."""
+
+    def test_object_round_trip(self, tmp_path):
+        """Object blocks survive the binary layout."""
+        entries = [_object_entry(), _object_entry("head_geo", 3, ("neck", "head", "jaw"))]
+        file_path = str(tmp_path / "body.swt")
+
+        b_skin_saver.write_binary_weights(file_path, entries)
+        kind, loaded = b_skin_saver.read_binary_weights(file_path)
+
+        assert b_skin_saver.is_binary_weights_file(file_path)
+        assert kind == b_skin_saver.KIND_OBJECTS
+        assert [e["name"] for e in loaded] == ["body_geo", "head_geo"]
+        assert loaded[1]["influences"] == ["neck", "head", "jaw"]
+        assert loaded[0]["vertex_ids"] is None
+        assert loaded[0]["soft_weights"] is None
+        for entry, result in zip(entries, loaded, strict=True):
+            assert result["weights"].dtype == np.float32
+            np.testing.assert_allclose(result["weights"], entry["weights"], atol=1e-6)
+
+    def test_vertex_round_trip_with_soft_selection(self, tmp_path):
+        """Vertex ids and soft selection weights are stored per block."""
+        entry = _object_entry(vertex_count=3)
+        entry["vertex_count"] = 100
+        entry["vertex_ids"] = [4, 17, 99]
+        entry["soft_weights"] = [1.0, 0.5, 0.25]
+        file_path = str(tmp_path / "verts.swt")
+
+        b_skin_saver.write_binary_weights(file_path, [entry], b_skin_saver.KIND_VERTICES)
+        kind, loaded = b_skin_saver.read_binary_weights(file_path)
+
+        assert kind == b_skin_saver.KIND_VERTICES
+        assert loaded[0]["vertex_count"] == 100
+        assert loaded[0]["vertex_ids"].tolist() == [4, 17, 99]
+        np.testing.assert_allclose(loaded[0]["soft_weights"], [1.0, 0.5, 0.25])
+        np.testing.assert_allclose(loaded[0]["weights"], entry["weights"], atol=1e-6)
+
+    def test_sparse_round_trip(self, tmp_path):
+        """Sparse blocks keep the CSR arrays and expand to the same weights."""
+        weights = np.zeros((4, 30))
+        weights[np.arange(4), [0, 7, 7, 29]] = 0.75
+        weights[np.arange(4), [1, 8, 9, 28]] = 0.25
+        influences = [f"joint{ii}" for ii in range(30)]
+        sparse = SparseSkinWeights.from_dense(weights, influences)
+        entries = [
+            {"name": "body_geo", "vertex_count": 4, "influences": influences, "sparse": sparse},
+            _object_entry("head_geo", 3),
+        ]
+        file_path = str(tmp_path / "body.swt")
+
+        b_skin_saver.write_binary_weights(file_path, entries, sparse=True)
+        kind, loaded = b_skin_saver.read_binary_weights(file_path)
+
+        assert kind == b_skin_saver.KIND_OBJECTS
+        np.testing.assert_array_equal(loaded[0]["sparse"].indptr, sparse.indptr)
+        np.testing.assert_array_equal(loaded[0]["sparse"].indices, sparse.indices)
+        np.testing.assert_allclose(loaded[0]["weights"], weights)
+        np.testing.assert_allclose(loaded[1]["weights"], entries[1]["weights"], atol=1e-6)
+
+    def test_sparse_file_is_smaller(self, tmp_path):
+        """Few influences per vertex out of many take far less space sparse."""
+        weights = np.zeros((100, 50))
+        weights[np.arange(100), np.arange(100) % 50] = 1.0
+        entry = {
+            "name": "body_geo",
+            "vertex_count": 100,
+            "influences": [f"joint{ii}" for ii in range(50)],
+            "weights": weights,
+        }
+        dense_path = tmp_path / "dense.swt"
+        sparse_path = tmp_path / "sparse.swt"
+
+        b_skin_saver.write_binary_weights(str(dense_path), [entry])
+        b_skin_saver.write_binary_weights(str(sparse_path), [entry], sparse=True)
+
+        assert sparse_path.stat().st_size * 5 < dense_path.stat().st_size
+        _, loaded = b_skin_saver.read_binary_weights(str(sparse_path))
+        np.testing.assert_array_equal(loaded[0]["weights"], weights)
+
+    def test_text_file_is_not_binary(self, tmp_path):
+        """Text files are not detected as binary."""
+        file_path = tmp_path / "body.swt"
+        file_path.write_text("body_geo\nroot\n============\n1\n\n", encoding="utf-8")
+
+        assert not b_skin_saver.is_binary_weights_file(str(file_path))
+
+    def test_bad_magic_raises(self, tmp_path):
+        """Files without the binary header are rejected."""
+        file_path = tmp_path / "bad.swt"
+        file_path.write_bytes(b"\0" * 32)
+
+        with pytest.raises(ValueError):
+            b_skin_saver.read_binary_weights(str(file_path))
+
+
+@pytest.mark.unit
+class TestTextWeights:
+    """Test suite for the text layout readers."""
+
+    def test_read_object_weights(self, tmp_path):
+        """Every object block of a text file is parsed."""
+        file_path = tmp_path / "body.swt"
+        file_path.write_text(
+            "body_geo\nroot\nspine\n============\n1 0\n0.25 0.75\n\n"
+            "head_geo\nhead\n============\n1\n\n",
+            encoding="utf-8",
+        )
+
+        entries = list(b_skin_saver.read_text_object_weights(str(file_path)))
+
+        assert [e["name"] for e in entries] == ["body_geo", "head_geo"]
+        assert entries[0]["influences"] == ["root", "spine"]
+        np.testing.assert_allclose(entries[0]["weights"], [[1.0, 0.0], [0.25, 0.75]])
+        assert entries[1]["weights"].shape == (1, 1)
+
+    def test_read_vertex_weights_with_soft_selection(self, tmp_path):
+        """Vertex files with soft selection columns are parsed."""
+        file_path = tmp_path / "verts.swt"
+        file_path.write_text(
+            "10\nroot\nspine\n============\n2:1.000000:1 0\n5:0.500000:0.5 0.5\n",
+            encoding="utf-8",
+        )
+
+        entry = b_skin_saver.read_text_vertex_weights(str(file_path))
+
+        assert entry["vertex_count"] == 10
+        assert entry["vertex_ids"].tolist() == [2, 5]
+        np.testing.assert_allclose(entry["soft_weights"], [1.0, 0.5])
+        np.testing.assert_allclose(entry["weights"], [[1.0, 0.0], [0.5, 0.5]])
@@ -0,0 +1,256 @@
+"""Unit tests for the Maya independent BVH parser and batch converter.
+
+Parses small in-memory BVH files and checks the joint hierarchy, channel
+columns and the vectorized motion array, then runs the batch converter
+and its cache against temporary take folders.
+"""
+
+import importlib
+import io
+import os
+
+import numpy as np
+import pytest
+
+from mayaLib.animationLib import bvh_batch, bvh_parser
+
+BVH_TEXT = """HIERARCHY
+ROOT Hips
+{
+\tOFFSET 0.0 0.0 0.0
+\tCHANNELS 6 Xposition Yposition Zposition Zrotation Xrotation Yrotation
+\tJOINT Spine
+\t{
+\t\tOFFSET 0.0 10.0 0.0
+\t\tCHANNELS 3 Zrotation Xrotation Yrotation
+\t\tEnd Site
+\t\t{
+\t\t\tOFFSET 0.0 5.0 0.0
+\t\t}
+\t}
+\tJOINT LeftUpLeg
+\t{
+\t\tOFFSET 3.0 -2.0 0.0
+\t\tCHANNELS 3 Zrotation Xrotation Yrotation
+\t}
+}
+MOTION
+Frames: 3
+Frame Time: 0.033333
+1 2 3 4 5 6 7 8 9 10 11 12
+13 14 15 16 17 18 19 20 21 22 23 24
+25 26 27 28 29 30 31 32 33 34 35 36
+"""
+
+
+def _parse(text=BVH_TEXT):
+    """Parse BVH text from memory."""
+    return bvh_parser.parse_bvh(io.StringIO(text))
+
+
+@pytest.mark.unit
+class TestParseBVH:
+    """Test suite for parse_bvh."""
+
+    def test_hierarchy(self):
+        """Joints, parents, offsets and end sites are read in file order."""
+        data = _parse()
+
+        assert [joint.name for joint in data.joints] == ["Hips", "Spine", "LeftUpLeg"]
+        assert [joint.parent for joint in data.joints] == [-1, 0, 0]
+        assert data.joints[2].offset == (3.0, -2.0, 0.0)
+        assert data.joints[1].end_site == (0.0, 5.0, 0.0)
+        assert data.joints[2].end_site is None
+        assert data.joint_path(2) == "Hips|LeftUpLeg"
+
+    def test_channel_columns(self):
+        """Channels map to consecutive motion columns."""
+        data = _parse()
+
+        channels = list(data.iter_channels())
+
+        assert data.num_channels == 12
+        assert channels[0] == (0, 0, "Xposition")
+        assert channels[6] == (6, 1, "Zrotation")
+        assert channels[-1] == (11, 2, "Yrotation")
+
+    def test_motion_array(self):
+        """The motion block becomes a (frames x channels) float array."""
+        data = _parse()
+
+        assert data.num_frames == 3
+        assert data.frame_time == pytest.approx(0.033333)
+        assert data.motion.dtype == np.float64
+        np.testing.assert_array_equal(data.motion[1], np.arange(13, 25))
+        np.testing.assert_array_equal(data.motion[:, 11], [12, 24, 36])
+
+    def test_motion_without_trailing_newline(self):
+        """The last value of the last frame is kept."""
+        data = _parse(BVH_TEXT.rstrip("\n"))
+
+        assert data.motion[-1, -1] == 36
+
+    def test_partial_frame_raises(self):
+        """A motion block that is not a whole number of frames is rejected."""
+        with pytest.raises(ValueError):
+            _parse(BVH_TEXT + "1 2 3\n")
+
+    def test_missing_header_raises(self):
+        """Files without the HIERARCHY header are rejected."""
+        with pytest.raises(ValueError):
+            _parse("MOTION\nFrames: 0\nFrame Time: 0.1\n")
+
+    def test_unbalanced_brackets_raise(self):
+        """A hierarchy that is never closed is rejected."""
+        text = BVH_TEXT.replace("\t\tCHANNELS 3 Zrotation Xrotation Yrotation\n\t}\n}", "")
+
+        with pytest.raises(ValueError):
+            _parse(text)
+
+    def test_bare_channels_raises(self):
+        """A CHANNELS line without a count is a ValueError, not an IndexError."""
+        text = BVH_TEXT.replace("CHANNELS 3 Zrotation Xrotation Yrotation", "CHANNELS", 1)
+
+        with pytest.raises(ValueError, match="CHANNELS needs a count"):
+            _parse(text)
+
+    def test_read_bvh(self, tmp_path):
+        """Files on disk parse like streams."""
+        file_path = tmp_path / "walk.bvh"
+        file_path.write_text(BVH_TEXT, encoding="utf-8")
+
+        data = bvh_parser.read_bvh(str(file_path))
+
+        assert data.motion.shape == (3, 12)
+
+
+@pytest.mark.unit
+class TestBVHBatch:
+    """Test suite for the batch converter and its cache."""
+
+    def test_cache_round_trip(self, tmp_path):
+        """Cached takes keep the hierarchy and store float32 motion."""
+        cache_path = str(tmp_path / "walk.npz")
+
+        bvh_batch.save_bvh_cache(cache_path, _parse())
+        data = bvh_batch.load_bvh_cache(cache_path)
+
+        assert [joint.name for joint in data.joints] == ["Hips", "Spine", "LeftUpLeg"]
+        assert data.joints[1].end_site == (0.0, 5.0, 0.0)
+        assert data.motion.dtype == np.float32
+        np.testing.assert_array_equal(data.motion, _parse().motion)
+
+    def test_convert_skips_unchanged_takes(self, tmp_path):
+        """A second run reuses the cache; changed content is parsed again."""
+        file_path = tmp_path / "walk.bvh"
+        file_path.write_text(BVH_TEXT, encoding="utf-8")
+        cache_path = bvh_batch.cache_path_for(str(file_path), str(tmp_path / "cache"))
+
+        first = bvh_batch.convert_bvh_file(str(file_path), cache_path)
+        second = bvh_batch.convert_bvh_file(str(file_path), cache_path)
+        file_path.write_text(BVH_TEXT.replace("Frames: 3", "Frames: 2").rsplit("25", 1)[0])
+        third = bvh_batch.convert_bvh_file(str(file_path), cache_path)
+
+        assert (first["status"], first["frames"], first["channels"]) == ("parsed", 3, 12)
+        assert (second["status"], second["frames"]) == ("cached", 3)
+        assert (third["status"], third["frames"]) == ("parsed", 2)
+
+    def test_touched_file_is_matched_by_hash(self, tmp_path):
+        """A new mtime with identical content still hits the cache."""
+        file_path = tmp_path / "walk.bvh"
+        file_path.write_text(BVH_TEXT, encoding="utf-8")
+        cache_path = bvh_batch.cache_path_for(str(file_path), str(tmp_path / "cache"))
+        bvh_batch.convert_bvh_file(str(file_path), cache_path)
+
+        os.utime(file_path, ns=(0, 0))
+
+        assert bvh_batch.convert_bvh_file(str(file_path), cache_path)["status"] == "cached"
+        assert bvh_batch.read_cache_header(cache_path)["source"]["mtime_ns"] == 0
+        np.testing.assert_array_equal(bvh_batch.load_bvh_cache(cache_path).motion, _parse().motion)
+
+    def test_touched_file_is_not_hashed_again(self, tmp_path, monkeypatch):
+        """After a hash hit the new mtime is cached, so the next run skips hashing."""
+        file_path = tmp_path / "walk.bvh"
+        file_path.write_text(BVH_TEXT, encoding="utf-8")
+        cache_path = bvh_batch.cache_path_for(str(file_path), str(tmp_path / "cache"))
+        bvh_batch.convert_bvh_file(str(file_path), cache_path)
+        os.utime(file_path, ns=(0, 0))
+        bvh_batch.convert_bvh_file(str(file_path), cache_path)
+
+        def no_hash(data):
+            raise AssertionError("hashed an unchanged take")
+
+        monkeypatch.setattr(bvh_batch.hashlib, "sha1", no_hash)
+
+        assert bvh_batch.convert_bvh_file(str(file_path), cache_path)["status"] == "cached"
+
+    def test_corrupt_cache_is_parsed_again(self, tmp_path):
+        """A truncated cache file counts as stale instead of failing the take."""
+        file_path = tmp_path / "walk.bvh"
+        file_path.write_text(BVH_TEXT, encoding="utf-8")
+        cache_path = bvh_batch.cache_path_for(str(file_path), str(tmp_path / "cache"))
+        bvh_batch.convert_bvh_file(str(file_path), cache_path)
+        with open(cache_path, "r+b") as f:
+            f.truncate(40)
+
+        assert bvh_batch.read_cache_header(cache_path) is None
+        row = bvh_batch.convert_bvh_file(str(file_path), cache_path)
+        assert (row["status"], row["frames"]) == ("parsed", 3)
+
+    def test_errors_are_reported(self, tmp_path):
+        """Broken takes produce an error row instead of raising."""
+        file_path = tmp_path / "broken.bvh"
+        file_path.write_text("not a bvh file\n", encoding="utf-8")
+
+        row = bvh_batch.convert_bvh_file(str(file_path), str(tmp_path / "broken.npz"))
+
+        assert row["status"] == "error"
+        assert "HIERARCHY" in row["error"]
+
+    def test_unexpected_errors_are_reported(self, tmp_path, monkeypatch):
+        """Errors other than the documented ones end up in the row too."""
+        file_path = tmp_path / "walk.bvh"
+        file_path.write_text(BVH_TEXT, encoding="utf-8")
+
+        def fail(stream):
+            raise IndexError("list index out of range")
+
+        monkeypatch.setattr(bvh_batch, "parse_bvh", fail)
+        row = bvh_batch.convert_bvh_file(str(file_path), str(tmp_path / "walk.npz"))
+
+        assert row["status"] == "error"
+        assert row["error"] == "IndexError: list index out of range"
+
+    def test_batch_survives_malformed_take(self, tmp_path, capsys):
+        """One malformed take is reported while the others still convert."""
+        for name in ("a.bvh", "c.bvh"):
+            (tmp_path / name).write_text(BVH_TEXT, encoding="utf-8")
+        (tmp_path / "b.bvh").write_text(
+            BVH_TEXT.replace("CHANNELS 3 Zrotation Xrotation Yrotation", "CHANNELS", 1),
+            encoding="utf-8",
+        )
+
+        batch = importlib.import_module("mayaLib.animationLib.bvh_batch")
+        rows = batch.batch_convert_bvh([str(tmp_path)], str(tmp_path / "cache"), max_workers=2)
+
+        assert [(os.path.basename(row["file"]), row["status"]) for row in rows] == [
+            ("a.bvh", "parsed"),
+            ("b.bvh", "error"),
+            ("c.bvh", "parsed"),
+        ]
+        assert "CHANNELS needs a count" in rows[1]["error"]
+        assert "1 failed" in capsys.readouterr().out
+
+    def test_batch_convert(self, tmp_path, capsys):
+        """Directories are searched and every take is reported."""
+        for name in ("a.bvh", "b.bvh", "notes.txt"):
+            (tmp_path / name).write_text(BVH_TEXT, encoding="utf-8")
+
+        # Workers pickle convert_bvh_file by reference, so use the module
+        # currently registered in sys.modules (other suites reload mayaLib)
+        batch = importlib.import_module("mayaLib.animationLib.bvh_batch")
+        rows = batch.batch_convert_bvh([str(tmp_path)], str(tmp_path / "cache"), max_workers=2)
+
+        assert [os.path.basename(row["file"]) for row in rows] == ["a.bvh", "b.bvh"]
+        assert {row["status"] for row in rows} == {"parsed"}
+        assert "BVH batch: 2 takes" in capsys.readouterr().out
@@ -0,0 +1,117 @@
+"""Unit tests for the ranked MayaLib tool search.
+
+Checks term matching across names, module paths and docstrings, the
+ranking order, fuzzy name matching and incremental narrowing.
+"""
+
+import pytest
+
+from mayaLib.pipelineLib.utility import catalog_search
+from mayaLib.pipelineLib.utility.catalog_search import CatalogSearchIndex, split_query
+
+ENTRIES = [
+    {"qualname": "mayaLib.rigLib.utils.skin.save_skin_weights", "doc": "Save skin weights.\nMore."},
+    {"qualname": "mayaLib.rigLib.utils.skin.load_skin_weights", "doc": "Load skin weights."},
+    {"qualname": "mayaLib.rigLib.utils.skin.skin", "doc": ""},
+    {"qualname": "mayaLib.modelLib.base.uv.AutoUV", "doc": "Unwrap meshes automatically."},
+    {"qualname": "mayaLib.modelLib.base.model.Mesh", "doc": "Mesh wrapper.\nHandles skin too."},
+    "mayaLib.animationLib.bvh_importer.BVHImporter",
+]
+
+
+@pytest.mark.unit
+class TestSplitQuery:
+    """Test suite for query tokenization."""
+
+    def test_splits_on_spaces_and_stars(self):
+        """Test spaces and the search field's '*' both separate terms."""
+        assert split_query("Skin*weights  Save*") == ["skin", "weights", "save"]
+
+    def test_empty_query(self):
+        """Test an empty or separator-only query has no terms."""
+        assert split_query("") == []
+        assert split_query("* *") == []
+
+
+@pytest.mark.unit
+class TestCatalogSearchIndex:
+    """Test suite for CatalogSearchIndex."""
+
+    def test_accepts_entries_and_strings(self):
+        """Test catalog entries and plain dotted names are both indexed."""
+        index = CatalogSearchIndex(ENTRIES)
+        assert len(index) == len(ENTRIES)
+        assert index.search("bvhimporter") == ["mayaLib.animationLib.bvh_importer.BVHImporter"]
+
+    def test_empty_query_returns_nothing(self):
+        """Test an empty query lists no tools."""
+        assert CatalogSearchIndex(ENTRIES).search("") == []
+
+    def test_all_terms_must_match(self):
+        """Test multi-term queries only keep tools matching every term."""
+        index = CatalogSearchIndex(ENTRIES)
+        assert index.search("load*weights") == ["mayaLib.rigLib.utils.skin.load_skin_weights"]
+        assert index.search("load autouv") == []
+
+    def test_ranking_prefers_name_matches(self):
+        """Test exact names beat prefixes, names beat module paths and docs."""
+        results = CatalogSearchIndex(ENTRIES).search("skin")
+        assert results[0] == "mayaLib.rigLib.utils.skin.skin"
+        assert set(results[1:3]) == {
+            "mayaLib.rigLib.utils.skin.save_skin_weights",
+            "mayaLib.rigLib.utils.skin.load_skin_weights",
+        }
+        # Mesh only mentions skin after the first docstring line
+        assert "mayaLib.modelLib.base.model.Mesh" not in results
+
+    def test_matches_module_path_and_doc(self):
+        """Test terms match the module path and the first docstring line."""
+        index = CatalogSearchIndex(ENTRIES)
+        assert index.search("modellib") == [
+            "mayaLib.modelLib.base.model.Mesh",
+            "mayaLib.modelLib.base.uv.AutoUV",
+        ]
+        assert index.search("unwrap") == ["mayaLib.modelLib.base.uv.AutoUV"]
+
+    def test_fuzzy_name_match(self):
+        """Test query characters in order match a name."""
+        index = CatalogSearchIndex(ENTRIES)
+        assert index.search("svskw") == ["mayaLib.rigLib.utils.skin.save_skin_weights"]
+
+    def test_fuzzy_match_only_checks_indexed_names(self, monkeypatch):
+        """Test the subsequence check only runs on names holding every query character."""
+        checked = []
+
+        def is_subsequence(term, text):
+            checked.append(text)
+            return original(term, text)
+
+        original = catalog_search._is_subsequence
+        monkeypatch.setattr(catalog_search, "_is_subsequence", is_subsequence)
+        index = CatalogSearchIndex(ENTRIES + [f"mayaLib.tools.tool_{ii}" for ii in range(100)])
+
+        assert index.search("svskw") == ["mayaLib.rigLib.utils.skin.save_skin_weights"]
+        assert checked == ["save_skin_weights"]
+
+    def test_short_terms(self):
+        """Test terms shorter than a trigram still match."""
+        index = CatalogSearchIndex(ENTRIES)
+        assert index.search("uv")[0] == "mayaLib.modelLib.base.uv.AutoUV"
+
+    def test_limit(self):
+        """Test the result count can be limited."""
+        assert len(CatalogSearchIndex(ENTRIES).search("skin", limit=1)) == 1
+
+    def test_incremental_narrowing_matches_full_search(self):
+        """Test typing a longer query gives the same results as a fresh search."""
+        index = CatalogSearchIndex(ENTRIES)
+        for query in ("s", "sk", "ski", "skin", "skin*", "skin*l", "skin*lo", "skin*load"):
+            assert index.search(query) == CatalogSearchIndex(ENTRIES).search(query)
+
+    def test_narrowing_is_reset_when_query_changes(self):
+        """Test a query that does not extend the previous one searches everything."""
+        index = CatalogSearchIndex(ENTRIES)
+        index.search("load")
+        assert index.search("save") == ["mayaLib.rigLib.utils.skin.save_skin_weights"]
+        index.search("skin*load")
+        assert "mayaLib.rigLib.utils.skin.save_skin_weights" in index.search("skin")
@@ -0,0 +1,179 @@
+"""Unit tests for the NumPy NURBS curve sampler.
+
+Curves with known closed forms (polylines, a parabola, straight cubics and
+a periodic curve) and a Cox-de Boor basis reference check evaluation, arc
+length and inverse arc length lookups without Maya.
+"""
+
+import importlib
+
+import numpy as np
+import pytest
+
+from mayaLib.rigLib.math import curve_sampling
+from mayaLib.rigLib.math.curve_sampling import NurbsCurve
+
+curve_operations = importlib.import_module("mayaLib.rigLib.face.operations.curve_operations")
+
+SEEDS = [0, 1, 2]
+
+# y = x^2 for x in [0, 1] as a quadratic Bezier
+PARABOLA = NurbsCurve([[0.0, 0.0, 0.0], [0.5, 0.0, 0.0], [1.0, 1.0, 0.0]], [0, 0, 1, 1], 2)
+PARABOLA_LENGTH = (2.0 * np.sqrt(5.0) + np.arcsinh(2.0)) / 4.0
+
+
+def _basis(index, degree, knots, t):
+    """Evaluate one B-spline basis function with the Cox-de Boor recursion."""
+    if degree == 0:
+        last = knots[index + 1] == knots[-1] and t == knots[-1]
+        return 1.0 if knots[index] <= t < knots[index + 1] or last else 0.0
+    value = 0.0
+    if knots[index + degree] > knots[index]:
+        weight = (t - knots[index]) / (knots[index + degree] - knots[index])
+        value += weight * _basis(index, degree - 1, knots, t)
+    if knots[index + degree + 1] > knots[index + 1]:
+        weight = (knots[index + degree + 1] - t) / (knots[index + degree + 1] - knots[index + 1])
+        value += weight * _basis(index + 1, degree - 1, knots, t)
+    return value
+
+
+def _reference_point(cvs, maya_knots, degree, t):
+    """Sum the CVs weighted by their basis functions."""
+    knots = [maya_knots[0], *maya_knots, maya_knots[-1]]
+    return sum(_basis(i, degree, knots, t) * np.asarray(cv) for i, cv in enumerate(cvs))
+
+
+def _clamped_knots(num_cvs, degree):
+    """Build Maya's clamped uniform knot list."""
+    spans = num_cvs - degree
+    return [0.0] * (degree - 1) + list(range(spans + 1)) + [float(spans)] * (degree - 1)
+
+
+@pytest.mark.unit
+class TestEvaluation:
+    """Test suite for points and derivatives."""
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    @pytest.mark.parametrize("degree", [1, 2, 3, 5])
+    def test_matches_basis_reference(self, seed, degree):
+        """Vectorized de Boor matches the basis function sum."""
+        rng = np.random.default_rng(seed)
+        cvs = rng.uniform(-5.0, 5.0, (9, 3))
+        knots = _clamped_knots(9, degree)
+        curve = NurbsCurve(cvs, knots, degree)
+        parameters = np.linspace(*curve.domain, 23)
+
+        expected = [_reference_point(cvs, knots, degree, t) for t in parameters]
+
+        np.testing.assert_allclose(curve.point(parameters), expected, atol=1e-9)
+
+    def test_parabola(self):
+        """The quadratic Bezier traces y = x^2 and its derivative."""
+        t = np.linspace(0.0, 1.0, 11)
+
+        np.testing.assert_allclose(PARABOLA.point(t)[:, :2], np.stack((t, t * t), axis=1))
+        np.testing.assert_allclose(PARABOLA.tangent(t)[:, :2], np.stack((t**0, 2 * t), axis=1))
+
+    def test_periodic_curve_closes(self):
+        """A periodic curve starts and ends at the same point and tangent."""
+        square = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [-1.0, 0.0, 0.0], [0.0, -1.0, 0.0]])
+        curve = NurbsCurve(np.vstack((square, square[:3])), np.arange(-2.0, 7.0), 3)
+
+        assert curve.domain == (0.0, 4.0)
+        np.testing.assert_allclose(curve.point(0.0), curve.point(4.0), atol=1e-12)
+        np.testing.assert_allclose(curve.tangent(0.0), curve.tangent(4.0), atol=1e-12)
+
+    def test_parameters_are_clamped(self):
+        """Parameters outside the domain evaluate the curve ends."""
+        np.testing.assert_allclose(PARABOLA.point([-1.0, 2.0])[:, :2], [[0.0, 0.0], [1.0, 1.0]])
+
+    def test_invalid_knots(self):
+        """Knot counts must follow Maya's cvs + degree - 1 rule."""
+        with pytest.raises(ValueError, match="Expected 4 knots"):
+            NurbsCurve(np.zeros((3, 3)), [0, 1, 2], 2)
+
+
+@pytest.mark.unit
+class TestArcLength:
+    """Test suite for arc length and its inverse."""
+
+    def test_parabola_length(self):
+        """Quadrature matches the closed form parabola length."""
+        assert PARABOLA.length == pytest.approx(PARABOLA_LENGTH, abs=1e-12)
+
+    def test_polyline_length(self):
+        """A degree 1 curve measures its control polygon."""
+        curve = NurbsCurve([[0.0, 0.0, 0.0], [3.0, 4.0, 0.0], [3.0, 4.0, 2.0]], [0, 1, 2], 1)
+
+        assert curve.length == pytest.approx(7.0)
+        np.testing.assert_allclose(curve.arc_lengths([0.5, 1.5]), [2.5, 6.0])
+        np.testing.assert_allclose(curve.parameters_at_lengths([2.5, 6.0]), [0.5, 1.5])
+
+    def test_partial_lengths(self):
+        """Arc lengths to inner parameters match the closed form."""
+        t = np.array([0.2, 0.55, 0.9])
+        expected = (2 * t * np.sqrt(1 + 4 * t * t) + np.arcsinh(2 * t)) / 4.0
+
+        np.testing.assert_allclose(PARABOLA.arc_lengths(t), expected, atol=1e-12)
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_inverse_on_uneven_line(self, seed):
+        """Points found by length sit at that distance along a straight cubic."""
+        rng = np.random.default_rng(seed)
+        x = np.sort(rng.uniform(0.0, 10.0, 8))
+        cvs = np.stack((x, np.zeros(8), np.zeros(8)), axis=1)
+        curve = NurbsCurve(cvs, _clamped_knots(8, 3), 3)
+        distances = np.linspace(0.0, x[-1] - x[0], 50)
+
+        points = curve.point(curve.parameters_at_lengths(distances))
+
+        np.testing.assert_allclose(points[:, 0] - x[0], distances, atol=1e-8)
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_uniform_parameters(self, seed):
+        """Uniform parameters split a random curve into equal lengths."""
+        rng = np.random.default_rng(seed)
+        curve = NurbsCurve(rng.uniform(-5.0, 5.0, (10, 3)), _clamped_knots(10, 3), 3)
+
+        parameters = curve.uniform_parameters(200)
+
+        np.testing.assert_allclose(np.diff(curve.arc_lengths(parameters)), curve.length / 199)
+        assert parameters[0] == curve.domain[0]
+        assert parameters[-1] == pytest.approx(curve.domain[1])
+
+
+@pytest.mark.unit
+class TestCurveOperations:
+    """Test suite for the face curve operations built on the sampler."""
+
+    @pytest.fixture
+    def brow_curve(self, monkeypatch):
+        """Serve a degree 1 curve for every Maya curve and record the reads."""
+        reads = []
+        curve = NurbsCurve([[0.0, 0.0, 0.0], [3.0, 4.0, 0.0], [3.0, 4.0, 2.0]], [0, 1, 2], 1)
+
+        def from_maya(name, world_space=True):
+            reads.append((name, world_space))
+            return curve
+
+        monkeypatch.setattr(curve_operations.NurbsCurve, "from_maya", from_maya)
+        return reads
+
+    def test_parameter_distances(self, brow_curve):
+        """CV distances accumulate from one curve read."""
+        distances = curve_operations.calculate_curve_parameter_distances("l_browsCurve")
+
+        assert distances == [0.0, 5.0, 7.0]
+        assert brow_curve == [("l_browsCurve", True)]
+
+    def test_sample_parameters(self, brow_curve):
+        """Sample parameters are evenly spaced by length."""
+        parameters = curve_operations.get_curve_sample_parameters("l_browsCurve", 3)
+
+        np.testing.assert_allclose(parameters, [0.0, 0.7, 2.0])
+
+    def test_polyline_distances(self):
+        """Distances accumulate between consecutive points."""
+        np.testing.assert_allclose(
+            curve_sampling.polyline_distances([[0, 0], [0, 2], [2, 2]]), [0, 2, 4]
+        )
@@ -0,0 +1,196 @@
+"""Unit tests for the static function catalog.
+
+Builds small throwaway packages on disk and checks that classes, functions,
+signatures and docstrings are extracted without importing anything, and
+that the JSON cache is only refreshed for files that changed.
+"""
+
+import os
+
+import pytest
+
+from mayaLib.pipelineLib.utility import function_catalog
+from mayaLib.pipelineLib.utility.function_catalog import FunctionCatalog
+
+TOOL_SOURCE = '''"""Tools."""
+
+import does_not_exist_anywhere
+from os.path import join
+
+
+class Builder:
+    """Build things."""
+
+    def __init__(self, name, count=2, *args, scale: float = 1.0, **kwargs):
+        pass
+
+
+def make_rig(root, side="L", /, mirror=False):
+    """Make a rig.
+
+    Args:
+        root: Root joint.
+    """
+
+
+def _helper():
+    pass
+'''
+
+
+def _write(path, text):
+    """Write a source file, creating its directory."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+@pytest.fixture
+def fake_lib(tmp_path):
+    """Create a ``fakeLib`` package with a few sub-packages."""
+    root = tmp_path / "fakeLib"
+    _write(root / "__init__.py", "")
+    _write(root / "top_level.py", "def ignored():\n    pass\n")
+    _write(root / "rigLib" / "__init__.py", "")
+    _write(root / "rigLib" / "tools.py", TOOL_SOURCE)
+    _write(root / "rigLib" / "base" / "__init__.py", "def from_init():\n    pass\n")
+    _write(root / "rigLib" / "base" / "limb.py", "class Limb:\n    pass\n")
+    _write(root / "rigLib" / "empty" / "__init__.py", "def leaf_tool():\n    pass\n")
+    _write(root / "utility" / "__init__.py", "")
+    _write(root / "utility" / "hidden.py", "def hidden():\n    pass\n")
+    return root
+
+
+@pytest.mark.unit
+class TestParseModuleSource:
+    """Test suite for parse_module_source."""
+
+    def test_extracts_public_definitions(self):
+        """Classes and functions defined in the module are listed, helpers are not."""
+        entries = function_catalog.parse_module_source(TOOL_SOURCE, "lib.tools")
+
+        assert [e["qualname"] for e in entries] == ["lib.tools.Builder", "lib.tools.make_rig"]
+        assert entries[0]["kind"] == "class"
+        assert entries[1]["kind"] == "function"
+
+    def test_signatures_and_docs(self):
+        """Signatures match inspect formatting and docstrings are cleaned."""
+        builder, make_rig = function_catalog.parse_module_source(TOOL_SOURCE, "lib.tools")
+
+        assert builder["signature"] == "(name, count=2, *args, scale: float = 1.0, **kwargs)"
+        assert make_rig["signature"] == "(root, side='L', /, mirror=False)"
+        assert make_rig["doc"].startswith("Make a rig.\n\nArgs:\n    root: Root joint.")
+
+    def test_syntax_error_raises(self):
+        """Broken sources raise SyntaxError."""
+        with pytest.raises(SyntaxError):
+            function_catalog.parse_module_source("def broken(:\n", "lib.broken")
+
+
+@pytest.mark.unit
+class TestDiscoverModules:
+    """Test suite for discover_modules."""
+
+    def test_menu_modules(self, fake_lib):
+        """Sub-package modules are found; root modules and utility packages are not."""
+        modules = function_catalog.discover_modules(str(fake_lib), "fakeLib")
+
+        assert sorted(modules) == [
+            "fakeLib.rigLib.base.limb",
+            "fakeLib.rigLib.empty",
+            "fakeLib.rigLib.tools",
+        ]
+        assert modules["fakeLib.rigLib.empty"].endswith("__init__.py")
+
+    def test_disabled_luna_is_excluded(self, fake_lib, monkeypatch):
+        """DEVPYLIB_DISABLE_LUNA=1 hides lunaLib from discovery and the catalog."""
+        monkeypatch.delenv("DEVPYLIB_DISABLE_LUNA", raising=False)
+        _write(fake_lib / "lunaLib" / "__init__.py", "")
+        _write(fake_lib / "lunaLib" / "luna_tool.py", "def luna_tool():\n    pass\n")
+        assert "fakeLib.lunaLib.luna_tool" in function_catalog.discover_modules(
+            str(fake_lib), "fakeLib"
+        )
+        monkeypatch.setenv("DEVPYLIB_DISABLE_LUNA", "1")
+
+        modules = function_catalog.discover_modules(str(fake_lib), "fakeLib")
+        catalog = FunctionCatalog(str(fake_lib), "fakeLib")
+        catalog.refresh()
+
+        assert not any("lunaLib" in name for name in modules)
+        assert "fakeLib.lunaLib.luna_tool.luna_tool" not in catalog.qualnames()
+
+
+@pytest.mark.unit
+class TestFunctionCatalog:
+    """Test suite for FunctionCatalog."""
+
+    def test_refresh_and_lookup(self, fake_lib):
+        """A refresh catalogs every tool without importing it."""
+        catalog = FunctionCatalog(str(fake_lib), "fakeLib")
+
+        stats = catalog.refresh()
+
+        assert stats == {"parsed": 3, "cached": 0, "removed": 0, "errors": 0}
+        assert catalog.qualnames() == [
+            "fakeLib.rigLib.base.limb.Limb",
+            "fakeLib.rigLib.empty.leaf_tool",
+            "fakeLib.rigLib.tools.Builder",
+            "fakeLib.rigLib.tools.make_rig",
+        ]
+        assert catalog.get("fakeLib.rigLib.tools.make_rig")["module"] == "fakeLib.rigLib.tools"
+        assert catalog.get("fakeLib.rigLib.tools.missing") is None
+
+    def test_cache_is_refreshed_incrementally(self, fake_lib, tmp_path):
+        """Only changed files are parsed again; deleted files are dropped."""
+        cache_path = str(tmp_path / "cache" / "catalog.json")
+        FunctionCatalog(str(fake_lib), "fakeLib", cache_path=cache_path).refresh()
+
+        _write(
+            fake_lib / "rigLib" / "base" / "limb.py",
+            "class Limb:\n    pass\n\n\nclass Arm:\n    pass\n",
+        )
+        os.remove(fake_lib / "rigLib" / "empty" / "__init__.py")
+        catalog = FunctionCatalog(str(fake_lib), "fakeLib", cache_path=cache_path)
+        stats = catalog.refresh()
+
+        assert stats == {"parsed": 1, "cached": 1, "removed": 1, "errors": 0}
+        assert "fakeLib.rigLib.base.limb.Arm" in catalog.qualnames()
+        assert "fakeLib.rigLib.empty.leaf_tool" not in catalog.qualnames()
+
+    def test_touched_file_is_matched_by_hash(self, fake_lib, tmp_path):
+        """A new mtime with the same content does not trigger a parse."""
+        cache_path = str(tmp_path / "catalog.json")
+        FunctionCatalog(str(fake_lib), "fakeLib", cache_path=cache_path).refresh()
+
+        os.utime(fake_lib / "rigLib" / "tools.py", ns=(0, 0))
+        stats = FunctionCatalog(str(fake_lib), "fakeLib", cache_path=cache_path).refresh()
+
+        assert stats["parsed"] == 0
+        assert stats["cached"] == 3
+
+    def test_broken_module_is_reported(self, fake_lib):
+        """Files that do not parse are counted as errors and listed as empty."""
+        _write(fake_lib / "rigLib" / "broken.py", "def broken(:\n")
+        catalog = FunctionCatalog(str(fake_lib), "fakeLib")
+
+        stats = catalog.refresh()
+
+        assert stats["errors"] == 1
+        assert catalog.files["fakeLib.rigLib.broken"]["error"]
+        assert not any(name.startswith("fakeLib.rigLib.broken") for name in catalog.qualnames())
+
+    def test_unreadable_module_is_dropped(self, fake_lib, monkeypatch):
+        """A file that stats but cannot be read is counted as an error and dropped."""
+        catalog = FunctionCatalog(str(fake_lib), "fakeLib")
+        catalog.refresh()
+        tools_path = str(fake_lib / "rigLib" / "tools.py")
+        os.utime(tools_path, ns=(0, 0))
+
+        def unreadable(path, *args, **kwargs):
+            raise PermissionError(path)
+
+        monkeypatch.setattr(function_catalog, "open", unreadable, raising=False)
+        stats = catalog.refresh()
+
+        assert stats["errors"] == 1
+        assert "fakeLib.rigLib.tools" not in catalog.files
+        assert "fakeLib.rigLib.tools.make_rig" not in catalog.qualnames()
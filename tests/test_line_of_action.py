@@ -0,0 +1,54 @@
+"""Unit tests for the NumPy line-of-action analysis.
+
+Checks the batch analysis against the pure Python reference implementation
+and its handling of degenerate point sets.
+"""
+
+import numpy as np
+import pytest
+
+from mayaLib.rigLib.utils import line_of_action
+
+
+def _reference(points):
+    """Run the pure Python centroid/PCA/extremal search on one point set."""
+    vertices = np.asarray(points).tolist()
+    centroid, main_axis = line_of_action.compute_main_axis(vertices)
+    return centroid, main_axis, line_of_action.find_extremal_vertices(vertices, centroid, main_axis)
+
+
+@pytest.mark.unit
+class TestComputeLinesOfAction:
+    """Test suite for compute_lines_of_action."""
+
+    def test_matches_reference(self):
+        """Test centroid, axis and extremal vertices match the Python path."""
+        rng = np.random.default_rng(2)
+        clouds = [
+            rng.normal(size=(n, 3)) * [8.0, 1.0, 0.5] @ np.linalg.qr(rng.normal(size=(3, 3)))[0]
+            for n in (30, 200, 75)
+        ]
+        for cloud, result in zip(
+            clouds, line_of_action.compute_lines_of_action(clouds), strict=True
+        ):
+            centroid, main_axis, extremal = _reference(cloud)
+            np.testing.assert_allclose(result["centroid"], centroid)
+            np.testing.assert_allclose(result["main_axis"], main_axis, atol=1e-6)
+            assert result["start_index"] == extremal["start_index"]
+            assert result["end_index"] == extremal["end_index"]
+            assert result["start_point"] == cloud[extremal["start_index"]].tolist()
+
+    def test_axis_aligned_cloud(self):
+        """Test a cloud along x gives the x axis and its two ends."""
+        points = [[float(x), 0.0, 0.0] for x in range(5)] + [[2.0, 0.1, 0.0]]
+        result = line_of_action.compute_line_of_action(points)
+        np.testing.assert_allclose(np.abs(result["main_axis"]), [1.0, 0.0, 0.0], atol=1e-6)
+        assert {result["start_index"], result["end_index"]} == {0, 4}
+
+    def test_degenerate_sets(self):
+        """Test sets with fewer than two points give None without breaking the batch."""
+        results = line_of_action.compute_lines_of_action(
+            [[], [[1.0, 2.0, 3.0]], [[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]]]
+        )
+        assert results[0] is None and results[1] is None
+        assert {results[2]["start_index"], results[2]["end_index"]} == {0, 1}
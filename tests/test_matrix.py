@@ -0,0 +1,246 @@
+"""Unit tests for the batched transform matrix library.
+
+Properties are checked on seeded random transform stacks against
+straightforward per-matrix reference math (axis-angle rotations, explicit
+scale * shear * rotate * translate products, per-joint hierarchy walks), so
+no OpenMaya is needed.
+"""
+
+import numpy as np
+import pytest
+
+from mayaLib.rigLib.math import matrix
+
+SEEDS = [0, 1, 2]
+
+
+def _axis_angle_quaternion(axis, angle):
+    """Build an ``(x, y, z, w)`` quaternion from an axis and an angle."""
+    axis = np.asarray(axis, dtype=np.float64) / np.linalg.norm(axis)
+    return np.append(axis * np.sin(angle / 2.0), np.cos(angle / 2.0))
+
+
+def _axis_angle_rotation(axis, angle):
+    """Build a row-vector rotation matrix with Rodrigues' formula."""
+    x, y, z = np.asarray(axis, dtype=np.float64) / np.linalg.norm(axis)
+    cross = np.array([[0.0, -z, y], [z, 0.0, -x], [-y, x, 0.0]])
+    column = np.eye(3) + np.sin(angle) * cross + (1.0 - np.cos(angle)) * cross @ cross
+    return column.T
+
+
+def _random_transforms(count, seed, shear=True):
+    """Build random translate, rotate (axes and angles), scale and shear."""
+    rng = np.random.default_rng(seed)
+    axes = rng.normal(size=(count, 3))
+    angles = rng.uniform(-np.pi, np.pi, count)
+    return {
+        "translate": rng.uniform(-10.0, 10.0, (count, 3)),
+        "axes": axes,
+        "angles": angles,
+        "rotate": np.array(
+            [_axis_angle_quaternion(a, t) for a, t in zip(axes, angles, strict=True)]
+        ),
+        "scale": rng.uniform(0.2, 3.0, (count, 3)),
+        "shear": rng.uniform(-0.5, 0.5, (count, 3)) if shear else np.zeros((count, 3)),
+    }
+
+
+def _reference_compose(translate, axis, angle, scale, shear):
+    """Compose one matrix with explicit 4x4 products."""
+    scale_matrix = np.diag(np.append(scale, 1.0))
+    shear_matrix = np.eye(4)
+    shear_matrix[1, 0], shear_matrix[2, 0], shear_matrix[2, 1] = shear
+    rotate_matrix = np.eye(4)
+    rotate_matrix[:3, :3] = _axis_angle_rotation(axis, angle)
+    translate_matrix = np.eye(4)
+    translate_matrix[3, :3] = translate
+    return scale_matrix @ shear_matrix @ rotate_matrix @ translate_matrix
+
+
+def _same_rotation(quaternions_a, quaternions_b):
+    """Check quaternions describe the same rotations, q and -q alike."""
+    dots = np.abs(np.sum(quaternions_a * quaternions_b, axis=-1))
+    np.testing.assert_allclose(dots, 1.0, atol=1e-9)
+
+
+@pytest.mark.unit
+class TestComposeDecompose:
+    """Test suite for composing and decomposing transforms."""
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_compose_matches_reference(self, seed):
+        """Batched compose matches explicit per-matrix products."""
+        data = _random_transforms(50, seed)
+
+        composed = matrix.compose(data["translate"], data["rotate"], data["scale"], data["shear"])
+
+        expected = [
+            _reference_compose(*values)
+            for values in zip(
+                data["translate"],
+                data["axes"],
+                data["angles"],
+                data["scale"],
+                data["shear"],
+                strict=True,
+            )
+        ]
+        np.testing.assert_allclose(composed, expected, atol=1e-9)
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_decompose_round_trip(self, seed):
+        """Decompose recovers every component of a composed matrix."""
+        data = _random_transforms(50, seed)
+        composed = matrix.compose(data["translate"], data["rotate"], data["scale"], data["shear"])
+
+        translate, rotate, scale, shear = matrix.decompose(composed)
+
+        np.testing.assert_allclose(translate, data["translate"], atol=1e-9)
+        _same_rotation(rotate, data["rotate"])
+        np.testing.assert_allclose(scale, data["scale"], atol=1e-9)
+        np.testing.assert_allclose(shear, data["shear"], atol=1e-9)
+
+    def test_negative_scale_goes_to_z(self):
+        """A mirrored matrix decomposes to a negative Z scale."""
+        mirrored = matrix.compose(scale=[1.0, 1.0, -2.0])
+
+        _, rotate, scale, _ = matrix.decompose(mirrored)
+
+        np.testing.assert_allclose(scale, [[1.0, 1.0, -2.0]])
+        _same_rotation(rotate, [[0.0, 0.0, 0.0, 1.0]])
+
+    def test_components_broadcast(self):
+        """One shared component broadcasts against a stack."""
+        data = _random_transforms(5, 0)
+
+        composed = matrix.compose(data["translate"], scale=[2.0, 2.0, 2.0])
+
+        assert composed.shape == (5, 4, 4)
+        np.testing.assert_allclose(composed[:, 0, 0], 2.0)
+
+    @pytest.mark.parametrize("angle", [0.0, 1.0, np.pi - 1e-9, np.pi])
+    def test_rotation_quaternion_round_trip(self, angle):
+        """Quaternions survive the matrix round trip up to 180 degrees."""
+        quaternions = np.array(
+            [_axis_angle_quaternion(axis, angle) for axis in np.eye(3).tolist() + [[1, 1, 1]]]
+        )
+
+        rotations = matrix.quaternion_to_rotation(quaternions)
+
+        _same_rotation(matrix.rotation_to_quaternion(rotations), quaternions)
+
+
+@pytest.mark.unit
+class TestInverseAndBlend:
+    """Test suite for inverses and blending."""
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_rigid_inverse(self, seed):
+        """The rigid inverse matches the general inverse without scale."""
+        data = _random_transforms(50, seed)
+        rigid = matrix.compose(data["translate"], data["rotate"])
+
+        np.testing.assert_allclose(matrix.inverse_rigid(rigid), np.linalg.inv(rigid), atol=1e-9)
+        np.testing.assert_allclose(
+            matrix.inverse_rigid(rigid) @ rigid, matrix.identity(50), atol=1e-9
+        )
+
+    def test_slerp_follows_the_arc(self):
+        """Slerp rotates at constant speed along the shortest arc."""
+        start = _axis_angle_quaternion((0, 0, 1), 0.0)
+        end = _axis_angle_quaternion((0, 0, 1), 1.2)
+
+        halfway = matrix.slerp([start, start], [end, -end], 0.25)
+
+        _same_rotation(halfway, [_axis_angle_quaternion((0, 0, 1), 0.3)] * 2)
+
+    def test_slerp_identical_rotations(self):
+        """Slerp between identical rotations returns that rotation."""
+        rotation = _axis_angle_quaternion((1, 0, 0), 0.4)
+
+        _same_rotation(matrix.slerp(rotation, rotation, 0.7), [rotation])
+
+    def test_blend_keeps_rotations_rigid(self):
+        """Blend interpolates components while lerp shrinks rotations."""
+        start = matrix.compose([0.0, 0.0, 0.0], _axis_angle_quaternion((0, 1, 0), 0.0))
+        end = matrix.compose([2.0, 0.0, 0.0], _axis_angle_quaternion((0, 1, 0), np.pi / 2))
+
+        blended = matrix.blend(start, end, 0.5)
+        linear = matrix.lerp(start, end, 0.5)
+
+        expected = matrix.compose([1.0, 0.0, 0.0], _axis_angle_quaternion((0, 1, 0), np.pi / 4))
+        np.testing.assert_allclose(blended, expected, atol=1e-9)
+        assert np.linalg.det(linear[0, :3, :3]) < 0.99
+
+
+@pytest.mark.unit
+class TestHierarchy:
+    """Test suite for world and local conversion along a hierarchy."""
+
+    # Two chains, listed out of order: 3 -> 0 -> 4 -> 1 and 2 -> 5
+    PARENTS = [3, 4, -1, -1, 0, 2]
+
+    def _reference_world(self, local, parents):
+        """Walk every joint up to its root multiplying local matrices."""
+        world = []
+        for joint in range(len(parents)):
+            result = local[joint]
+            parent = parents[joint]
+            while parent >= 0:
+                result = result @ local[parent]
+                parent = parents[parent]
+            world.append(result)
+        return np.array(world)
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_local_to_world(self, seed):
+        """Level-by-level conversion matches a per-joint walk."""
+        data = _random_transforms(6, seed)
+        local = matrix.compose(data["translate"], data["rotate"], data["scale"])
+
+        world = matrix.local_to_world(local, self.PARENTS)
+
+        np.testing.assert_allclose(world, self._reference_world(local, self.PARENTS), atol=1e-9)
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_world_to_local_round_trip(self, seed):
+        """World to local inverts local to world, also under a root matrix."""
+        data = _random_transforms(6, seed)
+        local = matrix.compose(data["translate"], data["rotate"], data["scale"], data["shear"])
+        root = matrix.compose([1.0, 2.0, 3.0], scale=[2.0, 2.0, 2.0])[0]
+
+        world = matrix.local_to_world(local, self.PARENTS, root_matrix=root)
+
+        np.testing.assert_allclose(
+            matrix.world_to_local(world, self.PARENTS, root_matrix=root), local, atol=1e-9
+        )
+
+    def test_depths_and_cycles(self):
+        """Depths count ancestors and cycles are rejected."""
+        np.testing.assert_array_equal(matrix.hierarchy_depths(self.PARENTS), [1, 3, 0, 0, 2, 1])
+        with pytest.raises(ValueError, match="cycle"):
+            matrix.hierarchy_depths([1, 0])
+
+
+@pytest.mark.unit
+class TestMayaConversion:
+    """Test suite for MMatrix conversion."""
+
+    def test_from_mmatrix(self):
+        """Single and sequences of 16-value matrices become stacks."""
+        values = np.arange(16.0)
+
+        assert matrix.from_mmatrix(values.tolist()).shape == (1, 4, 4)
+        stack = matrix.from_mmatrix([values.tolist(), (values * 2).tolist()])
+        np.testing.assert_array_equal(stack[1], (values * 2).reshape(4, 4))
+
+    def test_to_mmatrix(self, monkeypatch):
+        """Every matrix is passed to MMatrix as 16 row-major values."""
+        import maya.api.OpenMaya as om2  # noqa: N813 - Maya API alias
+
+        monkeypatch.setattr(om2, "MMatrix", lambda values: values)
+
+        result = matrix.to_mmatrix(matrix.compose([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]))
+
+        assert len(result) == 2
+        assert result[1][12:15] == [4.0, 5.0, 6.0]
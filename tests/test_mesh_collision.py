@@ -0,0 +1,177 @@
+"""Unit tests for the collision deformer broad phase helpers.
+
+The plugin is imported against the mocked Maya API with a plain base class
+for the deformer node, so the pure NumPy helpers and the caches of
+``CollisionDeformer`` can be checked without Maya.
+"""
+
+import importlib
+import sys
+
+import numpy as np
+import pytest
+
+
+class FakeDeformerNode:
+    """Stand-in for ``MPxDeformerNode``."""
+
+
+class FakeCollider:
+    """MFnMesh stand-in counting acceleration grid builds."""
+
+    def __init__(self, topology):
+        """Store the vertex, edge, face and face-vertex counts."""
+        self.topology = topology
+        self.grid_builds = 0
+
+    def numVertices(self):  # noqa: N802
+        """Return the vertex count."""
+        return self.topology[0]
+
+    def numEdges(self):  # noqa: N802
+        """Return the edge count."""
+        return self.topology[1]
+
+    def numPolygons(self):  # noqa: N802
+        """Return the face count."""
+        return self.topology[2]
+
+    def numFaceVertices(self):  # noqa: N802
+        """Return the face-vertex count."""
+        return self.topology[3]
+
+    def autoUniformGridParams(self):  # noqa: N802
+        """Count the build and return a new grid."""
+        self.grid_builds += 1
+        return f"grid {self.grid_builds}"
+
+
+class FakeWeightList:
+    """MArrayDataHandle stand-in without stored weights."""
+
+    def jumpToElement(self, index):  # noqa: N802
+        """Fail like a weight list without the element."""
+        raise RuntimeError(index)
+
+
+class FakeDataBlock:
+    """MDataBlock stand-in whose weight list is clean unless flagged dirty."""
+
+    def __init__(self):
+        """Start with a clean weight list."""
+        self.dirty = False
+
+    def isClean(self, attribute):  # noqa: N802
+        """Report the weight list state and clean it like a read would."""
+        clean = not self.dirty
+        self.dirty = False
+        return clean
+
+    def inputArrayValue(self, attribute):  # noqa: N802
+        """Return an empty weight list."""
+        return FakeWeightList()
+
+
+@pytest.fixture(scope="module")
+def mesh_collision():
+    """Import the plugin with a real deformer base class."""
+    import maya
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(maya.OpenMayaMPx, "MPxDeformerNode", FakeDeformerNode)
+        patch.setattr(maya.cmds, "about", lambda **flags: 202400)
+        sys.modules.pop("mayaLib.plugin.mesh_collision", None)
+        yield importlib.import_module("mayaLib.plugin.mesh_collision")
+    sys.modules.pop("mayaLib.plugin.mesh_collision", None)
+
+
+def _matrix(translate=(0.0, 0.0, 0.0), scale=1.0):
+    """Callable ``matrix(row, column)`` of a row vector scale then translate."""
+    values = np.diag([scale, scale, scale, 1.0])
+    values[3, :3] = translate
+    return lambda row, column: values[row, column]
+
+
+@pytest.mark.unit
+class TestBroadPhase:
+    """Test suite for the bounding box culling helpers."""
+
+    def test_world_bounding_box_identity(self, mesh_collision):
+        """The box is the padded extent of the points."""
+        points = np.array([[0.0, 0.0, 0.0], [1.0, 2.0, 3.0], [-1.0, 0.5, 1.0]])
+
+        box_min, box_max = mesh_collision.world_bounding_box(points, _matrix(), padding=0.5)
+
+        np.testing.assert_allclose(box_min, [-1.5, -0.5, -0.5])
+        np.testing.assert_allclose(box_max, [1.5, 2.5, 3.5])
+
+    def test_world_bounding_box_transform(self, mesh_collision):
+        """Padding is scaled with the points, then the box is translated."""
+        points = np.array([[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]])
+
+        box_min, box_max = mesh_collision.world_bounding_box(
+            points, _matrix(translate=(10.0, 0.0, -5.0), scale=2.0), padding=0.5
+        )
+
+        np.testing.assert_allclose(box_min, [9.0, -1.0, -6.0])
+        np.testing.assert_allclose(box_max, [13.0, 3.0, -2.0])
+
+    def test_world_bounding_box_empty(self, mesh_collision):
+        """No points give an inverted box that contains nothing."""
+        box_min, box_max = mesh_collision.world_bounding_box(np.zeros((0, 3)), _matrix())
+
+        assert np.all(box_min > box_max)
+        distance = mesh_collision.distance_to_box(np.zeros((1, 3)), box_min, box_max)
+        assert distance[0] > 0.0
+
+    def test_distance_to_box(self, mesh_collision):
+        """Inside points are at 0, outside ones at their Euclidean gap."""
+        points = np.array(
+            [
+                [0.5, 0.5, 0.5],
+                [1.0, 0.0, 1.0],
+                [3.0, 0.5, 0.5],
+                [-3.0, -4.0, 0.5],
+                [2.0, 2.0, 2.0],
+            ]
+        )
+
+        distance = mesh_collision.distance_to_box(points, np.zeros(3), np.ones(3))
+
+        np.testing.assert_allclose(distance, [0.0, 0.0, 2.0, 5.0, np.sqrt(3.0)])
+
+
+@pytest.mark.unit
+class TestCaches:
+    """Test suite for the per-node caches of the deformer."""
+
+    def test_accel_grid_follows_topology(self, mesh_collision):
+        """The grid is rebuilt only when the collider topology changes."""
+        deformer = mesh_collision.CollisionDeformer()
+        collider = FakeCollider((8, 12, 6, 24))
+
+        deformer._update_accel_params(collider)
+        deformer._update_accel_params(collider)
+        assert collider.grid_builds == 1
+        assert deformer.mm_accel_params == "grid 1"
+
+        collider.topology = (10, 16, 8, 32)
+        deformer._update_accel_params(collider)
+        deformer._update_accel_params(collider)
+        assert collider.grid_builds == 2
+        assert deformer.mm_accel_params == "grid 2"
+
+    def test_weights_dropped_when_painted(self, mesh_collision):
+        """A dirty weight list clears the cache, a clean one keeps it."""
+        deformer = mesh_collision.CollisionDeformer()
+        data_block = FakeDataBlock()
+        weights = np.full(4, 0.5)
+        deformer.weight_cache[0] = weights
+        deformer.weight_cache[1] = weights
+
+        assert deformer._get_weights(data_block, 0, 4) is weights
+        assert deformer._get_weights(data_block, 1, 4) is weights
+
+        data_block.dirty = True
+        np.testing.assert_array_equal(deformer._get_weights(data_block, 0, 4), np.ones(4))
+        assert list(deformer.weight_cache) == [0]
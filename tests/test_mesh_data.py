@@ -0,0 +1,267 @@
+"""Unit tests for the bulk mesh point accessor of the face operations.
+
+Mesh reads are replaced by counters over a small point array and a single
+pentagon face, so the tests check component resolution, how often points
+and topology are read, that dirty callbacks drop the right cache and how
+selected loops are split.
+"""
+
+import importlib
+
+import numpy as np
+import pytest
+
+mesh_data = importlib.import_module("mayaLib.rigLib.face.operations.mesh_data")
+edge_detection = importlib.import_module("mayaLib.rigLib.face.operations.edge_detection")
+
+POINTS = np.array(
+    [
+        [0.0, 0.0, 0.0],
+        [1.0, 2.0, 0.0],
+        [2.0, 4.0, 1.0],
+        [3.0, 2.0, 0.0],
+        [4.0, 0.0, -1.0],
+    ]
+)
+
+
+class FakeDagPath:
+    """Stand-in for an ``MDagPath``."""
+
+    def __init__(self, name):
+        """Store the node name."""
+        self.name = name
+        self.valid = True
+
+    def fullPathName(self):  # noqa: N802
+        """Return the full path of the node."""
+        return "|" + self.name
+
+    def isValid(self):  # noqa: N802
+        """Return False once the test deletes the node."""
+        return self.valid
+
+
+@pytest.fixture
+def point_reads(monkeypatch):
+    """Serve POINTS for every mesh (shifted by 10 in world space) and count reads."""
+    reads = []
+    dag_paths = {}
+
+    def read_points(dag_path, world_space=True):
+        reads.append((dag_path.name, world_space))
+        return POINTS + (10.0 if world_space else 0.0)
+
+    monkeypatch.setattr(mesh_data, "_read_points", read_points)
+    monkeypatch.setattr(
+        mesh_data, "_shape_dag_path", lambda mesh: dag_paths.setdefault(mesh, FakeDagPath(mesh))
+    )
+    monkeypatch.setattr(mesh_data.MeshData, "add_callbacks", lambda self: None)
+    mesh_data.clear_mesh_data_cache()
+    yield reads
+    mesh_data.clear_mesh_data_cache()
+
+
+@pytest.fixture
+def topology_reads(point_reads, monkeypatch):
+    """Serve one pentagon over the five POINTS for every mesh and count reads."""
+    reads = []
+
+    def read_topology(dag_path):
+        reads.append(dag_path.name)
+        return np.array([5]), np.arange(5), 5
+
+    monkeypatch.setattr(mesh_data, "_read_topology", read_topology)
+    yield reads
+    mesh_data.clear_mesh_data_cache()
+
+
+@pytest.mark.unit
+class TestParseComponents:
+    """Test suite for resolving component names."""
+
+    def test_groups_and_ranges(self):
+        """Components are grouped by node and type with ranges expanded."""
+        groups = mesh_data.parse_components(
+            ["head.vtx[3]", "head.vtx[0:1]", "head.e[4]", "ns:eye.vtx[2]"]
+        )
+
+        assert list(groups) == [("head", "vtx"), ("head", "e"), ("ns:eye", "vtx")]
+        np.testing.assert_array_equal(groups[("head", "vtx")], [3, 0, 1])
+
+    def test_wildcard(self):
+        """A [*] component stands for every component."""
+        groups = mesh_data.parse_components(["head.vtx[1]", "head.vtx[*]"])
+
+        assert groups[("head", "vtx")] is None
+
+    def test_invalid_name(self):
+        """Objects and unsupported components are rejected."""
+        with pytest.raises(ValueError, match="head.map"):
+            mesh_data.parse_components(["head.map[0]"])
+
+
+@pytest.mark.unit
+class TestMeshData:
+    """Test suite for the cached point reads."""
+
+    def test_points_read_once_per_space(self, point_reads):
+        """Repeated queries of a mesh share one read per space."""
+        mesh_data.get_component_positions(["head.vtx[0]"])
+        mesh_data.get_component_positions(["head.vtx[1:2]"])
+        mesh_data.get_component_positions(["head.vtx[3]"], world_space=False)
+
+        assert point_reads == [("head", True), ("head", False)]
+
+    def test_dirty_callbacks(self, point_reads):
+        """Node dirty drops both spaces, world matrix changes only world space."""
+        data = mesh_data.get_mesh_data("head")
+        data.points(True)
+        data.points(False)
+
+        data.mark_world_dirty()
+        data.points(True)
+        data.points(False)
+        data.mark_dirty()
+        data.points(False)
+
+        assert point_reads == [
+            ("head", True),
+            ("head", False),
+            ("head", True),
+            ("head", False),
+        ]
+
+    def test_deleted_mesh_is_read_again(self, point_reads):
+        """An invalid DAG path replaces the cached accessor."""
+        data = mesh_data.get_mesh_data("head")
+        data.dag_path.valid = False
+
+        assert mesh_data.get_mesh_data("head") is not data
+
+    def test_topology_shared_by_hash(self, topology_reads):
+        """Meshes and rereads with the same connectivity share one topology."""
+        topology = mesh_data.get_mesh_topology("head")
+        mesh_data.get_mesh_data("head").mark_dirty()
+
+        assert mesh_data.get_mesh_topology("head") is topology
+        assert mesh_data.get_mesh_topology("eye") is topology
+        assert topology_reads == ["head", "head", "eye"]
+
+
+@pytest.mark.unit
+class TestComponentQueries:
+    """Test suite for positions, centers and bounds."""
+
+    def test_positions_keep_component_order(self, point_reads):
+        """Positions follow the vertex order of the components."""
+        positions = mesh_data.get_component_positions(["head.vtx[3]", "head.vtx[0]"], False)
+
+        np.testing.assert_array_equal(positions, POINTS[[3, 0]])
+
+    def test_other_components_are_converted(self, point_reads, monkeypatch):
+        """Edges are converted to vertices in one call without selecting."""
+        import maya.cmds as cmds
+
+        monkeypatch.setattr(
+            cmds, "polyListComponentConversion", lambda items, **flags: ["head.vtx[1:2]"]
+        )
+
+        indices = mesh_data.get_vertex_indices(["head.vtx[4]", "head.e[7]"])
+
+        np.testing.assert_array_equal(indices["head"], [4, 1, 2])
+
+    def test_wildcard_uses_vertex_count(self, point_reads):
+        """A [*] component covers every vertex of the mesh."""
+        positions = mesh_data.get_component_positions(["head.vtx[*]"], False)
+
+        np.testing.assert_array_equal(positions, POINTS)
+
+    def test_center_counts_vertices_once(self, point_reads):
+        """Duplicated vertices do not move the center."""
+        center = mesh_data.get_components_center(
+            ["head.vtx[0]", "head.vtx[0:1]"], world_space=False
+        )
+
+        assert center == (0.5, 1.0, 0.0)
+
+    def test_bounding_box(self, point_reads):
+        """Bounds are the per-axis minimum and maximum."""
+        bounds = mesh_data.get_components_bounding_box(["head.vtx[1:4]"])
+
+        assert bounds == ((11.0, 10.0, 9.0), (14.0, 14.0, 11.0))
+        assert mesh_data.get_components_bounding_box([]) is None
+
+    @pytest.mark.parametrize(("direction", "expected"), [(0, "head.vtx[2]"), (1, "head.vtx[1]")])
+    def test_select_vertex_by_direction(self, point_reads, monkeypatch, direction, expected):
+        """The higher or lower of two vertices is picked from one object space read."""
+        import maya.cmds as cmds
+
+        monkeypatch.setattr(cmds, "select", lambda *args, **flags: None)
+
+        vertex = edge_detection._select_vertex_by_direction(
+            ["head.vtx[1]", "head.vtx[2]"], direction
+        )
+
+        assert vertex == expected
+        assert point_reads == [("head", False)]
+
+
+@pytest.mark.unit
+class TestEdgeLoopSplit:
+    """Test suite for splitting selected loops along their edges."""
+
+    @pytest.fixture
+    def loop_selection(self, point_reads, monkeypatch):
+        """Select the pentagon border and record selection changes."""
+        import maya.cmds as cmds
+
+        changes = []
+        edges = np.column_stack((np.arange(5), np.roll(np.arange(5), -1)))
+        monkeypatch.setattr(mesh_data, "_read_edge_vertices", lambda dag_path, ids: edges[ids])
+        monkeypatch.setattr(cmds, "ls", lambda *args, **flags: ["head.e[0:4]"])
+        monkeypatch.setattr(cmds, "select", lambda *args, **flags: changes.append(args))
+        return changes
+
+    @pytest.mark.parametrize(
+        ("direction", "expected"),
+        [(0, [0, 1, 2, 3, 4]), (1, [0, 4])],
+    )
+    def test_halves(self, loop_selection, direction, expected):
+        """The loop splits at its X extremities into the upper and lower half."""
+        vertices = edge_detection._split_edge_loop(["head.e[0:4]"], direction, axis_index=0)
+
+        assert vertices == [f"head.vtx[{index}]" for index in expected]
+
+    @pytest.mark.parametrize(
+        ("direction", "expected"),
+        [(0, [4, 3, 2]), (1, [4, 0, 1, 2])],
+    )
+    def test_tongue_halves(self, loop_selection, direction, expected):
+        """The tongue loop splits at its Z extremities without selecting."""
+        vertices = edge_detection.find_edge_up_down_tongue(direction, enable_loop_mode=False)
+
+        assert vertices == [f"head.vtx[{index}]" for index in expected]
+        assert loop_selection == []
+
+    @pytest.mark.parametrize(
+        ("direction", "expected"),
+        [(0, [0, 4, 2, 5]), (1, [0, 3, 1, 5])],
+    )
+    def test_chorded_cap(self, point_reads, monkeypatch, direction, expected):
+        """Cap chords between loop vertices are not mistaken for loop edges."""
+        # Hexagon loop 0-4-2-5-1-3 fanned from vertex 0: edges 6 to 8 are the
+        # chords 0-2, 0-5 and 0-1, only edges 0 to 5 are selected
+        loop = [0, 4, 2, 5, 1, 3]
+        edges = np.concatenate(
+            (np.column_stack((loop, np.roll(loop, -1))), [[0, 2], [0, 5], [0, 1]])
+        )
+        points = np.zeros((6, 3))
+        points[loop, 0] = [0.0, 1.0, 2.0, 3.0, 2.0, 1.0]
+        points[loop, 1] = [0.0, 1.0, 1.0, 0.0, -1.0, -1.0]
+        monkeypatch.setattr(mesh_data, "_read_points", lambda dag_path, world_space=True: points)
+        monkeypatch.setattr(mesh_data, "_read_edge_vertices", lambda dag_path, ids: edges[ids])
+
+        vertices = edge_detection._split_edge_loop(["cap.e[0:5]"], direction, axis_index=0)
+
+        assert vertices == [f"cap.vtx[{index}]" for index in expected]
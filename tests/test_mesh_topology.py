@@ -0,0 +1,148 @@
+"""Unit tests for the CSR mesh topology tables.
+
+Small quad grids and strips are built from polygon counts and vertex ids,
+so every table and traversal can be checked by hand without Maya.
+"""
+
+import numpy as np
+import pytest
+
+from mayaLib.rigLib.utils import mesh_topology
+from mayaLib.rigLib.utils.mesh_topology import MeshTopology
+
+
+def _quad_grid(rows, columns):
+    """Build the counts and vertex ids of a grid of quads.
+
+    Vertices are numbered row after row, ``columns + 1`` per row.
+    """
+    width = columns + 1
+    connects = []
+    for row in range(rows):
+        for column in range(columns):
+            vertex = row * width + column
+            connects += [vertex, vertex + 1, vertex + width + 1, vertex + width]
+    return [4] * (rows * columns), connects
+
+
+@pytest.fixture
+def grid():
+    """3x3 quads over a 4x4 vertex grid."""
+    return MeshTopology(*_quad_grid(3, 3))
+
+
+@pytest.mark.unit
+class TestTables:
+    """Test suite for the adjacency tables."""
+
+    def test_counts(self, grid):
+        """A 3x3 quad grid has 24 edges, 12 of them on the border."""
+        assert (grid.num_vertices, grid.num_faces, grid.num_edges) == (16, 9, 24)
+        assert len(grid.boundary_edges) == 12
+
+    def test_vertex_tables(self, grid):
+        """Neighbors and faces of an inner and a corner vertex."""
+        np.testing.assert_array_equal(grid.neighbors(5), [1, 4, 6, 9])
+        np.testing.assert_array_equal(grid.neighbors(0), [1, 4])
+        np.testing.assert_array_equal(grid.faces_of_vertex(5), [0, 1, 3, 4])
+
+    def test_edge_tables(self, grid):
+        """Edge lookup and the faces of inner and border edges."""
+        inner, border, missing = grid.edge_ids([5, 1, 0], [6, 0, 5])
+
+        np.testing.assert_array_equal(grid.faces_of_edge(inner), [1, 4])
+        np.testing.assert_array_equal(grid.faces_of_edge(border), [0])
+        assert missing == -1
+
+    def test_unused_vertices(self):
+        """Vertices without faces get empty rows."""
+        topology = MeshTopology([3], [0, 1, 2], num_vertices=5)
+
+        assert len(topology.neighbors(4)) == 0
+        assert len(topology.faces_of_vertex(3)) == 0
+
+    def test_hash_follows_connectivity(self):
+        """Same connectivity hashes alike, a flipped face does not."""
+        counts, connects = _quad_grid(2, 2)
+        flipped = connects[:4][::-1] + connects[4:]
+
+        assert MeshTopology(counts, connects).key == mesh_topology.topology_hash(counts, connects)
+        assert MeshTopology(counts, flipped).key != MeshTopology(counts, connects).key
+
+    def test_gather_rows(self):
+        """Rows are concatenated in request order, repeats included."""
+        indptr = np.array([0, 2, 2, 5])
+        indices = np.array([10, 11, 20, 21, 22])
+
+        np.testing.assert_array_equal(
+            mesh_topology.gather_rows(indptr, indices, [2, 1, 0, 2]),
+            [20, 21, 22, 10, 11, 20, 21, 22],
+        )
+
+
+@pytest.mark.unit
+class TestQueries:
+    """Test suite for traversals."""
+
+    def test_geodesic_distances(self, grid):
+        """Breadth-first hop counts are grid Manhattan distances."""
+        distances = grid.geodesic_distances([0])
+
+        rows, columns = np.divmod(np.arange(16), 4)
+        np.testing.assert_array_equal(distances, rows + columns)
+
+    def test_geodesic_limits(self):
+        """Unreached and out of range vertices stay at -1."""
+        topology = MeshTopology([3, 3], [0, 1, 2, 3, 4, 5])
+
+        np.testing.assert_array_equal(topology.geodesic_distances([0]), [0, 1, 1, -1, -1, -1])
+        assert topology.geodesic_distances([0], max_steps=0).tolist() == [0] + [-1] * 5
+
+    def test_k_ring(self, grid):
+        """Rings grow by one edge per step."""
+        np.testing.assert_array_equal(grid.k_ring([5], 1), [1, 4, 5, 6, 9])
+        np.testing.assert_array_equal(grid.k_ring([0], 2, include_sources=False), [1, 2, 4, 5, 8])
+
+    def test_boundary_loop(self, grid):
+        """The border is one ordered loop around the grid."""
+        (loop,) = grid.boundary_loops()
+
+        np.testing.assert_array_equal(loop, [0, 1, 2, 3, 7, 11, 15, 14, 13, 12, 8, 4])
+
+    def test_order_vertices(self, grid):
+        """Open paths start at an end, loops are flagged closed."""
+        (path, closed), (other, _) = grid.order_vertices([14, 1, 8, 0, 12, 2, 4, 15])
+        (loop, loop_closed) = grid.order_vertices([10, 9, 5, 6])[0]
+
+        np.testing.assert_array_equal(path, [2, 1, 0, 4, 8, 12])
+        np.testing.assert_array_equal(other, [14, 15])
+        assert not closed
+        np.testing.assert_array_equal(loop, [5, 6, 10, 9])
+        assert loop_closed
+
+    def test_loop_paths_closed(self, grid):
+        """A closed loop splits into both sides between two vertices."""
+        first, second = grid.loop_paths([5, 6, 10, 9], 5, 10)
+
+        np.testing.assert_array_equal(first, [5, 6, 10])
+        np.testing.assert_array_equal(second, [5, 9, 10])
+
+    def test_loop_paths_open(self, grid):
+        """An open path gives the one path between the vertices, reversed if needed."""
+        (path,) = grid.loop_paths([0, 1, 2, 3], 3, 1)
+
+        np.testing.assert_array_equal(path, [3, 2, 1])
+        with pytest.raises(ValueError, match="not on one path"):
+            grid.loop_paths([0, 1, 2, 3], 0, 15)
+
+    def test_edge_loop_paths_ignore_chords(self):
+        """Only the loop edges are walked, not the chords of a triangulated cap."""
+        loop = [0, 4, 2, 5, 1, 3]
+        cap = MeshTopology(np.full(4, 3), [0, 4, 2, 0, 2, 5, 0, 5, 1, 0, 1, 3])
+        pairs = np.column_stack((loop, np.roll(loop, -1)))
+
+        first, second = mesh_topology.edge_loop_paths(pairs, 0, 5)
+
+        assert len(cap.order_vertices(loop)) > 1
+        np.testing.assert_array_equal(first, [0, 4, 2, 5])
+        np.testing.assert_array_equal(second, [0, 3, 1, 5])
@@ -0,0 +1,509 @@
+"""Unit tests for the Houdini network serializer file format.
+
+Covers the schema v2 record encoding (interned spare templates, columnar
+keyframes, compact parameters), the streaming writer and reader with and
+without gzip, loading of legacy schema v1 documents, and incremental delta
+snapshots, and the batched parameter application of the deserializer.
+Houdini itself is mocked; the snapshot tests walk small fake node trees
+with the ``hou``-facing helpers patched out.
+"""
+
+import gzip
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from houdiniLib.utility import node_serializer
+
+FLOAT_TEMPLATE = {
+    "template_type": "Float",
+    "name": "weight",
+    "label": "Weight",
+    "num_components": 1,
+    "default": [0.5],
+    "min": 0.0,
+    "max": 1.0,
+}
+
+KEYFRAMES = [
+    {"frame": 1.0, "value": 0.0, "slope": 0.0, "in_slope": 0.0},
+    {"frame": 12.0, "value": 2.5, "expression": "bezier()"},
+    {"frame": 24.0, "string_keyframe": True, "expression": "'abc'"},
+]
+
+
+def make_node(name, spare=(FLOAT_TEMPLATE,), **extra):
+    """Build a v1 node dict as produced by ``_serialize_node_data``."""
+    node = {
+        "name": name,
+        "type": "null",
+        "position": [1.0, -2.0],
+        "color": [0.8, 0.8, 0.8],
+        "comment": "",
+        "flags": {
+            "display": True,
+            "render": False,
+            "bypass": False,
+            "template": False,
+            "lock": False,
+        },
+        "parameters": {
+            "tx": {"value": 2.0},
+            "ty": {"value": 1.0, "expression": "$F", "expression_language": "hscript"},
+            "tz": {"value": 0.0, "keyframes": KEYFRAMES},
+        },
+        "spare_parameters": list(spare),
+    }
+    node.update(extra)
+    return node
+
+
+def write_network(path, nodes, compress=None):
+    """Write top-level v1 node dicts with the stream writer."""
+    with node_serializer.NetworkStreamWriter(path, {"source_path": "/obj"}, compress) as writer:
+        for node in nodes:
+            writer.write_node(node, "")
+        writer.write({"kind": "connections", "parent": "", "connections": []})
+    return writer
+
+
+@pytest.mark.unit
+class TestKeyframeColumns:
+    """Tests for the columnar keyframe layout."""
+
+    def test_round_trip(self):
+        """Columns convert back to the original per-key dicts."""
+        columns = node_serializer._keyframes_to_columns(KEYFRAMES)
+        assert columns["frame"] == [1.0, 12.0, 24.0]
+        assert columns["slope"] == [0.0, None, None]
+        assert node_serializer._keyframes_from_columns(columns) == KEYFRAMES
+
+    def test_empty(self):
+        """No keyframes give no columns."""
+        assert node_serializer._keyframes_to_columns([]) == {}
+        assert node_serializer._keyframes_from_columns({}) == []
+
+
+@pytest.mark.unit
+class TestNodeRecords:
+    """Tests for encoding and decoding v2 node records."""
+
+    def test_round_trip(self):
+        """A decoded record matches the source node dict."""
+        node = make_node("null1", user_data={"key": "value"})
+        template_records, record = node_serializer._encode_node_record(
+            node, "subnet1", node_serializer._TemplateTable()
+        )
+        templates = {r["id"]: r["template"] for r in template_records}
+
+        decoded = node_serializer._decode_node_record(record, templates)
+
+        assert decoded.pop("kind") == "node"
+        assert decoded.pop("parent") == "subnet1"
+        assert decoded == node
+
+    def test_compact_encoding(self):
+        """Value-only parameters are bare and only set flags are stored."""
+        _, record = node_serializer._encode_node_record(
+            make_node("null1"), "", node_serializer._TemplateTable()
+        )
+        assert record["parameters"]["tx"] == 2.0
+        assert record["flags"] == ["display"]
+        assert "comment" not in record
+        assert isinstance(record["parameters"]["tz"]["keyframes"], dict)
+
+    def test_templates_are_interned(self):
+        """Identical templates get one id and are emitted once."""
+        table = node_serializer._TemplateTable()
+        first, record_a = node_serializer._encode_node_record(make_node("a"), "", table)
+        second, record_b = node_serializer._encode_node_record(make_node("b"), "", table)
+
+        assert len(first) == 1
+        assert second == []
+        assert record_a["spare_parameters"] == record_b["spare_parameters"] == [0]
+
+    def test_unknown_template_raises(self):
+        """A record referencing a missing template id is rejected."""
+        _, record = node_serializer._encode_node_record(
+            make_node("a"), "", node_serializer._TemplateTable()
+        )
+        with pytest.raises(ValueError, match="unknown template"):
+            node_serializer._decode_node_record(record, {})
+
+
+@pytest.mark.unit
+class TestStreamFiles:
+    """Tests for writing and reading v2 files."""
+
+    @pytest.mark.parametrize("file_name", ["net.json", "net.json.gz"])
+    def test_round_trip(self, tmp_path, file_name):
+        """Nodes written by the stream writer are read back in order."""
+        path = tmp_path / file_name
+        nodes = [make_node(f"null{ii}") for ii in range(5)]
+        writer = write_network(path, nodes)
+
+        records = list(node_serializer.iter_network_records(path))
+
+        assert writer.node_count == 5
+        assert writer.template_count == 1
+        assert records[0]["kind"] == "header"
+        assert records[0]["version"] == 2
+        assert records[-1] == {"kind": "end", "node_count": 5, "template_count": 1}
+        read_nodes = [r for r in records if r["kind"] == "node"]
+        assert [r["name"] for r in read_nodes] == [n["name"] for n in nodes]
+        assert read_nodes[3]["spare_parameters"] == [FLOAT_TEMPLATE]
+        assert read_nodes[3]["parameters"]["tz"]["keyframes"] == KEYFRAMES
+        assert not (tmp_path / (file_name + ".tmp")).exists()
+
+    def test_gzip_from_suffix(self, tmp_path):
+        """A '.gz' path is compressed and smaller than the plain file."""
+        nodes = [make_node(f"null{ii}") for ii in range(50)]
+        write_network(tmp_path / "net.json", nodes)
+        write_network(tmp_path / "net.json.gz", nodes)
+
+        with gzip.open(tmp_path / "net.json.gz", "rt", encoding="utf-8") as f:
+            assert f.read() == (tmp_path / "net.json").read_text(encoding="utf-8")
+        assert (tmp_path / "net.json.gz").stat().st_size < (tmp_path / "net.json").stat().st_size
+
+    def test_smaller_than_v1(self, tmp_path):
+        """The v2 stream is smaller than the indented v1 document."""
+        nodes = [make_node(f"null{ii}") for ii in range(50)]
+        write_network(tmp_path / "net.json", nodes)
+        v1_text = json.dumps({"version": 1, "nodes": nodes}, indent=2)
+
+        assert (tmp_path / "net.json").stat().st_size < len(v1_text) / 2
+
+    def test_failed_write_keeps_existing_file(self, tmp_path):
+        """An exception while writing leaves the previous file untouched."""
+        path = tmp_path / "net.json"
+        path.write_text("previous", encoding="utf-8")
+
+        with (
+            pytest.raises(RuntimeError),
+            node_serializer.NetworkStreamWriter(path) as writer,
+        ):
+            writer.write_node(make_node("a"))
+            raise RuntimeError("export failed")
+
+        assert path.read_text(encoding="utf-8") == "previous"
+        assert not (tmp_path / "net.json.tmp").exists()
+
+    def test_truncated_file_warns(self, tmp_path, caplog):
+        """A file without an end record is read with a warning."""
+        path = tmp_path / "net.json"
+        write_network(path, [make_node("a")])
+        lines = path.read_text(encoding="utf-8").splitlines()
+        path.write_text("\n".join(lines[:-1]) + "\n", encoding="utf-8")
+
+        records = list(node_serializer.iter_network_records(path))
+
+        assert [r["kind"] for r in records][-1] == "connections"
+        assert "truncated" in caplog.text
+
+    def test_missing_file(self, tmp_path):
+        """Reading a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            list(node_serializer.iter_network_records(tmp_path / "missing.json"))
+
+
+@pytest.mark.unit
+class TestLegacyFiles:
+    """Tests for reading schema v1 documents."""
+
+    def test_v1_is_flattened(self, tmp_path):
+        """Nested v1 children become node records with a parent path."""
+        child = make_node("inner")
+        subnet = make_node(
+            "subnet1",
+            children=[child],
+            connections=[{"from_node": None, "indirect_index": 0, "to_node": "inner"}],
+        )
+        data = {
+            "version": 1,
+            "houdini_version": "21.5.100",
+            "source_path": "/obj/geo1",
+            "nodes": [subnet],
+            "connections": [],
+            "network_boxes": [],
+            "sticky_notes": [],
+        }
+        path = tmp_path / "legacy.json"
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+        records = list(node_serializer.iter_network_records(path))
+
+        assert [(r["kind"], r.get("parent")) for r in records] == [
+            ("header", None),
+            ("node", ""),
+            ("node", "subnet1"),
+            ("connections", "subnet1"),
+            ("connections", ""),
+            ("network_boxes", None),
+            ("sticky_notes", None),
+        ]
+        assert records[2]["parameters"] == child["parameters"]
+
+    def test_unsupported_version(self, tmp_path):
+        """Unknown schema versions are rejected."""
+        path = tmp_path / "future.json"
+        path.write_text(json.dumps({"version": 99, "nodes": []}), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Unsupported schema version"):
+            list(node_serializer.iter_network_records(path))
+
+
+class FakeNode:
+    """Minimal stand-in for ``hou.Node`` used by the snapshot tests."""
+
+    def __init__(self, name, parent_path="/obj/geo1", value=0.0, children=()):
+        """Create the node and its children."""
+        self._name = name
+        self._path = f"{parent_path}/{name}"
+        self.value = value
+        self._children = [FakeNode(c._name, self._path, c.value, c._children) for c in children]
+
+    def name(self):
+        """Return the node name."""
+        return self._name
+
+    def path(self):
+        """Return the absolute node path."""
+        return self._path
+
+    def children(self):
+        """Return the child nodes."""
+        return self._children
+
+    def isLockedHDA(self):  # noqa: N802 - hou API
+        """Fake nodes are never locked assets."""
+        return False
+
+
+@pytest.fixture
+def fake_network(monkeypatch):
+    """Patch the hou-facing helpers and return a settable network root."""
+    network = {"nodes": []}
+    serialized = []
+
+    def serialize_node_data(node, include_keyframes=True):
+        serialized.append(node.path())
+        data = make_node(node.name())
+        data["parameters"]["tx"] = {"value": node.value}
+        return data
+
+    root = FakeNode("geo1", "/obj")
+    monkeypatch.setattr(node_serializer.hou, "applicationVersionString", lambda: "21.5.100")
+    monkeypatch.setattr(node_serializer, "_serialize_node_data", serialize_node_data)
+    monkeypatch.setattr(node_serializer, "_serialize_connections", lambda parent: [])
+    monkeypatch.setattr(node_serializer, "_serialize_network_boxes", lambda parent: [])
+    monkeypatch.setattr(node_serializer, "_serialize_sticky_notes", lambda parent: [])
+    monkeypatch.setattr(
+        node_serializer, "_resolve_nodes", lambda node_path=None: (root, network["nodes"])
+    )
+    network["serialized"] = serialized
+    return network
+
+
+def node_records(path):
+    """Return the node records of a snapshot keyed by relative path."""
+    return {
+        node_serializer._child_key(r["parent"], r["name"]): r
+        for r in node_serializer.iter_network_records(path)
+        if r["kind"] == "node"
+    }
+
+
+@pytest.mark.unit
+class TestIncrementalSnapshots:
+    """Tests for delta snapshots against a base snapshot."""
+
+    def test_delta_holds_only_changes(self, tmp_path, fake_network):
+        """Changed, added and removed nodes are the only delta content."""
+        subnet = FakeNode("subnet1", children=[FakeNode("inner1"), FakeNode("inner2")])
+        fake_network["nodes"] = [FakeNode("a"), FakeNode("b"), subnet]
+        node_serializer.serialize_network(tmp_path / "base.json", "/obj/geo1")
+
+        fake_network["nodes"] = [
+            FakeNode("a", value=5.0),
+            FakeNode("c"),
+            FakeNode("subnet1", children=[FakeNode("inner1")]),
+        ]
+        summary = node_serializer.serialize_network_delta(
+            tmp_path / "delta.json", tmp_path / "base.json", "/obj/geo1"
+        )
+        raw = [
+            json.loads(line)
+            for line in (tmp_path / "delta.json").read_text(encoding="utf-8").splitlines()
+        ]
+
+        assert summary["base"] == "base.json"
+        assert summary["node_count"] == 2
+        assert summary["removed_count"] == 2
+        assert [r["name"] for r in raw if r["kind"] == "node"] == ["a", "c"]
+        assert {"kind": "removed", "keys": ["b", "subnet1/inner2"]} in raw
+
+    def test_delta_applies_to_current_state(self, tmp_path, fake_network):
+        """Base plus delta reads back the same nodes as a full snapshot."""
+        fake_network["nodes"] = [FakeNode("a"), FakeNode("b", children=[FakeNode("x")])]
+        node_serializer.serialize_network(tmp_path / "base.json", "/obj/geo1")
+
+        fake_network["nodes"] = [FakeNode("b", value=2.0, children=[FakeNode("y")]), FakeNode("d")]
+        node_serializer.serialize_network_delta(
+            tmp_path / "delta.json.gz", tmp_path / "base.json", "/obj/geo1"
+        )
+        node_serializer.serialize_network(tmp_path / "full.json", "/obj/geo1")
+
+        merged = node_records(tmp_path / "delta.json.gz")
+        full = node_records(tmp_path / "full.json")
+        assert list(merged) == ["b", "b/y", "d"]
+        for key, record in full.items():
+            assert merged[key]["parameters"] == record["parameters"]
+            assert merged[key]["hash"] == record["hash"]
+
+    def test_delta_chain(self, tmp_path, fake_network):
+        """A delta can use another delta as its base."""
+        fake_network["nodes"] = [FakeNode("a")]
+        node_serializer.serialize_network(tmp_path / "s0.json", "/obj/geo1")
+        fake_network["nodes"] = [FakeNode("a", value=1.0)]
+        node_serializer.serialize_network_delta(
+            tmp_path / "s1.json", tmp_path / "s0.json", "/obj/geo1"
+        )
+        fake_network["nodes"] = [FakeNode("a", value=1.0), FakeNode("b")]
+        summary = node_serializer.serialize_network_delta(
+            tmp_path / "s2.json", tmp_path / "s1.json", "/obj/geo1"
+        )
+
+        merged = node_records(tmp_path / "s2.json")
+        assert summary["node_count"] == 1
+        assert merged["a"]["parameters"]["tx"] == {"value": 1.0}
+        assert list(merged) == ["a", "b"]
+
+    def test_dirty_paths_limit_serialization(self, tmp_path, fake_network):
+        """Only dirty and new nodes are serialized when dirty paths are given."""
+        fake_network["nodes"] = [FakeNode(name) for name in "abcd"]
+        node_serializer.serialize_network(tmp_path / "base.json", "/obj/geo1")
+        fake_network["serialized"].clear()
+
+        fake_network["nodes"] = [FakeNode(name) for name in "abcde"]
+        fake_network["nodes"][1].value = 3.0
+        summary = node_serializer.serialize_network_delta(
+            tmp_path / "delta.json",
+            tmp_path / "base.json",
+            "/obj/geo1",
+            dirty_paths={"/obj/geo1/b"},
+        )
+
+        assert fake_network["serialized"] == ["/obj/geo1/b", "/obj/geo1/e"]
+        assert summary["node_count"] == 2
+
+    def test_animated_values_do_not_change_hash(self):
+        """Evaluated values of keyframed parameters are not hashed."""
+        node = make_node("a")
+        moved = make_node("a")
+        moved["parameters"]["tz"] = {**moved["parameters"]["tz"], "value": 9.0}
+
+        assert node_serializer._node_hash(node) == node_serializer._node_hash(moved)
+
+
+class FakeParmTuple(list):
+    """List of fake parms that records bulk ``set`` calls."""
+
+    def __init__(self, name, size):
+        """Create ``size`` component parms."""
+        super().__init__(MagicMock(name=f"{name}{ii}") for ii in range(size))
+        self._name = name
+        self.set_calls = []
+        for index, parm in enumerate(self):
+            parm.tuple.return_value = self
+            parm.componentIndex.return_value = index
+
+    def name(self):
+        """Return the tuple name."""
+        return self._name
+
+    def set(self, values):
+        """Record a bulk set."""
+        self.set_calls.append(values)
+
+
+@pytest.mark.unit
+class TestBatchedParameters:
+    """Tests for tuple-batched parameter and bulk keyframe application."""
+
+    @pytest.fixture
+    def node(self):
+        """A mocked node with a 3 component 't' and a 1 component 'scale'."""
+        tuples = {"t": FakeParmTuple("t", 3), "scale": FakeParmTuple("scale", 1)}
+        parms = {"tx": tuples["t"][0], "ty": tuples["t"][1], "tz": tuples["t"][2]}
+        parms["scale"] = tuples["scale"][0]
+        node = MagicMock()
+        node.parm.side_effect = parms.get
+        node.tuples = tuples
+        return node
+
+    def test_full_tuple_set_in_one_call(self, node):
+        """All components of a tuple are set with one ParmTuple.set call."""
+        node_serializer._apply_parameters(
+            node, {"tx": {"value": 1.0}, "ty": {"value": 2.0}, "tz": {"value": 3.0}}
+        )
+
+        assert node.tuples["t"].set_calls == [(1.0, 2.0, 3.0)]
+        for parm in node.tuples["t"]:
+            parm.set.assert_not_called()
+
+    def test_partial_tuple_set_per_component(self, node):
+        """A partially serialized tuple falls back to Parm.set."""
+        node_serializer._apply_parameters(node, {"ty": {"value": 2.0}, "scale": {"value": 4.0}})
+
+        assert node.tuples["t"].set_calls == []
+        node.tuples["t"][1].set.assert_called_once_with(2.0)
+        assert node.tuples["scale"].set_calls == [(4.0,)]
+
+    def test_keyframes_set_in_bulk_and_locks_last(self, node):
+        """Keyframes use one setKeyframes call; locks follow the values."""
+        timer = node_serializer._PhaseTimer()
+        node_serializer._apply_parameters(
+            node,
+            {
+                "tx": {"value": 0.0, "keyframes": KEYFRAMES[:2]},
+                "ty": {"value": 1.0, "locked": True},
+            },
+            timer,
+        )
+
+        tx, ty = node.tuples["t"][0], node.tuples["t"][1]
+        tx.setKeyframes.assert_called_once()
+        assert len(tx.setKeyframes.call_args.args[0]) == 2
+        tx.setKeyframe.assert_not_called()
+        ty.set.assert_called_once_with(1.0)
+        ty.lock.assert_called_once_with(True)
+        assert timer.seconds["keys"] > 0.0
+
+
+@pytest.mark.unit
+class TestDeserializeNetwork:
+    """Tests for the deserialization driver with a mocked scene."""
+
+    def test_phases_and_update_mode(self, tmp_path, monkeypatch):
+        """Every phase is timed and the update mode is restored."""
+        path = tmp_path / "net.json"
+        write_network(path, [make_node("a"), make_node("b")])
+
+        parent = MagicMock()
+        parent.createNode.return_value.isLockedHDA.return_value = False
+        hou = node_serializer.hou
+        monkeypatch.setattr(hou, "node", lambda node_path: parent)
+        monkeypatch.setattr(hou, "updateModeSetting", lambda: "auto")
+        set_update_mode = MagicMock()
+        monkeypatch.setattr(hou, "setUpdateMode", set_update_mode)
+        monkeypatch.setattr(node_serializer, "_apply_parameters", MagicMock())
+
+        timings = {}
+        nodes = node_serializer.deserialize_network(path, "/obj/geo1", timings=timings)
+
+        assert len(nodes) == 2
+        assert parent.createNode.call_count == 2
+        assert set(timings) == {"create", "params", "keys", "connections", "flags", "total"}
+        assert set_update_mode.call_args_list[-1].args == ("auto",)
+        assert set_update_mode.call_args_list[0].args == (hou.updateMode.Manual,)
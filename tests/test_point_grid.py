@@ -0,0 +1,123 @@
+"""Unit tests for the uniform grid nearest point query and skin transfer.
+
+Compares PointGrid queries against a brute force reference on surface-like,
+flat, degenerate and far-away point sets, and checks the inverse distance
+blending used by the facial skin copy tools.
+"""
+
+import numpy as np
+import pytest
+
+from mayaLib.rigLib.face.skin.copy import blend_nearest_weights, transfer_weight_matrix
+from mayaLib.rigLib.utils.point_grid import PointGrid, brute_force_query
+
+
+def _sphere_patch(num_points, seed):
+    """Sample points on a patch of a sphere, like a face region."""
+    rng = np.random.default_rng(seed)
+    u, v = rng.random((2, num_points)) * np.pi
+    return np.column_stack([np.cos(u) * np.sin(v), np.sin(u) * np.sin(v), np.cos(v)]) * 10.0
+
+
+def _reference(source, points, k):
+    """Sorted distances of the k nearest source points, by brute force."""
+    dist = np.linalg.norm(points[:, None, :] - source[None, :, :], axis=2)
+    return np.sort(dist, axis=1)[:, :k]
+
+
+@pytest.mark.unit
+class TestPointGrid:
+    """Test suite for PointGrid."""
+
+    @pytest.mark.parametrize("k", [1, 4])
+    def test_matches_brute_force_on_surface(self, k):
+        """Test queries near a curved surface return the exact neighbors."""
+        source = _sphere_patch(3000, seed=1)
+        points = _sphere_patch(500, seed=2) + np.random.default_rng(3).normal(0, 0.1, (500, 3))
+        distances, indices = PointGrid(source).query(points, k=k)
+
+        assert distances.shape == indices.shape == (500, k)
+        np.testing.assert_allclose(distances, _reference(source, points, k))
+        np.testing.assert_allclose(
+            np.linalg.norm(source[indices] - points[:, None, :], axis=2), distances
+        )
+
+    def test_points_far_outside_the_grid(self):
+        """Test query points outside the source bounds fall back correctly."""
+        rng = np.random.default_rng(4)
+        source = rng.random((400, 3))
+        points = rng.random((200, 3)) * 6.0 - 3.0
+        distances, _ = PointGrid(source).query(points, k=3)
+        np.testing.assert_allclose(distances, _reference(source, points, 3))
+
+    def test_flat_and_degenerate_sources(self):
+        """Test planar, collinear and single point sources."""
+        rng = np.random.default_rng(5)
+        points = rng.random((100, 3)) * 2.0 - 0.5
+        for source in (
+            rng.random((300, 3)) * [1.0, 1.0, 0.0],
+            np.column_stack([np.linspace(0, 1, 50), np.zeros(50), np.zeros(50)]),
+            np.zeros((1, 3)),
+        ):
+            distances, _ = PointGrid(source).query(points, k=2)
+            np.testing.assert_allclose(distances, _reference(source, points, 2))
+
+    def test_k_is_capped_at_source_count(self):
+        """Test asking for more neighbors than source points."""
+        distances, indices = PointGrid(np.eye(3)).query(np.zeros((2, 3)), k=5)
+        assert indices.shape == (2, 3)
+        assert sorted(indices[0]) == [0, 1, 2]
+
+    def test_empty_source_raises(self):
+        """Test a grid needs at least one point."""
+        with pytest.raises(ValueError):
+            PointGrid(np.zeros((0, 3)))
+
+    def test_brute_force_query(self):
+        """Test the brute force fallback on its own."""
+        rng = np.random.default_rng(6)
+        source, points = rng.random((2, 80, 3))
+        distances, indices = brute_force_query(source, points, k=2, chunk_size=16)
+        np.testing.assert_allclose(distances, _reference(source, points, 2))
+        np.testing.assert_allclose(
+            np.linalg.norm(source[indices[:, 0]] - points, axis=1), distances[:, 0]
+        )
+
+
+@pytest.mark.unit
+class TestSkinTransfer:
+    """Test suite for nearest point skin weight transfer."""
+
+    def test_single_neighbor_copies_rows(self):
+        """Test k=1 copies the closest source row."""
+        weights = np.array([[1.0, 0.0], [0.0, 1.0]])
+        result = blend_nearest_weights(np.array([[0.5], [0.1]]), np.array([[1], [0]]), weights)
+        np.testing.assert_array_equal(result, [[0.0, 1.0], [1.0, 0.0]])
+
+    def test_inverse_distance_blend(self):
+        """Test neighbors are blended by inverse distance and normalized."""
+        weights = np.array([[1.0, 0.0], [0.0, 1.0]])
+        result = blend_nearest_weights(
+            np.array([[1.0, 3.0]]), np.array([[0, 1]]), weights, power=1.0
+        )
+        np.testing.assert_allclose(result, [[0.75, 0.25]])
+
+    def test_coincident_point_wins(self):
+        """Test a source point at zero distance takes over the blend."""
+        weights = np.array([[1.0, 0.0], [0.0, 1.0]])
+        result = blend_nearest_weights(np.array([[0.0, 0.5]]), np.array([[1, 0]]), weights)
+        np.testing.assert_allclose(result, [[0.0, 1.0]], atol=1e-9)
+
+    def test_transfer_weight_matrix(self):
+        """Test the transfer picks the weights of the matching source points."""
+        source = _sphere_patch(1000, seed=7)
+        weights = np.random.default_rng(8).random((1000, 5))
+        weights /= weights.sum(axis=1, keepdims=True)
+        order = np.random.default_rng(9).permutation(1000)
+
+        result, distances = transfer_weight_matrix(source, weights, source[order])
+        np.testing.assert_allclose(result, weights[order])
+        np.testing.assert_allclose(distances, 0.0)
+
+        blended, _ = transfer_weight_matrix(source, weights, source[order] + 0.01, neighbors=4)
+        np.testing.assert_allclose(blended.sum(axis=1), 1.0)
@@ -0,0 +1,69 @@
+"""Unit tests for the vectorized proxy geometry face assignment.
+
+Uses a small strip of quads and triangles to check the per-influence face
+masks and the face subset extraction used to build each proxy mesh.
+"""
+
+import numpy as np
+import pytest
+
+from mayaLib.rigLib.utils import proxy_geo
+
+# Three faces along x: quad (0,1,4,3), quad (1,2,5,4), triangle (2,6,5)
+COUNTS = np.array([4, 4, 3])
+CONNECTS = np.array([0, 1, 4, 3, 1, 2, 5, 4, 2, 6, 5])
+POINTS = np.array(
+    [[0, 0, 0], [1, 0, 0], [2, 0, 0], [0, 1, 0], [1, 1, 0], [2, 1, 0], [3, 0, 0]], dtype=float
+)
+# Two influences: the first fades out along x
+WEIGHTS = np.array(
+    [[1.0, 0.0], [0.6, 0.4], [0.2, 0.8], [1.0, 0.0], [0.6, 0.4], [0.2, 0.8], [0.0, 1.0]]
+)
+
+
+@pytest.mark.unit
+class TestFaceAssignment:
+    """Test suite for assigning faces to influences."""
+
+    def test_face_offsets(self):
+        """Test offsets point at the first vertex of every face."""
+        np.testing.assert_array_equal(proxy_geo.face_offsets(COUNTS), [0, 4, 8])
+
+    def test_threshold_mask(self):
+        """Test a face belongs to every influence one of its vertices exceeds."""
+        mask = proxy_geo.face_influence_mask(COUNTS, CONNECTS, WEIGHTS, threshold=0.45)
+        np.testing.assert_array_equal(mask, [[True, False], [True, True], [False, True]])
+
+    def test_threshold_is_exclusive(self):
+        """Test weights equal to the threshold do not count."""
+        mask = proxy_geo.face_influence_mask(COUNTS, CONNECTS, WEIGHTS, threshold=0.8)
+        np.testing.assert_array_equal(mask[:, 1], [False, False, True])
+
+    def test_dominant_mask(self):
+        """Test every face goes to its highest average weight only."""
+        mask = proxy_geo.face_dominant_influence(COUNTS, CONNECTS, WEIGHTS)
+        np.testing.assert_array_equal(mask, [[True, False], [False, True], [False, True]])
+
+
+@pytest.mark.unit
+class TestExtractFaceSubset:
+    """Test suite for building a mesh from a face subset."""
+
+    def test_vertices_are_compacted(self):
+        """Test unused vertices are dropped and indices renumbered."""
+        points, counts, connects, uv_map, uv_ids = proxy_geo.extract_face_subset(
+            POINTS, COUNTS, CONNECTS, np.array([False, True, True])
+        )
+        np.testing.assert_array_equal(counts, [4, 3])
+        np.testing.assert_array_equal(points, POINTS[[1, 2, 4, 5, 6]])
+        # Same positions face vertex by face vertex
+        np.testing.assert_array_equal(points[connects], POINTS[CONNECTS[4:]])
+        assert uv_map is None and uv_ids is None
+
+    def test_uvs_follow_the_faces(self):
+        """Test face-vertex UV indices are compacted like the vertices."""
+        uv_ids = np.arange(len(CONNECTS)) + 100
+        _, _, _, uv_map, sub_uv_ids = proxy_geo.extract_face_subset(
+            POINTS, COUNTS, CONNECTS, np.array([True, False, True]), uv_ids
+        )
+        np.testing.assert_array_equal(uv_map[sub_uv_ids], uv_ids[[0, 1, 2, 3, 8, 9, 10]])
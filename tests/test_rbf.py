@@ -0,0 +1,148 @@
+"""Unit tests for the RBF pose-space interpolation solver.
+
+Validates the interpolation at the driver poses, the batch and single pose
+paths against each other, and the rotational distance metrics against
+rotations with known angles.
+"""
+
+import numpy as np
+import pytest
+
+from mayaLib.rigLib.math import matrix, rbf
+
+
+def _axis_angle(axis, angle):
+    """Build an ``(x, y, z, w)`` quaternion from an axis and an angle."""
+    axis = np.asarray(axis, dtype=np.float64) / np.linalg.norm(axis)
+    return np.append(axis * np.sin(angle / 2.0), np.cos(angle / 2.0))
+
+
+def _random_problem(num_poses=20, num_inputs=3, num_outputs=5, seed=2):
+    """Build random driver poses and output values."""
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=(num_poses, num_inputs)), rng.normal(size=(num_poses, num_outputs))
+
+
+@pytest.mark.unit
+class TestRBFSolver:
+    """Test suite for RBFSolver."""
+
+    @pytest.mark.parametrize("kernel", sorted(rbf.KERNELS))
+    def test_interpolates_driver_poses(self, kernel):
+        """Every kernel reproduces the output values at the driver poses."""
+        poses, values = _random_problem()
+
+        solver = rbf.RBFSolver(poses, values, kernel=kernel)
+
+        np.testing.assert_allclose(solver.evaluate_batch(poses), values, atol=1e-6)
+
+    def test_single_pose_matches_batch(self):
+        """Single pose evaluation gives the rows of evaluate_batch."""
+        poses, values = _random_problem()
+        solver = rbf.RBFSolver(poses, values)
+        queries = np.random.default_rng(3).normal(size=(4, 3))
+
+        batch = solver.evaluate_batch(queries)
+
+        for query, row in zip(queries, batch, strict=True):
+            np.testing.assert_allclose(solver.evaluate(query), row)
+
+    def test_regularization_smooths(self):
+        """Regularization trades exact interpolation for smaller weights."""
+        poses, values = _random_problem()
+
+        exact = rbf.RBFSolver(poses, values)
+        smooth = rbf.RBFSolver(poses, values, epsilon=exact.epsilon, regularization=1.0)
+
+        assert np.abs(smooth.weights).sum() < np.abs(exact.weights).sum()
+        assert not np.allclose(smooth.evaluate_batch(poses), values)
+
+    def test_duplicated_poses_fall_back_to_lstsq(self):
+        """A singular kernel matrix is solved in the least squares sense."""
+        poses = np.array([[0.0], [1.0], [1.0], [2.0]])
+        values = np.array([0.0, 1.0, 1.0, 0.0])
+
+        solver = rbf.RBFSolver(poses, values)
+
+        np.testing.assert_allclose(solver.evaluate_batch(poses)[:, 0], values, atol=1e-6)
+
+    def test_one_dimensional_values(self):
+        """One value per pose gives a single output column."""
+        poses, values = _random_problem(num_outputs=1)
+
+        solver = rbf.RBFSolver(poses, values[:, 0])
+
+        assert solver.num_outputs == 1
+        assert solver.evaluate(poses[0]).shape == (1,)
+
+    def test_invalid_arguments(self):
+        """Unknown kernels, metrics and mismatched values are rejected."""
+        poses, values = _random_problem()
+
+        with pytest.raises(ValueError, match="kernel"):
+            rbf.RBFSolver(poses, values, kernel="cubic")
+        with pytest.raises(ValueError, match="metric"):
+            rbf.RBFSolver(poses, values, metric="manhattan")
+        with pytest.raises(ValueError, match="poses"):
+            rbf.RBFSolver(poses, values[:-1])
+
+
+@pytest.mark.unit
+class TestRotationMetrics:
+    """Test suite for the quaternion and swing-twist distances."""
+
+    def test_euclidean_matches_norm(self):
+        """Pairwise Euclidean distances match per-pair norms."""
+        poses_a, poses_b = _random_problem(num_poses=6, num_outputs=3)
+
+        distances = rbf.euclidean_distance(poses_a, poses_b)
+
+        expected = np.linalg.norm(poses_a[:, None] - poses_b[None], axis=-1)
+        np.testing.assert_allclose(distances, expected, atol=1e-9)
+
+    def test_quaternion_angle_and_sign(self):
+        """The distance is the rotation angle and q equals -q."""
+        identity = _axis_angle((1, 0, 0), 0.0)
+        bent = _axis_angle((0, 0, 1), 0.5)
+
+        distances = rbf.quaternion_distance([identity], [bent, -bent])
+
+        np.testing.assert_allclose(distances, [[0.5, 0.5]])
+
+    def test_multiple_drivers_combine(self):
+        """Angles of several drivers combine like vector components."""
+        pose_a = np.concatenate([_axis_angle((1, 0, 0), 0.0)] * 2)
+        pose_b = np.concatenate([_axis_angle((1, 0, 0), 0.3), _axis_angle((0, 1, 0), 0.4)])
+
+        np.testing.assert_allclose(rbf.quaternion_distance(pose_a, pose_b), [[0.5]])
+
+    def test_swing_twist_decomposition(self):
+        """Swing times twist rebuilds the rotation and twist stays on the axis."""
+        rotation = matrix.quaternion_multiply(
+            _axis_angle((0, 1, 0), 0.7), _axis_angle((1, 0, 0), 0.4)
+        )
+
+        swing, twist = rbf.swing_twist_decompose(rotation)
+
+        np.testing.assert_allclose(twist, _axis_angle((1, 0, 0), 0.4), atol=1e-9)
+        np.testing.assert_allclose(swing, _axis_angle((0, 1, 0), 0.7), atol=1e-9)
+        np.testing.assert_allclose(matrix.quaternion_multiply(swing, twist), rotation, atol=1e-9)
+
+    def test_swing_twist_weights(self):
+        """Twist weight scales only the twist part of the distance."""
+        identity = _axis_angle((1, 0, 0), 0.0)
+        twisted = _axis_angle((1, 0, 0), 0.6)
+        swung = _axis_angle((0, 0, 1), 0.6)
+
+        distances = rbf.swing_twist_distance([identity], [twisted, swung], twist_weight=0.5)
+
+        np.testing.assert_allclose(distances, [[0.3, 0.6]], atol=1e-9)
+
+    def test_quaternion_solver(self):
+        """A solver on rotational drivers hits its poses with q or -q."""
+        poses = np.array([_axis_angle((0, 0, 1), angle) for angle in (0.0, 0.5, 1.0, 1.5)])
+        values = np.array([[0.0], [0.2], [0.8], [1.0]])
+
+        solver = rbf.RBFSolver(poses, values, metric="swing_twist", twist_axis=(1, 0, 0))
+
+        np.testing.assert_allclose(solver.evaluate_batch(-poses), values, atol=1e-6)
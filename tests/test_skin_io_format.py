@@ -0,0 +1,207 @@
+"""Unit tests for the NumPy skin file format in skin_io.
+
+Covers the on-disk round trip of the compressed NumPy format, reading of
+legacy pickle files, influence column remapping and the threaded pack
+import. None of these paths touch the Maya API.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from mayaLib.rigLib.face.io import skin_io
+
+
+def _make_record(num_points=5, influences=("root", "spine", "head")):
+    """Build a skin record with normalized random weights."""
+    rng = np.random.default_rng(0)
+    weights = rng.random((num_points, len(influences)))
+    weights /= weights.sum(axis=1, keepdims=True)
+    return {
+        "objName": "body_geo",
+        "nameSpace": "",
+        "skinClsName": "skinCluster1",
+        "skinningMethod": 0,
+        "normalizeWeights": 1,
+        "influences": list(influences),
+        "weights": weights,
+        "blendWeights": np.linspace(0.0, 1.0, num_points),
+    }
+
+
+@pytest.mark.unit
+class TestSkinFileRoundTrip:
+    """Test suite for write_skin_file / read_skin_file."""
+
+    def test_npz_round_trip(self, tmp_path):
+        """Weights, blend weights and metadata survive the NumPy format."""
+        record = _make_record()
+        file_path = str(tmp_path / "body.data")
+
+        skin_io.write_skin_file(file_path, [record])
+        loaded = skin_io.read_skin_file(file_path)
+
+        assert len(loaded) == 1
+        assert loaded[0]["influences"] == record["influences"]
+        assert loaded[0]["skinClsName"] == "skinCluster1"
+        assert loaded[0]["pointCount"] == 5
+        assert loaded[0]["weights"].shape == (5, 3)
+        np.testing.assert_allclose(loaded[0]["weights"], record["weights"], atol=1e-6)
+        np.testing.assert_allclose(loaded[0]["blendWeights"], record["blendWeights"], atol=1e-6)
+
+    def test_stores_only_nonzero_weights(self, tmp_path):
+        """The archive holds CSR arrays sized by the non-zero weights."""
+        record = _make_record()
+        record["weights"][:, 1] = 0.0
+        file_path = str(tmp_path / "sparse.data")
+
+        skin_io.write_skin_file(file_path, [record])
+
+        with np.load(file_path) as archive:
+            assert len(archive["obj0_values"]) == 10
+        loaded = skin_io.read_skin_file(file_path)
+        np.testing.assert_allclose(loaded[0]["weights"], record["weights"], atol=1e-6)
+
+    def test_max_influences_pruning(self, tmp_path):
+        """Export pruning keeps the largest weights and renormalizes."""
+        record = _make_record()
+        file_path = str(tmp_path / "pruned.data")
+
+        skin_io.write_skin_file(file_path, [record], max_influences=1)
+        weights = skin_io.read_skin_file(file_path)[0]["weights"]
+
+        assert np.count_nonzero(weights, axis=1).tolist() == [1] * 5
+        np.testing.assert_allclose(weights.sum(axis=1), 1.0, atol=1e-6)
+        np.testing.assert_array_equal(weights.argmax(axis=1), record["weights"].argmax(axis=1))
+
+    def test_multiple_objects(self, tmp_path):
+        """Several objects are stored in a single file."""
+        first = _make_record(4)
+        second = _make_record(7, ("a", "b"))
+        second["objName"] = "head_geo"
+        file_path = str(tmp_path / "pack.data")
+
+        skin_io.write_skin_file(file_path, [first, second])
+        loaded = skin_io.read_skin_file(file_path)
+
+        assert [r["objName"] for r in loaded] == ["body_geo", "head_geo"]
+        assert loaded[1]["weights"].shape == (7, 2)
+
+    def test_legacy_pickle_is_readable(self, tmp_path):
+        """Files written in the legacy pickle layout load as records."""
+        record = _make_record()
+        file_path = str(tmp_path / "legacy.data")
+
+        skin_io.write_skin_file(file_path, [record], file_format="pickle")
+        loaded = skin_io.read_skin_file(file_path)
+
+        assert loaded[0]["influences"] == record["influences"]
+        np.testing.assert_allclose(loaded[0]["weights"], record["weights"])
+        np.testing.assert_allclose(loaded[0]["blendWeights"], record["blendWeights"])
+
+    def test_unknown_format_raises(self, tmp_path):
+        """Unsupported formats are rejected."""
+        with pytest.raises(ValueError):
+            skin_io.write_skin_file(str(tmp_path / "x.data"), [_make_record()], file_format="xml")
+
+
+@pytest.mark.unit
+class TestRemapWeightColumns:
+    """Test suite for remap_weight_columns."""
+
+    def test_reorders_columns_by_name(self):
+        """File columns land on the matching scene influence."""
+        weights = np.array([[0.2, 0.8], [1.0, 0.0]])
+
+        remapped, unused = skin_io.remap_weight_columns(weights, ["b", "a"], ["a", "c", "b"])
+
+        np.testing.assert_allclose(remapped, [[0.8, 0.0, 0.2], [0.0, 0.0, 1.0]])
+        assert unused == []
+
+    def test_reports_unused_influences(self):
+        """Influences missing from the scene are reported."""
+        weights = np.ones((1, 2))
+
+        remapped, unused = skin_io.remap_weight_columns(weights, ["a", "ghost"], ["a"])
+
+        assert remapped.shape == (1, 1)
+        assert unused == ["ghost"]
+
+
+@pytest.mark.unit
+class TestSkinPackPipeline:
+    """Test suite for the threaded pack import and its report."""
+
+    def test_import_pack_applies_files_in_order(self, tmp_path, monkeypatch, capsys):
+        """Files read on workers are applied in pack order with progress."""
+        names = [f"geo_{ii}" for ii in range(7)]
+        for name in names:
+            record = _make_record()
+            record["objName"] = name
+            skin_io.write_skin_file(str(tmp_path / f"{name}.data"), [record])
+        pack_path = tmp_path / "char.list"
+        pack_path.write_text(
+            json.dumps({"objectsList": [f"{name}.data" for name in names]}), encoding="utf-8"
+        )
+
+        applied = []
+        progress = []
+        monkeypatch.setattr(skin_io, "apply_skin_records", lambda records: applied.extend(records))
+
+        assert skin_io.import_skin_pack(
+            str(pack_path),
+            max_workers=2,
+            progress_callback=lambda percent, message: progress.append(percent),
+        )
+
+        assert [r["objName"] for r in applied] == names
+        assert progress[-1] == 100
+        assert "Skin pack import: 7 objects" in capsys.readouterr().out
+
+    def test_import_pack_skips_corrupt_files(self, tmp_path, monkeypatch):
+        """Truncated pickles and npz files with missing members are skipped."""
+        for name in ("good", "npz_member", "pickle_eof", "pickle_junk"):
+            record = _make_record()
+            record["objName"] = name
+            file_format = "pickle" if name.startswith("pickle") else "npz"
+            skin_io.write_skin_file(str(tmp_path / f"{name}.data"), [record], file_format)
+
+        # Keep the header but drop the weight arrays of the npz file
+        with np.load(tmp_path / "npz_member.data") as archive:
+            header = archive["header"]
+        with open(tmp_path / "npz_member.data", "wb") as fh:
+            np.savez(fh, header=header)
+        eof_path = tmp_path / "pickle_eof.data"
+        eof_path.write_bytes(eof_path.read_bytes()[:20])
+        (tmp_path / "pickle_junk.data").write_bytes(b"not a skin file")
+
+        names = ["npz_member", "pickle_eof", "good", "pickle_junk"]
+        for name in names[:2] + names[3:]:
+            with pytest.raises(ValueError, match="not a readable skin data file"):
+                skin_io.read_skin_file(str(tmp_path / f"{name}.data"))
+
+        pack_path = tmp_path / "char.list"
+        pack_path.write_text(
+            json.dumps({"objectsList": [f"{name}.data" for name in names]}), encoding="utf-8"
+        )
+        applied = []
+        monkeypatch.setattr(skin_io, "apply_skin_records", lambda records: applied.extend(records))
+
+        assert skin_io.import_skin_pack(str(pack_path), max_workers=2)
+        assert [r["objName"] for r in applied] == ["good"]
+
+    def test_format_pack_report(self):
+        """The report lists every object, slowest first, and totals."""
+        rows = [
+            {"name": "body", "main": 0.5, "io": 0.25, "size": 2048},
+            {"name": "head", "main": 1.5, "io": 0.75, "size": 1024},
+        ]
+
+        report = skin_io.format_pack_report(rows, "gather", "write", 2.0)
+        lines = report.splitlines()
+
+        assert lines[0] == "Skin pack: 2 objects in 2.00s"
+        assert lines[2].startswith("head")
+        assert lines[3].startswith("body")
+        assert lines[-1].split() == ["total", "2.000s", "1.000s", "3.0"]
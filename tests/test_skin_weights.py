@@ -0,0 +1,143 @@
+"""Unit tests for the sparse skin weight container.
+
+Validates CSR construction, dense round trips, vectorized pruning and
+normalization against straightforward per-row reference implementations.
+"""
+
+import numpy as np
+import pytest
+
+from mayaLib.rigLib.utils.skin_weights import SparseSkinWeights, prune_weights
+from mayaLib.utility import b_skin_saver
+
+
+def _random_weights(num_points=50, num_influences=12, seed=1):
+    """Build a dense, mostly-zero normalized weight matrix."""
+    rng = np.random.default_rng(seed)
+    weights = rng.random((num_points, num_influences))
+    weights[weights < 0.6] = 0.0
+    weights[:, 0] += 0.01  # make sure every row has a weight
+    return weights / weights.sum(axis=1, keepdims=True)
+
+
+def _names(count):
+    """Build influence names."""
+    return [f"jnt_{ii}" for ii in range(count)]
+
+
+@pytest.mark.unit
+class TestSparseSkinWeights:
+    """Test suite for SparseSkinWeights."""
+
+    def test_dense_round_trip(self):
+        """from_dense followed by to_dense reproduces the matrix."""
+        dense = _random_weights()
+
+        sparse = SparseSkinWeights.from_dense(dense, _names(12))
+
+        assert sparse.shape == dense.shape
+        assert sparse.nnz == np.count_nonzero(dense)
+        np.testing.assert_allclose(sparse.to_dense(), dense, atol=1e-6)
+
+    def test_from_coo_matches_from_dense(self):
+        """Unordered triplets build the same CSR layout as a dense matrix."""
+        dense = _random_weights()
+        rows, columns = np.nonzero(dense)
+        order = np.random.default_rng(3).permutation(len(rows))
+
+        sparse = SparseSkinWeights.from_coo(
+            _names(12), 50, rows[order], columns[order], dense[rows, columns][order]
+        )
+        expected = SparseSkinWeights.from_dense(dense, _names(12))
+
+        np.testing.assert_array_equal(sparse.indptr, expected.indptr)
+        np.testing.assert_array_equal(sparse.indices, expected.indices)
+        np.testing.assert_allclose(sparse.values, expected.values)
+
+    def test_prune_max_influences_matches_reference(self):
+        """Top-k pruning keeps the same entries as a per-row argsort."""
+        dense = _random_weights()
+        sparse = SparseSkinWeights.from_dense(dense, _names(12))
+
+        pruned = sparse.prune_max_influences(2).to_dense()
+
+        for row, pruned_row in zip(dense, pruned, strict=True):
+            keep = np.argsort(-row, kind="stable")[:2]
+            keep = keep[row[keep] > 0]
+            assert set(np.flatnonzero(pruned_row)) == set(keep)
+
+    def test_prune_threshold(self):
+        """Weights at or below the threshold are removed."""
+        sparse = SparseSkinWeights.from_dense(_random_weights(), _names(12))
+
+        pruned = sparse.prune_threshold(0.2)
+
+        assert pruned.values.min() > 0.2
+        assert pruned.num_points == sparse.num_points
+
+    def test_normalize(self):
+        """Rows sum to one after normalization; empty rows stay empty."""
+        dense = _random_weights() * 3.0
+        dense[4] = 0.0
+        sparse = SparseSkinWeights.from_dense(dense, _names(12))
+
+        sums = sparse.normalize().to_dense().sum(axis=1)
+
+        np.testing.assert_allclose(np.delete(sums, 4), 1.0, atol=1e-6)
+        assert sums[4] == 0.0
+
+    def test_compact_drops_unused_influences(self):
+        """Influences without weights are removed from the column list."""
+        dense = _random_weights()
+        dense[:, [3, 7]] = 0.0
+        sparse = SparseSkinWeights.from_dense(dense, _names(12))
+
+        compact = sparse.compact()
+
+        assert compact.influences == [n for n in _names(12) if n not in ("jnt_3", "jnt_7")]
+        np.testing.assert_allclose(compact.to_dense(), np.delete(dense, [3, 7], axis=1), atol=1e-6)
+
+    def test_arrays_round_trip(self):
+        """to_arrays/from_arrays preserve the container."""
+        sparse = SparseSkinWeights.from_dense(_random_weights(), _names(12))
+
+        rebuilt = SparseSkinWeights.from_arrays(
+            sparse.influences, sparse.to_arrays("obj0_"), prefix="obj0_"
+        )
+
+        np.testing.assert_array_equal(rebuilt.to_dense(), sparse.to_dense())
+
+    def test_invalid_arrays_raise(self):
+        """Inconsistent CSR arrays are rejected."""
+        with pytest.raises(ValueError):
+            SparseSkinWeights(["a"], [0, 2], [0], [1.0])
+        with pytest.raises(ValueError):
+            SparseSkinWeights(["a"], [0, 1], [1], [1.0])
+
+
+@pytest.mark.unit
+class TestPruneWeights:
+    """Test suite for prune_weights."""
+
+    def test_renormalizes_after_pruning(self):
+        """Pruned rows are renormalized."""
+        sparse = SparseSkinWeights.from_dense(_random_weights(), _names(12))
+
+        pruned = prune_weights(sparse, max_influences=3, threshold=0.05)
+
+        assert np.diff(pruned.indptr).max() <= 3
+        np.testing.assert_allclose(pruned.to_dense().sum(axis=1), 1.0, atol=1e-6)
+
+    def test_noop_without_options(self):
+        """Without options the container is returned unchanged."""
+        sparse = SparseSkinWeights.from_dense(_random_weights(), _names(12))
+
+        assert prune_weights(sparse) is sparse
+
+
+@pytest.mark.unit
+def test_parse_weight_lines():
+    """Weight lines of a bSkinSaver file parse into a dense matrix."""
+    weights = b_skin_saver.parse_weight_lines(["0 0.25 0.75", "1.0 0 0"], 3)
+
+    np.testing.assert_allclose(weights, [[0.0, 0.25, 0.75], [1.0, 0.0, 0.0]])
@@ -0,0 +1,154 @@
+"""Unit tests for the Bifrost graph model of the USD stage builder.
+
+Bifrost commands are replaced by a recorder, so the tests check which
+edits reach the graph and when, and that existence and connection checks
+are answered without querying it.
+"""
+
+import importlib
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+# The bifrostLib package shadows its submodules until Bifrost is initialized
+stage_builder = importlib.import_module("mayaLib.bifrostLib.stage_builder")
+
+
+@pytest.fixture
+def bifrost_calls(monkeypatch):
+    """Record the Bifrost API calls made by the graph model."""
+    calls = []
+    created = iter(range(1, 1000))
+
+    def create_node(shape, node_type, parent="/"):
+        calls.append(("create", node_type))
+        return node_type.split(",")[-1] + str(next(created))
+
+    def rename_node(shape, node, name):
+        calls.append(("rename", node, name))
+        return name
+
+    def add_input_port(shape, node, port_name, port_type, port_children=""):
+        calls.append(("port", node, port_name))
+        return node + "." + port_name + "1"
+
+    def connect(shape, source_port, destination_port):
+        calls.append(("connect", source_port, destination_port))
+
+    def get_node_type(shape, node):
+        calls.append(("type", node))
+        return "BifrostGraph,Core::Array,build_array"
+
+    cmds = MagicMock()
+    cmds.vnnCompound.return_value = ["input", "output"]
+    bifrost = SimpleNamespace(
+        bf_create_node=create_node,
+        bf_rename_node=rename_node,
+        bf_add_input_port=add_input_port,
+        bf_connect=connect,
+        bf_get_node_type=get_node_type,
+    )
+    monkeypatch.setattr(stage_builder, "cmds", cmds)
+    monkeypatch.setattr(stage_builder, "bifrost", bifrost)
+    return calls
+
+
+@pytest.mark.unit
+class TestHierarchyPaths:
+    """Test suite for deriving parents from full paths."""
+
+    def test_parent_path(self):
+        """Test the parent is the full path without its last name."""
+        assert stage_builder.get_parent_path("|geo|body|arm") == "|geo|body"
+        assert stage_builder.get_parent_path("|geo") == ""
+
+    def test_ancestor_paths(self):
+        """Test ancestors are listed from the object up to the top."""
+        assert stage_builder.get_ancestor_paths("|geo|body|arm") == [
+            "|geo|body|arm",
+            "|geo|body",
+            "|geo",
+        ]
+
+
+@pytest.mark.unit
+class TestBifrostGraphModel:
+    """Test suite for the in-memory Bifrost graph model."""
+
+    def test_existing_nodes_are_read_once(self, bifrost_calls):
+        """Test the nodes already in the graph are known without more queries."""
+        graph = stage_builder.BifrostGraphModel("bifrostShape")
+        assert graph.has_node("input")
+        assert graph.has_node("/output")
+        assert not graph.has_node("geo_define_usd_prim")
+        assert stage_builder.cmds.vnnCompound.call_count == 1
+
+    def test_created_node_type_is_not_queried(self, bifrost_calls):
+        """Test created nodes keep their type and name."""
+        graph = stage_builder.BifrostGraphModel("bifrostShape")
+        node = graph.create_node(stage_builder.DEFINE_USD_MESH, "geo_body_define_usd_mesh")
+
+        assert node == "geo_body_define_usd_mesh"
+        assert graph.has_node(node)
+        assert graph.get_node_type(node) == stage_builder.DEFINE_USD_MESH
+        assert not [call for call in bifrost_calls if call[0] == "type"]
+
+    def test_unknown_node_type_is_queried_once(self, bifrost_calls):
+        """Test the type of a pre-existing node is cached after one query."""
+        graph = stage_builder.BifrostGraphModel("bifrostShape")
+        graph.get_node_type("input")
+        graph.get_node_type("input")
+        assert bifrost_calls.count(("type", "input")) == 1
+
+    def test_connect_outside_batch_is_immediate(self, bifrost_calls):
+        """Test connections are sent at once when no batch is open."""
+        graph = stage_builder.BifrostGraphModel("bifrostShape")
+        graph.connect("time1.frame", "mesh1.frame")
+
+        assert bifrost_calls == [("connect", "time1.frame", "mesh1.frame")]
+        assert graph.is_connected("mesh1", "time1")
+        assert graph.is_connected("/time1", "mesh1")
+
+    def test_batch_defers_edits(self, bifrost_calls):
+        """Test edits in a batch are recorded at once but sent at the end."""
+        graph = stage_builder.BifrostGraphModel("bifrostShape")
+        with graph.batch():
+            graph.connect_child(
+                "arm_define_usd_mesh.mesh_definition",
+                "body_define_usd_prim",
+                "children.mesh_definition",
+                "children",
+            )
+            with graph.batch():
+                graph.connect("time1.frame", "arm_define_usd_mesh.frame")
+            assert graph.is_connected("body_define_usd_prim", "arm_define_usd_mesh")
+            assert bifrost_calls == []
+
+        assert bifrost_calls == [
+            ("port", "body_define_usd_prim", "children.mesh_definition"),
+            (
+                "connect",
+                "arm_define_usd_mesh.mesh_definition",
+                "body_define_usd_prim.children.mesh_definition1",
+            ),
+            ("connect", "time1.frame", "arm_define_usd_mesh.frame"),
+        ]
+        stage_builder.cmds.undoInfo.assert_any_call(openChunk=True)
+        stage_builder.cmds.undoInfo.assert_any_call(closeChunk=True)
+
+    def test_rename_updates_links_and_queue(self, bifrost_calls):
+        """Test renaming a node rewrites its links and queued connections."""
+        graph = stage_builder.BifrostGraphModel("bifrostShape")
+        with graph.batch():
+            node = graph.create_node(stage_builder.DEFINE_USD_PRIM)
+            graph.connect(node + ".prim_definition", "add_to_stage1.prim_definitions")
+            graph.connect(node + "/input.frame", "time1.frame")
+            graph.rename_node(node, "geo_define_usd_prim")
+
+        assert graph.is_connected("add_to_stage1", "geo_define_usd_prim")
+        assert not graph.is_connected("add_to_stage1", node)
+        assert bifrost_calls[-2:] == [
+            ("connect", "geo_define_usd_prim.prim_definition", "add_to_stage1.prim_definitions"),
+            ("connect", "geo_define_usd_prim/input.frame", "time1.frame"),
+        ]
@@ -0,0 +1,93 @@
+"""Unit tests for the NumPy helpers of the tension map plugin.
+
+A unit square split into two triangles, plus one unused vertex, is small
+enough to check edges, adjacency and average edge lengths by hand.
+"""
+
+import numpy as np
+import pytest
+
+from mayaLib.plugin import tension_map
+
+# Unit square in XY, split along the 0-2 diagonal; vertex 4 is unused
+POINTS = np.array(
+    [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0], [5.0, 5.0, 5.0]]
+)
+COUNTS = [3, 3]
+CONNECTS = [0, 1, 2, 0, 2, 3]
+
+
+@pytest.mark.unit
+class TestTopology:
+    """Test suite for topology hashing and edge adjacency."""
+
+    def test_topology_hash(self):
+        """The hash ignores the input dtype but follows counts and vertex ids."""
+        digest = tension_map.topology_hash(COUNTS, CONNECTS)
+
+        assert digest == tension_map.topology_hash(
+            np.array(COUNTS, dtype=np.int64), np.array(CONNECTS, dtype=np.int64)
+        )
+        assert digest != tension_map.topology_hash(COUNTS, [0, 1, 2, 0, 3, 2])
+        assert digest != tension_map.topology_hash([4, 2], CONNECTS)
+
+    def test_build_vertex_edge_adjacency(self):
+        """Unique sorted edges and the edges around every vertex."""
+        edges, indptr, indices = tension_map.build_vertex_edge_adjacency(COUNTS, CONNECTS, 5)
+
+        np.testing.assert_array_equal(edges, [[0, 1], [0, 2], [0, 3], [1, 2], [2, 3]])
+        np.testing.assert_array_equal(indptr, [0, 3, 5, 8, 10, 10])
+        np.testing.assert_array_equal(indices, [0, 1, 2, 3, 0, 4, 1, 3, 2, 4])
+
+    def test_quad_edges_wrap_around(self):
+        """The last vertex of a polygon connects back to its first one."""
+        edges, indptr, _ = tension_map.build_vertex_edge_adjacency([4], [0, 1, 2, 3], 4)
+
+        np.testing.assert_array_equal(edges, [[0, 1], [0, 3], [1, 2], [2, 3]])
+        np.testing.assert_array_equal(np.diff(indptr), [2, 2, 2, 2])
+
+
+@pytest.mark.unit
+class TestTension:
+    """Test suite for edge lengths, ramp positions and color lookup."""
+
+    def test_average_edge_lengths(self):
+        """Every vertex averages its sides and diagonal, unused ones get 0."""
+        adjacency = tension_map.build_vertex_edge_adjacency(COUNTS, CONNECTS, 5)
+
+        averages = tension_map.average_edge_lengths(POINTS, *adjacency)
+
+        corner = (2.0 + np.sqrt(2.0)) / 3.0
+        np.testing.assert_allclose(averages, [corner, 1.0, corner, 1.0, 0.0])
+
+    def test_scaled_mesh_doubles_lengths(self):
+        """Scaling the points scales the averages."""
+        adjacency = tension_map.build_vertex_edge_adjacency(COUNTS, CONNECTS, 5)
+
+        rest = tension_map.average_edge_lengths(POINTS, *adjacency)
+        scaled = tension_map.average_edge_lengths(POINTS * 2.0, *adjacency)
+
+        np.testing.assert_allclose(scaled, rest * 2.0)
+
+    def test_tension_positions(self):
+        """Compression moves above 0.5, stretch below, no rest length stays at 0.5."""
+        positions = tension_map.tension_positions(
+            np.array([1.0, 2.0, 0.0, 4.0]), np.array([0.5, 3.0, 1.0, 4.0])
+        )
+
+        np.testing.assert_allclose(positions, [1.0, 0.0, 0.5, 0.5])
+
+    def test_tension_positions_mismatched_meshes(self):
+        """Meshes with different vertex counts map to the neutral position."""
+        positions = tension_map.tension_positions(np.ones(3), np.ones(2))
+
+        np.testing.assert_array_equal(positions, [0.5, 0.5])
+
+    def test_sample_lut(self):
+        """Positions round to the nearest sample and clamp to the ends."""
+        lut = np.repeat(np.arange(5.0)[:, None], 4, axis=1)
+
+        colors = tension_map.sample_lut(lut, np.array([-1.0, 0.0, 0.24, 0.26, 0.5, 1.0, 2.0]))
+
+        np.testing.assert_array_equal(colors[:, 0], [0, 0, 1, 1, 2, 4, 4])
+        assert colors.shape == (7, 4)
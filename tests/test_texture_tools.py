@@ -0,0 +1,185 @@
+"""Unit tests for the texture batch tools.
+
+Images are written to a temporary directory, so the gamma tables, the
+output naming and the batch report can be checked end to end.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from tools import texture_tools  # noqa: E402
+from tools.texture_tools import TextureManager  # noqa: E402
+
+
+def _write_image(path, mode, color, size=(4, 2)):
+    """Save a flat color image and return its path as a string."""
+    Image.new(mode, size, color).save(path)
+    return str(path)
+
+
+def _set_mtime(path, seconds):
+    """Set the access and modification time of a file."""
+    os.utime(path, (seconds, seconds))
+
+
+@pytest.mark.unit
+class TestGammaCorrection:
+    """Test suite for the lookup table gamma correction."""
+
+    @pytest.mark.parametrize("gamma", [2.2, 0.454545, 1.0])
+    def test_lut_matches_point_callable(self, gamma):
+        """The cached table rounds like ``Image.point`` with the old lambda."""
+        ramp = Image.new("L", (256, 1))
+        ramp.putdata(list(range(256)))
+
+        expected = ramp.point(lambda x: ((x / 255) ** gamma) * 255)
+
+        np.testing.assert_array_equal(texture_tools.gamma_lut(gamma), np.asarray(expected)[0])
+
+    def test_eight_bit_modes(self):
+        """L and RGB images map every band through the 8-bit table."""
+        lut = texture_tools.gamma_lut(2.2)
+        gray = Image.new("L", (2, 2), 128)
+        color = Image.new("RGB", (2, 2), (10, 128, 250))
+
+        assert np.all(np.asarray(texture_tools.gamma_correction(gray, 2.2)) == lut[128])
+        corrected = texture_tools.gamma_correction(color, 2.2)
+        assert corrected.mode == "RGB"
+        assert corrected.getpixel((0, 0)) == tuple(int(lut[value]) for value in (10, 128, 250))
+
+    def test_sixteen_bit_mode(self):
+        """I;16 images go through the 16-bit table and keep their mode."""
+        pixels = np.array([[0, 1000, 32768, 65535]], dtype=np.uint16)
+
+        corrected = texture_tools.gamma_correction(Image.fromarray(pixels), 2.2)
+
+        assert corrected.mode == "I;16"
+        np.testing.assert_array_equal(
+            np.asarray(corrected), texture_tools.gamma_lut(2.2, 16)[pixels]
+        )
+
+    def test_integer_mode_is_clipped(self):
+        """32-bit integer images are clipped to 16 bits and stay in mode I."""
+        pixels = np.array([[-5, 0, 40000, 70000]], dtype=np.int32)
+
+        corrected = texture_tools.gamma_correction(Image.fromarray(pixels, mode="I"), 0.5)
+
+        lut = texture_tools.gamma_lut(0.5, 16)
+        assert corrected.mode == "I"
+        np.testing.assert_array_equal(np.asarray(corrected), [[0, 0, lut[40000], 65535]])
+
+    def test_float_mode(self):
+        """Float images are raised to the power, negative values clipped to 0."""
+        pixels = np.array([[-1.0, 0.25, 1.0, 4.0]], dtype=np.float32)
+
+        corrected = texture_tools.gamma_correction(Image.fromarray(pixels, mode="F"), 0.5)
+
+        assert corrected.mode == "F"
+        np.testing.assert_allclose(np.asarray(corrected), [[0.0, 0.5, 1.0, 2.0]])
+
+
+@pytest.mark.unit
+class TestTextureOutputs:
+    """Test suite for output naming and freshness checks."""
+
+    @pytest.mark.parametrize(
+        ("file_name", "expected"),
+        [
+            ("wood_OcclusionRoughnessMetallic.png", ("split", ("_ao", "_roughness", "_metallic"))),
+            ("wood_MT_R_AO.tga", ("split", ("_metallic", "_roughness", "_ao"))),
+            ("wood_BaseColor.jpg", ("convert", ["_diffuse"])),
+            ("wood_nrm-ogl.png", ("convert", ["_normal"])),
+            ("wood_rough.png", ("convert", ["_roughness"])),
+            ("wood_notes.png", (None, [])),
+        ],
+    )
+    def test_get_texture_outputs(self, tmp_path, file_name, expected):
+        """Packed maps split per channel, known channels are renamed next to the source."""
+        kind, base_name, suffix_list = TextureManager.get_texture_outputs(str(tmp_path / file_name))
+
+        assert (kind, suffix_list) == expected
+        assert base_name == str(tmp_path / "wood")
+
+    def test_is_up_to_date(self, tmp_path):
+        """Outputs count as up to date only if all exist and none is older."""
+        texture = _write_image(tmp_path / "wood_rough.png", "L", 0)
+        output = _write_image(tmp_path / "wood_roughness.png", "L", 0)
+        missing = str(tmp_path / "wood_missing.png")
+        _set_mtime(texture, 1000)
+
+        _set_mtime(output, 2000)
+        assert texture_tools.is_up_to_date(texture, [output])
+        assert not texture_tools.is_up_to_date(texture, [output, missing])
+        assert not texture_tools.is_up_to_date(texture, [])
+
+        _set_mtime(output, 500)
+        assert not texture_tools.is_up_to_date(texture, [output])
+
+
+@pytest.mark.unit
+class TestTextureBatch:
+    """Test suite for batch processing and its report."""
+
+    def test_format_texture_report(self):
+        """Failures are listed first, then the counts and the throughput."""
+        megabyte = 1024 * 1024
+        rows = [
+            {"file": "a.png", "status": "split", "bytes": megabyte, "error": ""},
+            {"file": "b.png", "status": "converted", "bytes": 3 * megabyte, "error": ""},
+            {"file": "c.png", "status": "skipped", "bytes": 0, "error": ""},
+            {"file": "d.png", "status": "error", "bytes": 0, "error": "OSError: bad file"},
+        ]
+
+        report = texture_tools.format_texture_report(rows, 2.0)
+
+        assert report.splitlines() == [
+            "Failed: d.png -- OSError: bad file",
+            "Textures: 4 in 2.00s (1 split, 1 converted, 1 up to date, 0 ignored, 1 failed)",
+            "Throughput: 2.0 MB/s, 1.0 images/s (4.0 MB read)",
+        ]
+
+    def test_unexpected_error_is_reported(self, tmp_path, monkeypatch):
+        """Errors other than I/O ones end up in the row instead of raising."""
+        texture = _write_image(tmp_path / "wood_MT_R_AO.png", "RGB", (1, 2, 3))
+
+        def fail(*args, **kwargs):
+            raise KeyError("channel")
+
+        monkeypatch.setattr(texture_tools, "split_channels", fail)
+        row = texture_tools.process_texture(texture)
+
+        assert row["status"] == "error"
+        assert row["error"] == "KeyError: 'channel'"
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_process_textures(self, tmp_path, workers):
+        """Every texture gets one row, sorted, and fresh outputs are skipped next time."""
+        packed = _write_image(tmp_path / "wood_OcclusionRoughnessMetallic.png", "RGB", (10, 20, 30))
+        color = _write_image(tmp_path / "wood_BaseColor.jpg", "RGB", (200, 100, 50))
+        unknown = _write_image(tmp_path / "wood_notes.png", "L", 0)
+        broken = tmp_path / "rock_Albedo.png"
+        broken.write_bytes(b"not an image")
+
+        rows = texture_tools.process_textures(
+            [packed, color, unknown, str(broken)], workers=workers, verbose=False
+        )
+
+        assert [row["file"] for row in rows] == sorted([packed, color, unknown, str(broken)])
+        status = {row["file"]: row["status"] for row in rows}
+        assert status == {
+            packed: "split",
+            color: "converted",
+            unknown: "ignored",
+            str(broken): "error",
+        }
+        for suffix, value in (("_ao", 10), ("_roughness", 20), ("_metallic", 30)):
+            with Image.open(tmp_path / f"wood{suffix}.png") as channel:
+                assert channel.getpixel((0, 0)) == value
+        assert (tmp_path / "wood_diffuse.png").exists()
+
+        rerun = texture_tools.process_textures([packed, color], workers=workers, verbose=False)
+        assert [row["status"] for row in rerun] == ["skipped", "skipped"]
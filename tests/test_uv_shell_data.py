@@ -0,0 +1,82 @@
+"""Unit tests for the vectorized UV shell and tile analysis.
+
+Uses three small shells: one inside tile (0, 0), one crossing into tile
+(1, 0) and one with a UV sitting on a tile border.
+"""
+
+import numpy as np
+import pytest
+
+from mayaLib.modelLib.base.uv import UVShellData, component_ranges
+
+U = [0.2, 0.4, 0.6, 0.9, 1.3, 0.5, 1.0]
+V = [0.2, 0.4, 0.5, 0.5, 0.5, 0.7, 0.7]
+SHELL_IDS = [0, 0, 1, 1, 1, 2, 2]
+# Faces 0-1 in shell 0, face 2 without UVs, faces 3-4 in shell 1, face 5 in shell 2
+FACE_SHELL_IDS = [0, 0, -1, 1, 1, 2]
+
+
+@pytest.fixture
+def uv_data():
+    """UV data of the three test shells."""
+    return UVShellData(U, V, SHELL_IDS, 3, FACE_SHELL_IDS, geo="pPlane1")
+
+
+@pytest.mark.unit
+class TestShellTiles:
+    """Test suite for per-shell tile membership."""
+
+    def test_tile_counts(self, uv_data):
+        """Test every shell counts the tiles its UVs fall in."""
+        np.testing.assert_array_equal(uv_data.tile_counts(), [1, 2, 2])
+
+    def test_out_of_bounds_shells(self, uv_data):
+        """Test shells crossing or touching a tile border are flagged."""
+        np.testing.assert_array_equal(uv_data.out_of_bounds_shells(), [False, True, True])
+
+    def test_shell_tile_ranges(self, uv_data):
+        """Test tile ranges match the [u_min, u_max, v_min, v_max] layout."""
+        assert uv_data.shell_tile_ranges(1) == [[0, 1, 0, 1], [1, 2, 0, 1]]
+
+    def test_negative_uvs_use_floor(self):
+        """Test negative UVs fall in negative tiles."""
+        uv_data = UVShellData([-0.5, 0.5], [0.5, 0.5], [0, 0])
+        assert uv_data.shell_tile_ranges(0) == [[-1, 0, 0, 1], [0, 1, 0, 1]]
+
+
+@pytest.mark.unit
+class TestTileGroups:
+    """Test suite for grouping UVs by shell and tile."""
+
+    def test_groups_of_flagged_shells(self, uv_data):
+        """Test only UVs strictly inside a tile are grouped."""
+        groups = uv_data.tile_uv_groups(uv_data.out_of_bounds_shells())
+        assert [(shell, tile, indices.tolist()) for shell, tile, indices in groups] == [
+            (1, (0, 0), [2, 3]),
+            (1, (1, 0), [4]),
+            (2, (0, 0), [5]),
+        ]
+
+    def test_no_shells(self, uv_data):
+        """Test an empty shell mask gives no groups."""
+        assert uv_data.tile_uv_groups([False, False, False]) == []
+
+
+@pytest.mark.unit
+class TestComponents:
+    """Test suite for building component names."""
+
+    def test_component_ranges(self):
+        """Test consecutive indices are merged into ranges."""
+        assert component_ranges("pPlane1", "map", [7, 1, 2, 3, 3]) == [
+            "pPlane1.map[1:3]",
+            "pPlane1.map[7]",
+        ]
+
+    def test_shell_faces(self, uv_data):
+        """Test faces are listed per shell, skipping faces without UVs."""
+        assert uv_data.shell_faces() == [
+            ["pPlane1.f[0:1]"],
+            ["pPlane1.f[3:4]"],
+            ["pPlane1.f[5]"],
+        ]
@@ -5,7 +5,7 @@ This script automatically detects its location and runs texture_tools.py
 without requiring hardcoded paths.
 
 Usage:
-    python converter.py [args]
+    python converter.py [directory] [--workers N] [--recursive] [args]
 """
 
 import subprocess
@@ -13,11 +13,37 @@ import sys
 from pathlib import Path
 
 
+def build_arguments(argv):
+    """Build the texture_tools.py argument list.
+
+    Args:
+        argv: Arguments passed to this script.
+
+    Returns:
+        list: Arguments to forward, with the worker count and recursive
+        options normalized and every other argument passed through.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the DevPyLib texture tools")
+    parser.add_argument(
+        "-j", "--workers", type=int, default=0, help="Worker process count (0: every CPU)"
+    )
+    parser.add_argument("-r", "--recursive", action="store_true", help="Include subdirectories")
+    args, forwarded = parser.parse_known_args(argv)
+
+    arguments = ["--workers", str(args.workers)]
+    if args.recursive:
+        arguments.append("--recursive")
+    return arguments + forwarded
+
+
 def main():
     """Auto-detect and run texture_tools.py with passed arguments.
 
     Auto-detects the tools directory based on this script's location
-    and runs texture_tools.py, forwarding all command-line arguments.
+    and runs texture_tools.py, forwarding the worker count, the recursive
+    option and every other command-line argument.
     """
     # Auto-detect the tools directory based on this script's location
     script_dir = Path(__file__).parent.resolve()
@@ -30,7 +56,8 @@ def main():
     # Run texture_tools.py with any arguments passed to this script
     try:
         result = subprocess.run(
-            [sys.executable, str(texture_tools_path)] + sys.argv[1:], check=True
+            [sys.executable, str(texture_tools_path)] + build_arguments(sys.argv[1:]),
+            check=True,
         )
         sys.exit(result.returncode)
     except subprocess.CalledProcessError as e:
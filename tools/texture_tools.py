@@ -2,17 +2,59 @@
 
 Provides tools for texture format conversion, channel splitting, colorspace
 management, and automated texture naming conventions for PBR workflows.
+
+Textures can be processed in parallel worker processes. Gamma correction
+uses lookup tables computed once per gamma (8 and 16-bit) and NumPy for
+float images, packed maps are split from a single decode, and outputs newer
+than their source are skipped:
+
+    python texture_tools.py textures/ --recursive --workers 16
 """
 
+import functools
 import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+import numpy as np
 from PIL import Image
 
+# Channel suffixes of packed maps, in R, G, B order
+PACKED_TEXTURE_LAYOUTS = {
+    "_MT_R_AO": ("_metallic", "_roughness", "_ao"),
+    "_OcclusionRoughnessMetallic": ("_ao", "_roughness", "_metallic"),
+}
+
+_SIXTEEN_BIT_MODES = ("I;16", "I;16B", "I;16L", "I")
+
+
+@functools.cache
+def gamma_lut(gamma, bits=8):
+    """Build the gamma correction lookup table of an integer bit depth.
+
+    Args:
+        gamma: Gamma correction value.
+        bits: Bit depth of the pixel values, 8 or 16.
+
+    Returns:
+        np.ndarray: Corrected value of every input value, rounded like
+        ``Image.point`` rounds a callable.
+    """
+    top = (1 << bits) - 1
+    values = np.arange(top + 1, dtype=np.float64) / top
+    return np.round(values**gamma * top).astype(np.uint8 if bits == 8 else np.uint16)
+
 
 def gamma_correction(img, gamma):
     """Apply gamma correction to an image.
 
+    8-bit images go through ``Image.point`` with a cached lookup table,
+    16-bit images through a NumPy table lookup and float images, assumed
+    normalized, through ``numpy.power``.
+
     Args:
         img: PIL Image object
         gamma: Gamma correction value
@@ -20,7 +62,21 @@ def gamma_correction(img, gamma):
     Returns:
         PIL Image object with gamma correction applied
     """
-    img_out = img.point(lambda x: ((x / 255) ** gamma) * 255)
+    if img.mode in _SIXTEEN_BIT_MODES:
+        pixels = np.clip(np.asarray(img), 0, 65535)
+        corrected = gamma_lut(gamma, 16)[pixels]
+        if img.mode == "I":
+            return Image.fromarray(corrected.astype(np.int32), mode="I")
+        return Image.fromarray(corrected)
+
+    if img.mode == "F":
+        pixels = np.clip(np.asarray(img, dtype=np.float32), 0.0, None)
+        return Image.fromarray(np.power(pixels, np.float32(gamma)), mode="F")
+
+    if img.mode in ("1", "P"):
+        img = img.convert("RGBA" if "transparency" in img.info else "RGB")
+
+    img_out = img.point(gamma_lut(gamma).tolist() * len(img.getbands()))
     return img_out
 
 
@@ -68,24 +124,34 @@ def check_colorspace(img):
         return "Unknown"
 
 
-def split_channels(image_file, image_name, extension=".png", colorspace="None"):
+def split_channels(
+    image_file,
+    image_name,
+    extension=".png",
+    colorspace="None",
+    channel_suffixes=PACKED_TEXTURE_LAYOUTS["_MT_R_AO"],
+):
     """Split RGB channels into separate files (metallic, roughness, AO).
 
+    The image is decoded once; an alpha channel is ignored.
+
     Args:
         image_file (str): Path to input image.
         image_name (str): Base name for output files.
         extension (str): Output file extension.
         colorspace (str): Colorspace for conversion.
+        channel_suffixes (tuple): Output suffix of the R, G and B channels.
     """
     image_path = Path(image_file)
     if not image_path.is_absolute():
         image_path = Path.cwd() / image_path
     with Image.open(image_path) as src_image:
+        src_image.load()
+        if src_image.mode not in ("RGB", "RGBA"):
+            src_image = src_image.convert("RGB")
         converted = colorspace_conversion(src_image, colorspace)
-        r_channel, g_channel, b_channel = converted.split()
-        r_channel.save(image_name + "_metallic" + extension)
-        g_channel.save(image_name + "_roughness" + extension)
-        b_channel.save(image_name + "_ao" + extension)
+        for channel, suffix in zip(converted.split()[:3], channel_suffixes, strict=True):
+            channel.save(image_name + suffix + extension)
 
 
 def convert_to_png(image_file, image_name, extension=".png", colorspace="None"):
@@ -93,38 +159,192 @@ def convert_to_png(image_file, image_name, extension=".png", colorspace="None"):
 
     Args:
         image_file (str): Path to input image.
-        image_name (str): Base name for output file.
+        image_name (str | list): Base name for output file, or several base
+            names to save the decoded image to.
         extension (str): Output file extension.
         colorspace (str): Colorspace for conversion.
     """
     image_path = Path(image_file)
     if not image_path.is_absolute():
         image_path = Path.cwd() / image_path
+    name_list = [image_name] if isinstance(image_name, str) else image_name
     with Image.open(image_path) as src_image:
         converted = colorspace_conversion(src_image, colorspace)
-        converted.save(image_name + extension)
+        for name in name_list:
+            converted.save(name + extension)
 
 
-def get_all_texture(extension_list=None):
-    """Find all texture files in current directory with specified extensions.
+def get_all_texture(extension_list=None, directory=None, recursive=False):
+    """Find all texture files in a directory with specified extensions.
 
     Args:
         extension_list (tuple): File extensions to search for (case-insensitive).
+        directory (str): Directory to search. Defaults to the current directory,
+            returning bare file names.
+        recursive (bool): Also search every subdirectory.
 
     Returns:
         set: Unique set of matching texture file names.
     """
     if extension_list is None:
         extension_list = ("png", "tga", "jpg")
+    pattern_root = os.path.join(directory, "") if directory else ""
+    if recursive:
+        pattern_root = os.path.join(pattern_root, "**", "")
     texture_list = []
 
     for ext in extension_list:
-        texture_list.extend(glob.glob("*." + ext))
-        texture_list.extend(glob.glob("*." + ext.upper()))
+        texture_list.extend(glob.glob(pattern_root + "*." + ext, recursive=recursive))
+        texture_list.extend(glob.glob(pattern_root + "*." + ext.upper(), recursive=recursive))
 
     return set(texture_list)
 
 
+def is_up_to_date(texture, output_list):
+    """Check if every output of a texture exists and is newer than it.
+
+    Args:
+        texture (str): Source texture path.
+        output_list (list): Output file paths.
+
+    Returns:
+        bool: True if no output needs to be written again.
+    """
+    if not output_list:
+        return False
+
+    source_mtime = os.stat(texture).st_mtime_ns
+    try:
+        return all(os.stat(output).st_mtime_ns >= source_mtime for output in output_list)
+    except FileNotFoundError:
+        return False
+
+
+def process_texture(texture, extension=".png", colorspace="None", force=False):
+    """Split or rename one texture unless its outputs are up to date.
+
+    Runs in worker processes, so it never raises: failures are reported
+    in the returned row.
+
+    Args:
+        texture (str): Texture path.
+        extension (str): Output file extension.
+        colorspace (str): Colorspace for conversion.
+        force (bool): Write the outputs even if they are newer than the source.
+
+    Returns:
+        dict: Report row with file, status (``"split"``, ``"converted"``,
+        ``"skipped"``, ``"ignored"`` or ``"error"``), outputs, bytes read,
+        seconds and error.
+    """
+    row = {
+        "file": texture,
+        "status": "error",
+        "outputs": [],
+        "bytes": 0,
+        "seconds": 0.0,
+        "error": "",
+    }
+    start = time.perf_counter()
+    try:
+        kind, base_name, suffix_list = TextureManager.get_texture_outputs(texture)
+        row["outputs"] = [base_name + suffix + extension for suffix in suffix_list]
+
+        if kind is None:
+            row["status"] = "ignored"
+        elif not force and is_up_to_date(texture, row["outputs"]):
+            row["status"] = "skipped"
+        else:
+            row["bytes"] = os.path.getsize(texture)
+            if kind == "split":
+                split_channels(texture, base_name, extension, colorspace, suffix_list)
+                row["status"] = "split"
+            else:
+                convert_to_png(
+                    texture, [base_name + suffix for suffix in suffix_list], extension, colorspace
+                )
+                row["status"] = "converted"
+    except Exception as exc:
+        row["error"] = f"{type(exc).__name__}: {exc}"
+
+    row["seconds"] = time.perf_counter() - start
+    return row
+
+
+def format_texture_report(row_list, total_time):
+    """Format the summary printed after a texture batch.
+
+    Args:
+        row_list (list): Rows returned by :func:`process_texture`.
+        total_time (float): Wall clock time of the whole batch in seconds.
+
+    Returns:
+        str: Report with the failures, the status counts and the throughput.
+    """
+    counts = dict.fromkeys(("split", "converted", "skipped", "ignored", "error"), 0)
+    for row in row_list:
+        counts[row["status"]] += 1
+
+    processed = counts["split"] + counts["converted"]
+    megabytes = sum(row["bytes"] for row in row_list) / (1024 * 1024)
+    wall_time = max(total_time, 1e-9)
+
+    lines = [f"Failed: {row['file']} -- {row['error']}" for row in row_list if row["error"]]
+    lines.append(
+        f"Textures: {len(row_list)} in {total_time:.2f}s ({counts['split']} split, "
+        f"{counts['converted']} converted, {counts['skipped']} up to date, "
+        f"{counts['ignored']} ignored, {counts['error']} failed)"
+    )
+    lines.append(
+        f"Throughput: {megabytes / wall_time:.1f} MB/s, {processed / wall_time:.1f} images/s "
+        f"({megabytes:.1f} MB read)"
+    )
+    return "\n".join(lines)
+
+
+def process_textures(
+    texture_list, extension=".png", colorspace="None", workers=1, force=False, verbose=True
+):
+    """Process many textures, in a process pool when ``workers`` > 1.
+
+    Args:
+        texture_list (list): Texture paths.
+        extension (str): Output file extension.
+        colorspace (str): Colorspace for conversion.
+        workers (int): Worker process count; 0 or None uses every CPU.
+        force (bool): Write outputs even if they are newer than their source.
+        verbose (bool): Print the summary report. Defaults to True.
+
+    Returns:
+        list: One report row per texture, sorted by file path.
+    """
+    texture_list = sorted(texture_list)
+    if not texture_list:
+        return []
+
+    start = time.perf_counter()
+    workers = min(workers or os.cpu_count() or 1, len(texture_list))
+
+    if workers == 1:
+        row_list = [
+            process_texture(texture, extension, colorspace, force) for texture in texture_list
+        ]
+    else:
+        row_list = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(process_texture, texture, extension, colorspace, force)
+                for texture in texture_list
+            ]
+            for future in as_completed(futures):
+                row_list.append(future.result())
+        row_list.sort(key=lambda row: row["file"])
+
+    if verbose:
+        print(format_texture_report(row_list, time.perf_counter() - start))
+    return row_list
+
+
 class TextureManager:
     """Texture Manager."""
 
@@ -141,23 +361,82 @@ class TextureManager:
     alpha_name_list = ["alpha"]
     emission_name_list = ["emission"]
 
-    def __init__(self, extension=".png", extension_search_list=None):
-        """Initialize TextureManager and process textures in current directory.
+    def __init__(
+        self,
+        extension=".png",
+        extension_search_list=None,
+        directory=None,
+        recursive=False,
+        workers=1,
+        force=False,
+    ):
+        """Initialize TextureManager and process textures in a directory.
 
         Args:
             extension: Output file extension for processed textures.
-            extension_search_list: File extensions to search for in current directory.
+            extension_search_list: File extensions to search for in the directory.
+            directory: Directory to process. Defaults to the current directory.
+            recursive: Also process every subdirectory.
+            workers: Worker process count; 0 or None uses every CPU.
+            force: Write outputs even if they are newer than their source.
         """
         self.extension = extension
         if extension_search_list is None:
             extension_search_list = ("png", "tga", "jpg")
-        self.texture_list = get_all_texture(extension_search_list)
+        self.texture_list = get_all_texture(extension_search_list, directory, recursive)
+        self.report = process_textures(
+            self.texture_list, extension=extension, workers=workers, force=force
+        )
 
-        for tex in self.texture_list:
-            if ("_MT_R_AO" in tex) or ("_OcclusionRoughnessMetallic" in tex):
-                self.split_texture(tex)
-            else:
-                self.rename_texture(tex)
+    @classmethod
+    def get_texture_outputs(cls, texture):
+        """Find what a texture turns into from its name.
+
+        Outputs are written next to the texture.
+
+        Args:
+            texture (str): Texture path.
+
+        Returns:
+            tuple: (kind, base_name, suffix_list), kind being ``"split"`` for
+            packed maps (one suffix per RGB channel), ``"convert"`` for
+            recognized channels and None for unknown textures.
+        """
+        texture_path = Path(texture)
+        stem = texture_path.name.split(".")[0]
+
+        for packed_name, suffix_list in PACKED_TEXTURE_LAYOUTS.items():
+            if packed_name in texture_path.name:
+                return (
+                    "split",
+                    str(texture_path.with_name(stem.replace(packed_name, ""))),
+                    suffix_list,
+                )
+
+        channel = stem.split("_")[-1]
+        name = str(texture_path.with_name("_".join(stem.split("_")[:-1])))
+
+        channel_lower = channel.lower()
+        normalized_channel = channel_lower.replace("-ogl", "")
+
+        channel_mappings = (
+            (cls.base_color_name_list, "_diffuse", channel_lower),
+            (cls.metallic_name_list, "_metallic", channel_lower),
+            (cls.subsurface_color_name_list, "_subsurface", channel_lower),
+            (cls.specular_name_list, "_specular", channel_lower),
+            (cls.roughness_name_list, "_roughness", channel_lower),
+            (cls.gloss_name_list, "_gloss", channel_lower),
+            (cls.normal_name_list, "_normal", normalized_channel),
+            (cls.transmission_name_list, "_transmission", channel_lower),
+            (cls.alpha_name_list, "_opacity", channel_lower),
+            (cls.emission_name_list, "_emission", channel_lower),
+            (cls.displacement_name_list, "_displacement", channel_lower),
+        )
+        suffix_list = [
+            suffix for names, suffix, candidate in channel_mappings if candidate in names
+        ]
+
+        return ("convert" if suffix_list else None), name, suffix_list
 
     def split_texture(self, texture):
         """Split packed texture into separate channel files.
@@ -165,10 +444,9 @@ class TextureManager:
         Args:
             texture (str): Packed texture filename.
         """
-        name = str(texture.split(".")[0])
-        name = name.replace("_MT_R_AO", "").replace("_OcclusionRoughnessMetallic", "")
+        _, name, suffix_list = self.get_texture_outputs(texture)
 
-        split_channels(texture, name, extension=".png")
+        split_channels(texture, name, extension=".png", channel_suffixes=suffix_list)
 
     def rename_texture(self, texture):
         """Rename texture file based on channel type detection.
@@ -176,33 +454,45 @@ class TextureManager:
         Args:
             texture (str): Texture filename to process.
         """
-        channel = str(texture.split(".")[0]).split("_")[-1]
-        name = "_".join(str(texture.split(".")[0]).split("_")[:-1])
+        _, name, suffix_list = self.get_texture_outputs(texture)
 
-        print(f"Texture: {texture} -- Name: {name} -- Channel: {channel}")
+        print(f"Texture: {texture} -- Name: {name} -- Channels: {suffix_list}")
 
-        channel_lower = channel.lower()
-        normalized_channel = channel_lower.replace("-ogl", "")
+        if suffix_list:
+            convert_to_png(texture, [name + suffix for suffix in suffix_list], self.extension)
 
-        channel_mappings = (
-            (self.base_color_name_list, "_diffuse", channel_lower),
-            (self.metallic_name_list, "_metallic", channel_lower),
-            (self.subsurface_color_name_list, "_subsurface", channel_lower),
-            (self.specular_name_list, "_specular", channel_lower),
-            (self.roughness_name_list, "_roughness", channel_lower),
-            (self.gloss_name_list, "_gloss", channel_lower),
-            (self.normal_name_list, "_normal", normalized_channel),
-            (self.transmission_name_list, "_transmission", channel_lower),
-            (self.alpha_name_list, "_opacity", channel_lower),
-            (self.emission_name_list, "_emission", channel_lower),
-            (self.displacement_name_list, "_displacement", channel_lower),
-        )
 
-        for names, suffix, candidate in channel_mappings:
-            if candidate in names:
-                convert_to_png(texture, name + suffix, self.extension)
+def main(argv=None):
+    """Command line entry point.
 
+    Args:
+        argv: Argument list, defaults to ``sys.argv[1:]``.
 
-if __name__ == "__main__":
-    tx_manager = TextureManager()
+    Returns:
+        int: Exit code, 1 if any texture failed.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Split and rename PBR textures")
+    parser.add_argument("directory", nargs="?", default=None, help="Texture directory")
+    parser.add_argument("-r", "--recursive", action="store_true", help="Include subdirectories")
+    parser.add_argument(
+        "-j", "--workers", type=int, default=0, help="Worker process count (0: every CPU)"
+    )
+    parser.add_argument("--force", action="store_true", help="Rewrite up to date outputs")
+    parser.add_argument("--extension", default=".png", help="Output file extension")
+
+    args = parser.parse_args(argv)
+    manager = TextureManager(
+        extension=args.extension,
+        directory=args.directory,
+        recursive=args.recursive,
+        workers=args.workers,
+        force=args.force,
+    )
     print("Done!")
+    return int(any(row["status"] == "error" for row in manager.report))
+
+
+if __name__ == "__main__":
+    sys.exit(main())